@@ -1,6 +1,9 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from services.tasks.worker_loop import get_worker_event_loop
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "EditEngine.settings")
@@ -16,6 +19,18 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+@worker_process_init.connect
+def start_worker_event_loop(**kwargs):
+    """Start the event loop shared by the tasks of a new worker process."""
+    get_worker_event_loop().start()
+
+
+@worker_process_shutdown.connect
+def stop_worker_event_loop(**kwargs):
+    """Stop the worker process's event loop."""
+    get_worker_event_loop().stop()
+
+
 
 @app.task(bind=True)
 def debug_task(self):
@@ -15,6 +15,7 @@ from pathlib import Path
 
 from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
+from kombu import Queue
 
 # Load environment variables
 # If running tests, prefer .env.test over .env
@@ -127,7 +128,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "EditEngine.urls"
+ROOT_URLCONF = os.environ.get("ROOT_URLCONF", "EditEngine.urls")
 
 TEMPLATES = [
     {
@@ -338,6 +339,11 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TASK_ALWAYS_EAGER = False  # Ensure tasks run asynchronously
 CELERY_TASK_EAGER_PROPAGATES = True  # Propagate exceptions in eager mode
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True  # Retry connections during startup
+# Acknowledge tasks only once they finish, so a task whose worker is recycled or
+# killed is redelivered and resumes from the paragraphs it already saved
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 # Redis-specific settings
 # Celery performance settings from environment variables
@@ -351,11 +357,20 @@ try:
 except ValueError as e:
     raise ImproperlyConfigured("The CELERY_PARAGRAPH_BATCH_SIZE environment variable must be an integer.") from e
 
+# Section edits are routed to a queue for small or large edits by their size
+# (services/tasks/queue_routing.py). Workers consume every queue and read small
+# edits first, with aging so large edits still get their turn
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+CELERY_TASK_QUEUES = [
+    Queue(name, routing_key=name) for name in ("celery", "edits-small", "edits-large")
+]
+
 CELERY_REDIS_MAX_CONNECTIONS = 20
 CELERY_BROKER_TRANSPORT_OPTIONS = {
     "visibility_timeout": 3600,  # 1 hour
     "fanout_prefix": True,
     "fanout_patterns": True,
+    "queue_order_strategy": "services.tasks.queue_routing:AgingQueueCycle",
 }
 
 # Security Headers
@@ -433,5 +448,12 @@ try:
 except ValueError as e:
     raise ImproperlyConfigured("The CELERY_MAX_TASKS_PER_CHILD environment variable must be an integer.") from e
 
+# Edit tasks run at once by the async worker (python manage.py async_worker),
+# which waits on LLM I/O for all of them on one event loop
+try:
+    CELERY_ASYNC_WORKER_CONCURRENCY = int(os.environ.get("CELERY_ASYNC_WORKER_CONCURRENCY", "16"))
+except ValueError as e:
+    raise ImproperlyConfigured("The CELERY_ASYNC_WORKER_CONCURRENCY environment variable must be an integer.") from e
+
 # Worker pool implementation is set via command line -P flag only (not Celery settings)
 # See management command for pool configuration
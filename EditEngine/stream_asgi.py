@@ -0,0 +1,17 @@
+"""ASGI config for the EditEngine result stream process.
+
+It exposes the ASGI callable as a module-level variable named ``application``,
+routing only the result stream (see ``EditEngine.stream_urls``).
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "EditEngine.settings")
+os.environ.setdefault("ROOT_URLCONF", "EditEngine.stream_urls")
+
+application = get_asgi_application()
@@ -0,0 +1,19 @@
+"""URL configuration for the result stream process.
+
+The stream process serves only the result stream, as an ASGI application; every
+other endpoint stays with the WSGI web process.
+"""
+
+from django.urls import path
+
+from api.views import ResultStreamView
+from EditEngine.urls import health_check
+
+urlpatterns = [
+    path("health/", health_check, name="health"),
+    path(
+        "api/results/<str:task_id>/stream",
+        ResultStreamView.as_view(),
+        name="results-stream",
+    ),
+]
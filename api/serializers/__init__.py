@@ -1,4 +1,5 @@
 from api.serializers.edit_serializers import (
+    ArticleEditRequestSerializer,
     EditRequestSerializer,
     EditTaskDetailSerializer,
     EditTaskListSerializer,
@@ -6,6 +7,7 @@ from api.serializers.edit_serializers import (
 )
 
 __all__ = [
+    "ArticleEditRequestSerializer",
     "EditRequestSerializer",
     "SectionHeadingSerializer",
     "EditTaskListSerializer",
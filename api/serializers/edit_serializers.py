@@ -33,6 +33,56 @@ class EditRequestSerializer(serializers.Serializer):
         label="Section Title",
     )
 
+    bypass_cache = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Skip cached AI responses and request fresh edits for every paragraph.",
+        label="Bypass Cache",
+    )
+
+    force = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Start a new edit even if the current revision was already edited with the same settings.",
+        label="Force",
+    )
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            "Wikipedia Article Example",
+            summary="Edit every section of a Wikipedia article",
+            description="Provide a Wikipedia article title to fetch the article and edit all of its sections",
+            value={"article_title": "Apollo"},
+            request_only=True,
+        ),
+    ]
+)
+class ArticleEditRequestSerializer(serializers.Serializer):
+    """Serializer for whole-article edit requests."""
+
+    article_title = serializers.CharField(
+        max_length=255,
+        required=True,
+        help_text="Wikipedia article title to fetch and edit every section of.",
+        label="Article Title",
+    )
+
+    bypass_cache = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Skip cached AI responses and request fresh edits for every paragraph.",
+        label="Bypass Cache",
+    )
+
+    force = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Start a new edit even if the current revision was already edited with the same settings.",
+        label="Force",
+    )
+
 
 @extend_schema_serializer(
     examples=[
@@ -105,7 +155,7 @@ class ParagraphResultSerializer(serializers.Serializer):
         help_text="Edited paragraph content after AI processing"
     )
     status = serializers.ChoiceField(
-        choices=["UNCHANGED", "CHANGED", "REJECTED", "SKIPPED", "ERRORED"],
+        choices=["UNCHANGED", "CHANGED", "REJECTED", "SKIPPED", "ERRORED", "TIMED_OUT"],
         help_text="Status indicating whether the paragraph was modified and why",
     )
     status_details = serializers.CharField(
@@ -172,6 +222,15 @@ class EditResponseSerializer(serializers.Serializer):
         required=False,
         help_text="URL to the Wikipedia article (only present when editing by article and section title)",
     )
+    token_usage = serializers.DictField(
+        required=False,
+        help_text="LLM token totals for the task, including input tokens served from the provider's prompt cache (cached_input_tokens)",
+    )
+    sections = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text="Title, task_id, status and paragraph_count (or error) of each section, in article order (only present when editing a whole article)",
+    )
 
 
 class EditTaskListSerializer(serializers.Serializer):
@@ -221,6 +280,11 @@ class EditTaskDetailSerializer(serializers.Serializer):
         allow_null=True,
         help_text="Wikipedia section title (if applicable)",
     )
+    revision_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text="Wikipedia revision the task edited (if known)",
+    )
     created_at = serializers.DateTimeField(help_text="Task creation timestamp")
     started_at = serializers.DateTimeField(
         required=False, allow_null=True, help_text="Task start timestamp"
@@ -237,6 +301,11 @@ class EditTaskDetailSerializer(serializers.Serializer):
     result = serializers.JSONField(
         required=False, allow_null=True, help_text="Complete edit results"
     )
+    usage_data = serializers.JSONField(
+        required=False,
+        allow_null=True,
+        help_text="LLM token counts (including prompt-cached input tokens), time to first token, latency, retries and provider errors, in total and per paragraph",
+    )
     error_message = serializers.CharField(
         required=False, allow_null=True, help_text="Error message if task failed"
     )
@@ -1,9 +1,11 @@
 from django.urls import path
 
 from api.views import (
+    ArticleEditView,
     EditTaskDetailView,
     EditTaskListView,
     EditView,
+    ResultStreamView,
     ResultView,
     SectionHeadingsView,
 )
@@ -14,4 +16,14 @@ urlpatterns = [
     path("section-headings", SectionHeadingsView.as_view(), name="section-headings"),
     path("tasks/", EditTaskListView.as_view(), name="task-list"),
     path("tasks/<str:task_id>/", EditTaskDetailView.as_view(), name="task-detail"),
+    path(
+        "results/<str:task_id>/stream",
+        ResultStreamView.as_view(),
+        name="results-stream",
+    ),
+    path(
+        "edit/<str:editing_mode>/article",
+        ArticleEditView.as_view(),
+        name="edit-article",
+    ),
 ]
@@ -1,15 +1,19 @@
 from api.views.edit_views import (
+    ArticleEditView,
     EditTaskDetailView,
     EditTaskListView,
     EditView,
+    ResultStreamView,
     ResultView,
     SectionHeadingsView,
 )
 
 __all__ = [
+    "ArticleEditView",
     "EditTaskDetailView",
     "EditTaskListView",
     "EditView",
+    "ResultStreamView",
     "ResultView",
     "SectionHeadingsView",
 ]
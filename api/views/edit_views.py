@@ -1,5 +1,13 @@
+import json
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
+from django.views import View
 from django_ratelimit.decorators import ratelimit
 from drf_spectacular.openapi import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
@@ -12,6 +20,7 @@ from api.exceptions import (
     ValidationError,
 )
 from api.serializers.edit_serializers import (
+    ArticleEditRequestSerializer,
     EditRequestSerializer,
     EditResponseSerializer,
     EditTaskDetailSerializer,
@@ -20,8 +29,15 @@ from api.serializers.edit_serializers import (
     SectionHeadingsResponseSerializer,
 )
 from data.models.edit_task import EditTask
+from services.core.constants import TASK_EVENTS_HEARTBEAT_SECONDS
 from services.tasks.edit_task_query_service import EditTaskQueryService
 from services.tasks.edit_task_service import EditTaskService
+from services.tracking.progress_store import get_progress_store
+from services.tracking.task_events import (
+    DONE_EVENT,
+    IdleSubscription,
+    get_task_event_broker,
+)
 from services.utils.section_headings_service import SectionHeadingsService
 
 # Common API responses for OpenAPI documentation
@@ -33,57 +49,68 @@ COMMON_API_RESPONSES = {
 }
 
 
+# Path and header parameters shared by the editing endpoints
+EDIT_PARAMETERS = [
+    OpenApiParameter(
+        name="editing_mode",
+        location=OpenApiParameter.PATH,
+        description="The editing mode to apply: 'brevity' for conciseness improvements, 'copyedit' for comprehensive editorial enhancements",
+        required=True,
+        type=OpenApiTypes.STR,
+        enum=["brevity", "copyedit"],
+    ),
+    OpenApiParameter(
+        name="X-Google-API-Key",
+        location=OpenApiParameter.HEADER,
+        description="Google API key for using Gemini models",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="X-OpenAI-API-Key",
+        location=OpenApiParameter.HEADER,
+        description="OpenAI API key for using GPT models",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="X-Anthropic-API-Key",
+        location=OpenApiParameter.HEADER,
+        description="Anthropic API key for using Claude models",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="X-Mistral-API-Key",
+        location=OpenApiParameter.HEADER,
+        description="Mistral API key for using Mistral models",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="X-Perplexity-API-Key",
+        location=OpenApiParameter.HEADER,
+        description="Perplexity API key for using Perplexity models",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="X-Fake-LLM-Profile",
+        location=OpenApiParameter.HEADER,
+        description="Use the fake LLM provider for load testing with a preset name or JSON profile; only accepted when LLM_FAKE_PROVIDER_ENABLED is set",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+]
+
+
 @extend_schema_view(
     post=extend_schema(
         summary="AI-Powered Wikipedia Section and Content Editing",
-        description="Use advanced AI to edit specific sections of Wikipedia articles. Provide an article title with a section title to fetch and edit that specific section from Wikipedia. Select 'brevity' mode to shorten text or 'copyedit' mode to improve grammar, style, and clarity. The system preserves formatting, protects links and references, maintains factual accuracy, and automatically retains regional spelling. Returns a task_id which can be used to poll for results.",
+        description="Use advanced AI to edit specific sections of Wikipedia articles. Provide an article title with a section title to fetch and edit that specific section from Wikipedia. Select 'brevity' mode to shorten text or 'copyedit' mode to improve grammar, style, and clarity. The system preserves formatting, protects links and references, maintains factual accuracy, and automatically retains regional spelling. Returns a task_id which can be used to poll for results; if the section's current revision was already edited with the same settings, the finished task's id is returned unless force is set.",
         request=EditRequestSerializer,
         responses={202: {"description": "Task accepted and processing"}},
-        parameters=[
-            OpenApiParameter(
-                name="editing_mode",
-                location=OpenApiParameter.PATH,
-                description="The editing mode to apply: 'brevity' for conciseness improvements, 'copyedit' for comprehensive editorial enhancements",
-                required=True,
-                type=OpenApiTypes.STR,
-                enum=["brevity", "copyedit"],
-            ),
-            OpenApiParameter(
-                name="X-Google-API-Key",
-                location=OpenApiParameter.HEADER,
-                description="Google API key for using Gemini models",
-                required=False,
-                type=OpenApiTypes.STR,
-            ),
-            OpenApiParameter(
-                name="X-OpenAI-API-Key",
-                location=OpenApiParameter.HEADER,
-                description="OpenAI API key for using GPT models",
-                required=False,
-                type=OpenApiTypes.STR,
-            ),
-            OpenApiParameter(
-                name="X-Anthropic-API-Key",
-                location=OpenApiParameter.HEADER,
-                description="Anthropic API key for using Claude models",
-                required=False,
-                type=OpenApiTypes.STR,
-            ),
-            OpenApiParameter(
-                name="X-Mistral-API-Key",
-                location=OpenApiParameter.HEADER,
-                description="Mistral API key for using Mistral models",
-                required=False,
-                type=OpenApiTypes.STR,
-            ),
-            OpenApiParameter(
-                name="X-Perplexity-API-Key",
-                location=OpenApiParameter.HEADER,
-                description="Perplexity API key for using Perplexity models",
-                required=False,
-                type=OpenApiTypes.STR,
-            ),
-        ],
+        parameters=EDIT_PARAMETERS,
         tags=["Wiki Editing"],
     )
 )
@@ -101,12 +128,7 @@ class EditView(APIView):
     """
 
     def post(self, request, *args, **kwargs):
-        editing_mode = kwargs.get("editing_mode")
-
-        if editing_mode not in ["brevity", "copyedit"]:
-            raise ValidationError(
-                f"Invalid editing mode '{editing_mode}'. Must be 'brevity' or 'copyedit'."
-            )
+        editing_mode = self._validate_editing_mode(kwargs.get("editing_mode"))
 
         serializer = EditRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -114,28 +136,44 @@ class EditView(APIView):
 
         article_title = serializer.validated_data.get("article_title")
         section_title = serializer.validated_data.get("section_title")
-
-        # Get API keys from headers
-        google_api_key = request.META.get("HTTP_X_GOOGLE_API_KEY")
-        openai_api_key = request.META.get("HTTP_X_OPENAI_API_KEY")
-        anthropic_api_key = request.META.get("HTTP_X_ANTHROPIC_API_KEY")
-        mistral_api_key = request.META.get("HTTP_X_MISTRAL_API_KEY")
-        perplexity_api_key = request.META.get("HTTP_X_PERPLEXITY_API_KEY")
+        bypass_cache = serializer.validated_data.get("bypass_cache", False)
+        force = serializer.validated_data.get("force", False)
 
         # Use EditTaskService to handle the complete workflow
         result = EditTaskService.create_and_start_edit_task(
             editing_mode=editing_mode,
             article_title=article_title,
             section_title=section_title,
-            google_api_key=google_api_key,
-            openai_api_key=openai_api_key,
-            anthropic_api_key=anthropic_api_key,
-            mistral_api_key=mistral_api_key,
-            perplexity_api_key=perplexity_api_key,
+            bypass_cache=bypass_cache,
+            force=force,
+            **self._get_llm_credentials(request),
         )
 
         return Response(result, status=status.HTTP_202_ACCEPTED)
 
+    def _validate_editing_mode(self, editing_mode: Optional[str]) -> str:
+        """Reject editing modes other than brevity and copyedit.
+
+        Returns:
+            The editing mode, once it is known to be valid
+        """
+        if editing_mode not in ["brevity", "copyedit"]:
+            raise ValidationError(
+                f"Invalid editing mode '{editing_mode}'. Must be 'brevity' or 'copyedit'."
+            )
+        return editing_mode
+
+    def _get_llm_credentials(self, request):
+        """Get the API keys and fake LLM profile from the request headers."""
+        return {
+            "google_api_key": request.META.get("HTTP_X_GOOGLE_API_KEY"),
+            "openai_api_key": request.META.get("HTTP_X_OPENAI_API_KEY"),
+            "anthropic_api_key": request.META.get("HTTP_X_ANTHROPIC_API_KEY"),
+            "mistral_api_key": request.META.get("HTTP_X_MISTRAL_API_KEY"),
+            "perplexity_api_key": request.META.get("HTTP_X_PERPLEXITY_API_KEY"),
+            "fake_llm_profile": request.META.get("HTTP_X_FAKE_LLM_PROFILE"),
+        }
+
     def _extract_serializer_error(self, serializer):
         """Safely extract error messages from serializer errors with proper fallback handling."""
         try:
@@ -158,10 +196,77 @@ class EditView(APIView):
         return error_message
 
 
+@extend_schema_view(
+    post=extend_schema(
+        summary="AI-Powered Whole-Article Editing",
+        description="Edit every section of a Wikipedia article in one task. The article is fetched once and split into its lead and level 2 sections, which are edited in parallel. The result lists all paragraphs in article order along with each section's status, and progress is reported per section while the task runs. Returns a task_id which can be used to poll for results.",
+        request=ArticleEditRequestSerializer,
+        responses={202: {"description": "Task accepted and processing"}},
+        parameters=EDIT_PARAMETERS,
+        tags=["Wiki Editing"],
+    )
+)
+class ArticleEditView(EditView):
+    """API endpoint for editing every section of a Wikipedia article using AI.
+
+    Each section is edited by its own background task; the results are merged
+    into the article's task once the last section finishes.
+    """
+
+    def post(self, request, *args, **kwargs):
+        editing_mode = self._validate_editing_mode(kwargs.get("editing_mode"))
+
+        serializer = ArticleEditRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(self._extract_serializer_error(serializer))
+
+        result = EditTaskService.create_and_start_article_edit_task(
+            editing_mode=editing_mode,
+            article_title=serializer.validated_data.get("article_title"),
+            bypass_cache=serializer.validated_data.get("bypass_cache", False),
+            force=serializer.validated_data.get("force", False),
+            **self._get_llm_credentials(request),
+        )
+
+        return Response(result, status=status.HTTP_202_ACCEPTED)
+
+
+RUNNING_STATUSES = ("PENDING", "STARTED")
+
+
+def _get_running_task_state(edit_task, task_id):
+    """Build the status, progress and finished paragraphs of a running task."""
+    response_data = {"task_id": task_id, "status": edit_task.status}
+    if edit_task.is_article_task():
+        # Whole-article tasks report the progress of each section's task
+        response_data["progress"] = EditTaskQueryService.get_article_progress(edit_task)
+        return response_data
+
+    progress_data = _get_live_progress(task_id)
+    if progress_data is None:
+        # Use the method that handles both legacy and enhanced progress formats
+        progress_data = edit_task.get_progress_for_api()
+    if progress_data:
+        response_data["progress"] = progress_data
+    # Paragraphs that already finished, before the whole result is ready
+    partial_results = EditTaskQueryService.get_partial_results(edit_task)
+    if partial_results:
+        response_data["partial_results"] = partial_results
+    return response_data
+
+
+def _get_live_progress(task_id):
+    """Get a running task's progress from the live progress store, if any."""
+    progress_store = get_progress_store()
+    if progress_store is None:
+        return None
+    return progress_store.get(str(task_id))
+
+
 @extend_schema_view(
     get=extend_schema(
         summary="Get Task Results",
-        description="Retrieve the results of an editing task by its task ID. The response will include the status of the task and, if completed, the editing results.",
+        description="Retrieve the results of an editing task by its task ID. The response will include the status of the task and, if completed, the editing results. Cancelled tasks report the REVOKED status along with the paragraphs finished before they were cancelled.",
         responses={
             200: EditResponseSerializer,
             202: {"description": "Task is still processing"},
@@ -175,18 +280,16 @@ class ResultView(APIView):
     """API endpoint for retrieving the results of an editing task."""
 
     def get(self, request, task_id, *args, **kwargs):
-        # Get the EditTask from database
-        edit_task = get_object_or_404(EditTask, id=task_id)
+        # Get the EditTask from database, leaving its progress JSON undecoded
+        # unless the live progress store has none
+        edit_task = get_object_or_404(
+            EditTask.objects.defer("progress_data"), id=task_id
+        )
 
-        if edit_task.status == "PENDING" or edit_task.status == "STARTED":
+        if edit_task.status in RUNNING_STATUSES:
             # Task is still processing
-            response_data = {"task_id": task_id, "status": edit_task.status}
-            # Use the new method that handles both legacy and enhanced progress formats
-            progress_data = edit_task.get_progress_for_api()
-            if progress_data:
-                response_data["progress"] = progress_data
             return Response(
-                response_data,
+                _get_running_task_state(edit_task, task_id),
                 status=status.HTTP_202_ACCEPTED,
             )
         elif edit_task.status == "FAILURE":
@@ -215,8 +318,19 @@ class ResultView(APIView):
             # Return the successful result
             response_data = {"task_id": task_id, "status": "SUCCESS", "result": result}
             return Response(response_data)
+        elif edit_task.status == "REVOKED":
+            # Task was cancelled; paragraphs finished before that stay available
+            response_data = {
+                "task_id": task_id,
+                "status": "REVOKED",
+                "error": edit_task.error_message or "Task was cancelled",
+            }
+            partial_results = EditTaskQueryService.get_partial_results(edit_task)
+            if partial_results:
+                response_data["partial_results"] = partial_results
+            return Response(response_data)
         else:
-            # Task is in some other state (e.g., RETRY, REVOKED)
+            # Task is in some other state (e.g., RETRY)
             return Response(
                 {"task_id": task_id, "status": edit_task.status},
                 status=status.HTTP_202_ACCEPTED,
@@ -237,6 +351,90 @@ class ResultView(APIView):
             return "An error occurred during processing."
 
 
+class ResultStreamView(View):
+    """Server-sent events stream of an editing task's progress and paragraphs.
+
+    The stream starts with a ``snapshot`` event holding what the results
+    endpoint would return for a running task, followed by ``progress`` events
+    with progress deltas and ``paragraph`` events as paragraphs finish. A
+    ``done`` event with the final status ends it; clients then fetch the full
+    result from the results endpoint. Streaming needs the ASGI application,
+    since a WSGI server would buffer the stream until the task finishes.
+    """
+
+    async def get(self, request, task_id, *args, **kwargs):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"error": "Result streaming requires the ASGI server"}, status=501
+            )
+
+        try:
+            task_exists = await EditTask.objects.filter(id=task_id).aexists()
+        except DjangoValidationError:
+            task_exists = False
+        if not task_exists:
+            return JsonResponse({"error": "Task not found"}, status=404)
+
+        response = StreamingHttpResponse(
+            self._stream_events(task_id), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # Stop reverse proxies from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _stream_events(self, task_id):
+        """Yield the task's events as server-sent events until it finishes."""
+        broker = get_task_event_broker()
+        subscription = (
+            broker.subscribe(str(task_id)) if broker is not None else IdleSubscription()
+        )
+        # Subscribe before taking the snapshot so no event falls in between
+        async with subscription:
+            snapshot = await sync_to_async(self._get_snapshot)(task_id)
+            yield self._format_event("snapshot", snapshot)
+            if snapshot["status"] not in RUNNING_STATUSES:
+                yield self._format_event(DONE_EVENT, {"status": snapshot["status"]})
+                return
+
+            while True:
+                task_event = await subscription.get(TASK_EVENTS_HEARTBEAT_SECONDS)
+                if task_event is None:
+                    # Catch a finish whose event was missed, e.g. while Redis
+                    # was unreachable, and keep proxies from closing the stream
+                    task_status = await self._get_status(task_id)
+                    if task_status not in RUNNING_STATUSES:
+                        yield self._format_event(DONE_EVENT, {"status": task_status})
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                event, data = task_event
+                yield self._format_event(event, data)
+                if event == DONE_EVENT:
+                    return
+
+    @staticmethod
+    def _get_snapshot(task_id):
+        """Get the task's current state, as the results endpoint reports it."""
+        edit_task = EditTask.objects.defer("progress_data").get(id=task_id)
+        if edit_task.status in RUNNING_STATUSES:
+            return _get_running_task_state(edit_task, task_id)
+        return {"task_id": task_id, "status": edit_task.status}
+
+    @staticmethod
+    async def _get_status(task_id):
+        return (
+            await EditTask.objects.filter(id=task_id)
+            .values_list("status", flat=True)
+            .afirst()
+        )
+
+    @staticmethod
+    def _format_event(event, data):
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @extend_schema_view(
     post=extend_schema(
         summary="Retrieve Level 2 Section Headings from Wikipedia Article",
@@ -385,10 +583,30 @@ class EditTaskListView(APIView):
             404: {"description": "Task not found"},
         },
         tags=["Edit History"],
-    )
+    ),
+    delete=extend_schema(
+        summary="Cancel Edit Task",
+        description="Cancel a queued or running edit task, sending the cancel_token returned when the task was submitted. Identical submissions share one task, so the task keeps running until every client that submitted it has cancelled; the response then reports its unchanged status. Queued tasks never start, and running tasks stop editing and cancel their outstanding LLM requests; paragraphs finished before the cancellation stay available as partial results. Cancelling a whole-article task also cancels its unfinished sections. Cancelling a task that was already cancelled succeeds without effect.",
+        parameters=[
+            OpenApiParameter(
+                name="X-Cancel-Token",
+                location=OpenApiParameter.HEADER,
+                description="The cancel_token returned when the task was submitted",
+                required=True,
+                type=OpenApiTypes.STR,
+            ),
+        ],
+        responses={
+            200: {"description": "Task cancelled, or the submission withdrawn"},
+            403: {"description": "Cancel token does not belong to the task"},
+            404: {"description": "Task not found"},
+            409: {"description": "Task already finished"},
+        },
+        tags=["Edit History"],
+    ),
 )
 class EditTaskDetailView(APIView):
-    """API endpoint for retrieving detailed information about a specific edit task."""
+    """API endpoint for retrieving or cancelling a specific edit task."""
 
     def get(self, request, task_id, *args, **kwargs):
         # Get the EditTask from database
@@ -401,13 +619,22 @@ class EditTaskDetailView(APIView):
             "status": edit_task.status,
             "article_title": edit_task.article_title,
             "section_title": edit_task.section_title,
+            "revision_id": edit_task.revision_id,
             "created_at": edit_task.created_at,
             "started_at": edit_task.started_at,
             "completed_at": edit_task.completed_at,
             "llm_provider": edit_task.llm_provider,
             "llm_model": edit_task.llm_model,
             "result": edit_task.result,
+            "usage_data": edit_task.usage_data,
             "error_message": edit_task.error_message,
         }
 
         return Response(task_data)
+
+    def delete(self, request, task_id, *args, **kwargs):
+        edit_task = get_object_or_404(EditTask, id=task_id)
+        edit_task = EditTaskService.cancel_edit_task(
+            edit_task, request.META.get("HTTP_X_CANCEL_TOKEN")
+        )
+        return Response({"id": edit_task.id, "status": edit_task.status})
@@ -7,7 +7,7 @@ import StatusDetails from '../../../tasks/StatusDetails/StatusDetails';
 interface Paragraph {
   before: string;
   after: string;
-  status: 'CHANGED' | 'UNCHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED';
+  status: 'CHANGED' | 'UNCHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED' | 'TIMED_OUT';
   status_details: string;
 }
 
@@ -10,7 +10,7 @@ import styles from "./DiffList.module.scss";
 interface Paragraph {
   before: string;
   after: string;
-  status: "CHANGED" | "UNCHANGED" | "REJECTED" | "SKIPPED" | "ERRORED";
+  status: "CHANGED" | "UNCHANGED" | "REJECTED" | "SKIPPED" | "ERRORED" | "TIMED_OUT";
   status_details: string;
 }
 
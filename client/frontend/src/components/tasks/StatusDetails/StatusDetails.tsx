@@ -5,7 +5,7 @@ import Modal from '../../shared/components/Modal/Modal';
 import styles from './StatusDetails.module.scss';
 
 interface StatusDetailsProps {
-  status: 'CHANGED' | 'UNCHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED';
+  status: 'CHANGED' | 'UNCHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED' | 'TIMED_OUT';
   statusDetails: string;
   className?: string;
 }
@@ -33,6 +33,8 @@ const StatusDetails: React.FC<StatusDetailsProps> = ({ status, statusDetails, cl
         return 'Skipped';
       case 'ERRORED':
         return 'Error';
+      case 'TIMED_OUT':
+        return 'Timed out';
       default:
         return status;
     }
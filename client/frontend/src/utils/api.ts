@@ -15,20 +15,31 @@ export interface SectionHeadingsResponse {
 export interface Paragraph {
   before: string;
   after: string;
-  status: "CHANGED" | "UNCHANGED" | "REJECTED" | "SKIPPED" | "ERRORED";
+  status: "CHANGED" | "UNCHANGED" | "REJECTED" | "SKIPPED" | "ERRORED" | "TIMED_OUT";
   status_details: string;
 }
 
+export interface TokenUsage {
+  llm_calls: number;
+  input_tokens: number;
+  output_tokens: number;
+  cached_input_tokens: number;
+  cache_creation_input_tokens: number;
+  cache_hit_ratio: number;
+}
+
 export interface EditResponse {
   paragraphs: Paragraph[];
   article_title?: string;
   section_title?: string;
   article_url?: string;
+  token_usage?: TokenUsage;
 }
 
 export interface TaskResponse {
   task_id: string;
   status_url: string;
+  cancel_token?: string;
 }
 
 export interface ProgressData {
@@ -49,14 +60,20 @@ export interface ProgressData {
     started_at?: string;
     completed_at?: string;
   }>;
+  concurrency_window?: number;
+}
+
+export interface PartialParagraph extends Paragraph {
+  index: number;
 }
 
 export interface TaskStatusResponse {
   task_id: string;
-  status: "PENDING" | "SUCCESS" | "FAILURE" | "STARTED" | "RETRY";
+  status: "PENDING" | "SUCCESS" | "FAILURE" | "STARTED" | "RETRY" | "REVOKED";
   result?: EditResponse;
   error?: string;
   progress?: ProgressData;
+  partial_results?: PartialParagraph[];
 }
 
 export type EditingMode = "brevity" | "copyedit";
@@ -149,13 +166,117 @@ export const getTaskStatus = async (
   return response.data;
 };
 
-// Utility function to poll for task results with progress updates
+// Merges a progress update that may list only the paragraphs that changed
+const mergeProgress = (
+  current: ProgressData | undefined,
+  update: ProgressData
+): ProgressData => {
+  const paragraphs = new Map(
+    (current?.paragraphs ?? []).map((paragraph) => [paragraph.index, paragraph])
+  );
+  for (const paragraph of update.paragraphs) {
+    paragraphs.set(paragraph.index, paragraph);
+  }
+  return {
+    ...update,
+    paragraphs: [...paragraphs.values()]
+      .filter((paragraph) => paragraph.index < update.total_paragraphs)
+      .sort((a, b) => a.index - b.index),
+  };
+};
+
+class StreamUnavailableError extends Error {}
+
+// Follows a task over the results stream until it finishes, then fetches the
+// full result. Rejects with StreamUnavailableError if the stream breaks, so
+// callers can fall back to polling.
+const streamTaskUntilComplete = (
+  taskId: string,
+  onProgress?: (progress: ProgressData) => void,
+  onPartialResults?: (paragraphs: PartialParagraph[]) => void
+): Promise<EditResponse> => {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`/api/results/${taskId}/stream`);
+    let progress: ProgressData | undefined;
+    const partialResults = new Map<number, PartialParagraph>();
+
+    const reportPartialResults = () => {
+      if (onPartialResults && partialResults.size > 0) {
+        onPartialResults(
+          [...partialResults.values()].sort((a, b) => a.index - b.index)
+        );
+      }
+    };
+
+    const applyProgress = (update: ProgressData) => {
+      progress = mergeProgress(progress, update);
+      onProgress?.(progress);
+    };
+
+    source.addEventListener("snapshot", (event) => {
+      const snapshot: TaskStatusResponse = JSON.parse(
+        (event as MessageEvent).data
+      );
+      if (snapshot.progress) {
+        applyProgress(snapshot.progress);
+      }
+      for (const paragraph of snapshot.partial_results ?? []) {
+        partialResults.set(paragraph.index, paragraph);
+      }
+      reportPartialResults();
+    });
+
+    source.addEventListener("progress", (event) => {
+      applyProgress(JSON.parse((event as MessageEvent).data));
+    });
+
+    source.addEventListener("paragraph", (event) => {
+      const paragraph: PartialParagraph = JSON.parse((event as MessageEvent).data);
+      partialResults.set(paragraph.index, paragraph);
+      reportPartialResults();
+    });
+
+    source.addEventListener("done", async () => {
+      source.close();
+      try {
+        const response = await getTaskStatus(taskId);
+        if (response.status === "SUCCESS" && response.result) {
+          resolve(response.result);
+        } else {
+          reject(new Error(response.error || "Task failed"));
+        }
+      } catch (error) {
+        reject(error);
+      }
+    });
+
+    source.onerror = () => {
+      source.close();
+      reject(new StreamUnavailableError("Result stream unavailable"));
+    };
+  });
+};
+
+// Utility function to wait for task results with progress updates.
+// Updates are pushed over server-sent events when the server supports them;
+// otherwise the results endpoint is polled.
 export const pollTaskUntilComplete = async (
   taskId: string,
   onProgress?: (progress: ProgressData) => void,
   pollingInterval = 1000,
-  maxAttempts = 200
+  maxAttempts = 200,
+  onPartialResults?: (paragraphs: PartialParagraph[]) => void
 ): Promise<EditResponse> => {
+  if (typeof EventSource !== "undefined") {
+    try {
+      return await streamTaskUntilComplete(taskId, onProgress, onPartialResults);
+    } catch (error) {
+      if (!(error instanceof StreamUnavailableError)) {
+        throw error;
+      }
+    }
+  }
+
   let attempts = 0;
 
   return new Promise((resolve, reject) => {
@@ -168,10 +289,15 @@ export const pollTaskUntilComplete = async (
           onProgress(response.progress);
         }
 
+        // Paragraphs that finished before the rest of the section
+        if (onPartialResults && response.partial_results) {
+          onPartialResults(response.partial_results);
+        }
+
         if (response.status === "SUCCESS" && response.result) {
           resolve(response.result);
           return;
-        } else if (response.status === "FAILURE") {
+        } else if (response.status === "FAILURE" || response.status === "REVOKED") {
           reject(new Error(response.error || "Task failed"));
           return;
         } else if (attempts >= maxAttempts) {
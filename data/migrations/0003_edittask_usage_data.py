@@ -0,0 +1,22 @@
+# Generated by Django 5.2.2 on 2026-10-18 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0002_remove_edittask_ip_address_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edittask",
+            name="usage_data",
+            field=models.JSONField(
+                blank=True,
+                help_text="LLM token and latency figures per paragraph and in total",
+                null=True,
+            ),
+        ),
+    ]
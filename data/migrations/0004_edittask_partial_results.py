@@ -0,0 +1,22 @@
+# Generated by Django 5.2.2 on 2026-10-18 11:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0003_edittask_usage_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edittask",
+            name="partial_results",
+            field=models.JSONField(
+                blank=True,
+                help_text="Paragraph results completed so far while the task is running",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.2 on 2026-10-18 11:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0004_edittask_partial_results"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edittask",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Whole-article task this section task belongs to",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="sections",
+                to="data.edittask",
+            ),
+        ),
+        migrations.AddField(
+            model_name="edittask",
+            name="section_index",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Position of the section within the article",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="edittask",
+            name="sections_completed",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Number of section tasks that have finished"
+            ),
+        ),
+        migrations.AddField(
+            model_name="edittask",
+            name="sections_total",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Number of section tasks of a whole-article task",
+                null=True,
+            ),
+        ),
+    ]
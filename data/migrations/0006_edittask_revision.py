@@ -0,0 +1,39 @@
+# Generated by Django 5.2.2 on 2026-10-18 11:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0005_edittask_sections"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edittask",
+            name="prompt_version",
+            field=models.CharField(
+                blank=True,
+                help_text="Version of the editing prompt the task was started with",
+                max_length=20,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="edittask",
+            name="revision_id",
+            field=models.PositiveBigIntegerField(
+                blank=True, help_text="Wikipedia revision the task edits", null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="edittask",
+            index=models.Index(
+                fields=["article_title", "revision_id"],
+                name="edit_tasks_article_3c3e61_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.2 on 2026-10-18 12:22
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0006_edittask_revision"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EditTaskSubmission",
+            fields=[
+                (
+                    "cancel_token",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Secret the client sends to cancel its submission",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "withdrawn_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When the client cancelled the submission",
+                        null=True,
+                    ),
+                ),
+                (
+                    "edit_task",
+                    models.ForeignKey(
+                        help_text="Task the submission started or attached to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="submissions",
+                        to="data.edittask",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "edit_task_submissions",
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.2 on 2026-10-18 13:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0007_edittasksubmission"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edittask",
+            name="delivery_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Times a worker started processing the task"
+            ),
+        ),
+    ]
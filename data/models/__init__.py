@@ -1,3 +1,4 @@
 from data.models.edit_task import EditTask
+from data.models.edit_task_submission import EditTaskSubmission
 
-__all__ = ["EditTask"]
+__all__ = ["EditTask", "EditTaskSubmission"]
@@ -1,7 +1,7 @@
 import uuid
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -32,6 +32,9 @@ class EditTask(models.Model):
     section_title = models.CharField(
         max_length=500, null=True, blank=True, help_text="Wikipedia section title"
     )
+    revision_id = models.PositiveBigIntegerField(
+        null=True, blank=True, help_text="Wikipedia revision the task edits"
+    )
 
     # LLM configuration
     llm_provider = models.CharField(
@@ -43,6 +46,12 @@ class EditTask(models.Model):
     llm_model = models.CharField(
         max_length=100, null=True, blank=True, help_text="Specific model used"
     )
+    prompt_version = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        help_text="Version of the editing prompt the task was started with",
+    )
 
     # Task status
     STATUS_CHOICES = [
@@ -57,6 +66,16 @@ class EditTask(models.Model):
 
     # Results
     result = models.JSONField(null=True, blank=True, help_text="Edit results as JSON")
+    usage_data = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="LLM token and latency figures per paragraph and in total",
+    )
+    partial_results = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Paragraph results completed so far while the task is running",
+    )
     progress_data = models.JSONField(
         null=True, blank=True, help_text="Progress tracking data during processing"
     )
@@ -73,6 +92,9 @@ class EditTask(models.Model):
     completed_at = models.DateTimeField(
         null=True, blank=True, help_text="When task completed"
     )
+    delivery_count = models.PositiveIntegerField(
+        default=0, help_text="Times a worker started processing the task"
+    )
 
     # Optional tracking fields
     user = models.ForeignKey(
@@ -83,6 +105,27 @@ class EditTask(models.Model):
         help_text="User who initiated the task (if authenticated)",
     )
 
+    # Whole-article editing, where each section is edited by its own task
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="sections",
+        help_text="Whole-article task this section task belongs to",
+    )
+    section_index = models.PositiveIntegerField(
+        null=True, blank=True, help_text="Position of the section within the article"
+    )
+    sections_total = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Number of section tasks of a whole-article task",
+    )
+    sections_completed = models.PositiveIntegerField(
+        default=0, help_text="Number of section tasks that have finished"
+    )
+
     class Meta:
         db_table = "edit_tasks"
         ordering = ["-created_at"]
@@ -90,6 +133,7 @@ class EditTask(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["created_at"]),
             models.Index(fields=["celery_task_id"]),
+            models.Index(fields=["article_title", "revision_id"]),
         ]
 
     def __str__(self):
@@ -103,31 +147,142 @@ class EditTask(models.Model):
         """Check if task is currently being processed."""
         return self.status in ["PENDING", "STARTED", "RETRY"]
 
+    def is_article_task(self):
+        """Check if task edits a whole article through section tasks."""
+        return self.sections_total is not None
+
+    def record_section_completed(self):
+        """Update the count of finished section tasks of this whole-article task.
+
+        The count is taken from the section tasks under a row lock, so when
+        sections finish at the same time on different workers, or a section's
+        message is delivered twice, exactly one caller sees the last section
+        complete.
+
+        Returns:
+            True if this call saw every section task finish
+        """
+        with transaction.atomic():
+            locked = EditTask.objects.select_for_update().get(id=self.id)
+            total = locked.sections_total or 0
+            already_completed = locked.sections_completed >= total
+            locked.sections_completed = locked.sections.filter(
+                status__in=["SUCCESS", "FAILURE", "REVOKED"]
+            ).count()
+            locked.save(update_fields=["sections_completed", "updated_at"])
+        self.sections_completed = locked.sections_completed
+        return not already_completed and locked.sections_completed >= total
+
     def mark_started(self):
-        """Mark task as started."""
-        self.status = "STARTED"
-        self.started_at = timezone.now()
-        self.save(update_fields=["status", "started_at", "updated_at"])
-
-    def mark_success(self, result_data):
-        """Mark task as successfully completed with results."""
-        self.status = "SUCCESS"
-        self.result = result_data
-        self.completed_at = timezone.now()
-        self.save(update_fields=["status", "result", "completed_at", "updated_at"])
+        """Mark task as started and count the delivery, unless it was cancelled.
+
+        Returns:
+            True if the task was marked started
+        """
+        started = self._update_unless_revoked(
+            status="STARTED",
+            started_at=timezone.now(),
+            delivery_count=models.F("delivery_count") + 1,
+        )
+        if started:
+            self.refresh_from_db(fields=["delivery_count"])
+        return started
+
+    def mark_success(self, result_data, usage_data=None):
+        """Mark task as successfully completed with results and LLM usage.
+
+        Returns:
+            True if the task was marked successful; False if it was cancelled
+        """
+        return self._update_unless_revoked(
+            status="SUCCESS",
+            result=result_data,
+            usage_data=usage_data,
+            # The full result supersedes the paragraphs recorded while running
+            partial_results=None,
+            completed_at=timezone.now(),
+        )
 
     def mark_failure(self, error_message):
-        """Mark task as failed with error message."""
-        self.status = "FAILURE"
-        self.error_message = error_message
+        """Mark task as failed with error message.
+
+        Returns:
+            True if the task was marked failed; False if it was cancelled
+        """
+        return self._update_unless_revoked(
+            status="FAILURE", error_message=error_message, completed_at=timezone.now()
+        )
+
+    def _update_unless_revoked(self, **fields):
+        """Save fields of the task unless it was cancelled in the meantime.
+
+        The status is checked in the same query as the update, so a task
+        cancelled while its worker finishes stays revoked. When the update is
+        skipped, the cancellation is loaded into this instance instead.
+
+        Returns:
+            True if the fields were saved
+        """
+        fields["updated_at"] = timezone.now()
+        updated = (
+            EditTask.objects.filter(id=self.id)
+            .exclude(status="REVOKED")
+            .update(**fields)
+        )
+        if not updated:
+            self.refresh_from_db(fields=["status", "error_message", "completed_at"])
+            return False
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+        return True
+
+    def mark_revoked(self):
+        """Mark task as cancelled before it finished."""
+        self.status = "REVOKED"
+        self.error_message = "Task was cancelled"
         self.completed_at = timezone.now()
         self.save(
             update_fields=["status", "error_message", "completed_at", "updated_at"]
         )
 
+    def add_partial_results(self, paragraph_results):
+        """Record paragraph results that completed while the task is running.
+
+        A result replaces any recorded earlier for the same paragraph, as when
+        a redelivered task restores its checkpoints.
+
+        Args:
+            paragraph_results: Paragraph result dictionaries, each with the
+                paragraph's position in the section as ``index``
+        """
+        paragraphs = {
+            paragraph["index"]: paragraph for paragraph in self.partial_results or []
+        }
+        paragraphs.update(
+            (paragraph["index"], paragraph) for paragraph in paragraph_results
+        )
+        self.partial_results = list(paragraphs.values())
+        self.save(update_fields=["partial_results", "updated_at"])
+
+    def get_partial_results_for_api(self):
+        """Get the paragraph results completed so far, in section order.
+
+        Returns:
+            List of paragraph result dictionaries, or None if none are recorded
+        """
+        if not self.partial_results:
+            return None
+
+        return sorted(self.partial_results, key=lambda paragraph: paragraph["index"])
+
     def update_progress_enhanced(self, progress_data):
         """Update progress data with enhanced granular phase tracking.
 
+        Progress updates may be deltas that list only the paragraphs changed
+        since the previous update; they are merged into the stored paragraphs by
+        index, while the summary fields are replaced.
+
         Args:
             progress_data: Dictionary containing enhanced progress information with format:
             {
@@ -149,7 +304,8 @@ class EditTask(models.Model):
                         "started_at": str,  # ISO timestamp
                         "completed_at": str,  # ISO timestamp, only when complete
                     }
-                ]
+                ],
+                "concurrency_window": int,  # Optional, current adaptive window
             }
         """
         # Validate that phase_counts sum to total_paragraphs
@@ -160,7 +316,21 @@ class EditTask(models.Model):
                     f"Phase counts ({total_in_phases}) don't match total paragraphs ({progress_data['total_paragraphs']})"
                 )
 
-        self.progress_data = progress_data
+        paragraphs = {
+            paragraph["index"]: paragraph
+            for paragraph in (self.progress_data or {}).get("paragraphs", [])
+        }
+        for paragraph in progress_data.get("paragraphs", []):
+            paragraphs[paragraph["index"]] = paragraph
+
+        # A rerun of the task may cover fewer paragraphs than the stored progress
+        total = progress_data.get("total_paragraphs", len(paragraphs))
+        self.progress_data = {
+            **progress_data,
+            "paragraphs": [
+                paragraphs[index] for index in sorted(paragraphs) if index < total
+            ],
+        }
         self.save(update_fields=["progress_data", "updated_at"])
 
     def get_progress_for_api(self):
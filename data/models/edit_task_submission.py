@@ -0,0 +1,39 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+from data.models.edit_task import EditTask
+
+
+class EditTaskSubmission(models.Model):
+    """A client's submission that started an edit task or attached to one.
+
+    Identical submissions share one task, but each keeps its own cancel token,
+    so a client can only withdraw its own submission and the task is only
+    cancelled once every submission was withdrawn.
+    """
+
+    cancel_token = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        help_text="Secret the client sends to cancel its submission",
+    )
+    edit_task = models.ForeignKey(
+        EditTask,
+        on_delete=models.CASCADE,
+        related_name="submissions",
+        help_text="Task the submission started or attached to",
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    withdrawn_at = models.DateTimeField(
+        null=True, blank=True, help_text="When the client cancelled the submission"
+    )
+
+    class Meta:
+        db_table = "edit_task_submissions"
+        ordering = ["created_at"]
+
+    def __str__(self):
+        return f"EditTaskSubmission for EditTask {self.edit_task_id}"
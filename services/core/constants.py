@@ -13,11 +13,201 @@ UNCHANGED_MARKER = "<UNCHANGED>"
 # Each batch processes multiple paragraphs to reduce task creation overhead
 DEFAULT_WORKER_CONCURRENCY = int(os.environ.get("CELERY_WORKER_CONCURRENCY", "1"))
 
+# Upper bound for the adaptive number of concurrent LLM requests per edit task.
+# The actual window starts at half of this and adapts to provider pushback.
+DEFAULT_MAX_CONCURRENT_REQUESTS = int(
+    os.environ.get("LLM_MAX_CONCURRENT_REQUESTS", "8")
+)
+
+# Cap on LLM requests in flight across all edits running in one worker process;
+# 0 leaves requests unlimited. The async worker runs many edits on one event
+# loop and sets this so their combined requests stay bounded.
+LLM_MAX_IN_FLIGHT_REQUESTS = int(os.environ.get("LLM_MAX_IN_FLIGHT_REQUESTS", "0"))
+
 # Paragraph batching configuration
 # Number of paragraphs to process in each Celery task
 # Reduces task creation overhead while maintaining parallelism
 DEFAULT_PARAGRAPH_BATCH_SIZE = int(os.environ.get("CELERY_PARAGRAPH_BATCH_SIZE", "3"))
 
+# Whether each batch is edited with a single packed LLM prompt instead of one
+# request per paragraph. Malformed parts of a packed response fall back to
+# single-paragraph requests.
+DEFAULT_PACK_PARAGRAPHS = (
+    os.environ.get("CELERY_PACK_PARAGRAPHS", "false").lower() == "true"
+)
+
+# Stream single-paragraph LLM responses so generation can stop as soon as the
+# output is known to be unchanged or unusable
+LLM_STREAM_RESPONSES = os.environ.get("LLM_STREAM_RESPONSES", "true").lower() == "true"
+
+# Hedged requests: once a request outlives this percentile of recent latencies
+# for its provider and model, a duplicate is sent and the first to finish wins.
+# Hedges are capped at LLM_HEDGE_MAX_RATIO of all requests.
+LLM_HEDGE_REQUESTS = os.environ.get("LLM_HEDGE_REQUESTS", "false").lower() == "true"
+LLM_HEDGE_PERCENTILE = float(os.environ.get("LLM_HEDGE_PERCENTILE", "0.9"))
+LLM_HEDGE_MAX_RATIO = float(os.environ.get("LLM_HEDGE_MAX_RATIO", "0.05"))
+
+# LLM response cache configuration
+# Backend for caching raw LLM output per paragraph: "redis" (shared by all
+# workers), "memory" (per worker process) or "none" to disable caching
+LLM_RESPONSE_CACHE_BACKEND = os.environ.get("LLM_RESPONSE_CACHE_BACKEND", "redis")
+LLM_RESPONSE_CACHE_TTL_SECONDS = int(
+    os.environ.get("LLM_RESPONSE_CACHE_TTL_SECONDS", "604800")  # 7 days
+)
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(
+    os.environ.get("LLM_RESPONSE_CACHE_MAX_ENTRIES", "10000")
+)
+
+# LLM rate limiting configuration
+# Backend for the token buckets shared by requests using the same provider and
+# API key: "redis" (shared by all workers), "memory" (per worker process) or
+# "none" to disable rate limiting
+LLM_RATE_LIMIT_BACKEND = os.environ.get("LLM_RATE_LIMIT_BACKEND", "redis")
+# Optional overrides applied to every provider; 0 keeps the provider defaults
+LLM_RATE_LIMIT_REQUESTS_PER_MINUTE = int(
+    os.environ.get("LLM_RATE_LIMIT_REQUESTS_PER_MINUTE", "0")
+)
+LLM_RATE_LIMIT_TOKENS_PER_MINUTE = int(
+    os.environ.get("LLM_RATE_LIMIT_TOKENS_PER_MINUTE", "0")
+)
+# Default (requests per minute, tokens per minute) per provider, based on the
+# entry-level paid tiers of each provider
+PROVIDER_RATE_LIMITS = {
+    "google": (1000, 1_000_000),
+    "openai": (500, 200_000),
+    "anthropic": (50, 50_000),
+    "mistral": (60, 500_000),
+    "perplexity": (50, 1_000_000),
+    # Effectively unlimited, so load tests measure the rest of the pipeline
+    "fake": (100_000, 100_000_000),
+}
+
+# Retries of transient LLM errors back off exponentially with full jitter,
+# unless the provider says how long to wait with Retry-After
+LLM_RETRY_MAX_ATTEMPTS = int(os.environ.get("LLM_RETRY_MAX_ATTEMPTS", "3"))
+LLM_RETRY_BASE_DELAY_SECONDS = float(
+    os.environ.get("LLM_RETRY_BASE_DELAY_SECONDS", "1.0")
+)
+LLM_RETRY_MAX_DELAY_SECONDS = float(os.environ.get("LLM_RETRY_MAX_DELAY_SECONDS", "30"))
+# Circuit breaker per provider and API key: opens after this many transient
+# errors within the window, then fails requests fast until one probe request
+# succeeds after the reset timeout. A threshold of 0 disables it.
+LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+    os.environ.get("LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD", "10")
+)
+LLM_CIRCUIT_BREAKER_WINDOW_SECONDS = float(
+    os.environ.get("LLM_CIRCUIT_BREAKER_WINDOW_SECONDS", "30")
+)
+LLM_CIRCUIT_BREAKER_RESET_SECONDS = float(
+    os.environ.get("LLM_CIRCUIT_BREAKER_RESET_SECONDS", "20")
+)
+
+# LLM client pool: clients are reused across tasks in a worker process, keyed
+# by provider, model and API key hash. A size of 0 disables pooling.
+LLM_CLIENT_POOL_MAX_SIZE = int(os.environ.get("LLM_CLIENT_POOL_MAX_SIZE", "16"))
+LLM_CLIENT_POOL_IDLE_SECONDS = float(
+    os.environ.get("LLM_CLIENT_POOL_IDLE_SECONDS", "600")
+)
+
+# Time limits: every LLM request is bounded by LLM_REQUEST_TIMEOUT_SECONDS, a
+# paragraph (including its retries and validation) by PARAGRAPH_TIMEOUT_SECONDS
+# (a packed call by that much per paragraph it carries) and an edit by
+# TASK_DEADLINE_SECONDS. Paragraphs that run out of time are
+# cancelled and reported as TIMED_OUT, and the task completes with the rest.
+# 0 disables the paragraph and task limits.
+LLM_REQUEST_TIMEOUT_SECONDS = float(os.environ.get("LLM_REQUEST_TIMEOUT_SECONDS", "60"))
+PARAGRAPH_TIMEOUT_SECONDS = float(os.environ.get("PARAGRAPH_TIMEOUT_SECONDS", "180"))
+TASK_DEADLINE_SECONDS = float(os.environ.get("TASK_DEADLINE_SECONDS", "1200"))
+
+# Progress updates for the same task are coalesced: after a write, further
+# paragraph phase changes are held for this many seconds and then written
+# together. 0 writes every change immediately.
+PROGRESS_FLUSH_INTERVAL_SECONDS = float(
+    os.environ.get("PROGRESS_FLUSH_INTERVAL_SECONDS", "1.0")
+)
+
+# Live progress of running tasks: "redis" keeps it in a hash per task that the
+# results endpoint reads, "memory" keeps it per process (tests and single-process
+# setups only) and "none" writes it straight to the EditTask row. The final
+# progress is copied to the EditTask row when the task finishes.
+PROGRESS_STORE_BACKEND = os.environ.get("PROGRESS_STORE_BACKEND", "redis")
+PROGRESS_STORE_TTL_SECONDS = int(
+    os.environ.get("PROGRESS_STORE_TTL_SECONDS", "86400")  # 1 day
+)
+
+# Task events (progress deltas, finished paragraphs, completion) are published
+# for the results stream endpoint: "redis" uses pub/sub, "memory" only reaches
+# subscribers in the same process (tests) and "none" publishes nothing, so
+# streams fall back to checking the task status on every heartbeat.
+TASK_EVENTS_BACKEND = os.environ.get("TASK_EVENTS_BACKEND", "redis")
+# Seconds between keep-alive comments (and task status checks) on idle streams
+TASK_EVENTS_HEARTBEAT_SECONDS = float(
+    os.environ.get("TASK_EVENTS_HEARTBEAT_SECONDS", "15")
+)
+
+# Identical edit submissions (same article, section, editing mode and provider)
+# made while a matching task is queued or running attach to that task instead of
+# starting another: "redis" shares the registry of in-flight tasks across web
+# processes, "memory" keeps it per process (tests) and "none" disables it.
+TASK_COALESCING_BACKEND = os.environ.get("TASK_COALESCING_BACKEND", "redis")
+# Registry entries expire after this many seconds even if their task never ends
+TASK_COALESCING_TTL_SECONDS = int(os.environ.get("TASK_COALESCING_TTL_SECONDS", "3600"))
+
+# Cancelling a running task sets a flag its worker polls for, and the worker
+# then cancels the task's outstanding LLM calls: "redis" shares the flags
+# between web and worker processes, "memory" keeps them per process (tests) and
+# "none" only stops tasks that have not started yet.
+TASK_CANCELLATION_BACKEND = os.environ.get("TASK_CANCELLATION_BACKEND", "redis")
+# Seconds between checks of the cancellation flag while a task runs
+TASK_CANCELLATION_POLL_SECONDS = float(
+    os.environ.get("TASK_CANCELLATION_POLL_SECONDS", "1.0")
+)
+
+# Edit tasks are acknowledged late, so a task whose worker is lost is delivered
+# again. A task started this many times without finishing, as when it keeps
+# running its worker out of memory, is marked failed instead of running again
+# (0 = no limit).
+MAX_TASK_DELIVERIES = int(os.environ.get("MAX_TASK_DELIVERIES", "3"))
+
+# Submissions look up the article's current revision and, when a task with the
+# same editing parameters already finished at that revision, get its result
+# instead of starting a new task. Requests can opt out with "force".
+RESULT_CACHE_ENABLED = os.environ.get("RESULT_CACHE_ENABLED", "true").lower() == "true"
+
+# Section edits reuse the results of paragraphs that are unchanged since the
+# section's last completed edit with the same mode, model and prompt version,
+# and only send new or modified paragraphs to the LLM. "force" and
+# "bypass_cache" requests edit every paragraph again.
+INCREMENTAL_EDITS_ENABLED = (
+    os.environ.get("INCREMENTAL_EDITS_ENABLED", "true").lower() == "true"
+)
+
+# Shortest job first: before a section edit is queued, its paragraphs to edit
+# and their characters are counted from a parse of the section, and the task is
+# routed to the queue for small edits or the one for large edits. Workers take
+# small edits first; once large edits have waited EDIT_QUEUE_AGING_SECONDS, one
+# of them goes ahead of the small ones, so large edits are never starved.
+EDIT_QUEUE_ROUTING_ENABLED = (
+    os.environ.get("EDIT_QUEUE_ROUTING_ENABLED", "true").lower() == "true"
+)
+SMALL_EDIT_MAX_PARAGRAPHS = int(os.environ.get("SMALL_EDIT_MAX_PARAGRAPHS", "20"))
+SMALL_EDIT_MAX_CHARACTERS = int(os.environ.get("SMALL_EDIT_MAX_CHARACTERS", "20000"))
+EDIT_QUEUE_AGING_SECONDS = float(os.environ.get("EDIT_QUEUE_AGING_SECONDS", "30"))
+
+# Fake LLM provider for load testing without API keys. Requests select it with
+# the X-Fake-LLM-Profile header, which is ignored unless the provider is enabled.
+LLM_FAKE_PROVIDER_ENABLED = (
+    os.environ.get("LLM_FAKE_PROVIDER_ENABLED", "false").lower() == "true"
+)
+# Profile used when the header is empty: a preset name or a JSON profile
+LLM_FAKE_PROFILE = os.environ.get("LLM_FAKE_PROFILE", "instant")
+# JSON file mapping paragraph text to responses for the "recorded" mode
+LLM_FAKE_RECORDINGS_PATH = os.environ.get("LLM_FAKE_RECORDINGS_PATH", "")
+
+# Prompt caching: the static system prompt is cached automatically by OpenAI and
+# Gemini, while these providers only cache prefixes marked with cache_control
+PROMPT_CACHE_CONTROL_PROVIDERS = {"anthropic"}
+
 # Wiki markup prefixes that indicate non-prose content
 NON_PROSE_PREFIXES = {
     "==",  # Headers
@@ -71,6 +261,7 @@ class LLMProvider(Enum):
     ANTHROPIC = "anthropic"
     MISTRAL = "mistral"
     PERPLEXITY = "perplexity"
+    FAKE = "fake"
 
 
 class GeminiModel(Enum):
@@ -99,3 +290,4 @@ DEFAULT_OPENAI_MODEL = OpenAIModel.GPT_4O_MINI.value
 DEFAULT_ANTHROPIC_MODEL = AnthropicModel.CLAUDE_3_5_HAIKU.value
 DEFAULT_MISTRAL_MODEL = MistralModel.MISTRAL_SMALL.value
 DEFAULT_PERPLEXITY_MODEL = PerplexityModel.LLAMA_3_1_SONAR_SMALL.value
+DEFAULT_FAKE_MODEL = "fake-editor"
@@ -4,6 +4,7 @@ This module defines the core interfaces that all components should implement, fo
 the Dependency Inversion Principle.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
@@ -16,6 +17,8 @@ class ParagraphProcessingResult:
     success: bool
     content: str
     failure_reason: Optional[str] = None
+    # Set when the paragraph ran out of time rather than failing validation
+    timed_out: bool = False
 
 
 @dataclass
@@ -38,6 +41,19 @@ class IParagraphProcessor(ABC):
     ) -> ParagraphProcessingResult:
         """Process a single paragraph."""
 
+    async def process_packed(
+        self, items: List[Tuple[str, ValidationContext]]
+    ) -> List[ParagraphProcessingResult]:
+        """Process several paragraphs, sharing LLM calls where supported.
+
+        The default implementation processes each paragraph on its own.
+        """
+        return list(
+            await asyncio.gather(
+                *[self.process(content, context) for content, context in items]
+            )
+        )
+
 
 class IReferenceHandler(ABC):
     """Interface for handling references."""
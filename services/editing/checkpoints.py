@@ -0,0 +1,87 @@
+"""Paragraph checkpoints for resuming interrupted edit tasks and re-edits.
+
+Running tasks save every paragraph result to ``EditTask.partial_results`` as it
+finishes. When a worker is lost mid-task and the message is redelivered, those
+results become checkpoints: paragraphs whose position and content are
+unchanged are restored instead of being sent to the LLM again.
+
+When a section is edited again, usually after a new revision of the article,
+the results of its last completed edit become checkpoints too. They are keyed by
+content alone, since added or removed paragraphs shift the positions of the
+ones that did not change.
+"""
+
+import hashlib
+from typing import Dict, Iterable, Optional
+
+# Paragraphs with these statuses are edited again rather than restored
+RETRIED_STATUSES = frozenset({"ERRORED", "TIMED_OUT"})
+
+
+def paragraph_checkpoint_key(document_index: int, content: str) -> str:
+    """Return the checkpoint key of a document item.
+
+    Args:
+        document_index: Position of the item in the edited document
+        content: The item's original content
+
+    Returns:
+        A hash identifying the item's position and content
+    """
+    return hashlib.sha256(f"{document_index}\n{content}".encode()).hexdigest()
+
+
+def paragraph_content_key(content: str) -> str:
+    """Return the checkpoint key of a paragraph's content at any position.
+
+    Whitespace is normalized, so paragraphs that only differ in spacing or line
+    breaks share a key.
+
+    Args:
+        content: The paragraph's original content
+
+    Returns:
+        A hash identifying the paragraph's content
+    """
+    normalized = " ".join(content.split())
+    return hashlib.sha256(f"content\n{normalized}".encode()).hexdigest()
+
+
+def checkpoints_from_partial_results(
+    partial_results: Optional[Iterable[dict]],
+) -> Dict[str, dict]:
+    """Build checkpoints from the paragraph results saved by an earlier attempt.
+
+    Args:
+        partial_results: Paragraph result dictionaries with their document
+            ``index``, as saved to ``EditTask.partial_results``
+
+    Returns:
+        Paragraph results by checkpoint key, leaving out errored and timed out
+        paragraphs
+    """
+    checkpoints = {}
+    for paragraph in partial_results or []:
+        if paragraph.get("status") in RETRIED_STATUSES:
+            continue
+        key = paragraph_checkpoint_key(paragraph["index"], paragraph["before"])
+        checkpoints[key] = paragraph
+    return checkpoints
+
+
+def checkpoints_from_previous_edit(result: Optional[dict]) -> Dict[str, dict]:
+    """Build checkpoints from the result of an earlier edit of the same section.
+
+    Args:
+        result: The result stored on the earlier task's ``EditTask.result``
+
+    Returns:
+        Paragraph results by content key, leaving out errored and timed out
+        paragraphs
+    """
+    checkpoints = {}
+    for paragraph in (result or {}).get("paragraphs", []):
+        if paragraph.get("status") in RETRIED_STATUSES:
+            continue
+        checkpoints[paragraph_content_key(paragraph["before"])] = paragraph
+    return checkpoints
@@ -6,20 +6,42 @@ the Single Responsibility Principle.
 
 import asyncio
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
-
-from asgiref.sync import sync_to_async
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-from services.core.constants import DEFAULT_WORKER_CONCURRENCY
+from services.core.constants import DEFAULT_MAX_CONCURRENT_REQUESTS
 from services.core.interfaces import (
     IContentClassifier,
     IDocumentProcessor,
     IParagraphProcessor,
     IReferenceHandler,
     IReversionTracker,
+    ParagraphProcessingResult,
     ValidationContext,
 )
+from services.editing.checkpoints import (
+    paragraph_checkpoint_key,
+    paragraph_content_key,
+)
+from services.llm.concurrency import AdaptiveConcurrencyLimiter
 from services.tracking.progress_tracker import EnhancedProgressTracker
+from services.tracking.progress_writer import ProgressWriter
+
+T = TypeVar("T")
+
+
+class ParagraphTimeoutError(Exception):
+    """Raised for paragraphs that ran out of time before they were edited."""
 
 
 @dataclass
@@ -61,7 +83,8 @@ class ParagraphResult:
 
     before: str
     after: str
-    status: str  # 'UNCHANGED' | 'CHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED'
+    # 'UNCHANGED' | 'CHANGED' | 'REJECTED' | 'SKIPPED' | 'ERRORED' | 'TIMED_OUT'
+    status: str
     status_details: str  # Explanation of why the edit had this status
 
 
@@ -78,19 +101,40 @@ class EditOrchestrator:
         content_classifier: IContentClassifier,
         reversion_tracker: IReversionTracker,
         reference_handler: IReferenceHandler,
-        max_concurrent_requests: int = DEFAULT_WORKER_CONCURRENCY,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        pack_paragraphs: bool = False,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        progress_flush_interval_seconds: float = 0.0,
+        paragraph_timeout_seconds: float = 0.0,
+        task_deadline_seconds: float = 0.0,
     ):
         self.document_processor = document_processor
         self.content_classifier = content_classifier
         self.reversion_tracker = reversion_tracker
         self.reference_handler = reference_handler
 
-        # Note: max_concurrent_requests parameter is kept for backward compatibility
-        # but LLM rate limiting is now handled by LangChain and the providers
+        # Paragraph processing is bounded by an adaptive window of at most
+        # max_concurrent_requests LLM requests in flight
+        self.concurrency_limiter = concurrency_limiter or AdaptiveConcurrencyLimiter(
+            max_limit=max_concurrent_requests
+        )
+
+        # When enabled, each batch is edited with a single packed LLM prompt
+        self.pack_paragraphs = pack_paragraphs
 
         # Enhanced progress tracking
         self._progress_tracker: Optional[EnhancedProgressTracker] = None
         self._enhanced_progress_callback: Optional[Callable] = None
+        # Progress changes within this interval are written together
+        self.progress_flush_interval_seconds = progress_flush_interval_seconds
+        self._progress_writer: Optional[ProgressWriter] = None
+
+        # Time limits for editing one paragraph (or packed batch) and for a
+        # whole streamed edit; 0 means no limit
+        self.paragraph_timeout_seconds = paragraph_timeout_seconds
+        self.task_deadline_seconds = task_deadline_seconds
+        # Loop time by which an orchestrate_* call stops editing, if limited
+        self._task_deadline: Optional[float] = None
 
     async def orchestrate_edit_structured(
         self,
@@ -104,19 +148,18 @@ class EditOrchestrator:
 
         # Initialize enhanced progress tracking if callback provided
         if enhanced_progress_callback:
-            self._progress_tracker = EnhancedProgressTracker(len(edit_tasks))
-            self._enhanced_progress_callback = enhanced_progress_callback
-            # Send initial progress update
-            await sync_to_async(enhanced_progress_callback)(
-                self._progress_tracker.get_progress_data()
+            await self._start_progress_tracking(
+                len(edit_tasks), enhanced_progress_callback
             )
 
+        self._start_task_deadline()
         paragraph_results = await self._process_and_create_results(
             edit_tasks,
             skipped_items,
             document_items,
             paragraph_processor,
         )
+        await self._finish_progress_tracking()
         self._display_summary()
         return paragraph_results
 
@@ -129,6 +172,9 @@ class EditOrchestrator:
     ) -> List[ParagraphResult]:
         """Orchestrate editing with batched paragraph processing to reduce task overhead.
 
+        When the orchestrator was created with ``pack_paragraphs`` enabled, each
+        batch is handed to the paragraph processor as one packed request.
+
         Args:
             text: The text to edit
             paragraph_processor: The processor to use for paragraph editing
@@ -144,13 +190,11 @@ class EditOrchestrator:
 
         # Initialize enhanced progress tracking if callback provided
         if enhanced_progress_callback:
-            self._progress_tracker = EnhancedProgressTracker(len(edit_tasks))
-            self._enhanced_progress_callback = enhanced_progress_callback
-            # Send initial progress update
-            await sync_to_async(enhanced_progress_callback)(
-                self._progress_tracker.get_progress_data()
+            await self._start_progress_tracking(
+                len(edit_tasks), enhanced_progress_callback
             )
 
+        self._start_task_deadline()
         paragraph_results = await self._process_and_create_results_batched(
             edit_tasks,
             skipped_items,
@@ -158,11 +202,274 @@ class EditOrchestrator:
             paragraph_processor,
             batch_size,
         )
+        await self._finish_progress_tracking()
         self._display_summary()
         return paragraph_results
 
+    async def iter_edit_structured_batched(
+        self,
+        text: str,
+        paragraph_processor: IParagraphProcessor,
+        enhanced_progress_callback=None,
+        batch_size: int = 5,
+        checkpoints: Optional[Mapping[str, dict]] = None,
+    ) -> AsyncGenerator[Tuple[int, ParagraphResult], None]:
+        """Edit like ``orchestrate_edit_structured_batched``, yielding each result early.
+
+        Skipped items are yielded first, then paragraphs restored from
+        checkpoints, then edited paragraphs in the order they finish, so callers
+        can use completed paragraphs while slower ones are still with the LLM.
+        Closing the generator early cancels unfinished edits. Paragraphs still
+        being edited when the task deadline passes are cancelled and yielded as
+        TIMED_OUT.
+
+        Args:
+            text: The text to edit
+            paragraph_processor: The processor to use for paragraph editing
+            enhanced_progress_callback: Optional callback for progress updates
+            batch_size: Number of paragraphs per packed request, when packing
+            checkpoints: Paragraph results of an earlier attempt or edit by
+                checkpoint key; paragraphs found here are not edited again
+
+        Yields:
+            Pairs of document item index and its ParagraphResult; every item of
+            the document is yielded exactly once
+        """
+        self._reset_tracking()
+        document_items = self._parse_document_structure(text)
+        edit_tasks, skipped_items = self._analyze_and_create_edit_tasks(document_items)
+
+        if enhanced_progress_callback:
+            await self._start_progress_tracking(
+                len(edit_tasks), enhanced_progress_callback
+            )
+
+        for skipped_item in skipped_items:
+            yield (
+                skipped_item.document_index,
+                self._create_result_for_skipped_item(skipped_item),
+            )
+
+        restored_results, edit_tasks = self._restore_checkpointed_tasks(
+            edit_tasks, document_items, checkpoints or {}
+        )
+        for task, paragraph_result in restored_results:
+            await self._update_progress(task.prose_index, "started", task.content)
+            await self._update_progress(
+                task.prose_index, "complete", status=paragraph_result.status
+            )
+            yield task.document_index, paragraph_result
+
+        # Packed batches finish together; otherwise every paragraph is its own unit
+        unit_size = batch_size if self.pack_paragraphs else 1
+        units: Dict[asyncio.Future, List[EditTask]] = {
+            asyncio.ensure_future(
+                self._run_work_unit(unit_tasks, paragraph_processor)
+            ): unit_tasks
+            for unit_tasks in (
+                edit_tasks[i : i + unit_size]
+                for i in range(0, len(edit_tasks), max(1, unit_size))
+            )
+        }
+        try:
+            async for unit_tasks, edit_results in self._iter_finished_units(units):
+                for task, edit_result in zip(unit_tasks, edit_results, strict=True):
+                    yield (
+                        task.document_index,
+                        self._create_result_for_processed_item(
+                            document_items[task.document_index], edit_result
+                        ),
+                    )
+        finally:
+            for unit in units:
+                if not unit.done():
+                    unit.cancel()
+            if self._progress_writer is not None:
+                self._progress_writer.cancel()
+
+        await self._finish_progress_tracking()
+        self._display_summary()
+
+    async def _iter_finished_units(
+        self, units: Dict[asyncio.Future, List[EditTask]]
+    ) -> AsyncIterator[Tuple[List[EditTask], List[EditResult]]]:
+        """Yield work units as they finish until the task deadline passes.
+
+        Units that finish together are yielded in document order. Units still
+        running at the deadline are cancelled and yielded as timed out.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self.task_deadline_seconds
+            if self.task_deadline_seconds
+            else None
+        )
+        order = {unit: position for position, unit in enumerate(units)}
+        pending = set(units)
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for unit in sorted(done, key=order.__getitem__):
+                yield unit.result()
+
+        for unit in sorted(pending, key=order.__getitem__):
+            unit.cancel()
+            yield await self._time_out_unit(units[unit])
+
+    async def _time_out_unit(
+        self, unit_tasks: List[EditTask]
+    ) -> Tuple[List[EditTask], List[EditResult]]:
+        """Report the paragraphs of a unit cancelled at the task deadline."""
+        error = self._task_deadline_error()
+        for task in unit_tasks:
+            await self._update_progress(
+                task.prose_index, "complete", status="TIMED_OUT"
+            )
+        return unit_tasks, [
+            EditResult(success=False, content=task.content, error=error)
+            for task in unit_tasks
+        ]
+
+    def _task_deadline_error(self) -> ParagraphTimeoutError:
+        """Return the error of a paragraph left unedited at the task deadline."""
+        return ParagraphTimeoutError(
+            "Task ran out of time before the paragraph was edited "
+            f"({self.task_deadline_seconds:g} second limit)"
+        )
+
+    def _start_task_deadline(self) -> None:
+        """Start the time budget of an orchestrate_* call, if it has one.
+
+        Those calls return every result together, so instead of cancelling
+        unfinished units as ``_iter_finished_units`` does, each paragraph is
+        only given the time left before the deadline.
+        """
+        self._task_deadline = (
+            asyncio.get_running_loop().time() + self.task_deadline_seconds
+            if self.task_deadline_seconds
+            else None
+        )
+
+    async def _with_paragraph_timeout(
+        self, awaitable: Awaitable[T], paragraphs: int = 1
+    ) -> T:
+        """Await the editing of a paragraph or packed batch within its time limit.
+
+        The limit is the paragraph time limit times ``paragraphs``, or the time
+        left before the task deadline when that is sooner.
+
+        Raises:
+            ParagraphTimeoutError: If editing takes longer than the limit
+        """
+        timeout = self.paragraph_timeout_seconds * paragraphs or None
+        error = ParagraphTimeoutError(
+            "Paragraph was not edited within "
+            f"{self.paragraph_timeout_seconds * paragraphs:g} seconds"
+        )
+        if self._task_deadline is not None:
+            time_left = max(
+                0.0, self._task_deadline - asyncio.get_running_loop().time()
+            )
+            if timeout is None or time_left < timeout:
+                timeout, error = time_left, self._task_deadline_error()
+        if timeout is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError as e:
+            raise error from e
+
+    async def _run_work_unit(
+        self, unit_tasks: List[EditTask], paragraph_processor: IParagraphProcessor
+    ) -> Tuple[List[EditTask], List[EditResult]]:
+        """Edit one paragraph, or one packed batch, turning failures into results."""
+        try:
+            if len(unit_tasks) > 1:
+                edit_results = await self._process_packed_batch(
+                    unit_tasks, paragraph_processor
+                )
+            else:
+                edit_results = [
+                    await self._process_single_task(unit_tasks[0], paragraph_processor)
+                ]
+        except Exception as e:
+            edit_results = [
+                EditResult(success=False, content=task.content, error=e)
+                for task in unit_tasks
+            ]
+        return unit_tasks, edit_results
+
+    def _restore_checkpointed_tasks(
+        self,
+        edit_tasks: List[EditTask],
+        document_items: List[str],
+        checkpoints: Mapping[str, dict],
+    ) -> Tuple[List[Tuple[EditTask, ParagraphResult]], List[EditTask]]:
+        """Split tasks into those restored from checkpoints and those still to edit.
+
+        A checkpoint for the paragraph's position is preferred over one that only
+        matches its content.
+        """
+        restored_results = []
+        remaining_tasks = []
+        for task in edit_tasks:
+            item = document_items[task.document_index]
+            checkpoint = checkpoints.get(
+                paragraph_checkpoint_key(task.document_index, item)
+            ) or checkpoints.get(paragraph_content_key(item))
+            if checkpoint is None:
+                remaining_tasks.append(task)
+                continue
+            # A paragraph that was left as it was keeps its current whitespace
+            after = checkpoint["after"]
+            if after == checkpoint["before"]:
+                after = item
+            restored_results.append(
+                (
+                    task,
+                    ParagraphResult(
+                        before=item,
+                        after=after,
+                        status=checkpoint["status"],
+                        status_details=checkpoint["status_details"],
+                    ),
+                )
+            )
+        return restored_results, remaining_tasks
+
     def _reset_tracking(self):
         self.reversion_tracker.reset()
+        self._task_deadline = None
+
+    async def _start_progress_tracking(
+        self, total_paragraphs: int, enhanced_progress_callback: Callable
+    ) -> None:
+        """Start tracking progress for a run and send the initial progress."""
+        self._progress_tracker = EnhancedProgressTracker(total_paragraphs)
+        self._enhanced_progress_callback = enhanced_progress_callback
+        self._progress_writer = None
+        await self._get_progress_writer().flush()
+
+    async def _finish_progress_tracking(self) -> None:
+        """Write any progress changes still held back by the writer."""
+        if self._progress_writer is not None:
+            await self._progress_writer.close()
+
+    def _get_progress_writer(self) -> ProgressWriter:
+        """Return the writer for the current tracker and callback."""
+        if self._progress_writer is None:
+            assert self._progress_tracker is not None
+            assert self._enhanced_progress_callback is not None
+            self._progress_writer = ProgressWriter(
+                self._progress_tracker,
+                self._enhanced_progress_callback,
+                interval_seconds=self.progress_flush_interval_seconds,
+            )
+        return self._progress_writer
 
     def _parse_document_structure(self, text):
         try:
@@ -200,8 +507,12 @@ class EditOrchestrator:
                 status_details=status_details,
             )
         else:
-            # This is a processed item that failed - could be rejected or errored
-            if edit_result.error:
+            # This is a processed item that failed - could be rejected, errored
+            # or timed out
+            if isinstance(edit_result.error, ParagraphTimeoutError):
+                status = "TIMED_OUT"
+                status_details = str(edit_result.error)
+            elif edit_result.error:
                 status = "ERRORED"
                 status_details = (
                     f"Error during task processing: {type(edit_result.error).__name__}"
@@ -335,6 +646,9 @@ class EditOrchestrator:
         self, batch_tasks, paragraph_processor: IParagraphProcessor
     ):
         """Process a single batch of edit tasks."""
+        if self.pack_paragraphs and len(batch_tasks) > 1:
+            return await self._process_packed_batch(batch_tasks, paragraph_processor)
+
         # Create a coroutine for each task in the batch
         coroutines = [
             self._process_single_task(task, paragraph_processor)
@@ -352,6 +666,42 @@ class EditOrchestrator:
                 processed_results.append(result)
         return processed_results
 
+    async def _process_packed_batch(
+        self, batch_tasks, paragraph_processor: IParagraphProcessor
+    ) -> List[EditResult]:
+        """Process a batch of edit tasks with one packed paragraph processor call."""
+        items = []
+        for task in batch_tasks:
+            await self._update_progress(task.prose_index, "started", task.content)
+            items.append((task.content, self._create_validation_context(task)))
+
+        try:
+            async with self.concurrency_limiter.slot():
+                for task in batch_tasks:
+                    await self._update_progress(task.prose_index, "llm_processing")
+                # The packed call gets the time of every paragraph it carries and
+                # its single-paragraph fallbacks one more; the processor times
+                # out each paragraph on its own within that
+                process_results = await self._with_paragraph_timeout(
+                    paragraph_processor.process_packed(items),
+                    paragraphs=len(items) + 1,
+                )
+        except Exception as e:
+            for task in batch_tasks:
+                await self._update_progress(
+                    task.prose_index, "complete", status=self._failure_status(e)
+                )
+            return [
+                EditResult(success=False, content=task.content, error=e)
+                for task in batch_tasks
+            ]
+
+        edit_results = []
+        for task, process_result in zip(batch_tasks, process_results, strict=True):
+            await self._update_progress(task.prose_index, "post_processing")
+            edit_results.append(await self._complete_task(task, process_result))
+        return edit_results
+
     def _create_paragraph_results(
         self, document_items, edit_result_map, skipped_item_map
     ):
@@ -464,33 +814,61 @@ class EditOrchestrator:
     ) -> EditResult:
         """Process a single edit task with enhanced progress tracking."""
         try:
-            await self._update_progress(task.prose_index, "started", task.content)
-            context = self._create_validation_context(task)
-
-            await self._update_progress(task.prose_index, "llm_processing")
-            process_result = await paragraph_processor.process(task.content, context)
+            # Paragraphs waiting for a slot in the concurrency window stay pending
+            async with self.concurrency_limiter.slot():
+                await self._update_progress(task.prose_index, "started", task.content)
+                context = self._create_validation_context(task)
+
+                await self._update_progress(task.prose_index, "llm_processing")
+                process_result = await self._with_paragraph_timeout(
+                    paragraph_processor.process(task.content, context)
+                )
 
             await self._update_progress(task.prose_index, "post_processing")
 
-            if process_result.success:
-                status = (
-                    "CHANGED" if process_result.content != task.content else "UNCHANGED"
-                )
-                await self._update_progress(task.prose_index, "complete", status=status)
-                return EditResult(success=True, content=process_result.content)
-            else:
-                await self._update_progress(
-                    task.prose_index, "complete", status="REJECTED"
-                )
-                return EditResult(
-                    success=False,
-                    content=task.content,
-                    failure_reason=process_result.failure_reason,
-                )
+            return await self._complete_task(task, process_result)
         except Exception as e:
-            await self._update_progress(task.prose_index, "complete", status="ERRORED")
+            await self._update_progress(
+                task.prose_index, "complete", status=self._failure_status(e)
+            )
             return EditResult(success=False, content=task.content, error=e)
 
+    @staticmethod
+    def _failure_status(error: BaseException) -> str:
+        """Return the paragraph status for an edit that raised ``error``."""
+        if isinstance(error, ParagraphTimeoutError):
+            return "TIMED_OUT"
+        return "ERRORED"
+
+    async def _complete_task(
+        self, task: EditTask, process_result: ParagraphProcessingResult
+    ) -> EditResult:
+        """Record a task's final progress status and convert its processing result."""
+        if process_result.success:
+            status = (
+                "CHANGED" if process_result.content != task.content else "UNCHANGED"
+            )
+            await self._update_progress(task.prose_index, "complete", status=status)
+            return EditResult(success=True, content=process_result.content)
+        elif process_result.timed_out:
+            await self._update_progress(
+                task.prose_index, "complete", status="TIMED_OUT"
+            )
+            return EditResult(
+                success=False,
+                content=task.content,
+                error=ParagraphTimeoutError(process_result.failure_reason),
+            )
+        else:
+            await self._update_progress(
+                task.prose_index, "complete", status="REJECTED"
+            )
+            return EditResult(
+                success=False,
+                content=task.content,
+                failure_reason=process_result.failure_reason,
+            )
+
     async def _update_progress(
         self,
         prose_index: int,
@@ -511,10 +889,10 @@ class EditOrchestrator:
         elif stage == "complete" and status is not None:
             self._progress_tracker.mark_paragraph_complete(prose_index, status)
 
+        self._progress_tracker.set_concurrency_window(self.concurrency_limiter.limit)
+
         if self._enhanced_progress_callback:
-            await sync_to_async(self._enhanced_progress_callback)(
-                self._progress_tracker.get_progress_data()
-            )
+            await self._get_progress_writer().update()
 
     def _create_validation_context(self, task: EditTask) -> ValidationContext:
         """Create a validation context for a given task."""
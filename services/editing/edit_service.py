@@ -1,10 +1,18 @@
 """WikiEditor class for orchestrating the wiki editing process."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
 
 from langchain_core.output_parsers import StrOutputParser
 
 from api.exceptions import ErrorSanitizer
+from services.core.constants import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    LLM_STREAM_RESPONSES,
+    PARAGRAPH_TIMEOUT_SECONDS,
+    PROGRESS_FLUSH_INTERVAL_SECONDS,
+    PROMPT_CACHE_CONTROL_PROVIDERS,
+    TASK_DEADLINE_SECONDS,
+)
 from services.core.factories import (
     ProcessorFactory,
     TrackerFactory,
@@ -19,6 +27,12 @@ from services.core.interfaces import (
 from services.document.classifier import ContentClassifier
 from services.editing.edit_orchestrator import EditOrchestrator, ParagraphResult
 from services.editing.paragraph_processor import ParagraphProcessor
+from services.llm.concurrency import AdaptiveConcurrencyLimiter, InFlightRequestLimit
+from services.llm.hedging import HedgingPolicy
+from services.llm.rate_limiter import RateLimiter, estimate_tokens
+from services.llm.response_cache import CacheScope, ResponseCache
+from services.llm.retry_policy import CircuitBreaker
+from services.llm.usage import UsageTracker
 from services.prompts.prompt_manager import PromptManager
 from services.utils.wikipedia_api import WikipediaAPI, WikipediaAPIError
 from services.validation.adapters import (
@@ -51,11 +65,43 @@ class WikiEditor:
         content_classifier: Optional[IContentClassifier] = None,
         reversion_tracker: Optional[IReversionTracker] = None,
         reference_handler: Optional[IReferenceHandler] = None,
+        response_cache: Optional[ResponseCache] = None,
+        llm_provider: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        pack_paragraphs: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        usage_tracker: Optional[UsageTracker] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        in_flight_request_limit: Optional[InFlightRequestLimit] = None,
     ):
-        """Initialize WikiEditor with dependency injection support."""
+        """Initialize WikiEditor with dependency injection support.
+
+        Responses are only cached when ``response_cache`` is given together with
+        the provider and model, since both are part of the cache key. With
+        ``pack_paragraphs`` enabled, batched edits send each batch of paragraphs
+        to the LLM in a single packed prompt. A ``rate_limiter`` makes every LLM
+        request wait for capacity shared with other users of the same API key,
+        and a ``hedging_policy`` duplicates requests that become stragglers.
+        Token and latency figures for every paragraph sent to the LLM, including
+        prompt cache hits, are recorded in ``usage_tracker`` when given. A
+        ``circuit_breaker`` shared by tasks using the same provider and API key
+        stops LLM requests early while that provider keeps failing, and an
+        ``in_flight_request_limit`` caps the LLM requests of every edit running
+        in the process.
+        """
         self.llm = llm
         self.verbose = verbose
         self.editing_mode = editing_mode
+        self.response_cache = response_cache
+        self.llm_provider = llm_provider
+        self.llm_model = llm_model
+        self.pack_paragraphs = pack_paragraphs
+        self.rate_limiter = rate_limiter
+        self.hedging_policy = hedging_policy
+        self.usage_tracker = usage_tracker
+        self.circuit_breaker = circuit_breaker
+        self.in_flight_request_limit = in_flight_request_limit
 
         self.reversion_tracker = (
             reversion_tracker or TrackerFactory.create_reversion_tracker()
@@ -78,9 +124,28 @@ class WikiEditor:
         self.post_processing_pipeline = self._build_post_processing_pipeline(validators)
         self.pre_processing_pipeline = self._build_pre_processing_pipeline()
 
-        prompt_manager = PromptManager()
+        prompt_manager = PromptManager(
+            cache_system_prompt=self.llm_provider in PROMPT_CACHE_CONTROL_PROVIDERS
+        )
         prompt_template = prompt_manager.get_template(self.editing_mode)
         self.chain = prompt_template | self.llm | StrOutputParser()
+        packed_prompt_template = prompt_manager.get_packed_template(self.editing_mode)
+        self.packed_chain = packed_prompt_template | self.llm | StrOutputParser()
+
+        cache_scope = None
+        if self.response_cache is not None and self.llm_provider and self.llm_model:
+            cache_scope = CacheScope(
+                editing_mode=self.editing_mode,
+                provider=self.llm_provider,
+                model=self.llm_model,
+                prompt_version=prompt_manager.get_template_version(self.editing_mode),
+            )
+
+        # Shared so the paragraph processor's provider requests, retries
+        # included, size the window the orchestrator schedules paragraphs with
+        concurrency_limiter = AdaptiveConcurrencyLimiter(
+            max_limit=DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
 
         self.paragraph_processor = ParagraphProcessor(
             llm_chain=self.chain,
@@ -88,6 +153,20 @@ class WikiEditor:
             post_processing_pipeline=self.post_processing_pipeline,
             reversion_tracker=self.reversion_tracker,
             reference_handler=self.reference_handler,
+            response_cache=self.response_cache,
+            cache_scope=cache_scope,
+            packed_llm_chain=self.packed_chain if self.pack_paragraphs else None,
+            rate_limiter=self.rate_limiter,
+            prompt_overhead_tokens=estimate_tokens(
+                prompt_manager.get_static_prompt_text(self.editing_mode)
+            ),
+            concurrency_limiter=concurrency_limiter,
+            stream_responses=LLM_STREAM_RESPONSES,
+            hedging_policy=self.hedging_policy,
+            usage_tracker=self.usage_tracker,
+            circuit_breaker=self.circuit_breaker,
+            in_flight_request_limit=self.in_flight_request_limit,
+            paragraph_timeout_seconds=PARAGRAPH_TIMEOUT_SECONDS,
         )
 
         self.orchestrator = EditOrchestrator(
@@ -95,6 +174,11 @@ class WikiEditor:
             content_classifier=self.content_classifier,
             reversion_tracker=self.reversion_tracker,
             reference_handler=self.reference_handler,
+            pack_paragraphs=self.pack_paragraphs,
+            concurrency_limiter=concurrency_limiter,
+            progress_flush_interval_seconds=PROGRESS_FLUSH_INTERVAL_SECONDS,
+            paragraph_timeout_seconds=PARAGRAPH_TIMEOUT_SECONDS,
+            task_deadline_seconds=TASK_DEADLINE_SECONDS,
         )
 
     def _build_pre_processing_pipeline(self) -> Any:
@@ -371,27 +455,9 @@ class WikiEditor:
             WikipediaAPIError: If the article cannot be fetched
             ValueError: If the section cannot be found
         """
-        if not article_title or not article_title.strip():
-            raise ValueError("Article title cannot be empty")
-
-        if not section_title or not section_title.strip():
-            raise ValueError("Section title cannot be empty")
-
-        # Initialize Wikipedia API client
-        wikipedia_api = WikipediaAPI(language=language)
-
-        # Fetch the article content
-        wikitext = await wikipedia_api.get_article_wikitext(article_title)
-
-        # Extract the specific section content
-        from services.utils.wiki_utils import extract_section_content
-
-        section_content = extract_section_content(wikitext, section_title)
-
-        if section_content is None:
-            raise ValueError(
-                f"Section '{section_title}' not found in article '{article_title}'"
-            )
+        section_content = await self._fetch_section_content(
+            article_title, section_title, language
+        )
 
         # Edit the section content using the structured edit method
         paragraph_results = await self.edit_wikitext_structured(
@@ -427,6 +493,122 @@ class WikiEditor:
             WikipediaAPIError: If the article cannot be fetched
             ValueError: If the section cannot be found
         """
+        section_content = await self._fetch_section_content(
+            article_title, section_title, language
+        )
+
+        # Edit the section content using the batched structured edit method
+        paragraph_results = await self.edit_wikitext_structured_batched(
+            section_content, enhanced_progress_callback, batch_size
+        )
+
+        return paragraph_results
+
+    async def stream_article_section_structured_batched(
+        self,
+        article_title: str,
+        section_title: str,
+        language: str = "en",
+        enhanced_progress_callback=None,
+        batch_size: int = 5,
+        checkpoints: Optional[Mapping[str, dict]] = None,
+        revision_id: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, ParagraphResult]]:
+        """Edit a section of a Wikipedia article, yielding each paragraph once done.
+
+        Works like ``edit_article_section_structured_batched``, but results are
+        yielded in the order paragraphs finish instead of all at the end.
+
+        Args:
+            article_title: The title of the Wikipedia article
+            section_title: The title of the section to edit within the article
+            language: Wikipedia language code (default: "en")
+            enhanced_progress_callback: Optional callback for enhanced progress with granular phases
+            batch_size: Number of paragraphs to process per batch
+            checkpoints: Paragraph results of an earlier attempt or edit by key,
+                restored instead of edited again
+            revision_id: Revision of the article to edit instead of the latest one
+
+        Yields:
+            Pairs of paragraph index within the section and its ParagraphResult
+
+        Raises:
+            WikipediaAPIError: If the article cannot be fetched
+            ValueError: If the section cannot be found
+        """
+        section_content = await self._fetch_section_content(
+            article_title, section_title, language, revision_id
+        )
+        async for index, result in self.stream_wikitext_structured_batched(
+            section_content, enhanced_progress_callback, batch_size, checkpoints
+        ):
+            yield index, result
+
+    async def stream_wikitext_structured_batched(
+        self,
+        wikitext: str,
+        enhanced_progress_callback=None,
+        batch_size: int = 5,
+        checkpoints: Optional[Mapping[str, dict]] = None,
+    ) -> AsyncIterator[Tuple[int, ParagraphResult]]:
+        """Edit wikitext with batched processing, yielding each paragraph once done.
+
+        Used for sections whose content was already fetched, such as the
+        sections of a whole-article edit.
+
+        Args:
+            wikitext: The wikitext content to edit
+            enhanced_progress_callback: Optional callback for enhanced progress with granular phases
+            batch_size: Number of paragraphs to process per batch
+            checkpoints: Paragraph results of an earlier attempt or edit by key,
+                restored instead of edited again
+
+        Yields:
+            Pairs of paragraph index within the wikitext and its ParagraphResult
+        """
+        if not wikitext.strip():
+            return
+
+        emitted = set()
+        try:
+            async for index, result in self.orchestrator.iter_edit_structured_batched(
+                wikitext,
+                self.paragraph_processor,
+                enhanced_progress_callback,
+                batch_size,
+                checkpoints,
+            ):
+                emitted.add(index)
+                yield index, result
+        except Exception as e:
+            # Paragraphs not yet finished are returned unchanged, as in the
+            # non-streaming methods
+            error_message = ErrorSanitizer.sanitize_exception(e).user_message
+            document_items = self.document_processor.process(wikitext)
+            for index, item in enumerate(document_items):
+                if index not in emitted:
+                    yield index, ParagraphResult(
+                        before=item,
+                        after=item,
+                        status="ERRORED",
+                        status_details=error_message,
+                    )
+
+    async def _fetch_section_content(
+        self,
+        article_title: str,
+        section_title: str,
+        language: str,
+        revision_id: Optional[int] = None,
+    ) -> str:
+        """Fetch an article from Wikipedia and extract one section's wikitext.
+
+        The latest revision is fetched unless ``revision_id`` is given.
+
+        Raises:
+            WikipediaAPIError: If the article cannot be fetched
+            ValueError: If a title is empty or the section cannot be found
+        """
         if not article_title or not article_title.strip():
             raise ValueError("Article title cannot be empty")
 
@@ -437,7 +619,9 @@ class WikiEditor:
         wikipedia_api = WikipediaAPI(language=language)
 
         # Fetch the article content
-        wikitext = await wikipedia_api.get_article_wikitext(article_title)
+        wikitext = await wikipedia_api.get_article_wikitext(
+            article_title, revision_id=revision_id
+        )
 
         # Extract the specific section content
         from services.utils.wiki_utils import extract_section_content
@@ -448,10 +632,4 @@ class WikiEditor:
             raise ValueError(
                 f"Section '{section_title}' not found in article '{article_title}'"
             )
-
-        # Edit the section content using the batched structured edit method
-        paragraph_results = await self.edit_wikitext_structured_batched(
-            section_content, enhanced_progress_callback, batch_size
-        )
-
-        return paragraph_results
+        return section_content
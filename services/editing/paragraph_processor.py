@@ -5,13 +5,14 @@ pipeline, separating this concern from orchestration.
 """
 
 import asyncio
-from typing import Any, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import httpx
 from google.api_core.exceptions import GoogleAPIError
 from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
 
-from services.core.constants import UNCHANGED_MARKER
+from services.core.constants import LLM_RETRY_MAX_ATTEMPTS, UNCHANGED_MARKER
 from services.core.interfaces import (
     IParagraphProcessor,
     IReferenceHandler,
@@ -19,10 +20,33 @@ from services.core.interfaces import (
     ParagraphProcessingResult,
     ValidationContext,
 )
+from services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    InFlightRequestLimit,
+    is_overload_error,
+)
+from services.llm.hedging import HedgingPolicy
+from services.llm.rate_limiter import RateLimiter, estimate_tokens
+from services.llm.response_cache import CacheScope, ResponseCache
+from services.llm.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_retry_after,
+)
+from services.llm.streaming import LLMOutputAbortedError, StreamGuard
+from services.llm.usage import LLMCallUsageHandler, ParagraphUsage, UsageTracker
+from services.prompts.paragraph_packing import (
+    can_pack,
+    pack_paragraphs,
+    unpack_paragraphs,
+)
 from services.text.output_cleaner import OutputCleaner
 from services.tracking.reversion_tracker import ReversionType
 from services.validation.pipeline import ValidationPipeline
 
+T = TypeVar("T")
+
 
 class ParagraphProcessor(IParagraphProcessor):
     """Processes individual paragraphs through the editing pipeline.
@@ -32,7 +56,7 @@ class ParagraphProcessor(IParagraphProcessor):
     """
 
     # Constants
-    MAX_LLM_RETRIES = 3
+    MAX_LLM_RETRIES = LLM_RETRY_MAX_ATTEMPTS
 
     def __init__(
         self,
@@ -41,12 +65,51 @@ class ParagraphProcessor(IParagraphProcessor):
         post_processing_pipeline: ValidationPipeline,
         reversion_tracker: IReversionTracker,
         reference_handler: IReferenceHandler,
+        response_cache: Optional[ResponseCache] = None,
+        cache_scope: Optional[CacheScope] = None,
+        packed_llm_chain: Any = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        prompt_overhead_tokens: int = 0,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        stream_responses: bool = False,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        usage_tracker: Optional[UsageTracker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        in_flight_request_limit: Optional[InFlightRequestLimit] = None,
+        paragraph_timeout_seconds: float = 0,
     ):
         self.llm_chain = llm_chain
         self.pre_processing_pipeline = pre_processing_pipeline
         self.post_processing_pipeline = post_processing_pipeline
         self.reversion_tracker = reversion_tracker
         self.reference_handler = reference_handler
+        # Responses are only cached when the scope identifying them is known
+        self.response_cache = response_cache if cache_scope else None
+        self.cache_scope = cache_scope
+        # Chain for the multi-paragraph prompt; without it packing is disabled
+        self.packed_llm_chain = packed_llm_chain
+        # Shared rate limiter for the provider and API key, if any, and the
+        # estimated tokens the prompt template adds to every request
+        self.rate_limiter = rate_limiter
+        self.prompt_overhead_tokens = prompt_overhead_tokens
+        # The orchestrator's concurrency window, fed the outcome and latency of
+        # every provider request, including retries handled here
+        self.concurrency_limiter = concurrency_limiter
+        # Stream single-paragraph edits so hopeless generations stop early
+        self.stream_responses = stream_responses
+        # Duplicates straggling single-paragraph requests when set
+        self.hedging_policy = hedging_policy
+        # Receives token and latency figures for every paragraph sent to the LLM
+        self.usage_tracker = usage_tracker
+        # Backoff between retries, and the provider health shared across tasks
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        # Bounds the requests of every edit in the process, not just this one
+        self.in_flight_request_limit = in_flight_request_limit
+        # Time limit for each paragraph of a packed batch; a packed call gets the
+        # limit of every paragraph it carries, and 0 means no limit
+        self.paragraph_timeout_seconds = paragraph_timeout_seconds
 
     async def process(
         self, content: str, context: ValidationContext
@@ -60,116 +123,525 @@ class ParagraphProcessor(IParagraphProcessor):
         Returns:
             The processed paragraph content
         """
-        intermediate_steps = {}
-
         try:
-            # Get text with placeholders from context
-            text_with_placeholders = context.additional_data.get(
-                "text_with_placeholders", content
-            )
-            intermediate_steps["Text with Placeholders"] = text_with_placeholders
-
-            # Run pre-processing validations
-            (
-                validated_text,
-                should_revert,
-            ) = await self.pre_processing_pipeline.validate(
-                content, text_with_placeholders, context.__dict__
-            )
+            validated_text, failure = await self._run_pre_processing(content, context)
+            if failure is not None:
+                return failure
 
-            if should_revert:
-                failure_info = self.pre_processing_pipeline.get_last_failure()
-                failure_reason = (
-                    failure_info.reason
-                    if failure_info
-                    else "Unknown pre-processing failure"
-                )
-                return ParagraphProcessingResult(
-                    success=False,
-                    content=content,
-                    failure_reason=f"Pre-processing validation failure: {failure_reason}",
-                )
-
-            # Get LLM edit
             raw_llm_output = await self._get_llm_edit(validated_text, context)
-            intermediate_steps["Raw LLM Output"] = raw_llm_output
+            return await self._finalize_llm_output(content, raw_llm_output, context)
 
-            if not raw_llm_output:
-                return ParagraphProcessingResult(
-                    success=False,
-                    content=content,
-                    failure_reason="LLM did not return any content",
+        except Exception as e:
+            return self._create_error_result(e, content, context)
+
+    async def process_packed(
+        self, items: List[Tuple[str, ValidationContext]]
+    ) -> List[ParagraphProcessingResult]:
+        """Process several paragraphs with a single packed LLM call.
+
+        Paragraphs already in the response cache skip the LLM entirely. The rest
+        are sent together in one delimited prompt, and any paragraph whose part of
+        the response is malformed falls back to its own single-paragraph call.
+
+        Args:
+            items: Pairs of paragraph content and validation context
+
+        Returns:
+            One processing result per item, in the same order
+        """
+        if self.packed_llm_chain is None or len(items) < 2:
+            return await super().process_packed(items)
+
+        results: Dict[int, ParagraphProcessingResult] = {}
+        raw_outputs: Dict[int, Optional[str]] = {}
+        pending: List[Tuple[int, str]] = []
+
+        for index, (content, context) in enumerate(items):
+            try:
+                validated_text, failure = await self._run_pre_processing(
+                    content, context
                 )
+            except Exception as e:
+                results[index] = self._create_error_result(e, content, context)
+                continue
 
-            # Clean LLM output
-            cleaned_llm_output = OutputCleaner.cleanup_llm_output(raw_llm_output)
-            intermediate_steps["Cleaned LLM Output"] = cleaned_llm_output
+            if failure is not None:
+                results[index] = failure
+                continue
 
-            # Check for unchanged marker
-            if not cleaned_llm_output or cleaned_llm_output.strip() == UNCHANGED_MARKER:
-                return ParagraphProcessingResult(success=True, content=content)
+            cached_result = await self._get_cached_edit(validated_text)
+            if cached_result is not None:
+                self._record_response_cache_hit(context)
+                raw_outputs[index] = cached_result
+            else:
+                pending.append((index, validated_text))
 
-            # Run post-processing validations
-            final_text, should_revert = await self.post_processing_pipeline.validate(
-                content, cleaned_llm_output, context.__dict__
-            )
+        single_texts = await self._collect_packed_outputs(pending, raw_outputs, items)
 
-            if should_revert:
-                failure_info = self.post_processing_pipeline.get_last_failure()
-                if failure_info:
-                    failure_reason = (
-                        f"{failure_info.validator_name}: {failure_info.reason}"
+        async def _finalize(index: int) -> ParagraphProcessingResult:
+            content, context = items[index]
+            try:
+                if index in single_texts:
+                    raw_llm_output = await self._within_paragraph_timeout(
+                        self._get_llm_edit(single_texts[index], context)
                     )
                 else:
-                    failure_reason = "Unknown post-processing failure"
-
+                    raw_llm_output = raw_outputs[index]
+                return await self._finalize_llm_output(content, raw_llm_output, context)
+            except asyncio.TimeoutError as e:
+                self._record_overload(e)
                 return ParagraphProcessingResult(
                     success=False,
                     content=content,
-                    failure_reason=f"Post-processing validation failure: {failure_reason}",
+                    failure_reason=(
+                        "Paragraph was not edited within "
+                        f"{self.paragraph_timeout_seconds:g} seconds"
+                    ),
+                    timed_out=True,
                 )
+            except Exception as e:
+                return self._create_error_result(e, content, context)
+
+        remaining = [index for index in range(len(items)) if index not in results]
+        finalized = await asyncio.gather(*[_finalize(index) for index in remaining])
+        results.update(zip(remaining, finalized, strict=True))
+
+        return [results[index] for index in range(len(items))]
+
+    async def _collect_packed_outputs(
+        self,
+        pending: List[Tuple[int, str]],
+        raw_outputs: Dict[int, Optional[str]],
+        items: List[Tuple[str, ValidationContext]],
+    ) -> Dict[int, str]:
+        """Edit pending paragraphs with one packed call, recording raw outputs.
 
-            # Restore references if needed
-            if context.refs_list:
-                final_text = self.reference_handler.restore_references(
-                    final_text, context.refs_list
+        Args:
+            pending: Item indexes and placeholder text of paragraphs needing an edit
+            raw_outputs: Raw LLM output per item index, updated in place
+            items: All items being processed, for their validation contexts
+
+        Returns:
+            Placeholder text per item index for paragraphs that still need their
+            own single-paragraph call
+        """
+        packable = [(index, text) for index, text in pending if can_pack(text)]
+        single_texts = {index: text for index, text in pending if not can_pack(text)}
+
+        if len(packable) < 2:
+            single_texts.update(packable)
+            return single_texts
+
+        usage = self._start_usage(-1)
+        started_at = time.monotonic()
+        try:
+            packed_parts = await self._within_paragraph_timeout(
+                self._invoke_packed_llm_with_retries(
+                    [text for _, text in packable], usage
+                ),
+                paragraphs=len(packable),
+            )
+        except asyncio.TimeoutError as e:
+            # Each paragraph of a packed call that ran out of time gets its own
+            # call, with its own time limit
+            self._record_overload(e)
+            packed_parts = [None] * len(packable)
+        finally:
+            if usage is not None:
+                usage.latency_seconds = time.monotonic() - started_at
+                self._record_usage(
+                    *usage.split(
+                        [items[index][1].paragraph_index for index, _ in packable]
+                    )
                 )
+        if packed_parts is None:
+            # The API failed outright; retrying each paragraph on its own would
+            # only multiply the failing requests
+            raw_outputs.update((index, None) for index, _ in packable)
+            return single_texts
 
-            return ParagraphProcessingResult(success=True, content=final_text)
+        for (index, text), part in zip(packable, packed_parts, strict=True):
+            if part is None:
+                single_texts[index] = text
+            else:
+                await self._cache_edit(text, part)
+                raw_outputs[index] = part
+        return single_texts
 
-        except Exception as e:
-            self._handle_processing_error(e, content, context)
+    async def _within_paragraph_timeout(
+        self, awaitable: Awaitable[T], paragraphs: int = 1
+    ) -> T:
+        """Await LLM work for some paragraphs within their combined time limit.
+
+        Raises:
+            asyncio.TimeoutError: If the work takes longer than the limit
+        """
+        if not self.paragraph_timeout_seconds:
+            return await awaitable
+        return await asyncio.wait_for(
+            awaitable, self.paragraph_timeout_seconds * paragraphs
+        )
+
+    async def _run_pre_processing(
+        self, content: str, context: ValidationContext
+    ) -> Tuple[str, Optional[ParagraphProcessingResult]]:
+        """Run pre-processing validations on a paragraph's placeholder text.
+
+        Returns:
+            The validated text, and a failure result if the paragraph was reverted
+        """
+        # Get text with placeholders from context
+        text_with_placeholders = context.additional_data.get(
+            "text_with_placeholders", content
+        )
+
+        # Run pre-processing validations
+        (
+            validated_text,
+            should_revert,
+        ) = await self.pre_processing_pipeline.validate(
+            content, text_with_placeholders, context.__dict__
+        )
+
+        if should_revert:
+            failure_info = self.pre_processing_pipeline.get_last_failure()
+            failure_reason = (
+                failure_info.reason
+                if failure_info
+                else "Unknown pre-processing failure"
+            )
+            return validated_text, ParagraphProcessingResult(
+                success=False,
+                content=content,
+                failure_reason=f"Pre-processing validation failure: {failure_reason}",
+            )
+
+        return validated_text, None
+
+    async def _finalize_llm_output(
+        self,
+        content: str,
+        raw_llm_output: Optional[str],
+        context: ValidationContext,
+    ) -> ParagraphProcessingResult:
+        """Clean, validate and restore references in raw LLM output."""
+        if not raw_llm_output:
             return ParagraphProcessingResult(
                 success=False,
                 content=content,
-                failure_reason=f"Processing error: {str(e)}",
+                failure_reason="LLM did not return any content",
             )
 
+        # Clean LLM output
+        cleaned_llm_output = OutputCleaner.cleanup_llm_output(raw_llm_output)
+
+        # Check for unchanged marker
+        if not cleaned_llm_output or cleaned_llm_output.strip() == UNCHANGED_MARKER:
+            return ParagraphProcessingResult(success=True, content=content)
+
+        # Run post-processing validations
+        final_text, should_revert = await self.post_processing_pipeline.validate(
+            content, cleaned_llm_output, context.__dict__
+        )
+
+        if should_revert:
+            failure_info = self.post_processing_pipeline.get_last_failure()
+            if failure_info:
+                failure_reason = f"{failure_info.validator_name}: {failure_info.reason}"
+            else:
+                failure_reason = "Unknown post-processing failure"
+
+            return ParagraphProcessingResult(
+                success=False,
+                content=content,
+                failure_reason=f"Post-processing validation failure: {failure_reason}",
+            )
+
+        # Restore references if needed
+        if context.refs_list:
+            final_text = self.reference_handler.restore_references(
+                final_text, context.refs_list
+            )
+
+        return ParagraphProcessingResult(success=True, content=final_text)
+
+    def _create_error_result(
+        self, error: Exception, content: str, context: ValidationContext
+    ) -> ParagraphProcessingResult:
+        """Record an unexpected processing error and build its failure result."""
+        if isinstance(error, LLMOutputAbortedError):
+            # Generation was stopped deliberately, not because anything failed
+            return ParagraphProcessingResult(
+                success=False,
+                content=content,
+                failure_reason=f"LLM output aborted early: {error.reason}",
+            )
+
+        self._record_overload(error)
+        self._handle_processing_error(error, content, context)
+        return ParagraphProcessingResult(
+            success=False,
+            content=content,
+            failure_reason=f"Processing error: {str(error)}",
+        )
+
     async def _get_llm_edit(
         self, text: str, context: ValidationContext
+    ) -> Optional[str]:
+        """Get edited text from the response cache or the language model."""
+        cached_result = await self._get_cached_edit(text)
+        if cached_result is not None:
+            self._record_response_cache_hit(context)
+            return cached_result
+
+        original = context.additional_data.get("original_content")
+        usage = self._start_usage(context.paragraph_index)
+        started_at = time.monotonic()
+        try:
+            result = await self._invoke_llm_with_retries(text, original, usage)
+        finally:
+            if usage is not None:
+                usage.latency_seconds = time.monotonic() - started_at
+                self._record_usage(usage)
+        await self._cache_edit(text, result)
+        return result
+
+    async def _get_cached_edit(self, text: str) -> Optional[str]:
+        """Look up a cached LLM response for placeholder text."""
+        if self.response_cache is None or self.cache_scope is None:
+            return None
+        return await self.response_cache.aget(self.cache_scope.key_for(text))
+
+    async def _cache_edit(self, text: str, result: Optional[str]) -> None:
+        """Store a non-empty LLM response for placeholder text."""
+        if self.response_cache is None or self.cache_scope is None or not result:
+            return
+        await self.response_cache.aset(self.cache_scope.key_for(text), result)
+
+    async def _invoke_llm_with_retries(
+        self,
+        text: str,
+        original: Optional[str] = None,
+        usage: Optional[ParagraphUsage] = None,
     ) -> Optional[str]:
         """Get edited text from the language model with retries."""
+
+        def send_attempt() -> Awaitable[Optional[str]]:
+            return self._send_limited_request(
+                lambda: self._request_llm_output(text, original, usage)
+            )
+
+        async def make_request() -> Optional[str]:
+            if self.hedging_policy is None:
+                return await send_attempt()
+
+            # Each hedged attempt takes its own process-wide request slot
+            return await self.hedging_policy.run(
+                send_attempt,
+                can_hedge=lambda: self._try_acquire_rate_limit_now(text),
+            )
+
+        return await self._run_with_retries(make_request, text, usage)
+
+    async def _run_with_retries(
+        self,
+        make_request: Callable[[], Awaitable[T]],
+        rate_limit_text: str,
+        usage: Optional[ParagraphUsage] = None,
+    ) -> Optional[T]:
+        """Run an LLM request, retrying transient provider errors.
+
+        Args:
+            make_request: Sends one attempt of the request, holding its own
+                process-wide request slot
+            rate_limit_text: Text the request edits, for rate limit accounting
+            usage: Usage record counting retries and provider errors
+
+        Returns:
+            The request's result, or None when every attempt failed or the
+            provider's circuit is open
+        """
         for attempt in range(self.MAX_LLM_RETRIES):
             try:
-                # Use the variable names expected by the prompt template
-                result = await self.llm_chain.ainvoke(
-                    {
-                        "wikitext": text,  # Changed from "text" to "wikitext"
-                    }
-                )
-                return result
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.check()
+                await self._acquire_rate_limit(rate_limit_text)
+                result = await self._send_request(make_request, attempt)
+
+            except CircuitOpenError:
+                # Fail fast rather than backing off against a provider known to
+                # be failing
+                self.reversion_tracker.record_reversion(ReversionType.API_ERROR)
+                return None
 
-            except (
-                ChatGoogleGenerativeAIError,
-                GoogleAPIError,
-                httpx.ReadTimeout,
-            ):
+            except Exception as e:
+                if not self.retry_policy.is_retryable(e):
+                    raise
+                self._record_provider_error(usage, attempt)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(get_retry_after(e))
                 if attempt >= self.MAX_LLM_RETRIES - 1:
                     self.reversion_tracker.record_reversion(ReversionType.API_ERROR)
                     return None
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(self.retry_policy.delay(attempt, e))
+
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return result
         return None
 
+    async def _send_request(
+        self, make_request: Callable[[], Awaitable[T]], attempt: int = 0
+    ) -> T:
+        """Send one attempt, recording its outcome in the concurrency window.
+
+        Only a first attempt that succeeds grows the window, so a request that
+        needed retries never counts as a sign of spare provider capacity.
+        """
+        if self.concurrency_limiter is None:
+            return await make_request()
+        async with self.concurrency_limiter.attempt(grow=attempt == 0):
+            return await make_request()
+
+    async def _send_limited_request(
+        self, make_request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Send a request, holding a process-wide request slot if limited."""
+        if self.in_flight_request_limit is None:
+            return await make_request()
+        async with self.in_flight_request_limit.slot():
+            return await make_request()
+
+    async def _request_llm_output(
+        self,
+        text: str,
+        original: Optional[str],
+        usage: Optional[ParagraphUsage] = None,
+    ) -> Optional[str]:
+        """Send one request for an edit of ``text``."""
+        if self.stream_responses and hasattr(self.llm_chain, "astream"):
+            return await self._stream_llm_output(text, original, usage)
+
+        # Use the variable names expected by the prompt template
+        result = await self.llm_chain.ainvoke(
+            {
+                "wikitext": text,  # Changed from "text" to "wikitext"
+            },
+            **self._usage_config(usage),
+        )
+        return result
+
+    async def _stream_llm_output(
+        self,
+        text: str,
+        original: Optional[str],
+        usage: Optional[ParagraphUsage] = None,
+    ) -> str:
+        """Stream an edit, stopping as soon as its outcome is known.
+
+        Generation stops once the output starts with the unchanged marker, in
+        which case only the marker is returned.
+
+        Raises:
+            LLMOutputAbortedError: If the output turns into meta commentary or
+                grows far beyond the input length
+        """
+        guard = StreamGuard(text, original)
+        stream = self.llm_chain.astream({"wikitext": text}, **self._usage_config(usage))
+        try:
+            async for chunk in stream:
+                if guard.feed(chunk):
+                    return UNCHANGED_MARKER
+        finally:
+            # Closing the stream cancels the underlying request when stopping early
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+        return guard.output
+
+    async def _invoke_packed_llm_with_retries(
+        self, texts: List[str], usage: Optional[ParagraphUsage] = None
+    ) -> Optional[List[Optional[str]]]:
+        """Edit several paragraphs with one packed LLM call.
+
+        Returns:
+            The per-paragraph response parts (None where malformed), or None when
+            the API call itself failed
+        """
+        assert self.packed_llm_chain is not None
+        packed_text = pack_paragraphs(texts)
+        result = await self._run_with_retries(
+            lambda: self._send_limited_request(
+                lambda: self.packed_llm_chain.ainvoke(
+                    {"wikitext": packed_text}, **self._usage_config(usage)
+                )
+            ),
+            packed_text,
+            usage,
+        )
+        if result is None:
+            return None
+        return unpack_paragraphs(result, len(texts))
+
+    async def _acquire_rate_limit(self, text: str) -> None:
+        """Wait for rate limit capacity for one LLM request editing ``text``."""
+        if self.rate_limiter is None:
+            return
+        await self.rate_limiter.acquire(self._estimate_request_tokens(text))
+
+    async def _try_acquire_rate_limit_now(self, text: str) -> bool:
+        """Take rate limit capacity for a request only if none needs waiting for."""
+        if self.rate_limiter is None:
+            return True
+        return await self.rate_limiter.try_acquire_now(
+            self._estimate_request_tokens(text)
+        )
+
+    def _estimate_request_tokens(self, text: str) -> int:
+        """Estimate the tokens one request editing ``text`` consumes."""
+        # The edited output is roughly as long as the input paragraph
+        return self.prompt_overhead_tokens + 2 * estimate_tokens(text)
+
+    def _start_usage(self, paragraph_index: int) -> Optional[ParagraphUsage]:
+        """Create a usage record for LLM work on a paragraph, if usage is tracked."""
+        if self.usage_tracker is None:
+            return None
+        return ParagraphUsage(paragraph_index=paragraph_index)
+
+    def _usage_config(self, usage: Optional[ParagraphUsage]) -> Dict[str, Any]:
+        """Build the chain invocation arguments that record a call's usage."""
+        if usage is None:
+            return {}
+        return {"config": {"callbacks": [LLMCallUsageHandler(usage)]}}
+
+    def _record_usage(self, *usages: ParagraphUsage) -> None:
+        """Hand finished usage records to the tracker."""
+        if self.usage_tracker is None:
+            return
+        for usage in usages:
+            self.usage_tracker.record(usage)
+
+    def _record_response_cache_hit(self, context: ValidationContext) -> None:
+        """Record a paragraph whose edit was served from the response cache."""
+        usage = self._start_usage(context.paragraph_index)
+        if usage is not None:
+            usage.response_cache_hit = True
+            self._record_usage(usage)
+
+    @staticmethod
+    def _record_provider_error(usage: Optional[ParagraphUsage], attempt: int) -> None:
+        """Count a failed LLM attempt, and the retry that follows unless it was last."""
+        if usage is None:
+            return
+        usage.provider_errors += 1
+        if attempt < ParagraphProcessor.MAX_LLM_RETRIES - 1:
+            usage.retries += 1
+
+    def _record_overload(self, error: Exception) -> None:
+        """Shrink the concurrency window if an error signals provider overload."""
+        if self.concurrency_limiter is not None and is_overload_error(error):
+            self.concurrency_limiter.record_overload()
+
     def _handle_processing_error(
         self, error: Exception, original: str, context: ValidationContext
     ) -> None:
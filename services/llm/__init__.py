@@ -0,0 +1,69 @@
+"""LLM call infrastructure modules."""
+
+from services.llm.client_pool import LLMClientPool, get_llm_client_pool
+from services.llm.concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+from services.llm.fake_llm import (
+    FAKE_LLM_PRESETS,
+    FakeEditorChatModel,
+    FakeLLMProfile,
+    create_fake_llm,
+)
+from services.llm.hedging import HedgingPolicy, LatencyTracker, get_hedging_policy
+from services.llm.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimiter,
+    RateLimits,
+    RedisRateLimiter,
+    get_rate_limiter,
+)
+from services.llm.response_cache import (
+    CacheScope,
+    InMemoryResponseCache,
+    RedisResponseCache,
+    ResponseCache,
+    get_response_cache,
+)
+from services.llm.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_circuit_breaker,
+    get_retry_after,
+)
+from services.llm.usage import (
+    ParagraphUsage,
+    UsageTracker,
+    count_tokens,
+)
+
+__all__ = [
+    "CacheScope",
+    "ResponseCache",
+    "InMemoryResponseCache",
+    "RedisResponseCache",
+    "get_response_cache",
+    "RateLimits",
+    "RateLimiter",
+    "InMemoryRateLimiter",
+    "RedisRateLimiter",
+    "get_rate_limiter",
+    "AdaptiveConcurrencyLimiter",
+    "is_overload_error",
+    "LatencyTracker",
+    "HedgingPolicy",
+    "get_hedging_policy",
+    "ParagraphUsage",
+    "UsageTracker",
+    "count_tokens",
+    "LLMClientPool",
+    "get_llm_client_pool",
+    "FakeLLMProfile",
+    "FakeEditorChatModel",
+    "FAKE_LLM_PRESETS",
+    "create_fake_llm",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "get_retry_after",
+]
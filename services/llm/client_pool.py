@@ -0,0 +1,138 @@
+"""Per-process pool of LLM clients.
+
+Building a chat model client sets up an SDK client and its HTTP connection pool,
+so every task that builds its own pays for SDK setup and fresh TLS handshakes.
+Clients are instead kept per worker process, keyed by provider, model and a hash
+of the API key, and reused by later tasks with the same configuration. The pool
+is bounded in size (least recently used clients are evicted first) and drops
+clients that have been idle for too long.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+from services.core.constants import (
+    LLM_CLIENT_POOL_IDLE_SECONDS,
+    LLM_CLIENT_POOL_MAX_SIZE,
+)
+
+PoolKey = Tuple[str, str, str]
+
+
+def hash_api_key(api_key: str) -> str:
+    """Hash an API key so it can be used as a lookup key without storing it."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    last_used_at: float
+
+
+class LLMClientPool:
+    """LRU pool of LLM clients with idle-time eviction.
+
+    Args:
+        max_size: Maximum number of clients kept; 0 disables pooling
+        idle_timeout_seconds: Clients unused for longer than this are dropped
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        max_size: int = LLM_CLIENT_POOL_MAX_SIZE,
+        idle_timeout_seconds: float = LLM_CLIENT_POOL_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[PoolKey, _PooledClient]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def get(
+        self, provider: str, model: str, api_key: str, factory: Callable[[], Any]
+    ) -> Any:
+        """Return the pooled client for a configuration, creating it if needed.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            api_key: The API key the client authenticates with; only its hash
+                is used as the pool key
+            factory: Creates a new client when none is pooled
+
+        Returns:
+            The LLM client
+        """
+        if self.max_size <= 0:
+            return factory()
+
+        key = (provider, model, hash_api_key(api_key or ""))
+        now = self._clock()
+        with self._lock:
+            self._evict_idle(now)
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                pooled.last_used_at = now
+                self._clients.move_to_end(key)
+                return pooled.client
+
+        # Built outside the lock so slow SDK setup does not block other lookups
+        client = factory()
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                # Another thread created the same client first; keep one
+                pooled.last_used_at = now
+                self._clients.move_to_end(key)
+                return pooled.client
+            self._clients[key] = _PooledClient(client=client, last_used_at=now)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        """Drop every pooled client."""
+        with self._lock:
+            self._clients.clear()
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop clients idle for longer than the timeout (lock must be held)."""
+        # Entries are ordered by last use, so idle ones are at the front
+        while self._clients:
+            key, pooled = next(iter(self._clients.items()))
+            if now - pooled.last_used_at <= self.idle_timeout_seconds:
+                break
+            del self._clients[key]
+
+
+_client_pool: Optional[LLMClientPool] = None
+_client_pool_pid: Optional[int] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Return the client pool of the current worker process.
+
+    A forked child starts with an empty pool rather than inheriting clients
+    whose connections belong to the parent.
+    """
+    global _client_pool, _client_pool_pid
+
+    with _client_pool_lock:
+        pid = os.getpid()
+        if _client_pool is None or _client_pool_pid != pid:
+            _client_pool = LLMClientPool()
+            _client_pool_pid = pid
+        return _client_pool
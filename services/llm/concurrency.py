@@ -0,0 +1,245 @@
+"""Adaptive concurrency limiting for LLM requests.
+
+The number of paragraphs edited at once is bounded by a window that follows
+additive-increase/multiplicative-decrease (AIMD): every provider request that
+succeeds at its first attempt grows the window by a fraction of a slot, while
+rate-limit errors, timeouts and latency spikes halve it. The window settles
+just below the point where the provider starts pushing back, without a
+hand-tuned concurrency setting.
+"""
+
+import asyncio
+import math
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from services.core.constants import LLM_MAX_IN_FLIGHT_REQUESTS
+
+# HTTP statuses providers use to signal overload (429 rate limited, 503 and
+# 529 overloaded)
+OVERLOAD_STATUS_CODES = {429, 503, 529}
+
+# Exception class names used by provider SDKs for throttling and timeouts
+OVERLOAD_ERROR_NAMES = {
+    "RateLimitError",
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "APITimeoutError",
+    "DeadlineExceeded",
+    "OverloadedError",
+}
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Return whether an exception signals that the provider is overloaded."""
+    if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return True
+    if type(error).__name__ in OVERLOAD_ERROR_NAMES:
+        return True
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status_code in OVERLOAD_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency window shared by the requests of one edit.
+
+    Args:
+        max_limit: Upper bound for the window
+        min_limit: Lower bound for the window
+        initial_limit: Starting window, defaults to half of ``max_limit``
+        decrease_factor: Multiplier applied to the window on overload
+        latency_tolerance: A request slower than this multiple of the average
+            latency counts as an overload signal
+        decrease_cooldown_seconds: Minimum time between two decreases, so a
+            burst of failures from the same overload only shrinks the window once
+        clock: Time source, injectable for tests
+    """
+
+    # Weight of the newest sample in the average latency
+    LATENCY_SMOOTHING = 0.2
+    # Samples needed before latency spikes can shrink the window
+    MIN_LATENCY_SAMPLES = 5
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        decrease_cooldown_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        if initial_limit is None:
+            initial_limit = self.max_limit // 2
+        self._window = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self._clock = clock
+
+        self._in_flight = 0
+        self._average_latency: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease_at: Optional[float] = None
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_limit, math.floor(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot in the current window and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """Give a slot back and wake waiters if the window allows."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot while one paragraph or packed batch is edited.
+
+        Overload errors and timeouts escaping the edit shrink the window.
+        Successes are not recorded here, since an edit spans retries, backoff
+        and validation; ``attempt`` records each provider request instead.
+        """
+        await self.acquire()
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_overload_error(e):
+                self.record_overload()
+            raise
+        finally:
+            await self.release()
+
+    @asynccontextmanager
+    async def attempt(self, grow: bool = True) -> AsyncIterator[None]:
+        """Record the outcome and latency of one provider request.
+
+        Args:
+            grow: Whether a success may grow the window; retries of a failed
+                request only update the average latency
+        """
+        started_at = self._clock()
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_overload_error(e):
+                self.record_overload()
+            raise
+        else:
+            self.record_latency(self._clock() - started_at, grow=grow)
+
+    def record_latency(self, latency_seconds: float, grow: bool = True) -> None:
+        """Record a completed request, growing or shrinking the window.
+
+        Args:
+            latency_seconds: How long the request took
+            grow: Whether the request may grow the window if it was not a
+                latency spike
+        """
+        average = self._average_latency
+        self._latency_samples += 1
+        if average is None:
+            self._average_latency = latency_seconds
+        else:
+            self._average_latency = (
+                1 - self.LATENCY_SMOOTHING
+            ) * average + self.LATENCY_SMOOTHING * latency_seconds
+
+        if (
+            average is not None
+            and self._latency_samples > self.MIN_LATENCY_SAMPLES
+            and latency_seconds > average * self.latency_tolerance
+        ):
+            self.record_overload()
+            return
+        if not grow:
+            return
+
+        # Additive increase: roughly one extra slot per window of successes
+        self._window = min(self.max_limit, self._window + 1 / self._window)
+
+    def record_overload(self) -> None:
+        """Shrink the window after a rate limit, timeout or latency spike."""
+        now = self._clock()
+        if (
+            self._last_decrease_at is not None
+            and now - self._last_decrease_at < self.decrease_cooldown_seconds
+        ):
+            return
+        self._last_decrease_at = now
+        self._window = max(self.min_limit, self._window * self.decrease_factor)
+
+
+class InFlightRequestLimit:
+    """Cap on LLM requests in flight across every edit running in a process.
+
+    Each edit's adaptive window only sees its own requests. When a worker runs
+    many edits at once on one event loop, this limit keeps their combined
+    requests within what the process, and the API keys it shares, can handle.
+
+    Args:
+        max_in_flight: Largest number of requests allowed in flight at once
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max(1, max_in_flight)
+        # asyncio primitives belong to one loop, so each loop gets its own
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the process's request slots for the duration of a request."""
+        async with self._get_semaphore():
+            yield
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_in_flight)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+
+_in_flight_request_limit: Optional[InFlightRequestLimit] = None
+_in_flight_request_limit_lock = threading.Lock()
+
+
+def get_in_flight_request_limit() -> Optional[InFlightRequestLimit]:
+    """Return the process-wide limit on in-flight LLM requests.
+
+    Returns:
+        The limit, or None when ``LLM_MAX_IN_FLIGHT_REQUESTS`` leaves requests
+        unlimited
+    """
+    global _in_flight_request_limit
+    if LLM_MAX_IN_FLIGHT_REQUESTS <= 0:
+        return None
+    with _in_flight_request_limit_lock:
+        if _in_flight_request_limit is None:
+            _in_flight_request_limit = InFlightRequestLimit(LLM_MAX_IN_FLIGHT_REQUESTS)
+        return _in_flight_request_limit
@@ -0,0 +1,331 @@
+"""Deterministic fake LLM provider for load testing.
+
+The fake provider edits paragraphs without calling any API, so the whole path
+from the API through Celery, the orchestrator and validation can be exercised
+locally or in CI without keys. A profile controls what it returns (the input
+unchanged, the unchanged marker, scripted regex edits or recorded responses) and
+how it behaves: latency drawn from a log-normal distribution, bursts of 429
+rate-limit errors, timeouts and streamed output. Latency and failures are seeded
+from the profile seed and the request, so runs are reproducible.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+from google.api_core.exceptions import TooManyRequests
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.ai import UsageMetadata
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from services.core.constants import (
+    LLM_FAKE_PROFILE,
+    LLM_FAKE_RECORDINGS_PATH,
+    UNCHANGED_MARKER,
+)
+from services.llm.rate_limiter import estimate_tokens
+from services.prompts.paragraph_packing import pack_paragraphs, unpack_paragraphs
+
+RESPONSE_MODES = ("identity", "unchanged", "transform", "recorded")
+
+
+@dataclass(frozen=True)
+class FakeLLMProfile:
+    """Behaviour of the fake provider.
+
+    Attributes:
+        response_mode: "identity" returns the paragraph as is, "unchanged" the
+            unchanged marker, "transform" applies ``transforms`` and "recorded"
+            looks the paragraph up in the recordings file
+        transforms: Ordered (regex pattern, replacement) pairs for "transform"
+        latency_median_seconds: Median time to first token
+        latency_sigma: Spread of the log-normal latency distribution; 0 makes
+            every request take exactly the median
+        rate_limit_burst_every: Every N-th request starts a burst of 429 errors;
+            0 disables rate limiting
+        rate_limit_burst_length: Number of consecutive requests in each burst
+        timeout_rate: Fraction of requests that hang and then time out
+        timeout_seconds: How long a timed-out request hangs
+        stream_chunk_chars: Characters per streamed chunk
+        stream_chunk_delay_seconds: Delay between streamed chunks
+        seed: Seed for latency and timeout draws
+    """
+
+    response_mode: str = "identity"
+    transforms: Tuple[Tuple[str, str], ...] = ()
+    latency_median_seconds: float = 0.0
+    latency_sigma: float = 0.0
+    rate_limit_burst_every: int = 0
+    rate_limit_burst_length: int = 0
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 30.0
+    stream_chunk_chars: int = 20
+    stream_chunk_delay_seconds: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.response_mode not in RESPONSE_MODES:
+            raise ValueError(
+                f"Unknown fake LLM response mode '{self.response_mode}'. "
+                f"Available modes: {list(RESPONSE_MODES)}"
+            )
+        for pattern, _ in self.transforms:
+            re.compile(pattern)
+
+    @classmethod
+    def from_config(cls, value: Optional[str]) -> "FakeLLMProfile":
+        """Build a profile from a preset name or a JSON object of fields.
+
+        Args:
+            value: Preset name, JSON object, or empty for the default preset
+
+        Raises:
+            ValueError: If the preset is unknown or the JSON is invalid
+        """
+        value = (value or LLM_FAKE_PROFILE).strip()
+        if value in FAKE_LLM_PRESETS:
+            return FAKE_LLM_PRESETS[value]
+        if not value.startswith("{"):
+            raise ValueError(
+                f"Unknown fake LLM profile '{value}'. "
+                f"Available presets: {list(FAKE_LLM_PRESETS)}"
+            )
+
+        try:
+            config = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid fake LLM profile JSON: {e}") from e
+        known_fields = {field.name for field in fields(cls)}
+        unknown_fields = set(config) - known_fields
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fake LLM profile fields: {sorted(unknown_fields)}"
+            )
+        if "transforms" in config:
+            config["transforms"] = tuple(
+                (str(pattern), str(replacement))
+                for pattern, replacement in config["transforms"]
+            )
+        try:
+            return cls(**config)
+        except (TypeError, re.error) as e:
+            raise ValueError(f"Invalid fake LLM profile: {e}") from e
+
+
+FAKE_LLM_PRESETS: Dict[str, FakeLLMProfile] = {
+    "instant": FakeLLMProfile(),
+    "realistic": FakeLLMProfile(
+        latency_median_seconds=1.5,
+        latency_sigma=0.5,
+        stream_chunk_delay_seconds=0.02,
+    ),
+    "rate-limited": FakeLLMProfile(
+        latency_median_seconds=1.0,
+        latency_sigma=0.3,
+        rate_limit_burst_every=50,
+        rate_limit_burst_length=5,
+    ),
+    "flaky": FakeLLMProfile(
+        latency_median_seconds=1.0,
+        latency_sigma=0.8,
+        timeout_rate=0.02,
+        timeout_seconds=10.0,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class _RequestPlan:
+    """What one fake request returns and how it behaves."""
+
+    output: str
+    latency_seconds: float
+    error: Optional[Exception]
+    error_delay_seconds: float
+
+
+def load_recordings(path: str) -> Dict[str, str]:
+    """Load recorded responses keyed by paragraph text.
+
+    Args:
+        path: JSON file with an object mapping paragraph text to a response
+    """
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as recordings_file:
+        recordings = json.load(recordings_file)
+    return {str(text): str(response) for text, response in recordings.items()}
+
+
+class FakeEditorChatModel(BaseChatModel):
+    """Chat model that edits the last message deterministically per a profile."""
+
+    profile: FakeLLMProfile = FakeLLMProfile()
+    recordings: Dict[str, str] = {}
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _request_count: int = PrivateAttr(default=0)
+    _attempts: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-editor"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        plan = self._plan(messages)
+        if plan.error is not None:
+            time.sleep(plan.error_delay_seconds)
+            raise plan.error
+        time.sleep(plan.latency_seconds)
+        return self._result(messages, plan.output)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        plan = self._plan(messages)
+        if plan.error is not None:
+            await asyncio.sleep(plan.error_delay_seconds)
+            raise plan.error
+        await asyncio.sleep(plan.latency_seconds)
+        return self._result(messages, plan.output)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        plan = self._plan(messages)
+        if plan.error is not None:
+            await asyncio.sleep(plan.error_delay_seconds)
+            raise plan.error
+        await asyncio.sleep(plan.latency_seconds)
+
+        size = max(1, self.profile.stream_chunk_chars)
+        pieces = [plan.output[i : i + size] for i in range(0, len(plan.output), size)]
+        for position, piece in enumerate(pieces):
+            if position:
+                await asyncio.sleep(self.profile.stream_chunk_delay_seconds)
+            is_last = position == len(pieces) - 1
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content=piece,
+                    usage_metadata=(
+                        self._usage_metadata(messages, plan.output) if is_last else None
+                    ),
+                )
+            )
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
+
+    def _plan(self, messages: List[BaseMessage]) -> _RequestPlan:
+        """Decide the output, latency and any failure of one request."""
+        text = messages[-1].text() if messages else ""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            request_number = self._request_count
+            self._request_count += 1
+            attempt = self._attempts.get(text_hash, 0)
+            self._attempts[text_hash] = attempt + 1
+
+        profile = self.profile
+        rng = random.Random(f"{profile.seed}:{text_hash}:{attempt}")
+        latency = profile.latency_median_seconds
+        if profile.latency_sigma > 0 and latency > 0:
+            latency = math.exp(rng.gauss(math.log(latency), profile.latency_sigma))
+
+        error: Optional[Exception] = None
+        error_delay = 0.0
+        if (
+            profile.rate_limit_burst_every > 0
+            and request_number % profile.rate_limit_burst_every
+            < profile.rate_limit_burst_length
+        ):
+            error = TooManyRequests("Simulated rate limit from the fake LLM provider")
+        elif rng.random() < profile.timeout_rate:
+            error = httpx.ReadTimeout("Simulated timeout from the fake LLM provider")
+            error_delay = profile.timeout_seconds
+
+        return _RequestPlan(
+            output=self._respond(text),
+            latency_seconds=latency,
+            error=error,
+            error_delay_seconds=error_delay,
+        )
+
+    def _respond(self, text: str) -> str:
+        """Edit a paragraph, or each paragraph of a packed prompt."""
+        count = text.count("<<<PARAGRAPH ")
+        if count:
+            parts = unpack_paragraphs(text, count)
+            if all(part is not None for part in parts):
+                return pack_paragraphs([self._edit(part or "") for part in parts])
+        return self._edit(text)
+
+    def _edit(self, text: str) -> str:
+        """Edit a single paragraph according to the profile's response mode."""
+        mode = self.profile.response_mode
+        if mode == "unchanged":
+            return UNCHANGED_MARKER
+        if mode == "transform":
+            for pattern, replacement in self.profile.transforms:
+                text = re.sub(pattern, replacement, text)
+            return text
+        if mode == "recorded":
+            return self.recordings.get(text, text)
+        return text
+
+    def _result(self, messages: List[BaseMessage], output: str) -> ChatResult:
+        """Wrap an output in a chat result with simulated usage metadata."""
+        message = AIMessage(
+            content=output, usage_metadata=self._usage_metadata(messages, output)
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _usage_metadata(messages: List[BaseMessage], output: str) -> UsageMetadata:
+        """Estimate token usage the way a real provider would report it."""
+        input_tokens = sum(estimate_tokens(message.text()) for message in messages)
+        output_tokens = estimate_tokens(output)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+
+def create_fake_llm(profile_config: Optional[str] = None) -> FakeEditorChatModel:
+    """Create a fake chat model for a profile preset name or JSON profile.
+
+    Recorded responses are read from ``LLM_FAKE_RECORDINGS_PATH`` on the worker,
+    never from a path supplied with a request.
+    """
+    profile = FakeLLMProfile.from_config(profile_config)
+    recordings = (
+        load_recordings(LLM_FAKE_RECORDINGS_PATH)
+        if profile.response_mode == "recorded"
+        else {}
+    )
+    return FakeEditorChatModel(profile=profile, recordings=recordings)
@@ -0,0 +1,182 @@
+"""Hedged LLM requests for cutting tail latency.
+
+A section edit only finishes when its slowest paragraph does, so a single
+straggling request dominates end-to-end latency. When a request has been running
+longer than a latency percentile learned for its provider and model, a duplicate
+is sent and whichever finishes first wins; the other is cancelled. Hedges are
+capped at a small fraction of all requests so they cannot multiply load.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Tuple, TypeVar
+
+from services.core.constants import (
+    LLM_HEDGE_MAX_RATIO,
+    LLM_HEDGE_PERCENTILE,
+    LLM_HEDGE_REQUESTS,
+)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies for one provider and model.
+
+    Args:
+        window_size: Number of most recent samples kept
+        min_samples: Samples needed before percentiles are reported
+    """
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def record(self, latency_seconds: float) -> None:
+        """Add a completed request's latency."""
+        with self._lock:
+            self._samples.append(latency_seconds)
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Return a latency percentile, or None until enough samples exist."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(quantile * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+
+class HedgingPolicy:
+    """Issues a duplicate request once a request outlives a latency percentile.
+
+    Args:
+        latency_tracker: Latencies observed for the provider and model
+        percentile: Quantile of observed latency after which to hedge
+        max_hedge_ratio: Maximum hedged requests as a fraction of all requests
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        latency_tracker: LatencyTracker,
+        percentile: float = LLM_HEDGE_PERCENTILE,
+        max_hedge_ratio: float = LLM_HEDGE_MAX_RATIO,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.latency_tracker = latency_tracker
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while latency is unknown."""
+        return self.latency_tracker.percentile(self.percentile)
+
+    def _take_hedge_budget(self) -> bool:
+        """Reserve budget for one hedge if the hedge ratio allows it."""
+        with self._lock:
+            if self.hedges + 1 > self.requests * self.max_hedge_ratio:
+                return False
+            self.hedges += 1
+            return True
+
+    def _return_hedge_budget(self) -> None:
+        """Release a reserved hedge that was not sent."""
+        with self._lock:
+            self.hedges -= 1
+
+    async def run(
+        self,
+        make_request: Callable[[], Awaitable[T]],
+        can_hedge: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> T:
+        """Run a request, hedging it if it becomes a straggler.
+
+        Args:
+            make_request: Starts one attempt of the request
+            can_hedge: Optional last check before hedging, e.g. whether rate
+                limit capacity is available right now
+
+        Returns:
+            The result of whichever attempt completed successfully first
+        """
+        with self._lock:
+            self.requests += 1
+
+        started_at = self._clock()
+        primary = asyncio.ensure_future(make_request())
+        attempts = {primary}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done and self._take_hedge_budget():
+                    if can_hedge is None or await can_hedge():
+                        attempts.add(asyncio.ensure_future(make_request()))
+                    else:
+                        self._return_hedge_budget()
+
+            result = await self._first_successful(attempts)
+            self.latency_tracker.record(self._clock() - started_at)
+            return result
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    @staticmethod
+    async def _first_successful(attempts: Set["asyncio.Task[T]"]) -> T:
+        """Wait for the first attempt to succeed, or raise the first failure."""
+        pending = set(attempts)
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for attempt in done:
+                error = attempt.exception()
+                if error is None:
+                    return attempt.result()
+                if first_error is None:
+                    first_error = error
+        assert first_error is not None
+        raise first_error
+
+
+_latency_trackers: Dict[Tuple[str, str], LatencyTracker] = {}
+_hedging_policies: Dict[Tuple[str, str], HedgingPolicy] = {}
+_hedging_lock = threading.Lock()
+
+
+def get_hedging_policy(provider: str, model: str) -> Optional[HedgingPolicy]:
+    """Return the process-wide hedging policy for a provider and model.
+
+    Latencies and the hedge budget are shared by every task in the process
+    using the same provider and model.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+
+    Returns:
+        The hedging policy, or None when hedging is disabled
+    """
+    if not LLM_HEDGE_REQUESTS:
+        return None
+
+    key = (provider, model)
+    with _hedging_lock:
+        policy = _hedging_policies.get(key)
+        if policy is None:
+            tracker = _latency_trackers.setdefault(key, LatencyTracker())
+            policy = HedgingPolicy(tracker)
+            _hedging_policies[key] = policy
+        return policy
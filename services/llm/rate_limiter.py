@@ -0,0 +1,263 @@
+"""Token-bucket rate limiting for LLM requests.
+
+Every worker process editing with the same provider and API key draws from the
+same pair of buckets: one for requests per minute and one for tokens per minute.
+Callers wait for capacity before each request instead of stampeding the provider
+into rate-limit errors and sleeping through blind retries. Bucket checks against
+Redis run in a worker thread, since the callers are coroutines on an event loop
+shared by every task in the process.
+"""
+
+import asyncio
+import hashlib
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import redis
+from asgiref.sync import sync_to_async
+
+from services.core.constants import (
+    LLM_RATE_LIMIT_BACKEND,
+    LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+    LLM_RATE_LIMIT_TOKENS_PER_MINUTE,
+    PROVIDER_RATE_LIMITS,
+)
+
+# Rough characters-per-token ratio shared by the supported providers' tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a piece of text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Per-minute request and token allowances for one provider and API key."""
+
+    requests_per_minute: int
+    tokens_per_minute: int
+
+    def bucket_params(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Return (capacity, refill per second) for the request and token buckets."""
+        return (
+            (self.requests_per_minute, self.requests_per_minute / 60),
+            (self.tokens_per_minute, self.tokens_per_minute / 60),
+        )
+
+
+class RateLimiter(ABC):
+    """Base class for token-bucket rate limiters."""
+
+    def __init__(self, limits: RateLimits):
+        self.limits = limits
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request using ``tokens`` tokens is allowed, then take it.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        # A request larger than a whole minute's allowance waits for a full bucket
+        tokens = min(tokens, self.limits.tokens_per_minute)
+        while True:
+            wait_seconds = await self._try_acquire_async(tokens)
+            if wait_seconds <= 0:
+                return
+            await asyncio.sleep(wait_seconds)
+
+    async def try_acquire_now(self, tokens: int = 0) -> bool:
+        """Take capacity for one request only if it is available without waiting.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        tokens = min(tokens, self.limits.tokens_per_minute)
+        return await self._try_acquire_async(tokens) <= 0
+
+    async def _try_acquire_async(self, tokens: int) -> float:
+        """Run ``_try_acquire`` in a worker thread, keeping the event loop free."""
+        return await sync_to_async(self._try_acquire, thread_sensitive=False)(tokens)
+
+    @abstractmethod
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity if available.
+
+        Returns:
+            0 when the request was admitted, otherwise seconds until it could be
+        """
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Per-process token buckets, used for tests and as the Redis fallback."""
+
+    def __init__(self, limits: RateLimits, clock: Callable[[], float] = time.monotonic):
+        super().__init__(limits)
+        self._clock = clock
+        self._lock = threading.Lock()
+        (request_capacity, _), (token_capacity, _) = limits.bucket_params()
+        self._levels = [float(request_capacity), float(token_capacity)]
+        self._updated_at = clock()
+
+    def _try_acquire(self, tokens: int) -> float:
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._updated_at = now
+
+            costs = (1, tokens)
+            wait_seconds = 0.0
+            for index, (capacity, rate) in enumerate(self.limits.bucket_params()):
+                self._levels[index] = min(
+                    capacity, self._levels[index] + elapsed * rate
+                )
+                shortfall = costs[index] - self._levels[index]
+                if shortfall > 0:
+                    wait_seconds = max(wait_seconds, shortfall / rate)
+
+            if wait_seconds > 0:
+                return wait_seconds
+
+            for index, cost in enumerate(costs):
+                self._levels[index] -= cost
+            return 0.0
+
+    # The buckets only take a lock, so they are cheaper than a hop to a thread
+    async def _try_acquire_async(self, tokens: int) -> float:
+        return self._try_acquire(tokens)
+
+
+class RedisRateLimiter(RateLimiter):
+    """Token buckets stored in Redis and shared by every worker process.
+
+    Both buckets are checked and debited atomically in a Lua script using the
+    Redis server clock, so workers on different hosts agree on refill timing.
+    If Redis is unavailable the limiter falls back to per-process buckets.
+    """
+
+    KEY_PREFIX = "editengine:rate-limit:"
+
+    SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local wait = 0
+local levels = {}
+
+for i = 1, 2 do
+    local capacity = tonumber(ARGV[(i - 1) * 3 + 1])
+    local rate = tonumber(ARGV[(i - 1) * 3 + 2])
+    local cost = tonumber(ARGV[(i - 1) * 3 + 3])
+    local state = redis.call('HMGET', KEYS[i], 'level', 'updated_at')
+    local level = tonumber(state[1])
+    if level == nil then
+        level = capacity
+    else
+        local elapsed = math.max(0, now - tonumber(state[2]))
+        level = math.min(capacity, level + elapsed * rate)
+    end
+    levels[i] = level - cost
+    if level < cost then
+        wait = math.max(wait, (cost - level) / rate)
+    end
+end
+
+if wait > 0 then
+    return tostring(wait)
+end
+
+for i = 1, 2 do
+    redis.call('HSET', KEYS[i], 'level', tostring(levels[i]), 'updated_at', tostring(now))
+    redis.call('EXPIRE', KEYS[i], 120)
+end
+return '0'
+"""
+
+    def __init__(self, client: redis.Redis, key: str, limits: RateLimits):
+        super().__init__(limits)
+        self.client = client
+        self.key = key
+        self._script = client.register_script(self.SCRIPT)
+        self._fallback = InMemoryRateLimiter(limits)
+
+    def _try_acquire(self, tokens: int) -> float:
+        (request_capacity, request_rate), (token_capacity, token_rate) = (
+            self.limits.bucket_params()
+        )
+        try:
+            wait_seconds = self._script(
+                keys=[
+                    f"{self.KEY_PREFIX}{self.key}:requests",
+                    f"{self.KEY_PREFIX}{self.key}:tokens",
+                ],
+                args=[
+                    request_capacity,
+                    request_rate,
+                    1,
+                    token_capacity,
+                    token_rate,
+                    tokens,
+                ],
+            )
+            return float(wait_seconds)
+        except redis.RedisError:
+            return self._fallback._try_acquire(tokens)
+
+
+def get_rate_limits(provider: str) -> RateLimits:
+    """Return the configured rate limits for a provider.
+
+    Deployment-wide overrides take precedence over the provider defaults.
+    """
+    default_requests, default_tokens = PROVIDER_RATE_LIMITS.get(
+        provider, PROVIDER_RATE_LIMITS["openai"]
+    )
+    return RateLimits(
+        requests_per_minute=LLM_RATE_LIMIT_REQUESTS_PER_MINUTE or default_requests,
+        tokens_per_minute=LLM_RATE_LIMIT_TOKENS_PER_MINUTE or default_tokens,
+    )
+
+
+def get_rate_limit_key(provider: str, api_key: str) -> str:
+    """Build the bucket key for a provider and API key without exposing the key."""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return f"{provider}:{key_hash}"
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: str) -> Optional[RateLimiter]:
+    """Return the shared rate limiter for a provider and API key.
+
+    Limiters are reused for the lifetime of the process so every task using the
+    same key in this process also shares the in-memory buckets.
+
+    Args:
+        provider: LLM provider name
+        api_key: The API key requests are billed to
+
+    Returns:
+        The rate limiter, or None when rate limiting is disabled
+    """
+    if LLM_RATE_LIMIT_BACKEND not in ("redis", "memory"):
+        return None
+
+    key = get_rate_limit_key(provider, api_key or "")
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limits = get_rate_limits(provider)
+            if LLM_RATE_LIMIT_BACKEND == "redis":
+                from services.utils.redis_client import get_redis_client
+
+                limiter = RedisRateLimiter(get_redis_client(), key, limits)
+            else:
+                limiter = InMemoryRateLimiter(limits)
+            _rate_limiters[key] = limiter
+        return limiter
@@ -0,0 +1,243 @@
+"""Content-addressed cache for raw LLM responses.
+
+Responses are keyed on everything that determines the model output for a paragraph:
+editing mode, provider, model, prompt template version and the placeholder text
+itself. Byte-identical inputs therefore reuse the earlier output instead of paying
+for another LLM round trip.
+
+Edits look responses up from coroutines on an event loop shared by every task in
+the worker process, so they use ``aget`` and ``aset``, which keep Redis round
+trips off the loop.
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+import redis
+from asgiref.sync import sync_to_async
+
+from services.core.constants import (
+    LLM_RESPONSE_CACHE_BACKEND,
+    LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    LLM_RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class CacheScope:
+    """Everything besides the paragraph text that shapes an LLM response."""
+
+    editing_mode: str
+    provider: str
+    model: str
+    prompt_version: str
+
+    def key_for(self, text: str) -> str:
+        """Build the cache key for a paragraph's placeholder text."""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return ":".join(
+            [
+                self.editing_mode,
+                self.provider,
+                self.model,
+                self.prompt_version,
+                text_hash,
+            ]
+        )
+
+
+class ResponseCache(ABC):
+    """Base class for LLM response caches with hit/miss accounting."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under a key."""
+        self._set(key, value)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Return the cached response for a key without blocking the event loop."""
+        return await sync_to_async(self.get, thread_sensitive=False)(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Store a response under a key without blocking the event loop."""
+        await sync_to_async(self.set, thread_sensitive=False)(key, value)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit and miss counters for this cache instance."""
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Backend-specific lookup."""
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None:
+        """Backend-specific store."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Per-process LRU cache with TTL expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = LLM_RESPONSE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # Lookups only take a lock, so they are cheaper than a hop to a thread
+    async def aget(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        self.set(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisResponseCache(ResponseCache):
+    """Redis-backed cache shared by every worker process.
+
+    Values expire through Redis TTLs. A sorted set of keys scored by last access
+    time provides LRU eviction once the cache holds more than ``max_entries``.
+    Redis failures are treated as misses so the cache can never fail an edit.
+    """
+
+    KEY_PREFIX = "editengine:llm-cache:"
+    INDEX_KEY = "editengine:llm-cache-index"
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = LLM_RESPONSE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__()
+        self.client = client
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def _get(self, key: str) -> Optional[str]:
+        try:
+            value = cast(Optional[str], self.client.get(self.KEY_PREFIX + key))
+            if value is not None:
+                self.client.zadd(self.INDEX_KEY, {key: self._clock()})
+            return value
+        except redis.RedisError:
+            return None
+
+    def _set(self, key: str, value: str) -> None:
+        now = self._clock()
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.set(self.KEY_PREFIX + key, value, ex=self.ttl_seconds)
+            pipeline.zadd(self.INDEX_KEY, {key: now})
+            # Entries not touched for a full TTL have already expired
+            pipeline.zremrangebyscore(self.INDEX_KEY, 0, now - self.ttl_seconds)
+            pipeline.zcard(self.INDEX_KEY)
+            size = pipeline.execute()[-1]
+
+            overflow = size - self.max_entries
+            if overflow > 0:
+                evicted = cast(
+                    List[Tuple[str, float]],
+                    self.client.zpopmin(self.INDEX_KEY, overflow),
+                )
+                if evicted:
+                    self.client.delete(
+                        *[self.KEY_PREFIX + evicted_key for evicted_key, _ in evicted]
+                    )
+        except redis.RedisError:
+            return
+
+    def clear(self) -> None:
+        try:
+            keys = cast(List[str], self.client.zrange(self.INDEX_KEY, 0, -1))
+            if keys:
+                self.client.delete(*[self.KEY_PREFIX + key for key in keys])
+            self.client.delete(self.INDEX_KEY)
+        except redis.RedisError:
+            return
+
+
+_response_cache_instance: Optional[ResponseCache] = None
+_response_cache_initialized = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache configured for this deployment.
+
+    Returns:
+        The configured cache, or None when caching is disabled
+    """
+    global _response_cache_instance, _response_cache_initialized
+    if not _response_cache_initialized:
+        if LLM_RESPONSE_CACHE_BACKEND == "redis":
+            from services.utils.redis_client import get_redis_client
+
+            _response_cache_instance = RedisResponseCache(get_redis_client())
+        elif LLM_RESPONSE_CACHE_BACKEND == "memory":
+            _response_cache_instance = InMemoryResponseCache()
+        else:
+            _response_cache_instance = None
+        _response_cache_initialized = True
+    return _response_cache_instance
@@ -0,0 +1,241 @@
+"""Retry policy and circuit breaker for LLM requests.
+
+Transient provider errors (rate limits, overload, timeouts) are retried with
+exponential backoff and full jitter, so paragraphs that failed together do not
+retry in lockstep. When the provider says how long to wait with a Retry-After
+header, that wait is used instead.
+
+A circuit breaker per provider and API key remembers provider health across
+paragraphs and tasks in a worker process. After a burst of transient errors it
+opens and requests fail immediately instead of each spending its full backoff
+against an endpoint that is down. After a reset timeout one probe request is let
+through; if it succeeds the breaker closes again.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Optional
+
+import httpx
+from google.api_core.exceptions import GoogleAPIError
+from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
+
+from services.core.constants import (
+    LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_BREAKER_RESET_SECONDS,
+    LLM_CIRCUIT_BREAKER_WINDOW_SECONDS,
+    LLM_RETRY_BASE_DELAY_SECONDS,
+    LLM_RETRY_MAX_DELAY_SECONDS,
+)
+from services.llm.concurrency import is_overload_error
+from services.llm.rate_limiter import get_rate_limit_key
+
+# Errors retried regardless of whether they signal overload
+RETRYABLE_ERRORS = (ChatGoogleGenerativeAIError, GoogleAPIError, httpx.ReadTimeout)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a provider's circuit is open."""
+
+    def __init__(self, name: str, retry_in_seconds: float):
+        super().__init__(
+            f"Circuit for {name} is open after repeated provider errors; "
+            f"retry in {retry_in_seconds:.1f}s"
+        )
+        self.retry_in_seconds = retry_in_seconds
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Return the wait in seconds a provider asked for with an error, if any.
+
+    Reads a ``retry_after`` attribute or the ``retry-after-ms`` and
+    ``retry-after`` headers of the error's HTTP response. ``retry-after`` may be
+    a number of seconds or an HTTP date.
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return max(0.0, float(retry_after))
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    milliseconds = _get_header(headers, "retry-after-ms")
+    if milliseconds is not None:
+        try:
+            return max(0.0, float(milliseconds) / 1000)
+        except ValueError:
+            pass
+
+    value = _get_header(headers, "retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_header(headers: Any, name: str) -> Optional[str]:
+    """Read a header from a case-insensitive or plain mapping."""
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.title())
+    return value
+
+
+class RetryPolicy:
+    """Decides which LLM errors are retried and how long to wait before each retry.
+
+    Args:
+        base_delay_seconds: Backoff ceiling for the first retry, doubled for
+            each later one
+        max_delay_seconds: Upper bound for any wait, including Retry-After
+        rng: Random number generator for jitter, injectable for tests
+    """
+
+    def __init__(
+        self,
+        base_delay_seconds: float = LLM_RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = LLM_RETRY_MAX_DELAY_SECONDS,
+        rng: Optional[random.Random] = None,
+    ):
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """Return whether an error is transient and worth retrying."""
+        return isinstance(error, RETRYABLE_ERRORS) or is_overload_error(error)
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """Return the seconds to wait after a failed attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: The error it failed with, checked for Retry-After
+        """
+        retry_after = get_retry_after(error) if error is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay_seconds)
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2**attempt)
+        return self._rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Fails requests fast after a burst of transient errors from a provider.
+
+    Args:
+        name: Identifies the provider and API key in error messages
+        failure_threshold: Transient errors within the window that open the circuit
+        window_seconds: Length of the sliding window errors are counted in
+        reset_timeout_seconds: How long the circuit stays open before a probe
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        window_seconds: float = LLM_CIRCUIT_BREAKER_WINDOW_SECONDS,
+        reset_timeout_seconds: float = LLM_CIRCUIT_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.window_seconds = window_seconds
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: Deque[float] = deque()
+        self._open_until: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being rejected."""
+        with self._lock:
+            return self._open_until is not None and self._clock() < self._open_until
+
+    def check(self) -> None:
+        """Allow a request through, or raise if the circuit is open.
+
+        Once the reset timeout has passed, one probe request is allowed and the
+        circuit stays closed to others until it reports back or the timeout
+        passes again.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._open_until is None:
+                return
+            now = self._clock()
+            if now < self._open_until:
+                raise CircuitOpenError(self.name, self._open_until - now)
+            self._probing = True
+            self._open_until = now + self.reset_timeout_seconds
+
+    def record_success(self) -> None:
+        """Close the circuit after a request succeeded."""
+        with self._lock:
+            self._failures.clear()
+            self._open_until = None
+            self._probing = False
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """Count a transient error, opening the circuit on a burst of them.
+
+        Args:
+            retry_after: Seconds the provider asked to wait, which extends how
+                long the circuit stays open
+        """
+        with self._lock:
+            now = self._clock()
+            open_seconds = max(self.reset_timeout_seconds, retry_after or 0.0)
+            if self._probing:
+                # The probe failed, so the provider is still unhealthy
+                self._probing = False
+                self._open_until = now + open_seconds
+                return
+
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_seconds:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._failures.clear()
+                self._open_until = now + open_seconds
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, api_key: str) -> Optional[CircuitBreaker]:
+    """Return the process-wide circuit breaker for a provider and API key.
+
+    Args:
+        provider: LLM provider name
+        api_key: The API key requests are made with; only its hash is kept
+
+    Returns:
+        The circuit breaker, or None when circuit breaking is disabled
+    """
+    if LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD <= 0:
+        return None
+
+    key = get_rate_limit_key(provider, api_key)
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key)
+            _circuit_breakers[key] = breaker
+        return breaker
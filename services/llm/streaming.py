@@ -0,0 +1,119 @@
+"""Incremental checks on streamed LLM output.
+
+Many paragraphs end up unchanged or rejected. Watching the output as it streams
+lets the editor stop generation as soon as the outcome is known, instead of
+waiting for and paying for the whole response.
+"""
+
+import re
+from typing import Optional
+
+from services.core.constants import META_COMMENTARY_WORDS, UNCHANGED_MARKER
+
+# Output may grow this many times longer than the input, plus a fixed slack for
+# short paragraphs, before generation is stopped
+MAX_OUTPUT_LENGTH_RATIO = 2.0
+OUTPUT_LENGTH_SLACK_CHARS = 200
+
+# Wrapping characters the output cleaner also strips around the marker
+_MARKER_WRAPPING_CHARS = "`'\" \t\r\n"
+
+_WORD_PATTERN = re.compile(r"\b\w+\b")
+
+
+class LLMOutputAbortedError(Exception):
+    """Raised when streamed output is stopped because it can only be rejected."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class StreamGuard:
+    """Decides after each streamed chunk whether generation can stop early.
+
+    Args:
+        text: The text sent to the LLM
+        original: The original paragraph, whose words are never meta commentary
+    """
+
+    def __init__(self, text: str, original: Optional[str] = None):
+        self.max_length = (
+            int(len(text) * MAX_OUTPUT_LENGTH_RATIO) + OUTPUT_LENGTH_SLACK_CHARS
+        )
+        self._allowed_words = set(_WORD_PATTERN.findall(text.lower()))
+        if original:
+            self._allowed_words |= set(_WORD_PATTERN.findall(original.lower()))
+        self._meta_words = META_COMMENTARY_WORDS - self._allowed_words
+        self._output = ""
+        self._scanned_up_to = 0
+
+    @property
+    def output(self) -> str:
+        """Everything streamed so far."""
+        return self._output
+
+    def feed(self, chunk: str) -> bool:
+        """Add a streamed chunk.
+
+        Returns:
+            True when the output is complete enough to stop streaming
+
+        Raises:
+            LLMOutputAbortedError: If the output could only be rejected
+        """
+        self._output += chunk
+
+        if self._is_unchanged():
+            return True
+
+        if len(self._output) > self.max_length:
+            raise LLMOutputAbortedError(
+                f"Output grew beyond {self.max_length} characters for a "
+                "paragraph this long"
+            )
+
+        meta_word = self._find_meta_word()
+        if meta_word:
+            raise LLMOutputAbortedError(
+                f"Output contains meta commentary word '{meta_word}'"
+            )
+
+        return False
+
+    def _is_unchanged(self) -> bool:
+        """Return whether the output starts with the unchanged marker."""
+        return self._output.lstrip(_MARKER_WRAPPING_CHARS).startswith(UNCHANGED_MARKER)
+
+    def _find_meta_word(self) -> Optional[str]:
+        """Scan newly completed words for meta commentary vocabulary."""
+        if not self._meta_words:
+            return None
+
+        leading_text = self._output.lstrip()
+        if self._scanned_up_to == 0 and "```".startswith(leading_text):
+            # Could still become an opening code fence
+            return None
+        if self._scanned_up_to == 0 and leading_text.startswith("```"):
+            # Skip the opening code fence and its language specifier, which the
+            # output cleaner removes (e.g. "```wikitext")
+            fence_end = self._output.find("\n")
+            if fence_end == -1:
+                return None
+            self._scanned_up_to = fence_end + 1
+
+        # Only words followed by a non-word character are complete; the last
+        # word may still be growing (e.g. "I" could become "In")
+        end = len(self._output)
+        while end > self._scanned_up_to and (
+            self._output[end - 1].isalnum() or self._output[end - 1] == "_"
+        ):
+            end -= 1
+
+        for match in _WORD_PATTERN.finditer(self._output, self._scanned_up_to, end):
+            word = match.group(0).lower()
+            if word in self._meta_words:
+                return match.group(0)
+
+        self._scanned_up_to = end
+        return None
@@ -0,0 +1,248 @@
+"""Token and latency accounting for LLM requests.
+
+Every paragraph sent to the LLM gets a usage record with its input, output and
+prompt-cached tokens, time to first token, total latency, retries and provider
+errors. Token counts come from provider usage metadata where available and are
+otherwise counted with ``tiktoken``. Records are collected per task so slow or
+expensive sections, modes and providers can be told apart.
+"""
+
+import functools
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from services.llm.rate_limiter import estimate_tokens
+
+# Encoding used to count tokens for providers that report no usage metadata
+TIKTOKEN_ENCODING = "cl100k_base"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> Any:
+    """Load the tiktoken encoding once, or None if it is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    except Exception:
+        # The encoding file is downloaded on first use and may be unreachable
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens in a piece of text.
+
+    Falls back to a character-based estimate when tiktoken cannot be loaded.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@dataclass
+class ParagraphUsage:
+    """Token and timing figures for the LLM work done on one paragraph.
+
+    For packed prompts, one call serves several paragraphs; its tokens are
+    split evenly between them and each reports the call's timings.
+    """
+
+    paragraph_index: int
+    llm_calls: int = 0
+    retries: int = 0
+    provider_errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    time_to_first_token_seconds: Optional[float] = None
+    latency_seconds: Optional[float] = None
+    tokens_estimated: bool = False
+    response_cache_hit: bool = False
+    packed: bool = False
+
+    def split(self, paragraph_indexes: List[int]) -> List["ParagraphUsage"]:
+        """Divide the usage of a packed call between the paragraphs it served."""
+        count = len(paragraph_indexes)
+        token_fields = (
+            "input_tokens",
+            "output_tokens",
+            "cached_input_tokens",
+            "cache_creation_input_tokens",
+        )
+        shares = []
+        for position, paragraph_index in enumerate(paragraph_indexes):
+            share = ParagraphUsage(
+                **{**asdict(self), "paragraph_index": paragraph_index}
+            )
+            share.packed = True
+            for field_name in token_fields:
+                total = getattr(self, field_name)
+                # The remainder goes to the first paragraphs so totals add up
+                amount = total // count + (1 if position < total % count else 0)
+                setattr(share, field_name, amount)
+            shares.append(share)
+        return shares
+
+
+class LLMCallUsageHandler(BaseCallbackHandler):
+    """Callback handler that records the LLM calls made for one paragraph.
+
+    Pass it in the ``callbacks`` of a chain invocation. Calls that were stopped
+    before completing count as calls but report no tokens.
+    """
+
+    # Run in the event loop so token arrival times are not skewed by a thread hop
+    run_inline = True
+
+    def __init__(self, usage: ParagraphUsage, clock=time.monotonic):
+        super().__init__()
+        self.usage = usage
+        self._clock = clock
+        self._started_at: Dict[Any, float] = {}
+        self._prompt_text: Dict[Any, str] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Note when a call started and what was sent."""
+        self.usage.llm_calls += 1
+        self._started_at[run_id] = self._clock()
+        self._prompt_text[run_id] = "\n".join(
+            message.text() for batch in messages for message in batch
+        )
+
+    def on_llm_new_token(self, token: str, *, run_id: Any, **kwargs: Any) -> None:
+        """Record the time to first token of a streamed call."""
+        self._record_first_token(run_id)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: Any, **kwargs: Any) -> None:
+        """Add the tokens reported, or counted, for a finished call."""
+        # Non-streamed responses arrive all at once
+        self._record_first_token(run_id)
+        prompt_text = self._prompt_text.pop(run_id, "")
+        self._started_at.pop(run_id, None)
+
+        usage = _extract_usage_metadata(response)
+        if usage:
+            details = usage.get("input_token_details") or {}
+            self.usage.input_tokens += usage.get("input_tokens", 0) or 0
+            self.usage.output_tokens += usage.get("output_tokens", 0) or 0
+            self.usage.cached_input_tokens += details.get("cache_read", 0) or 0
+            self.usage.cache_creation_input_tokens += (
+                details.get("cache_creation", 0) or 0
+            )
+            return
+
+        self.usage.tokens_estimated = True
+        self.usage.input_tokens += count_tokens(prompt_text)
+        self.usage.output_tokens += count_tokens(_response_text(response))
+
+    def _record_first_token(self, run_id: Any) -> None:
+        """Set the time to first token if this is the first token seen."""
+        started_at = self._started_at.get(run_id)
+        if started_at is not None and self.usage.time_to_first_token_seconds is None:
+            self.usage.time_to_first_token_seconds = self._clock() - started_at
+
+
+def _extract_usage_metadata(response: LLMResult) -> Optional[Dict[str, Any]]:
+    """Return the usage metadata of a chat response, if the provider sent any."""
+    for generations in response.generations:
+        for generation in generations:
+            if isinstance(generation, ChatGeneration):
+                usage = getattr(generation.message, "usage_metadata", None)
+                if usage:
+                    return dict(usage)
+    return None
+
+
+def _response_text(response: LLMResult) -> str:
+    """Join the text of every generation in a response."""
+    return "".join(
+        generation.text
+        for generations in response.generations
+        for generation in generations
+    )
+
+
+def _percentile(values: List[float], quantile: float) -> Optional[float]:
+    """Return a nearest-rank percentile, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(quantile * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+class UsageTracker:
+    """Collects paragraph usage records for one edit task."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paragraphs: List[ParagraphUsage] = []
+
+    def record(self, usage: ParagraphUsage) -> None:
+        """Add the usage of one paragraph."""
+        with self._lock:
+            self._paragraphs.append(usage)
+
+    @property
+    def paragraphs(self) -> List[ParagraphUsage]:
+        """Usage records in the order they were completed."""
+        with self._lock:
+            return list(self._paragraphs)
+
+    def totals(self) -> Dict[str, Any]:
+        """Return task-wide token totals in a JSON-serializable form."""
+        paragraphs = self.paragraphs
+        input_tokens = sum(p.input_tokens for p in paragraphs)
+        cached_input_tokens = sum(p.cached_input_tokens for p in paragraphs)
+        return {
+            "llm_calls": sum(p.llm_calls for p in paragraphs),
+            "input_tokens": input_tokens,
+            "output_tokens": sum(p.output_tokens for p in paragraphs),
+            "cached_input_tokens": cached_input_tokens,
+            "cache_creation_input_tokens": sum(
+                p.cache_creation_input_tokens for p in paragraphs
+            ),
+            "cache_hit_ratio": (
+                round(cached_input_tokens / input_tokens, 4) if input_tokens else 0.0
+            ),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return totals, timing summaries and per-paragraph records."""
+        paragraphs = self.paragraphs
+        latencies = [
+            p.latency_seconds for p in paragraphs if p.latency_seconds is not None
+        ]
+        first_token_times = [
+            p.time_to_first_token_seconds
+            for p in paragraphs
+            if p.time_to_first_token_seconds is not None
+        ]
+        return {
+            **self.totals(),
+            "retries": sum(p.retries for p in paragraphs),
+            "provider_errors": sum(p.provider_errors for p in paragraphs),
+            "response_cache_hits": sum(p.response_cache_hit for p in paragraphs),
+            "latency_p50_seconds": _percentile(latencies, 0.5),
+            "latency_p95_seconds": _percentile(latencies, 0.95),
+            "time_to_first_token_p50_seconds": _percentile(first_token_times, 0.5),
+            "paragraphs": [asdict(p) for p in paragraphs],
+        }
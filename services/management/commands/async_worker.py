@@ -0,0 +1,90 @@
+"""Django management command for a Celery worker that edits many tasks at once."""
+
+import os
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.core.constants import LLM_MAX_IN_FLIGHT_REQUESTS
+
+# LLM requests in flight across all tasks when LLM_MAX_IN_FLIGHT_REQUESTS is unset
+DEFAULT_MAX_IN_FLIGHT_REQUESTS = 32
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a Celery worker that edits many tasks concurrently on one event loop, "
+        "with a limit on LLM requests in flight across all of them"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            "-c",
+            type=int,
+            help="Number of edit tasks run at once (default: CELERY_ASYNC_WORKER_CONCURRENCY)",
+        )
+        parser.add_argument(
+            "--max-in-flight",
+            type=int,
+            help="Maximum LLM requests in flight across all tasks (default: LLM_MAX_IN_FLIGHT_REQUESTS or 32)",
+        )
+        parser.add_argument(
+            "--loglevel", "-l", default="info", help="Logging level (default: info)"
+        )
+        parser.add_argument(
+            "--purge", action="store_true", help="Purge all waiting tasks before start"
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        celery_cmd = self._build_celery_command(options)
+        env = self._build_environment(options)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Executing: {' '.join(celery_cmd)} "
+                f"(LLM_MAX_IN_FLIGHT_REQUESTS={env['LLM_MAX_IN_FLIGHT_REQUESTS']})"
+            )
+        )
+
+        os.execvpe(celery_cmd[0], celery_cmd, env)
+
+    def _build_celery_command(self, options) -> List[str]:
+        """Build the celery worker command.
+
+        The worker uses the threads pool: each task's thread only waits while
+        its coroutine runs on the process's shared event loop (see
+        ``services/tasks/worker_loop.py``), so one process and one set of
+        pooled LLM clients serve every task.
+        """
+        concurrency = options.get("concurrency")
+        if concurrency is None:
+            concurrency = settings.CELERY_ASYNC_WORKER_CONCURRENCY
+
+        cmd = [
+            "celery",
+            "-A",
+            "EditEngine",
+            "worker",
+            "--pool",
+            "threads",
+            "--concurrency",
+            str(concurrency),
+            "--loglevel",
+            options["loglevel"],
+        ]
+        if options["purge"]:
+            cmd.append("--purge")
+        return cmd
+
+    def _build_environment(self, options) -> Dict[str, str]:
+        """Build the worker environment with its in-flight LLM request limit."""
+        max_in_flight = options.get("max_in_flight")
+        if max_in_flight is None:
+            max_in_flight = LLM_MAX_IN_FLIGHT_REQUESTS or DEFAULT_MAX_IN_FLIGHT_REQUESTS
+
+        env = os.environ.copy()
+        env["LLM_MAX_IN_FLIGHT_REQUESTS"] = str(max_in_flight)
+        return env
@@ -0,0 +1,84 @@
+"""Packing of several paragraphs into a single LLM prompt.
+
+Each paragraph is wrapped in numbered delimiter lines so that one response can be
+split back into per-paragraph outputs. Parts that cannot be recovered unambiguously
+are reported as missing so callers can retry just those paragraphs on their own.
+"""
+
+import re
+from typing import List, Optional
+
+PARAGRAPH_START_TEMPLATE = "<<<PARAGRAPH {number}>>>"
+PARAGRAPH_END_TEMPLATE = "<<<END PARAGRAPH {number}>>>"
+
+# Any text that could be mistaken for a delimiter disqualifies a paragraph from
+# packing, since its response part could not be split back out reliably
+_DELIMITER_FRAGMENT = "<<<"
+
+_PACKED_PART_PATTERN = re.compile(
+    r"<<<PARAGRAPH (\d+)>>>(.*?)<<<END PARAGRAPH \1>>>", re.DOTALL
+)
+
+
+def can_pack(text: str) -> bool:
+    """Return whether a paragraph can be safely wrapped in packing delimiters."""
+    return _DELIMITER_FRAGMENT not in text
+
+
+def pack_paragraphs(texts: List[str]) -> str:
+    """Join paragraphs into a single prompt body with numbered delimiters.
+
+    Args:
+        texts: The paragraphs to pack, in order
+
+    Returns:
+        The delimited text, numbering paragraphs from 1
+    """
+    blocks = []
+    for number, text in enumerate(texts, start=1):
+        blocks.append(
+            "\n".join(
+                [
+                    PARAGRAPH_START_TEMPLATE.format(number=number),
+                    text,
+                    PARAGRAPH_END_TEMPLATE.format(number=number),
+                ]
+            )
+        )
+    return "\n\n".join(blocks)
+
+
+def unpack_paragraphs(response: str, count: int) -> List[Optional[str]]:
+    """Split a packed LLM response back into per-paragraph outputs.
+
+    A part is None when it is missing, empty, duplicated or still contains
+    delimiter text, meaning that paragraph needs to be edited on its own.
+
+    Args:
+        response: The raw packed LLM response
+        count: Number of paragraphs that were packed into the prompt
+
+    Returns:
+        One output per packed paragraph, in the original order
+    """
+    parts: List[Optional[str]] = [None] * count
+    seen = set()
+    duplicated = set()
+
+    for match in _PACKED_PART_PATTERN.finditer(response or ""):
+        index = int(match.group(1)) - 1
+        if not 0 <= index < count:
+            continue
+        if index in seen:
+            duplicated.add(index)
+            continue
+        seen.add(index)
+
+        part = match.group(2).strip()
+        if part and _DELIMITER_FRAGMENT not in part:
+            parts[index] = part
+
+    for index in duplicated:
+        parts[index] = None
+
+    return parts
@@ -1,8 +1,15 @@
-"""Prompt templates for Wiki editing operations."""
+"""Prompt templates for Wiki editing operations.
 
-from typing import List
+Prompts are chat templates: a system message holding the static instructions and
+constraints, followed by a user message holding only the wikitext. Keeping every
+variable part out of the system message gives each request the same prefix, so
+providers can serve it from their prompt cache.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Union
 
-from langchain.prompts import PromptTemplate
+from langchain_core.prompts import ChatPromptTemplate
 
 # Critical constraints used in prompts
 SHARED_CRITICAL_CONSTRAINTS = """== Critical Preservation Rules ==
@@ -58,13 +65,74 @@ Conciseness Rules:
 * We care about the brevity of the display text, not concise wikitext markup"""
 
 
+SINGLE_PARAGRAPH_OUTPUT_INSTRUCTIONS = (
+    "Return only the edited version of the wikitext in the user message."
+)
+
+
+PACKED_PARAGRAPHS_OUTPUT_INSTRUCTIONS = """== Multiple Paragraphs ==
+
+The wikitext in the user message contains several independent paragraphs. Each one starts with a line like `<<<PARAGRAPH 1>>>` and ends with the matching line `<<<END PARAGRAPH 1>>>`.
+
+* Edit each paragraph independently, applying every rule above to each one
+* Never move, merge, or split content between paragraphs
+* Return every paragraph in the same order, wrapped in the same delimiter lines with the same numbers
+* If no safe improvements are possible for a paragraph, return only <UNCHANGED> between its delimiter lines
+* Do not write anything outside the delimiter lines
+
+Return only the edited paragraphs."""
+
+
+def _output_instructions(packed: bool) -> str:
+    """Get the closing instructions for single-paragraph or packed prompts."""
+    if packed:
+        return PACKED_PARAGRAPHS_OUTPUT_INSTRUCTIONS
+    return SINGLE_PARAGRAPH_OUTPUT_INSTRUCTIONS
+
+
+# The only variable part of a prompt, sent as its own user message
+USER_MESSAGE_TEMPLATE = "{wikitext}"
+
+
+def _build_chat_prompt(
+    system_prompt: str, cache_system_prompt: bool = False
+) -> ChatPromptTemplate:
+    """Build a chat prompt from static system instructions and the wikitext.
+
+    Args:
+        system_prompt: Instructions and constraints shared by every request
+        cache_system_prompt: Whether to mark the system message with an explicit
+            cache breakpoint, for providers that only cache marked prefixes
+    """
+    if cache_system_prompt:
+        system_content: Union[str, List[Dict[str, Any]]] = [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+    else:
+        system_content = system_prompt
+    return ChatPromptTemplate.from_messages(
+        [("system", system_content), ("human", USER_MESSAGE_TEMPLATE)]
+    )
+
+
 class PromptTemplateFactory:
     """Factory for creating different types of editing prompts."""
 
     @staticmethod
-    def create_brevity_prompt() -> PromptTemplate:
-        """Creates a prompt template for brevity editing."""
-        return PromptTemplate.from_template(
+    def create_brevity_prompt(
+        packed: bool = False, cache_system_prompt: bool = False
+    ) -> ChatPromptTemplate:
+        """Creates a prompt template for brevity editing.
+
+        Args:
+            packed: Whether the prompt edits several delimited paragraphs at once
+            cache_system_prompt: Whether to mark the system message as cacheable
+        """
+        return _build_chat_prompt(
             f"""You are an expert editor specializing in concise, clear writing.
 
 == Your Task ==
@@ -79,16 +147,21 @@ Edit the following wikitext for brevity while preserving all meaning.
 
 {SHARED_CRITICAL_CONSTRAINTS}
 
-Return only the edited version of the following wikitext:
-
-{{wikitext}}
-"""
+{_output_instructions(packed)}""",
+            cache_system_prompt,
         )
 
     @staticmethod
-    def create_copyedit_prompt() -> PromptTemplate:
-        """Creates a prompt template for general copy editing."""
-        return PromptTemplate.from_template(
+    def create_copyedit_prompt(
+        packed: bool = False, cache_system_prompt: bool = False
+    ) -> ChatPromptTemplate:
+        """Creates a prompt template for general copy editing.
+
+        Args:
+            packed: Whether the prompt edits several delimited paragraphs at once
+            cache_system_prompt: Whether to mark the system message as cacheable
+        """
+        return _build_chat_prompt(
             f"""You are an expert editor specializing in clarity and correctness.
 
 == Your Task ==
@@ -101,22 +174,23 @@ Perform a general copy edit on the following wikitext.
 
 {SHARED_CRITICAL_CONSTRAINTS}
 
-Return only the edited version of the following wikitext:
-
-{{wikitext}}
-"""
+{_output_instructions(packed)}""",
+            cache_system_prompt,
         )
 
     @staticmethod
     def create_custom_prompt(
-        task_description: str, specific_constraints: str = ""
-    ) -> PromptTemplate:
+        task_description: str,
+        specific_constraints: str = "",
+        packed: bool = False,
+        cache_system_prompt: bool = False,
+    ) -> ChatPromptTemplate:
         """Creates a custom prompt template with specified task and constraints."""
         constraints_section = (
             f"\n{specific_constraints}" if specific_constraints else ""
         )
 
-        return PromptTemplate.from_template(
+        return _build_chat_prompt(
             f"""You are an expert editor.
 
 == Your Task ==
@@ -124,23 +198,39 @@ Return only the edited version of the following wikitext:
 
 {SHARED_CRITICAL_CONSTRAINTS}
 
-Return only the edited version of the following wikitext:
-
-{{wikitext}}
-"""
+{_output_instructions(packed)}""",
+            cache_system_prompt,
         )
 
 
 class PromptManager:
-    """Manages prompt templates and their associated configurations."""
+    """Manages prompt templates and their associated configurations.
+
+    Args:
+        cache_system_prompt: Whether templates mark their system message with an
+            explicit cache breakpoint (needed for Anthropic prompt caching)
+    """
 
-    def __init__(self):
+    def __init__(self, cache_system_prompt: bool = False):
+        self.cache_system_prompt = cache_system_prompt
         self.templates = {
-            "brevity": PromptTemplateFactory.create_brevity_prompt(),
-            "copyedit": PromptTemplateFactory.create_copyedit_prompt(),
+            "brevity": PromptTemplateFactory.create_brevity_prompt(
+                cache_system_prompt=cache_system_prompt
+            ),
+            "copyedit": PromptTemplateFactory.create_copyedit_prompt(
+                cache_system_prompt=cache_system_prompt
+            ),
+        }
+        self.packed_templates = {
+            "brevity": PromptTemplateFactory.create_brevity_prompt(
+                packed=True, cache_system_prompt=cache_system_prompt
+            ),
+            "copyedit": PromptTemplateFactory.create_copyedit_prompt(
+                packed=True, cache_system_prompt=cache_system_prompt
+            ),
         }
 
-    def get_template(self, mode: str) -> PromptTemplate:
+    def get_template(self, mode: str) -> ChatPromptTemplate:
         """Get a prompt template by mode name."""
         if mode not in self.templates:
             available_modes = list(self.templates.keys())
@@ -149,12 +239,42 @@ class PromptManager:
             )
         return self.templates[mode]
 
+    def get_packed_template(self, mode: str) -> ChatPromptTemplate:
+        """Get the multi-paragraph variant of a prompt template by mode name."""
+        self.get_template(mode)  # Raises for unknown modes
+        return self.packed_templates[mode]
+
+    def get_template_version(self, mode: str) -> str:
+        """Get a short version identifier derived from a template's content.
+
+        The version changes whenever the single or packed prompt text changes, so
+        anything keyed on it (such as cached LLM responses) is invalidated by
+        prompt edits.
+        """
+        content = self.get_static_prompt_text(mode) + self.get_static_prompt_text(
+            mode, packed=True
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+    def get_static_prompt_text(self, mode: str, packed: bool = False) -> str:
+        """Render a template without wikitext, i.e. the part shared by every call."""
+        template = self.get_packed_template(mode) if packed else self.get_template(mode)
+        return template.format(wikitext="")
+
     def add_custom_template(
         self, name: str, task_description: str, specific_constraints: str = ""
     ):
         """Add a custom prompt template."""
         self.templates[name] = PromptTemplateFactory.create_custom_prompt(
-            task_description, specific_constraints
+            task_description,
+            specific_constraints,
+            cache_system_prompt=self.cache_system_prompt,
+        )
+        self.packed_templates[name] = PromptTemplateFactory.create_custom_prompt(
+            task_description,
+            specific_constraints,
+            packed=True,
+            cache_system_prompt=self.cache_system_prompt,
         )
 
     def list_available_modes(self) -> List[str]:
@@ -0,0 +1,116 @@
+"""Flags telling workers to stop edit tasks that were cancelled.
+
+Cancelling a queued task only needs its Celery message revoked, but a running
+task is already inside its worker. The cancel endpoint therefore also sets a
+flag for the task, which the worker polls while it collects paragraph results;
+once the flag is seen, the worker cancels the task's outstanding LLM calls and
+records the task as revoked. Flags expire on their own, so they are never
+cleared explicitly.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+import redis
+
+from services.core.constants import TASK_CANCELLATION_BACKEND
+
+# Flags outlive any task that could still be running
+FLAG_TTL_SECONDS = 86400  # 1 day
+
+
+class TaskCancellationFlags(ABC):
+    """Base class for stores of cancellation flags keyed by task id."""
+
+    @abstractmethod
+    def cancel(self, task_id: str) -> None:
+        """Flag a task as cancelled; never raises."""
+
+    @abstractmethod
+    def is_cancelled(self, task_id: str) -> bool:
+        """Check if a task was flagged as cancelled; never raises."""
+
+
+class InMemoryTaskCancellationFlags(TaskCancellationFlags):
+    """Per-process flags, for tests and single-process deployments.
+
+    Args:
+        ttl_seconds: How long a flag is kept
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = FLAG_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._expiries: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def cancel(self, task_id: str) -> None:
+        with self._lock:
+            self._expiries[task_id] = self._clock() + self.ttl_seconds
+
+    def is_cancelled(self, task_id: str) -> bool:
+        with self._lock:
+            expiry = self._expiries.get(task_id)
+            if expiry is not None and expiry <= self._clock():
+                del self._expiries[task_id]
+                return False
+            return expiry is not None
+
+
+class RedisTaskCancellationFlags(TaskCancellationFlags):
+    """Redis-backed flags shared by web and worker processes.
+
+    Redis failures are reported as no cancellation, so an outage never stops a
+    task; the task still ends up revoked when the cancel endpoint marked it.
+    """
+
+    KEY_PREFIX = "editengine:cancelled:"
+
+    def __init__(self, client: redis.Redis, ttl_seconds: int = FLAG_TTL_SECONDS):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def cancel(self, task_id: str) -> None:
+        try:
+            self.client.set(self.KEY_PREFIX + task_id, 1, ex=self.ttl_seconds)
+        except redis.RedisError:
+            return
+
+    def is_cancelled(self, task_id: str) -> bool:
+        try:
+            return bool(self.client.exists(self.KEY_PREFIX + task_id))
+        except redis.RedisError:
+            return False
+
+
+_cancellation_flags_instance: Optional[TaskCancellationFlags] = None
+_cancellation_flags_initialized = False
+
+
+def get_task_cancellation_flags() -> Optional[TaskCancellationFlags]:
+    """Return the process-wide cancellation flags configured for this deployment.
+
+    Returns:
+        The configured flags, or None when running tasks cannot be cancelled
+    """
+    global _cancellation_flags_instance, _cancellation_flags_initialized
+    if not _cancellation_flags_initialized:
+        if TASK_CANCELLATION_BACKEND == "redis":
+            from services.utils.redis_client import get_redis_client
+
+            _cancellation_flags_instance = RedisTaskCancellationFlags(
+                get_redis_client()
+            )
+        elif TASK_CANCELLATION_BACKEND == "memory":
+            _cancellation_flags_instance = InMemoryTaskCancellationFlags()
+        else:
+            _cancellation_flags_instance = None
+        _cancellation_flags_initialized = True
+    return _cancellation_flags_instance
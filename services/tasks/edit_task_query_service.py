@@ -6,6 +6,7 @@ from django.db.models import QuerySet
 
 from api.exceptions import ValidationError
 from data.models.edit_task import EditTask
+from services.tracking.progress_store import get_progress_store
 
 
 class EditTaskQueryService:
@@ -76,7 +77,8 @@ class EditTaskQueryService:
         Raises:
             ValueError: If date filters are not in valid ISO format
         """
-        queryset = EditTask.objects.all()
+        # Section tasks of a whole-article edit are reached through their article
+        queryset = EditTask.objects.filter(parent__isnull=True)
 
         # Apply basic filters
         if status_filter:
@@ -141,6 +143,148 @@ class EditTaskQueryService:
         )
         return changed_count
 
+    @staticmethod
+    def find_completed_task(
+        editing_mode: str,
+        article_title: str,
+        section_title: Optional[str],
+        llm_provider: str,
+        llm_model: str,
+        prompt_version: str,
+        revision_id: int,
+    ) -> Optional[EditTask]:
+        """Find the latest successful task that edited the same revision the same way.
+
+        Args:
+            editing_mode: The editing mode of the request
+            article_title: Title of the edited article
+            section_title: Title of the edited section, or None for the whole article
+            llm_provider: LLM provider of the request
+            llm_model: Model the provider's tasks are run with
+            prompt_version: Version of the editing prompt for the editing mode
+            revision_id: The article's current revision ID
+
+        Returns:
+            The most recently completed matching task, or None if there is none
+        """
+        return (
+            EditTask.objects.filter(
+                parent__isnull=True,
+                status="SUCCESS",
+                editing_mode=editing_mode,
+                article_title=article_title,
+                section_title=section_title,
+                llm_provider=llm_provider,
+                llm_model=llm_model,
+                prompt_version=prompt_version,
+                revision_id=revision_id,
+            )
+            .order_by("-completed_at")
+            .first()
+        )
+
+    @staticmethod
+    def find_previous_edit(edit_task: EditTask) -> Optional[EditTask]:
+        """Find the latest successful edit of the same section as a task.
+
+        Sections edited as part of a whole-article task count too.
+
+        Args:
+            edit_task: The task editing the section again
+
+        Returns:
+            The most recently completed task with the same article, section,
+            editing mode, model and prompt version, or None if there is none
+        """
+        return (
+            EditTask.objects.filter(
+                status="SUCCESS",
+                editing_mode=edit_task.editing_mode,
+                article_title=edit_task.article_title,
+                section_title=edit_task.section_title,
+                llm_model=edit_task.llm_model,
+                prompt_version=edit_task.prompt_version,
+            )
+            .exclude(id=edit_task.id)
+            .order_by("-completed_at")
+            .first()
+        )
+
+    @staticmethod
+    def get_partial_results(edit_task: EditTask) -> Optional[List[Dict[str, Any]]]:
+        """Get the paragraph results a task completed so far, in section order.
+
+        Results kept in the live progress store while the task runs are merged
+        over those saved to the task, such as by an earlier attempt at it.
+
+        Args:
+            edit_task: The task whose paragraph results are read
+
+        Returns:
+            List of paragraph result dictionaries, or None if none are recorded
+        """
+        paragraphs = {
+            paragraph["index"]: paragraph
+            for paragraph in edit_task.partial_results or []
+        }
+        progress_store = get_progress_store()
+        if progress_store is not None:
+            live_results = progress_store.get_partial_results(str(edit_task.id))
+            paragraphs.update(
+                (paragraph["index"], paragraph) for paragraph in live_results or []
+            )
+        if not paragraphs:
+            return None
+        return [paragraphs[index] for index in sorted(paragraphs)]
+
+    @staticmethod
+    def get_article_progress(article_task: EditTask) -> Dict[str, Any]:
+        """Build the per-section progress of a whole-article task.
+
+        Running sections report the progress percentage of their own task, read
+        from the live progress store when it has one; finished sections count
+        as complete.
+
+        Args:
+            article_task: EditTask that edits a whole article through section tasks
+
+        Returns:
+            Dictionary with section counts, overall percentage and each section
+        """
+        progress_store = get_progress_store()
+        sections = []
+        sections_completed = 0
+        for section_task in article_task.sections.order_by("section_index"):
+            if section_task.is_completed():
+                sections_completed += 1
+                percentage = 100
+            else:
+                progress_data = None
+                if progress_store is not None:
+                    progress_data = progress_store.get(str(section_task.id))
+                if progress_data is None:
+                    progress_data = section_task.get_progress_for_api() or {}
+                percentage = progress_data.get("progress_percentage", 0)
+            sections.append(
+                {
+                    "index": section_task.section_index,
+                    "section_title": section_task.section_title,
+                    "task_id": str(section_task.id),
+                    "status": section_task.status,
+                    "progress_percentage": percentage,
+                }
+            )
+
+        total_percentage = sum(section["progress_percentage"] for section in sections)
+        return {
+            "sections_total": article_task.sections_total,
+            "sections_completed": sections_completed,
+            "progress_percentage": (
+                round(total_percentage / len(sections)) if sections else 0
+            ),
+            "sections": sections,
+        }
+
     @staticmethod
     def serialize_task_list(page_obj) -> List[Dict[str, Any]]:
         """Serialize a list of EditTask objects for API response.
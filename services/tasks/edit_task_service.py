@@ -1,9 +1,41 @@
+import uuid
 from typing import Any, Dict, Optional
 
-from api.exceptions import APIKeyError
+from asgiref.sync import async_to_sync
+from celery import current_app
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+
+from api.exceptions import APIKeyError, UserFacingError, ValidationError
 from data.models.edit_task import EditTask
+from data.models.edit_task_submission import EditTaskSubmission
+from services.core.constants import (
+    EDIT_QUEUE_ROUTING_ENABLED,
+    LLM_FAKE_PROVIDER_ENABLED,
+    RESULT_CACHE_ENABLED,
+)
+from services.llm.fake_llm import FakeLLMProfile
+from services.prompts.prompt_manager import PromptManager
 from services.security.encryption_service import EncryptionService
-from services.tasks.edit_tasks import process_edit_task_batched
+from services.tasks.cancellation import get_task_cancellation_flags
+from services.tasks.edit_task_query_service import EditTaskQueryService
+from services.tasks.edit_tasks import (
+    get_model_name,
+    process_edit_article_task,
+    process_edit_task_batched,
+)
+from services.tasks.in_flight_registry import (
+    get_coalescing_key,
+    get_in_flight_registry,
+)
+from services.tasks.queue_routing import get_edit_queue
+from services.tracking.task_events import DONE_EVENT, get_task_event_broker
+from services.utils.wiki_utils import extract_section_content
+from services.utils.wikipedia_api import WikipediaAPI, WikipediaAPIError
+
+# Attempts to take over a coalescing key from tasks that are no longer in flight
+MAX_COALESCING_ATTEMPTS = 3
 
 
 class EditTaskService:
@@ -16,8 +48,13 @@ class EditTaskService:
         anthropic_api_key: Optional[str],
         mistral_api_key: Optional[str],
         perplexity_api_key: Optional[str],
+        fake_llm_profile: Optional[str] = None,
     ) -> Dict[str, str]:
-        """Create a configuration dictionary for the LLM to be used in the task."""
+        """Create a configuration dictionary for the LLM to be used in the task.
+
+        The fake provider is only chosen when no real API key is given and it is
+        enabled with ``LLM_FAKE_PROVIDER_ENABLED``.
+        """
         if google_api_key:
             return {"provider": "google", "api_key": google_api_key}
         elif openai_api_key:
@@ -28,6 +65,12 @@ class EditTaskService:
             return {"provider": "mistral", "api_key": mistral_api_key}
         elif perplexity_api_key:
             return {"provider": "perplexity", "api_key": perplexity_api_key}
+        elif fake_llm_profile is not None and LLM_FAKE_PROVIDER_ENABLED:
+            try:
+                FakeLLMProfile.from_config(fake_llm_profile)
+            except ValueError as e:
+                raise ValidationError(str(e)) from e
+            return {"provider": "fake", "api_key": "", "fake_profile": fake_llm_profile}
         else:
             raise APIKeyError()
 
@@ -38,30 +81,94 @@ class EditTaskService:
         anthropic_api_key: Optional[str],
         mistral_api_key: Optional[str],
         perplexity_api_key: Optional[str],
+        fake_llm_profile: Optional[str] = None,
     ) -> bool:
-        """Validate that at least one API key is provided."""
+        """Validate that at least one API key, or an enabled fake profile, is provided."""
         return bool(
             google_api_key
             or openai_api_key
             or anthropic_api_key
             or mistral_api_key
             or perplexity_api_key
+            or (fake_llm_profile is not None and LLM_FAKE_PROVIDER_ENABLED)
         )
 
     @staticmethod
     def create_edit_task(
         editing_mode: str,
         article_title: str,
-        section_title: str,
+        section_title: Optional[str],
         llm_config: Dict[str, Any],
+        revision_id: Optional[int] = None,
     ) -> EditTask:
-        """Create a new EditTask record in the database."""
+        """Create a new EditTask record in the database.
+
+        The task edits the given article revision, or the latest one if None.
+        """
         return EditTask.objects.create(
             editing_mode=editing_mode,
             article_title=article_title,
             section_title=section_title,
+            revision_id=revision_id,
             llm_provider=llm_config.get("provider"),
             llm_model=llm_config.get("model"),
+            prompt_version=PromptManager().get_template_version(editing_mode),
+        )
+
+    @staticmethod
+    def get_current_revision_id(
+        article_title: str, routed: bool = False
+    ) -> Optional[int]:
+        """Look up the ID of an article's latest revision in a single request.
+
+        Only the revision ID is fetched; a routed section edit fetches its
+        section from this revision later, once no existing task can be reused.
+
+        Args:
+            article_title: The article to look up
+            routed: Whether the edit's queue is picked from the size of its
+                section at this revision
+
+        Returns:
+            The revision ID, or None if neither the result cache nor queue
+            routing needs it or the revision could not be looked up
+        """
+        if not RESULT_CACHE_ENABLED and not (routed and EDIT_QUEUE_ROUTING_ENABLED):
+            return None
+        try:
+            return async_to_sync(WikipediaAPI().get_latest_revision_id)(article_title)
+        except WikipediaAPIError:
+            # The task reports the error when it fetches the article itself
+            return None
+
+    @staticmethod
+    def find_completed_task(
+        editing_mode: str,
+        article_title: str,
+        section_title: Optional[str],
+        llm_config: Dict[str, Any],
+        revision_id: Optional[int],
+    ) -> Optional[EditTask]:
+        """Find a finished task whose result answers this request.
+
+        Results are only reused for a known revision and a real provider, since
+        the profile of the fake provider is not stored with tasks.
+
+        Returns:
+            The latest successful task with the same editing parameters at the
+            same revision, or None
+        """
+        provider = llm_config["provider"]
+        if not RESULT_CACHE_ENABLED or revision_id is None or provider == "fake":
+            return None
+        return EditTaskQueryService.find_completed_task(
+            editing_mode=editing_mode,
+            article_title=article_title,
+            section_title=section_title,
+            llm_provider=provider,
+            llm_model=get_model_name(provider),
+            prompt_version=PromptManager().get_template_version(editing_mode),
+            revision_id=revision_id,
         )
 
     @staticmethod
@@ -69,28 +176,277 @@ class EditTaskService:
         edit_task_id: str,
         article_title: str,
         section_title: str,
+        bypass_cache: bool = False,
+        force: bool = False,
     ) -> Dict[str, Any]:
         """Build task parameters for the Celery task."""
         return {
             "edit_task_id": edit_task_id,
             "article_title": article_title,
             "section_title": section_title,
+            "bypass_cache": bypass_cache,
+            "force": force,
         }
 
     @staticmethod
     def start_processing_task(
-        editing_mode: str, llm_config: Dict[str, Any], task_kwargs: Dict[str, Any]
+        editing_mode: str,
+        llm_config: Dict[str, Any],
+        task_kwargs: Dict[str, Any],
+        queue: Optional[str] = None,
     ) -> str:
-        """Start processing the edit task asynchronously and return the Celery task ID."""
+        """Start processing the edit task asynchronously and return the Celery task ID.
+
+        The task goes to the given queue, or the default queue if none is given.
+        """
         # Encrypt the llm_config to secure API keys in transit
         encryption_service = EncryptionService()
         encrypted_config = encryption_service.encrypt_dict(llm_config)
 
-        celery_task = process_edit_task_batched.delay(
+        celery_task = process_edit_task_batched.apply_async(
+            kwargs={
+                "editing_mode": editing_mode,
+                "encrypted_llm_config": encrypted_config,
+                **task_kwargs,
+            },
+            queue=queue,
+        )
+        return celery_task.id
+
+    @staticmethod
+    def get_section_queue(
+        section_title: str, revision_id: Optional[int]
+    ) -> Optional[str]:
+        """Pick the queue for a section edit from the size of the section.
+
+        Only the section is fetched, from the revision the task is pinned to,
+        and parsed to count the paragraphs that will be edited, so small edits
+        are not queued behind large ones.
+
+        Returns:
+            The queue for small or large edits, or None for the default queue if
+            routing is disabled or the section could not be fetched
+        """
+        if not EDIT_QUEUE_ROUTING_ENABLED or revision_id is None:
+            return None
+        try:
+            section_wikitext = async_to_sync(WikipediaAPI().get_section_wikitext)(
+                revision_id, section_title
+            )
+        except WikipediaAPIError:
+            return None
+        if section_wikitext is None:
+            return None
+        section_content = extract_section_content(section_wikitext, section_title)
+        if section_content is None:
+            return None
+        return get_edit_queue(section_content)
+
+    @staticmethod
+    def start_article_processing_task(
+        editing_mode: str, llm_config: Dict[str, Any], task_kwargs: Dict[str, Any]
+    ) -> str:
+        """Start splitting a whole article into section tasks and return the Celery task ID."""
+        encryption_service = EncryptionService()
+        encrypted_config = encryption_service.encrypt_dict(llm_config)
+
+        celery_task = process_edit_article_task.delay(
             editing_mode=editing_mode, encrypted_llm_config=encrypted_config, **task_kwargs
         )
         return celery_task.id
 
+    @classmethod
+    def find_in_flight_task(
+        cls, edit_task: EditTask, coalescing_key: str
+    ) -> Optional[EditTaskSubmission]:
+        """Register a new task as in flight, or attach to a matching task in flight.
+
+        A task found in the registry only counts while it is queued or running;
+        keys of finished tasks are taken over by the new task.
+
+        Args:
+            edit_task: The EditTask created for the submission
+            coalescing_key: Key of the submission's editing parameters
+
+        Returns:
+            The submission attached to the matching queued or running task, or
+            None if the new task should be started
+        """
+        registry = get_in_flight_registry()
+        if registry is None:
+            return None
+
+        task_id = str(edit_task.id)
+        holder_id = registry.claim(coalescing_key, task_id)
+        for _ in range(MAX_COALESCING_ATTEMPTS):
+            if holder_id is None:
+                return None
+            submission = cls.attach_submission(holder_id)
+            if submission is not None:
+                return submission
+            if registry.replace(coalescing_key, holder_id, task_id):
+                return None
+            holder_id = registry.claim(coalescing_key, task_id)
+        return None
+
+    @staticmethod
+    def attach_submission(task_id: str) -> Optional[EditTaskSubmission]:
+        """Add a submission to a task, if the task is still queued or running.
+
+        The task's row is locked, so a submission is never attached to a task
+        that its last other submission is cancelling at the same time.
+
+        Returns:
+            The new submission, or None if the task is no longer in flight
+        """
+        with transaction.atomic():
+            edit_task = (
+                EditTask.objects.select_for_update()
+                .filter(id=task_id, status__in=["PENDING", "STARTED", "RETRY"])
+                .first()
+            )
+            if edit_task is None:
+                return None
+            return EditTaskSubmission.objects.create(edit_task=edit_task)
+
+    @staticmethod
+    def release_in_flight_task(edit_task: EditTask, coalescing_key: str) -> None:
+        """Drop a task from the in-flight registry, as when it could not be started."""
+        registry = get_in_flight_registry()
+        if registry is not None:
+            registry.release(coalescing_key, str(edit_task.id))
+
+    @classmethod
+    def cancel_edit_task(
+        cls, edit_task: EditTask, cancel_token: Optional[str]
+    ) -> EditTask:
+        """Withdraw a client's submission, cancelling the task once none remain.
+
+        Identical submissions share a task, so the task keeps running while
+        other clients still wait for it. Once the last submission is withdrawn,
+        the task and its unfinished sections are marked revoked and their Celery
+        messages revoked, so a queued task never starts. Running tasks are
+        flagged as cancelled; their worker notices the flag and cancels the LLM
+        calls still outstanding. Cancelling a task that was already cancelled
+        does nothing.
+
+        Args:
+            edit_task: The task to cancel
+            cancel_token: Cancel token of the client's submission
+
+        Returns:
+            The task in its state after the cancellation
+
+        Raises:
+            UserFacingError: If the token is not one of the task's submissions,
+                the task already succeeded or failed, or it is running and
+                cancellation flags are disabled
+        """
+        with transaction.atomic():
+            edit_task = EditTask.objects.select_for_update().get(id=edit_task.id)
+            submission = cls.find_submission(edit_task, cancel_token)
+            if submission is None:
+                raise UserFacingError(
+                    "The task can only be cancelled by a client that submitted it.",
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    error_code="TASK_NOT_SUBMITTED",
+                )
+            if edit_task.status in ("SUCCESS", "FAILURE"):
+                raise UserFacingError(
+                    "The task has already finished and cannot be cancelled.",
+                    status_code=status.HTTP_409_CONFLICT,
+                    error_code="TASK_ALREADY_FINISHED",
+                )
+            if edit_task.status == "REVOKED":
+                return edit_task
+
+            if submission.withdrawn_at is None:
+                submission.withdrawn_at = timezone.now()
+                submission.save(update_fields=["withdrawn_at"])
+            if edit_task.submissions.filter(withdrawn_at__isnull=True).exists():
+                return edit_task
+
+            cancelled_tasks = [
+                edit_task,
+                *edit_task.sections.exclude(
+                    status__in=["SUCCESS", "FAILURE", "REVOKED"]
+                ).order_by("section_index"),
+            ]
+            # Workers only notice that a running edit was cancelled through
+            # its flag; without flags they would finish it regardless
+            if get_task_cancellation_flags() is None and any(
+                cls.is_editing(task) for task in cancelled_tasks
+            ):
+                raise UserFacingError(
+                    "The task is already running and cannot be stopped.",
+                    status_code=status.HTTP_409_CONFLICT,
+                    error_code="TASK_CANNOT_BE_STOPPED",
+                )
+            for task in cancelled_tasks:
+                task.mark_revoked()
+
+        for task in cancelled_tasks:
+            cls.stop_cancelled_task(task)
+        return edit_task
+
+    @staticmethod
+    def is_editing(edit_task: EditTask) -> bool:
+        """Check if a worker is editing the task's paragraphs.
+
+        Whole-article tasks only split the article, and their sections check
+        whether the article was cancelled before they start.
+        """
+        return edit_task.section_title is not None and edit_task.status in (
+            "STARTED",
+            "RETRY",
+        )
+
+    @staticmethod
+    def find_submission(
+        edit_task: EditTask, cancel_token: Optional[str]
+    ) -> Optional[EditTaskSubmission]:
+        """Find the task's submission with the given cancel token, if any."""
+        try:
+            token = uuid.UUID(cancel_token or "")
+        except ValueError:
+            return None
+        return edit_task.submissions.filter(cancel_token=token).first()
+
+    @staticmethod
+    def stop_cancelled_task(edit_task: EditTask) -> None:
+        """Stop the worker processing a cancelled task and end its result streams."""
+        flags = get_task_cancellation_flags()
+        if flags is not None:
+            flags.cancel(str(edit_task.id))
+
+        if edit_task.celery_task_id:
+            try:
+                current_app.control.revoke(edit_task.celery_task_id)
+            except Exception:
+                # Workers skip messages of revoked tasks even without the revoke
+                pass
+
+        broker = get_task_event_broker()
+        if broker is not None:
+            broker.publish(str(edit_task.id), DONE_EVENT, {"status": edit_task.status})
+
+    @staticmethod
+    def build_task_response(
+        task_id: str, submission: Optional[EditTaskSubmission] = None
+    ) -> Dict[str, Any]:
+        """Build the response pointing the client to a task's results.
+
+        Responses for a task the client submitted or attached to include the
+        cancel token of its submission.
+        """
+        response = {
+            "task_id": task_id,
+            "status_url": f"/api/results/{task_id}",
+        }
+        if submission is not None:
+            response["cancel_token"] = str(submission.cancel_token)
+        return response
+
     @staticmethod
     def update_task_with_celery_id(edit_task: EditTask, celery_task_id: str) -> None:
         """Update the EditTask with the Celery task ID."""
@@ -98,24 +454,19 @@ class EditTaskService:
         edit_task.save(update_fields=["celery_task_id"])
 
     @classmethod
-    def create_and_start_edit_task(
+    def resolve_llm_config(
         cls,
-        editing_mode: str,
-        article_title: str,
-        section_title: str,
         google_api_key: Optional[str],
         openai_api_key: Optional[str],
         anthropic_api_key: Optional[str],
         mistral_api_key: Optional[str],
         perplexity_api_key: Optional[str],
-    ) -> Dict[str, Any]:
-        """Complete workflow to create and start an edit task.
-
-        Returns:
-            Dict containing task_id and status_url
+        fake_llm_profile: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Validate the given API keys and create the LLM configuration for a task.
 
         Raises:
-            ValueError: If no valid API key is provided
+            APIKeyError: If no valid API key is provided
         """
         # Validate API keys
         if not cls.validate_api_keys(
@@ -124,45 +475,210 @@ class EditTaskService:
             anthropic_api_key,
             mistral_api_key,
             perplexity_api_key,
+            fake_llm_profile,
         ):
             raise APIKeyError(
                 "API key required. Provide one of: X-Google-API-Key, X-OpenAI-API-Key, X-Anthropic-API-Key, X-Mistral-API-Key, or X-Perplexity-API-Key header"
             )
 
         # Create LLM configuration
-        llm_config = cls.create_llm_config(
+        return cls.create_llm_config(
             google_api_key,
             openai_api_key,
             anthropic_api_key,
             mistral_api_key,
             perplexity_api_key,
+            fake_llm_profile,
         )
 
+    @classmethod
+    def create_and_start_edit_task(
+        cls,
+        editing_mode: str,
+        article_title: str,
+        section_title: str,
+        google_api_key: Optional[str],
+        openai_api_key: Optional[str],
+        anthropic_api_key: Optional[str],
+        mistral_api_key: Optional[str],
+        perplexity_api_key: Optional[str],
+        bypass_cache: bool = False,
+        fake_llm_profile: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Complete workflow to create and start an edit task.
+
+        When ``bypass_cache`` is set, every paragraph is sent to the provider even
+        if a cached response exists. ``fake_llm_profile`` selects the fake
+        provider for load testing when it is enabled.
+
+        The task is pinned to the article's current revision. If a task with the
+        same editing parameters already succeeded at that revision, its ids are
+        returned instead unless ``force`` is set. Unless forced, paragraphs
+        unchanged since the section's last completed edit reuse its results. If
+        an identical submission is already queued or running, no new task is
+        started and the returned ids are those of the task in flight.
+        Forced submissions and those that bypass the cache always start their
+        own task.
+
+        Returns:
+            Dict containing task_id and status_url, and the cancel_token of the
+            client's submission unless a finished result is returned
+
+        Raises:
+            ValueError: If no valid API key is provided
+        """
+        llm_config = cls.resolve_llm_config(
+            google_api_key,
+            openai_api_key,
+            anthropic_api_key,
+            mistral_api_key,
+            perplexity_api_key,
+            fake_llm_profile,
+        )
+
+        # The section is only fetched for queue routing once no finished or
+        # in-flight task can be reused
+        revision_id = cls.get_current_revision_id(article_title, routed=True)
+
+        # Return the result of an identical edit of the current revision
+        if not force and not bypass_cache:
+            completed_task = cls.find_completed_task(
+                editing_mode, article_title, section_title, llm_config, revision_id
+            )
+            if completed_task is not None:
+                return cls.build_task_response(str(completed_task.id))
+
         # Create EditTask record
         edit_task = cls.create_edit_task(
             editing_mode=editing_mode,
             article_title=article_title,
             section_title=section_title,
             llm_config=llm_config,
+            revision_id=revision_id,
+        )
+        submission = EditTaskSubmission.objects.create(edit_task=edit_task)
+
+        # Attach to an identical task already in flight
+        coalescing_key = get_coalescing_key(
+            editing_mode, article_title, section_title, llm_config, revision_id
         )
+        if not bypass_cache and not force:
+            in_flight_submission = cls.find_in_flight_task(edit_task, coalescing_key)
+            if in_flight_submission is not None:
+                edit_task.delete()
+                return cls.build_task_response(
+                    str(in_flight_submission.edit_task_id), in_flight_submission
+                )
 
         # Build task parameters
         task_kwargs = cls.build_task_kwargs(
             edit_task_id=str(edit_task.id),
             article_title=article_title,
             section_title=section_title,
+            bypass_cache=bypass_cache,
+            force=force,
         )
 
         # Start processing task
-        celery_task_id = cls.start_processing_task(
-            editing_mode=editing_mode, llm_config=llm_config, task_kwargs=task_kwargs
-        )
+        try:
+            celery_task_id = cls.start_processing_task(
+                editing_mode=editing_mode,
+                llm_config=llm_config,
+                task_kwargs=task_kwargs,
+                queue=cls.get_section_queue(section_title, revision_id),
+            )
+        except Exception:
+            cls.release_in_flight_task(edit_task, coalescing_key)
+            raise
 
         # Update task with Celery ID
         cls.update_task_with_celery_id(edit_task, celery_task_id)
 
         # Return response data
-        return {
-            "task_id": str(edit_task.id),
-            "status_url": f"/api/results/{edit_task.id}",
-        }
+        return cls.build_task_response(str(edit_task.id), submission)
+
+    @classmethod
+    def create_and_start_article_edit_task(
+        cls,
+        editing_mode: str,
+        article_title: str,
+        google_api_key: Optional[str],
+        openai_api_key: Optional[str],
+        anthropic_api_key: Optional[str],
+        mistral_api_key: Optional[str],
+        perplexity_api_key: Optional[str],
+        bypass_cache: bool = False,
+        fake_llm_profile: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Complete workflow to create and start editing a whole article.
+
+        The task fetches the article once and edits each of its sections in a
+        separate Celery task, so sections are processed in parallel across
+        workers. Its result holds every section's paragraphs in article order.
+        Finished results of the current revision are reused, and identical
+        submissions attach to a task in flight, as in
+        ``create_and_start_edit_task``.
+
+        Returns:
+            Dict containing task_id and status_url, and the cancel_token of the
+            client's submission unless a finished result is returned
+
+        Raises:
+            APIKeyError: If no valid API key is provided
+        """
+        llm_config = cls.resolve_llm_config(
+            google_api_key,
+            openai_api_key,
+            anthropic_api_key,
+            mistral_api_key,
+            perplexity_api_key,
+            fake_llm_profile,
+        )
+
+        revision_id = cls.get_current_revision_id(article_title)
+        if not force and not bypass_cache:
+            completed_task = cls.find_completed_task(
+                editing_mode, article_title, None, llm_config, revision_id
+            )
+            if completed_task is not None:
+                return cls.build_task_response(str(completed_task.id))
+
+        edit_task = cls.create_edit_task(
+            editing_mode=editing_mode,
+            article_title=article_title,
+            section_title=None,
+            llm_config=llm_config,
+            revision_id=revision_id,
+        )
+        submission = EditTaskSubmission.objects.create(edit_task=edit_task)
+
+        coalescing_key = get_coalescing_key(
+            editing_mode, article_title, None, llm_config, revision_id
+        )
+        if not bypass_cache and not force:
+            in_flight_submission = cls.find_in_flight_task(edit_task, coalescing_key)
+            if in_flight_submission is not None:
+                edit_task.delete()
+                return cls.build_task_response(
+                    str(in_flight_submission.edit_task_id), in_flight_submission
+                )
+
+        try:
+            celery_task_id = cls.start_article_processing_task(
+                editing_mode=editing_mode,
+                llm_config=llm_config,
+                task_kwargs={
+                    "edit_task_id": str(edit_task.id),
+                    "article_title": article_title,
+                    "bypass_cache": bypass_cache,
+                    "force": force,
+                },
+            )
+        except Exception:
+            cls.release_in_flight_task(edit_task, coalescing_key)
+            raise
+        cls.update_task_with_celery_id(edit_task, celery_task_id)
+
+        return cls.build_task_response(str(edit_task.id), submission)
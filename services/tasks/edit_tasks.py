@@ -1,8 +1,13 @@
 import asyncio
+import math
+import time
+import uuid
 from dataclasses import asdict
 
-from celery import shared_task
+from asgiref.sync import sync_to_async
+from celery import group, shared_task
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from langchain_anthropic.chat_models import ChatAnthropic
 from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
 from langchain_mistralai.chat_models import ChatMistralAI
@@ -13,17 +18,53 @@ from api.exceptions import ErrorSanitizer, ValidationError
 from data.models.edit_task import EditTask
 from services.core.constants import (
     DEFAULT_ANTHROPIC_MODEL,
+    DEFAULT_FAKE_MODEL,
     DEFAULT_GEMINI_MODEL,
     DEFAULT_MISTRAL_MODEL,
     DEFAULT_OPENAI_MODEL,
+    DEFAULT_PACK_PARAGRAPHS,
     DEFAULT_PARAGRAPH_BATCH_SIZE,
     DEFAULT_PERPLEXITY_MODEL,
+    INCREMENTAL_EDITS_ENABLED,
+    LLM_FAKE_PROVIDER_ENABLED,
+    LLM_REQUEST_TIMEOUT_SECONDS,
+    MAX_TASK_DELIVERIES,
+    PROGRESS_FLUSH_INTERVAL_SECONDS,
+    TASK_CANCELLATION_POLL_SECONDS,
+)
+from services.editing.checkpoints import (
+    checkpoints_from_partial_results,
+    checkpoints_from_previous_edit,
 )
 from services.editing.edit_service import WikiEditor
+from services.llm.client_pool import get_llm_client_pool
+from services.llm.concurrency import get_in_flight_request_limit
+from services.llm.fake_llm import create_fake_llm
+from services.llm.hedging import get_hedging_policy
+from services.llm.rate_limiter import get_rate_limiter
+from services.llm.response_cache import get_response_cache
+from services.llm.retry_policy import get_circuit_breaker
+from services.llm.usage import ParagraphUsage, UsageTracker
 from services.security.encryption_service import EncryptionService
+from services.tasks.cancellation import get_task_cancellation_flags
+from services.tasks.edit_task_query_service import EditTaskQueryService
+from services.tasks.queue_routing import get_edit_queue
+from services.tasks.worker_loop import get_worker_event_loop
+from services.tracking.progress_store import get_progress_store
+from services.tracking.task_events import (
+    DONE_EVENT,
+    PARAGRAPH_EVENT,
+    PROGRESS_EVENT,
+    get_task_event_broker,
+)
+from services.utils.wiki_utils import split_article_sections
 from services.utils.wikipedia_api import WikipediaAPI
 
 
+class TaskCancelledError(Exception):
+    """Raised when a running task notices that it was cancelled."""
+
+
 @shared_task(bind=True)
 def process_edit_task_batched(self, editing_mode, encrypted_llm_config, edit_task_id, batch_size=DEFAULT_PARAGRAPH_BATCH_SIZE, **kwargs):
     """Process an editing task with batched paragraph processing to reduce task overhead.
@@ -36,6 +77,8 @@ def process_edit_task_batched(self, editing_mode, encrypted_llm_config, edit_tas
         batch_size: Number of paragraphs to process per batch (default from constants)
         **kwargs: Additional arguments including:
             - article_title and section_title for section editing
+            - bypass_cache to skip the LLM response cache for this request
+            - force to edit every paragraph instead of reusing earlier results
 
     Returns:
         dict: The results of the editing operation (stored in EditTask model)
@@ -46,36 +89,30 @@ def process_edit_task_batched(self, editing_mode, encrypted_llm_config, edit_tas
     except ObjectDoesNotExist:
         return {"error": f"EditTask with id {edit_task_id} not found"}
 
-    try:
-        # Mark task as started
-        edit_task.mark_started()
-
-        # Decrypt the LLM configuration
-        encryption_service = EncryptionService()
-        llm_config = encryption_service.decrypt_dict(encrypted_llm_config)
+    # A redelivered message for a task that already finished has nothing to do
+    if edit_task.is_completed():
+        return edit_task.result or {"error": edit_task.error_message}
 
-        # Initialize the LLM based on the provided configuration
-        llm = _initialize_llm(llm_config)
+    # Mark task as started, unless it was cancelled before it could start
+    if not edit_task.mark_started():
+        return {"error": edit_task.error_message}
 
-        # Update model information in the EditTask
-        provider = llm_config.get("provider", "")
-        model_name = {
-            "google": DEFAULT_GEMINI_MODEL,
-            "openai": DEFAULT_OPENAI_MODEL,
-            "anthropic": DEFAULT_ANTHROPIC_MODEL,
-            "mistral": DEFAULT_MISTRAL_MODEL,
-            "perplexity": DEFAULT_PERPLEXITY_MODEL,
-        }.get(provider, DEFAULT_OPENAI_MODEL)
-        edit_task.llm_model = model_name
-        edit_task.save(update_fields=["llm_model"])
+    if _fail_redelivered_task(edit_task):
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+        return {"error": edit_task.error_message}
 
+    try:
         # Initialize the WikiEditor with batching enabled
-        editor = WikiEditor(llm=llm, editing_mode=editing_mode, verbose=False)
+        editor, usage_tracker = _create_batched_editor(
+            edit_task, editing_mode, encrypted_llm_config, kwargs
+        )
 
         # Create enhanced progress callback
+        progress_store = get_progress_store()
+
         def enhanced_progress_callback(progress_data):
             """Enhanced progress callback that updates with granular phase information."""
-            edit_task.update_progress_enhanced(progress_data)  # pragma: no cover
+            _save_progress(edit_task, progress_store, progress_data)  # pragma: no cover
 
         # Process article section with batching
         article_title = kwargs.get("article_title")
@@ -87,40 +124,44 @@ def process_edit_task_batched(self, editing_mode, encrypted_llm_config, edit_tas
                 "article_title and section_title must be provided as strings"
             )
 
+        # Paragraphs are saved as they finish so clients can show them early
         paragraph_results = _run_async_safely(
-            editor.edit_article_section_structured_batched(
-                article_title, section_title, "en", enhanced_progress_callback, batch_size
+            _collect_streamed_results(
+                editor.stream_article_section_structured_batched(
+                    article_title,
+                    section_title,
+                    "en",
+                    enhanced_progress_callback,
+                    batch_size,
+                    checkpoints=_get_checkpoints(edit_task, kwargs),
+                    revision_id=edit_task.revision_id,
+                ),
+                edit_task,
             )
         )
 
-        # Get article URL
-        wikipedia_api = WikipediaAPI()
-        article_url = wikipedia_api.get_article_url(article_title)
-
-        # Filter out any results with empty before/after fields
-        valid_results = _filter_valid_results(paragraph_results)
-
-        response_data = {
-            "paragraphs": [asdict(p) for p in valid_results],
-        }
-        if article_title:
-            response_data["article_title"] = str(article_title)  # type: ignore
-        if section_title:
-            response_data["section_title"] = str(section_title)  # type: ignore
-        if article_url:
-            response_data["article_url"] = str(article_url)  # type: ignore
+        response_data = _build_section_response(
+            paragraph_results, usage_tracker, article_title, section_title
+        )
 
         # Mark task as successful and store results
-        edit_task.mark_success(response_data)
+        _persist_progress_snapshot(edit_task, keep_partial_results=False)
+        edit_task.mark_success(response_data, usage_data=usage_tracker.as_dict())
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
         return response_data
 
+    except TaskCancelledError:
+        return _record_cancellation(edit_task)
+
     except Exception as e:
         # Sanitize the error message before storing
         sanitized_error = ErrorSanitizer.sanitize_exception(e)
         error_message = sanitized_error.user_message
 
         # Mark task as failed and store sanitized error
+        _persist_progress_snapshot(edit_task)
         edit_task.mark_failure(error_message)
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
         return {"error": error_message}
 
 
@@ -135,6 +176,7 @@ def process_edit_task(self, editing_mode, encrypted_llm_config, edit_task_id, **
         edit_task_id: UUID of the EditTask record to update
         **kwargs: Additional arguments including:
             - article_title and section_title for section editing
+            - bypass_cache to skip the LLM response cache for this request
 
     Returns:
         dict: The results of the editing operation (stored in EditTask model)
@@ -145,10 +187,11 @@ def process_edit_task(self, editing_mode, encrypted_llm_config, edit_task_id, **
     except ObjectDoesNotExist:
         return {"error": f"EditTask with id {edit_task_id} not found"}
 
-    try:
-        # Mark task as started
-        edit_task.mark_started()
+    # Mark task as started, unless it was cancelled before it could start
+    if not edit_task.mark_started():
+        return {"error": edit_task.error_message}
 
+    try:
         # Decrypt the LLM configuration
         encryption_service = EncryptionService()
         llm_config = encryption_service.decrypt_dict(encrypted_llm_config)
@@ -158,23 +201,33 @@ def process_edit_task(self, editing_mode, encrypted_llm_config, edit_task_id, **
 
         # Update model information in the EditTask
         provider = llm_config.get("provider", "")
-        model_name = {
-            "google": DEFAULT_GEMINI_MODEL,
-            "openai": DEFAULT_OPENAI_MODEL,
-            "anthropic": DEFAULT_ANTHROPIC_MODEL,
-            "mistral": DEFAULT_MISTRAL_MODEL,
-            "perplexity": DEFAULT_PERPLEXITY_MODEL,
-        }.get(provider, DEFAULT_OPENAI_MODEL)
+        model_name = get_model_name(provider)
         edit_task.llm_model = model_name
         edit_task.save(update_fields=["llm_model"])
 
         # Initialize the WikiEditor
-        editor = WikiEditor(llm=llm, editing_mode=editing_mode, verbose=False)
+        usage_tracker = UsageTracker()
+        editor = WikiEditor(
+            llm=llm,
+            editing_mode=editing_mode,
+            verbose=False,
+            response_cache=_get_task_response_cache(kwargs),
+            llm_provider=provider,
+            llm_model=model_name,
+            rate_limiter=get_rate_limiter(provider, llm_config.get("api_key", "")),
+            hedging_policy=get_hedging_policy(provider, model_name),
+            usage_tracker=usage_tracker,
+            circuit_breaker=get_circuit_breaker(
+                provider, llm_config.get("api_key", "")
+            ),
+        )
 
         # Create enhanced progress callback
+        progress_store = get_progress_store()
+
         def enhanced_progress_callback(progress_data):
             """Enhanced progress callback that updates with granular phase information."""
-            edit_task.update_progress_enhanced(progress_data)  # pragma: no cover
+            _save_progress(edit_task, progress_store, progress_data)  # pragma: no cover
 
         # Process article section
         article_title = kwargs.get("article_title")
@@ -192,26 +245,261 @@ def process_edit_task(self, editing_mode, encrypted_llm_config, edit_task_id, **
             )
         )
 
-        # Get article URL
-        wikipedia_api = WikipediaAPI()
-        article_url = wikipedia_api.get_article_url(article_title)
+        response_data = _build_section_response(
+            paragraph_results, usage_tracker, article_title, section_title
+        )
+
+        # Mark task as successful and store results
+        _persist_progress_snapshot(edit_task, keep_partial_results=False)
+        edit_task.mark_success(response_data, usage_data=usage_tracker.as_dict())
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+        return response_data
+
+    except Exception as e:
+        # Sanitize the error message before storing
+        sanitized_error = ErrorSanitizer.sanitize_exception(e)
+        error_message = sanitized_error.user_message
+
+        # Mark task as failed and store sanitized error
+        _persist_progress_snapshot(edit_task)
+        edit_task.mark_failure(error_message)
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+        return {"error": error_message}
+
+
+@shared_task(bind=True)
+def process_edit_article_task(self, editing_mode, encrypted_llm_config, edit_task_id, batch_size=DEFAULT_PARAGRAPH_BATCH_SIZE, **kwargs):
+    """Edit a whole article by fanning its sections out to section tasks.
+
+    The article is fetched and split into sections once. Each section gets its
+    own EditTask, linked to this one, and a ``process_edit_section_task``, so
+    sections are edited in parallel across workers. The section task that
+    finishes last merges every section's results into this task.
+
+    Args:
+        self: The task instance (provided by Celery)
+        editing_mode: The editing mode to apply ('brevity' or 'copyedit')
+        encrypted_llm_config: Encrypted configuration for initializing the LLM
+        edit_task_id: UUID of the whole-article EditTask record
+        batch_size: Number of paragraphs to process per batch in each section
+        **kwargs: Additional arguments including:
+            - article_title of the article to edit
+            - bypass_cache to skip the LLM response cache for this request
+            - force to edit every paragraph instead of reusing earlier results
 
-        # Filter out any results with empty before/after fields
+    Returns:
+        dict: The number of sections dispatched, or an error
+    """
+    # Get the EditTask from database
+    try:
+        edit_task = EditTask.objects.get(id=edit_task_id)
+    except ObjectDoesNotExist:
+        return {"error": f"EditTask with id {edit_task_id} not found"}
+
+    if edit_task.is_completed():
+        return {"sections": edit_task.sections_total or 0}
+
+    # Mark task as started, unless it was cancelled before it could start
+    if not edit_task.mark_started():
+        return {"error": edit_task.error_message}
+
+    try:
+        article_title = kwargs.get("article_title")
+        if not isinstance(article_title, str):
+            raise ValidationError("article_title must be provided as a string")
+
+        # Fetch and split the article once for every section; a redelivered
+        # message fetches the revision its sections were created from
+        article_revision = _run_async_safely(
+            WikipediaAPI().get_article_revision(article_title, edit_task.revision_id)
+        )
+        sections = split_article_sections(article_revision.wikitext)
+
+        if edit_task.is_article_task():
+            # The sections were created by an earlier delivery, which may have
+            # been lost before queueing them; queue those that never started
+            section_tasks = list(
+                edit_task.sections.filter(status="PENDING").order_by("section_index")
+            )
+        else:
+            edit_task.revision_id = article_revision.revision_id
+            section_tasks = _create_article_sections(edit_task, sections)
+
+        if not sections:
+            _merge_article_sections(edit_task)
+            return {"sections": 0}
+
+        if section_tasks:
+            _queue_article_sections(
+                section_tasks,
+                sections,
+                editing_mode,
+                encrypted_llm_config,
+                batch_size,
+                kwargs,
+            )
+        return {"sections": len(sections)}
+
+    except Exception as e:
+        # Sanitize the error message before storing
+        sanitized_error = ErrorSanitizer.sanitize_exception(e)
+        error_message = sanitized_error.user_message
+
+        # Mark task as failed and store sanitized error
+        edit_task.mark_failure(error_message)
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+        return {"error": error_message}
+
+
+def _create_article_sections(article_task, sections):
+    """Create the section tasks of a whole-article task.
+
+    The sections and the article's count of them are saved together, so a
+    worker lost in between never leaves sections that the article does not
+    wait for.
+
+    Args:
+        article_task: EditTask that edits the whole article
+        sections: (section_title, section_content) pairs in article order
+
+    Returns:
+        List of the created section EditTasks, in article order
+    """
+    with transaction.atomic():
+        section_tasks = EditTask.objects.bulk_create(
+            EditTask(
+                editing_mode=article_task.editing_mode,
+                article_title=article_task.article_title,
+                section_title=section_title,
+                llm_provider=article_task.llm_provider,
+                llm_model=article_task.llm_model,
+                prompt_version=article_task.prompt_version,
+                celery_task_id=str(uuid.uuid4()),
+                revision_id=article_task.revision_id,
+                parent=article_task,
+                section_index=index,
+            )
+            for index, (section_title, _) in enumerate(sections)
+        )
+        # Sections count against this total as they finish, so it has to be
+        # saved before any of them can start
+        article_task.sections_total = len(section_tasks)
+        article_task.save(
+            update_fields=["sections_total", "revision_id", "updated_at"]
+        )
+    return section_tasks
+
+
+def _queue_article_sections(
+    section_tasks, sections, editing_mode, encrypted_llm_config, batch_size, task_kwargs
+):
+    """Queue a ``process_edit_section_task`` for each of the given section tasks.
+
+    Without a result backend there is no chord to run the merge; the last
+    section task to finish does it instead. Each section is queued by its size,
+    so small sections are not stuck behind large ones.
+    """
+    group(
+        process_edit_section_task.s(
+            editing_mode=editing_mode,
+            encrypted_llm_config=encrypted_llm_config,
+            edit_task_id=str(section_task.id),
+            section_content=sections[section_task.section_index][1],
+            batch_size=batch_size,
+            bypass_cache=task_kwargs.get("bypass_cache", False),
+            force=task_kwargs.get("force", False),
+        ).set(
+            task_id=section_task.celery_task_id,
+            queue=get_edit_queue(sections[section_task.section_index][1]),
+        )
+        for section_task in section_tasks
+    ).apply_async()
+
+
+@shared_task(bind=True)
+def process_edit_section_task(self, editing_mode, encrypted_llm_config, edit_task_id, section_content, batch_size=DEFAULT_PARAGRAPH_BATCH_SIZE, **kwargs):
+    """Edit one section of a whole-article task from its already fetched content.
+
+    The section's results are stored on its own EditTask, with progress and
+    finished paragraphs saved as for a single-section task. Whether it succeeds
+    or fails, the section is then counted as finished on the whole-article task.
+
+    Args:
+        self: The task instance (provided by Celery)
+        editing_mode: The editing mode to apply ('brevity' or 'copyedit')
+        encrypted_llm_config: Encrypted configuration for initializing the LLM
+        edit_task_id: UUID of the section's EditTask record
+        section_content: Wikitext of the section, including its heading
+        batch_size: Number of paragraphs to process per batch
+        **kwargs: Additional arguments including:
+            - bypass_cache to skip the LLM response cache for this request
+            - force to edit every paragraph instead of reusing earlier results
+
+    Returns:
+        dict: The results of editing the section (stored in EditTask model)
+    """
+    # Get the EditTask from database
+    try:
+        edit_task = EditTask.objects.get(id=edit_task_id)
+    except ObjectDoesNotExist:
+        return {"error": f"EditTask with id {edit_task_id} not found"}
+
+    # A redelivered message for a finished section only needs it counted, in
+    # case the worker was lost before the article task saw it
+    if edit_task.is_completed():
+        _complete_article_section(edit_task)
+        return edit_task.result or {"error": edit_task.error_message}
+
+    # Sections created while their article was being cancelled never start
+    if EditTask.objects.filter(id=edit_task.parent_id, status="REVOKED").exists():
+        edit_task.mark_revoked()
+        return {"error": edit_task.error_message}
+
+    # Mark task as started, unless it was cancelled before it could start
+    if not edit_task.mark_started():
+        return {"error": edit_task.error_message}
+
+    if _fail_redelivered_task(edit_task):
+        _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+        _complete_article_section(edit_task)
+        return {"error": edit_task.error_message}
+
+    try:
+        editor, usage_tracker = _create_batched_editor(
+            edit_task, editing_mode, encrypted_llm_config, kwargs
+        )
+
+        progress_store = get_progress_store()
+
+        def enhanced_progress_callback(progress_data):
+            """Enhanced progress callback that updates with granular phase information."""
+            _save_progress(edit_task, progress_store, progress_data)  # pragma: no cover
+
+        paragraph_results = _run_async_safely(
+            _collect_streamed_results(
+                editor.stream_wikitext_structured_batched(
+                    section_content,
+                    enhanced_progress_callback,
+                    batch_size,
+                    checkpoints=_get_checkpoints(edit_task, kwargs),
+                ),
+                edit_task,
+            )
+        )
         valid_results = _filter_valid_results(paragraph_results)
 
         response_data = {
             "paragraphs": [asdict(p) for p in valid_results],
+            "token_usage": usage_tracker.totals(),
+            "section_title": edit_task.section_title,
         }
-        if article_title:
-            response_data["article_title"] = str(article_title)  # type: ignore
-        if section_title:
-            response_data["section_title"] = str(section_title)  # type: ignore
-        if article_url:
-            response_data["article_url"] = str(article_url)  # type: ignore
 
         # Mark task as successful and store results
-        edit_task.mark_success(response_data)
-        return response_data
+        _persist_progress_snapshot(edit_task, keep_partial_results=False)
+        edit_task.mark_success(response_data, usage_data=usage_tracker.as_dict())
+
+    except TaskCancelledError:
+        response_data = _record_cancellation(edit_task)
 
     except Exception as e:
         # Sanitize the error message before storing
@@ -219,67 +507,433 @@ def process_edit_task(self, editing_mode, encrypted_llm_config, edit_task_id, **
         error_message = sanitized_error.user_message
 
         # Mark task as failed and store sanitized error
+        _persist_progress_snapshot(edit_task)
         edit_task.mark_failure(error_message)
-        return {"error": error_message}
+        response_data = {"error": error_message}
 
+    _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+    _complete_article_section(edit_task)
+    return response_data
 
-def _run_async_safely(coro):
-    """Safely run an async coroutine in a potentially async context.
 
-    This function handles event loop conflicts that can occur when running
-    async code in Celery tasks or other environments where an event loop
-    might already be running.
+def _build_section_response(paragraph_results, usage_tracker, article_title, section_title):
+    """Build the result of a section task from its paragraph results.
+
+    Returns:
+        dict: The valid paragraphs, token usage and the section's article
+    """
+    # Get article URL
+    wikipedia_api = WikipediaAPI()
+    article_url = wikipedia_api.get_article_url(article_title)
+
+    # Filter out any results with empty before/after fields
+    valid_results = _filter_valid_results(paragraph_results)
+
+    response_data = {
+        "paragraphs": [asdict(p) for p in valid_results],
+        "token_usage": usage_tracker.totals(),
+    }
+    if article_title:
+        response_data["article_title"] = str(article_title)
+    if section_title:
+        response_data["section_title"] = str(section_title)
+    if article_url:
+        response_data["article_url"] = str(article_url)
+    return response_data
+
+
+def _create_batched_editor(edit_task, editing_mode, encrypted_llm_config, task_kwargs):
+    """Create the WikiEditor and usage tracker for a batched edit task.
+
+    The LLM configuration is decrypted and the model used is recorded on the
+    task.
+
+    Returns:
+        Tuple of the WikiEditor and the UsageTracker collecting its LLM usage
+    """
+    # Decrypt the LLM configuration
+    encryption_service = EncryptionService()
+    llm_config = encryption_service.decrypt_dict(encrypted_llm_config)
+
+    # Initialize the LLM based on the provided configuration
+    llm = _initialize_llm(llm_config)
+
+    # Update model information in the EditTask
+    provider = llm_config.get("provider", "")
+    model_name = get_model_name(provider)
+    edit_task.llm_model = model_name
+    edit_task.save(update_fields=["llm_model"])
+
+    usage_tracker = UsageTracker()
+    editor = WikiEditor(
+        llm=llm,
+        editing_mode=editing_mode,
+        verbose=False,
+        response_cache=_get_task_response_cache(task_kwargs),
+        llm_provider=provider,
+        llm_model=model_name,
+        pack_paragraphs=DEFAULT_PACK_PARAGRAPHS,
+        rate_limiter=get_rate_limiter(provider, llm_config.get("api_key", "")),
+        hedging_policy=get_hedging_policy(provider, model_name),
+        usage_tracker=usage_tracker,
+        circuit_breaker=get_circuit_breaker(provider, llm_config.get("api_key", "")),
+        in_flight_request_limit=get_in_flight_request_limit(),
+    )
+    return editor, usage_tracker
+
+
+def _complete_article_section(edit_task):
+    """Count a finished section task, merging the article after the last one."""
+    if edit_task.parent_id is None:
+        return
+
+    article_task = EditTask.objects.get(id=edit_task.parent_id)
+    # A cancelled article is not merged, whatever its sections did
+    if article_task.status == "REVOKED":
+        return
+    if article_task.record_section_completed():
+        _merge_article_sections(article_task)
+    else:
+        _publish_task_event(
+            article_task,
+            PROGRESS_EVENT,
+            EditTaskQueryService.get_article_progress(article_task),
+        )
+
+
+def _merge_article_sections(article_task):
+    """Combine the finished section tasks into the whole-article task's result.
+
+    Paragraphs are kept in article order. Sections that failed are listed with
+    their error; the article only fails when every section failed.
+    """
+    section_tasks = list(article_task.sections.order_by("section_index"))
+    paragraphs = []
+    sections = []
+    usage_tracker = UsageTracker()
+    for section_task in section_tasks:
+        section = {
+            "section_title": section_task.section_title,
+            "task_id": str(section_task.id),
+            "status": section_task.status,
+        }
+        if section_task.status == "SUCCESS":
+            section_paragraphs = section_task.result.get("paragraphs", [])
+            section["paragraph_count"] = len(section_paragraphs)
+            paragraphs.extend(section_paragraphs)
+            for usage in (section_task.usage_data or {}).get("paragraphs", []):
+                usage_tracker.record(ParagraphUsage(**usage))
+        else:
+            section["error"] = section_task.error_message
+        sections.append(section)
+
+    if section_tasks and all(section["status"] == "FAILURE" for section in sections):
+        article_task.mark_failure(section_tasks[0].error_message)
+    else:
+        response_data = {
+            "paragraphs": paragraphs,
+            "sections": sections,
+            "token_usage": usage_tracker.totals(),
+            "article_title": article_task.article_title,
+            "article_url": WikipediaAPI().get_article_url(article_task.article_title),
+        }
+        article_task.mark_success(response_data, usage_data=usage_tracker.as_dict())
+    _publish_task_event(article_task, DONE_EVENT, {"status": article_task.status})
+
+
+def _get_checkpoints(edit_task, task_kwargs):
+    """Return the paragraph results a section edit restores instead of editing.
+
+    Paragraphs saved by an earlier attempt at the task are restored by position.
+    Unless the request is forced or bypasses the cache, paragraphs unchanged
+    since the section's last completed edit reuse that edit's results.
+    """
+    checkpoints = {}
+    if (
+        INCREMENTAL_EDITS_ENABLED
+        and not task_kwargs.get("force")
+        and not task_kwargs.get("bypass_cache")
+    ):
+        previous_task = EditTaskQueryService.find_previous_edit(edit_task)
+        if previous_task is not None:
+            checkpoints.update(checkpoints_from_previous_edit(previous_task.result))
+    checkpoints.update(
+        checkpoints_from_partial_results(
+            EditTaskQueryService.get_partial_results(edit_task)
+        )
+    )
+    return checkpoints
+
+
+def _get_task_response_cache(task_kwargs):
+    """Return the LLM response cache for a task unless the request bypasses it."""
+    if task_kwargs.get("bypass_cache"):
+        return None
+    return get_response_cache()
+
+
+def _save_progress(edit_task, progress_store, progress_data):
+    """Write a progress update to the live store, or to the task without one.
+
+    The update is also published to clients streaming the task's results.
+
+    Args:
+        edit_task: The EditTask the progress belongs to
+        progress_store: Live progress store, or None to write to the database
+        progress_data: Progress summary with all or only changed paragraphs
+    """
+    if progress_store is None or not progress_store.save(
+        str(edit_task.id), progress_data
+    ):
+        edit_task.update_progress_enhanced(progress_data)
+    _publish_task_event(edit_task, PROGRESS_EVENT, progress_data)
+
+
+def _publish_task_event(edit_task, event, data):
+    """Publish an event to clients streaming the task's results, if enabled."""
+    broker = get_task_event_broker()
+    if broker is not None:
+        broker.publish(str(edit_task.id), event, data)
+
+
+async def _apublish_task_event(edit_task, event, data):
+    """Publish an event to clients streaming the task's results, off the loop."""
+    broker = get_task_event_broker()
+    if broker is not None:
+        await broker.apublish(str(edit_task.id), event, data)
+
+
+def _persist_progress_snapshot(edit_task, keep_partial_results=True):
+    """Copy a finished task's live progress to the database and drop it.
+
+    Paragraph results kept while the task ran are copied too, in a single
+    write, unless the task's full result supersedes them.
+    """
+    progress_store = get_progress_store()
+    if progress_store is None:
+        return
+
+    task_id = str(edit_task.id)
+    if keep_partial_results:
+        partial_results = progress_store.get_partial_results(task_id)
+        if partial_results:
+            edit_task.add_partial_results(partial_results)
+    progress_data = progress_store.get(task_id)
+    if progress_data is not None:
+        edit_task.update_progress_enhanced(progress_data)
+    progress_store.delete(task_id)
+
+
+def _fail_redelivered_task(edit_task):
+    """Mark a task failed once it was started too often without finishing.
+
+    Edit tasks are acknowledged late, so a task that keeps killing its worker,
+    for example by running it out of memory, would otherwise be delivered again
+    forever, paying for the paragraphs after its last checkpoint each time.
+
+    Returns:
+        True if the task was marked failed
+    """
+    if not MAX_TASK_DELIVERIES or edit_task.delivery_count <= MAX_TASK_DELIVERIES:
+        return False
+    _persist_progress_snapshot(edit_task)
+    edit_task.mark_failure(
+        f"Task was stopped after {MAX_TASK_DELIVERIES} attempts that did not finish"
+    )
+    return True
+
+
+def _record_cancellation(edit_task):
+    """Save the progress of a task stopped by its cancellation and mark it revoked."""
+    _persist_progress_snapshot(edit_task)
+    edit_task.mark_revoked()
+    _publish_task_event(edit_task, DONE_EVENT, {"status": edit_task.status})
+    return {"error": edit_task.error_message}
+
+
+async def _collect_streamed_results(streamed_results, edit_task):
+    """Collect streamed paragraph results, saving each to the task as it arrives.
+
+    The task's cancellation flag is polled meanwhile. Once it is set, collecting
+    stops, which closes the stream and cancels the paragraphs still being
+    edited along with their LLM calls.
+
+    Args:
+        streamed_results: Async iterator of (index, ParagraphResult) pairs
+        edit_task: The EditTask whose partial results are updated
+
+    Returns:
+        List of ParagraphResult objects in section order
+
+    Raises:
+        TaskCancelledError: If the task was cancelled before every paragraph
+            finished
     """
+    flags = get_task_cancellation_flags()
+    if flags is None:
+        return await _save_streamed_results(streamed_results, edit_task)
+
+    collecting = asyncio.ensure_future(
+        _save_streamed_results(streamed_results, edit_task)
+    )
+    watching = asyncio.ensure_future(_wait_for_cancellation(flags, edit_task))
     try:
-        # Try to get the current event loop
-        asyncio.get_running_loop()
-        # If we're already in an event loop, we can't use asyncio.run()
-        # Instead, we need to use a different approach
-        import concurrent.futures
+        await asyncio.wait(
+            {collecting, watching}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        watching.cancel()
+        if not collecting.done():
+            collecting.cancel()
+            # Wait for the stream to cancel its outstanding work
+            await asyncio.gather(collecting, return_exceptions=True)
+
+    if collecting.cancelled():
+        raise TaskCancelledError(f"EditTask {edit_task.id} was cancelled")
+    return collecting.result()
+
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    except RuntimeError:
-        # No event loop is running, safe to use asyncio.run()
-        return asyncio.run(coro)
+async def _wait_for_cancellation(flags, edit_task):
+    """Return once the task's cancellation flag is set."""
+    is_cancelled = sync_to_async(flags.is_cancelled, thread_sensitive=False)
+    while not await is_cancelled(str(edit_task.id)):
+        await asyncio.sleep(TASK_CANCELLATION_POLL_SECONDS)
+
+
+async def _save_streamed_results(streamed_results, edit_task):
+    """Save streamed paragraph results and publish them as they arrive.
+
+    Each paragraph is kept in the live progress store, which stores it on its
+    own. Without a store, or if saving to it fails, paragraphs are written to
+    the task at most once per ``PROGRESS_FLUSH_INTERVAL_SECONDS``, since each
+    write rewrites every paragraph recorded so far; any still held are written
+    when the stream ends, however it ends.
+
+    Returns:
+        List of ParagraphResult objects in section order
+    """
+    progress_store = get_progress_store()
+    collected = {}
+    unsaved = []
+    saved_at = None
+    try:
+        async for index, result in streamed_results:
+            collected[index] = result
+            if not _filter_valid_results([result]):
+                continue
+            paragraph = {"index": index, **asdict(result)}
+            if progress_store is None or not await progress_store.asave_partial_results(
+                str(edit_task.id), [paragraph]
+            ):
+                unsaved.append(paragraph)
+            now = time.monotonic()
+            if unsaved and (
+                saved_at is None or now - saved_at >= PROGRESS_FLUSH_INTERVAL_SECONDS
+            ):
+                saved_at = now
+                await sync_to_async(edit_task.add_partial_results)(unsaved)
+                unsaved = []
+            await _apublish_task_event(edit_task, PARAGRAPH_EVENT, paragraph)
+    finally:
+        if unsaved:
+            await sync_to_async(edit_task.add_partial_results)(unsaved)
+    return [collected[index] for index in sorted(collected)]
+
+
+def _run_async_safely(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    The coroutine runs on the process's long-lived event loop rather than a new
+    loop per call, so loop-bound resources such as the connections of pooled
+    LLM clients are reused across tasks. Callers may or may not be inside a
+    running event loop themselves.
+    """
+    return get_worker_event_loop().run(coro)
+
+
+_PROVIDER_MODELS = {
+    "google": DEFAULT_GEMINI_MODEL,
+    "openai": DEFAULT_OPENAI_MODEL,
+    "anthropic": DEFAULT_ANTHROPIC_MODEL,
+    "mistral": DEFAULT_MISTRAL_MODEL,
+    "perplexity": DEFAULT_PERPLEXITY_MODEL,
+    "fake": DEFAULT_FAKE_MODEL,
+}
+
+
+def get_model_name(provider):
+    """Get the model used for a provider."""
+    return _PROVIDER_MODELS.get(provider, DEFAULT_OPENAI_MODEL)
 
 
 def _initialize_llm(llm_config):
-    """Initialize the appropriate LLM based on configuration."""
+    """Get the appropriate LLM based on configuration.
+
+    Clients are reused from the worker's client pool, so tasks with the same
+    provider, model and API key share SDK clients and their HTTP connections.
+    """
+    provider = llm_config.get("provider")
+    api_key = llm_config.get("api_key")
+
+    if provider not in _PROVIDER_MODELS:
+        raise ValidationError(f"Invalid LLM provider specified: {provider}")
+    if provider == "fake" and not LLM_FAKE_PROVIDER_ENABLED:
+        raise ValidationError("The fake LLM provider is not enabled")
+
+    # The fake provider has no key; its profile tells pooled clients apart
+    credential = llm_config.get("fake_profile") if provider == "fake" else api_key
+
+    return get_llm_client_pool().get(
+        provider,
+        get_model_name(provider),
+        credential or "",
+        lambda: _create_llm(llm_config),
+    )
+
+
+def _create_llm(llm_config):
+    """Create a new LLM client for a provider."""
     provider = llm_config.get("provider")
     api_key = llm_config.get("api_key")
 
     if provider == "google":
         return ChatGoogleGenerativeAI(
-            model=DEFAULT_GEMINI_MODEL, temperature=0, google_api_key=api_key
+            model=DEFAULT_GEMINI_MODEL,
+            temperature=0,
+            google_api_key=api_key,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
         )
     elif provider == "openai":
         return ChatOpenAI(
             model=DEFAULT_OPENAI_MODEL,
             temperature=0,
             api_key=api_key,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
         )
     elif provider == "anthropic":
         return ChatAnthropic(
             model_name=DEFAULT_ANTHROPIC_MODEL,
             temperature=0,
             api_key=api_key,
-            timeout=None,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
             stop=None,
         )
     elif provider == "mistral":
         return ChatMistralAI(
             temperature=0,
             api_key=api_key,
+            # The Mistral client only takes whole seconds
+            timeout=math.ceil(LLM_REQUEST_TIMEOUT_SECONDS),
         )
     elif provider == "perplexity":
         return ChatPerplexity(
             model=DEFAULT_PERPLEXITY_MODEL,
             temperature=0,
             api_key=api_key,
-            timeout=None,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
         )
+    elif provider == "fake":
+        return create_fake_llm(llm_config.get("fake_profile"))
     else:
         raise ValidationError(f"Invalid LLM provider specified: {provider}")
 
@@ -0,0 +1,210 @@
+"""Registry of in-flight edit tasks for coalescing identical submissions.
+
+When an article trends, many clients ask for the same edit at once. Each
+submission is registered under a key built from what determines its result;
+a submission whose key is already held by a queued or running task attaches to
+that task instead of starting another LLM pass. Entries are not removed when
+tasks finish: a later submission finding a finished task simply takes the key
+over, and a TTL drops entries of tasks that never finished.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple, cast
+
+import redis
+
+from services.core.constants import (
+    TASK_COALESCING_BACKEND,
+    TASK_COALESCING_TTL_SECONDS,
+)
+
+
+def get_coalescing_key(
+    editing_mode: str,
+    article_title: str,
+    section_title: Optional[str],
+    llm_config: Dict[str, str],
+    revision_id: Optional[int] = None,
+) -> str:
+    """Build the key shared by submissions that would produce the same edit.
+
+    Args:
+        editing_mode: The editing mode of the submission
+        article_title: Title of the article to edit
+        section_title: Title of the section to edit, or None for the whole article
+        llm_config: LLM configuration of the submission; the API key is left out
+        revision_id: The article revision to edit, if known
+
+    Returns:
+        A hash of the submission's editing parameters
+    """
+    parameters = [
+        editing_mode,
+        article_title,
+        section_title,
+        llm_config.get("provider"),
+        llm_config.get("model"),
+        llm_config.get("fake_profile"),
+        revision_id,
+    ]
+    return hashlib.sha256(json.dumps(parameters).encode("utf-8")).hexdigest()
+
+
+class InFlightRegistry(ABC):
+    """Base class for registries mapping coalescing keys to task ids."""
+
+    @abstractmethod
+    def claim(self, key: str, task_id: str) -> Optional[str]:
+        """Register a task under a key unless another task already holds it.
+
+        Args:
+            key: Coalescing key of the submission
+            task_id: Id of the EditTask created for the submission
+
+        Returns:
+            Id of the task already holding the key, or None if the task was
+            registered (or the registry is unavailable)
+        """
+
+    @abstractmethod
+    def replace(self, key: str, stale_task_id: str, task_id: str) -> bool:
+        """Move a key from a task that is no longer in flight to a new task.
+
+        Returns:
+            Whether the key was moved; False if another submission moved it first
+        """
+
+    @abstractmethod
+    def release(self, key: str, task_id: str) -> None:
+        """Remove a task's registration, if it still holds the key."""
+
+
+class InMemoryInFlightRegistry(InFlightRegistry):
+    """Per-process registry, for tests and single-process deployments.
+
+    Args:
+        ttl_seconds: How long a task stays registered at most
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = TASK_COALESCING_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, task_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                return entry[1]
+            self._entries[key] = (self._clock() + self.ttl_seconds, task_id)
+            return None
+
+    def replace(self, key: str, stale_task_id: str, task_id: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] != stale_task_id:
+                return False
+            self._entries[key] = (self._clock() + self.ttl_seconds, task_id)
+            return True
+
+    def release(self, key: str, task_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == task_id:
+                del self._entries[key]
+
+
+class RedisInFlightRegistry(InFlightRegistry):
+    """Redis-backed registry shared by every web process.
+
+    Redis failures are reported as a successful claim, so submissions start
+    their own task and a Redis outage never blocks an edit.
+    """
+
+    KEY_PREFIX = "editengine:in-flight:"
+
+    # Compare-and-set, so two submissions finding the same finished task cannot
+    # both take the key over
+    REPLACE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+    RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+    def __init__(
+        self, client: redis.Redis, ttl_seconds: int = TASK_COALESCING_TTL_SECONDS
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._replace_script = client.register_script(self.REPLACE_SCRIPT)
+        self._release_script = client.register_script(self.RELEASE_SCRIPT)
+
+    def claim(self, key: str, task_id: str) -> Optional[str]:
+        redis_key = self.KEY_PREFIX + key
+        try:
+            if self.client.set(redis_key, task_id, nx=True, ex=self.ttl_seconds):
+                return None
+            # The holder's entry may have expired since the SET
+            return cast(Optional[str], self.client.get(redis_key))
+        except redis.RedisError:
+            return None
+
+    def replace(self, key: str, stale_task_id: str, task_id: str) -> bool:
+        try:
+            return bool(
+                self._replace_script(
+                    keys=[self.KEY_PREFIX + key],
+                    args=[stale_task_id, task_id, self.ttl_seconds],
+                )
+            )
+        except redis.RedisError:
+            return True
+
+    def release(self, key: str, task_id: str) -> None:
+        try:
+            self._release_script(keys=[self.KEY_PREFIX + key], args=[task_id])
+        except redis.RedisError:
+            return
+
+
+_in_flight_registry_instance: Optional[InFlightRegistry] = None
+_in_flight_registry_initialized = False
+
+
+def get_in_flight_registry() -> Optional[InFlightRegistry]:
+    """Return the process-wide in-flight task registry configured for this deployment.
+
+    Returns:
+        The configured registry, or None when coalescing is disabled
+    """
+    global _in_flight_registry_instance, _in_flight_registry_initialized
+    if not _in_flight_registry_initialized:
+        if TASK_COALESCING_BACKEND == "redis":
+            from services.utils.redis_client import get_redis_client
+
+            _in_flight_registry_instance = RedisInFlightRegistry(get_redis_client())
+        elif TASK_COALESCING_BACKEND == "memory":
+            _in_flight_registry_instance = InMemoryInFlightRegistry()
+        else:
+            _in_flight_registry_instance = None
+        _in_flight_registry_initialized = True
+    return _in_flight_registry_instance
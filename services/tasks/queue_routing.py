@@ -0,0 +1,155 @@
+"""Size-aware routing of edit tasks to Celery queues, shortest job first.
+
+With a single FIFO queue, one section with hundreds of paragraphs delays every
+small edit queued behind it. Before a section edit is queued, the paragraphs
+that would be sent to the LLM are counted from a parse of the section, and the
+task goes to the queue for small edits or the one for large edits.
+
+Workers consume every queue, and ``AgingQueueCycle`` decides the order in which
+they are read: small edits always come before large ones, except that once large
+edits have waited ``EDIT_QUEUE_AGING_SECONDS`` one of them is taken first.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+from services.core.constants import (
+    EDIT_QUEUE_AGING_SECONDS,
+    EDIT_QUEUE_ROUTING_ENABLED,
+    SMALL_EDIT_MAX_CHARACTERS,
+    SMALL_EDIT_MAX_PARAGRAPHS,
+)
+from services.document.classifier import ContentClassifier
+from services.document.parser import DocumentParser
+
+# Queue names, also declared in CELERY_TASK_QUEUES
+DEFAULT_QUEUE = "celery"
+SMALL_EDITS_QUEUE = "edits-small"
+LARGE_EDITS_QUEUE = "edits-large"
+
+# Order in which workers read the queues; whole-article tasks only split the
+# article, so the default queue holding them is read first
+QUEUE_ORDER = (DEFAULT_QUEUE, SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE)
+
+
+@dataclass(frozen=True)
+class EditWorkEstimate:
+    """The work an edit will send to the LLM."""
+
+    paragraphs: int
+    characters: int
+
+    @property
+    def is_small(self) -> bool:
+        """Check if the edit fits the limits of the queue for small edits."""
+        return (
+            self.paragraphs <= SMALL_EDIT_MAX_PARAGRAPHS
+            and self.characters <= SMALL_EDIT_MAX_CHARACTERS
+        )
+
+
+def estimate_edit_work(wikitext: str) -> EditWorkEstimate:
+    """Count the paragraphs of a section that would be edited, and their length.
+
+    The section is parsed and classified as the editor does, without any LLM
+    call, so paragraphs that are skipped are not counted.
+
+    Args:
+        wikitext: Wikitext of the section
+
+    Returns:
+        The number of paragraphs to edit and their total characters
+    """
+    document_items = DocumentParser().parse_document_structure(wikitext)
+    classifier = ContentClassifier()
+    paragraphs = [
+        item.strip()
+        for index, item in enumerate(document_items)
+        if classifier.should_process_with_context(item, index, document_items)[0]
+    ]
+    return EditWorkEstimate(
+        paragraphs=len(paragraphs),
+        characters=sum(len(paragraph) for paragraph in paragraphs),
+    )
+
+
+def get_edit_queue(wikitext: str) -> Optional[str]:
+    """Return the queue for an edit of a section, by the section's size.
+
+    Args:
+        wikitext: Wikitext of the section
+
+    Returns:
+        The name of the queue for small or large edits, or None for the default
+        queue when routing is disabled
+    """
+    if not EDIT_QUEUE_ROUTING_ENABLED:
+        return None
+    if estimate_edit_work(wikitext).is_small:
+        return SMALL_EDITS_QUEUE
+    return LARGE_EDITS_QUEUE
+
+
+def _queue_position(queue: str) -> int:
+    # Queues not listed are read last
+    return QUEUE_ORDER.index(queue) if queue in QUEUE_ORDER else len(QUEUE_ORDER)
+
+
+class AgingQueueCycle:
+    """Order in which a worker reads its queues, with aging for large edits.
+
+    Kombu's Redis transport asks the cycle for the order of the queues before
+    each blocking pop, which takes from the first queue that is not empty, and
+    reports every queue it received a message from. Set it as the broker's
+    ``queue_order_strategy``.
+
+    Once a large edit was last taken, or their queue last found empty, more than
+    ``aging_seconds`` ago, the large edits queue is put first for the next pop.
+    If a message still comes from another queue, the large edits queue was
+    empty.
+
+    Args:
+        it: Initial queues
+        aging_seconds: How long large edits wait at most while small edits are
+            queued, or 0 to always take small edits first
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        it: Optional[Iterable[str]] = None,
+        aging_seconds: float = EDIT_QUEUE_AGING_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.items: List[str] = []
+        self.aging_seconds = aging_seconds
+        self._clock = clock
+        self._large_edits_checked_at = clock()
+        self._large_edits_first = False
+        if it is not None:
+            self.update(it)
+
+    def update(self, it: Iterable[str]) -> None:
+        """Replace the queues, which kombu passes as an unordered set."""
+        self.items[:] = sorted(it, key=_queue_position)
+
+    def consume(self, n: int) -> List[str]:
+        """Return the queues in the order to read them."""
+        items = self.items[:n]
+        self._large_edits_first = (
+            bool(self.aging_seconds)
+            and LARGE_EDITS_QUEUE in items
+            and self._clock() - self._large_edits_checked_at >= self.aging_seconds
+        )
+        if self._large_edits_first:
+            items.remove(LARGE_EDITS_QUEUE)
+            items.insert(0, LARGE_EDITS_QUEUE)
+        return items
+
+    def rotate(self, last_used: str) -> None:
+        """Record the queue a message was received from."""
+        # A message from another queue while large edits came first means none
+        # were waiting
+        if last_used == LARGE_EDITS_QUEUE or self._large_edits_first:
+            self._large_edits_checked_at = self._clock()
@@ -0,0 +1,121 @@
+"""Event loop shared by every task a worker process runs.
+
+Celery tasks are synchronous functions driving async editing code. Running each
+task's coroutine with ``asyncio.run`` creates and closes an event loop per task,
+which throws away everything bound to that loop: the connection pools of pooled
+LLM clients, SDK sessions and async locks. Each worker process instead runs one
+event loop in a background thread for its whole life, started by Celery's
+``worker_process_init`` signal, and tasks submit their coroutines to it.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Seconds to wait for the loop thread to finish when the worker shuts down
+LOOP_SHUTDOWN_TIMEOUT_SECONDS = 5
+
+
+class WorkerEventLoop:
+    """An event loop running in a daemon thread that other threads submit to.
+
+    The loop is started on first use if it was not started explicitly, and is
+    started again in a forked child, which inherits the loop but not the thread
+    running it.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop unless it already runs in this process.
+
+        Returns:
+            The running loop
+        """
+        with self._lock:
+            if self._is_running():
+                return self._loop  # type: ignore[return-value]
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_forever,
+                args=(loop,),
+                name="worker-event-loop",
+                daemon=True,
+            )
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        If the waiting thread is interrupted, as by a task time limit, the
+        coroutine is cancelled rather than left running.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from a coroutine running on the loop, which
+                would block the loop waiting for itself
+        """
+        loop = self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot wait for the worker event loop from inside it")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Stop the loop and wait briefly for its thread to finish."""
+        with self._lock:
+            running = self._is_running()
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+        if not running or loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(LOOP_SHUTDOWN_TIMEOUT_SECONDS)
+
+    def _is_running(self) -> bool:
+        """Check if the loop runs in this process (lock must be held)."""
+        return (
+            self._loop is not None
+            and self._thread is not None
+            and self._pid == os.getpid()
+            and self._thread.is_alive()
+        )
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+_worker_event_loop = WorkerEventLoop()
+
+
+def get_worker_event_loop() -> WorkerEventLoop:
+    """Return the event loop shared by the tasks of this process."""
+    return _worker_event_loop
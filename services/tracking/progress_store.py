@@ -0,0 +1,294 @@
+"""Live progress store for running edit tasks.
+
+Clients poll the results endpoint for every open task, so keeping in-flight
+progress in the ``EditTask.progress_data`` column means a database write per
+progress update and a large JSON decode per poll. Running tasks instead keep
+their progress in Redis, as a hash per task with one field for the summary and
+one per paragraph, so a progress delta only rewrites the paragraphs it lists.
+The final progress is copied to the database when the task finishes and the
+hash is dropped; a TTL cleans up after workers that died mid-task.
+
+Paragraph results that finish while the task runs are kept the same way, in a
+second hash with one field per paragraph, instead of rewriting the task's whole
+``partial_results`` column for every paragraph. They are only copied to the
+database if the task stops without a result.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+import redis
+from asgiref.sync import sync_to_async
+
+from services.core.constants import PROGRESS_STORE_BACKEND, PROGRESS_STORE_TTL_SECONDS
+
+SUMMARY_FIELD = "summary"
+PARAGRAPH_FIELD_PREFIX = "paragraph:"
+
+
+def _split_progress(progress_data: dict) -> Tuple[dict, Dict[int, dict]]:
+    """Split progress data into its summary fields and paragraphs by index."""
+    summary = {
+        key: value for key, value in progress_data.items() if key != "paragraphs"
+    }
+    paragraphs = {
+        paragraph["index"]: paragraph
+        for paragraph in progress_data.get("paragraphs", [])
+    }
+    return summary, paragraphs
+
+
+def _join_progress(summary: dict, paragraphs: Dict[int, dict]) -> dict:
+    """Build progress data from a summary and paragraphs, in paragraph order."""
+    # Paragraphs from an earlier run of the task may exceed the current total
+    total = summary.get("total_paragraphs", len(paragraphs))
+    return {
+        **summary,
+        "paragraphs": [
+            paragraphs[index] for index in sorted(paragraphs) if index < total
+        ],
+    }
+
+
+class ProgressStore(ABC):
+    """Base class for live progress stores keyed by task id."""
+
+    @abstractmethod
+    def save(self, task_id: str, progress_data: dict) -> bool:
+        """Merge a progress update into the task's stored progress.
+
+        Args:
+            task_id: Id of the EditTask
+            progress_data: Progress summary with all or only changed paragraphs
+
+        Returns:
+            Whether the update was stored
+        """
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[dict]:
+        """Return the task's progress, or None if none is stored."""
+
+    @abstractmethod
+    def save_partial_results(self, task_id: str, paragraph_results: List[dict]) -> bool:
+        """Store paragraph results that completed while the task is running.
+
+        A result replaces any stored earlier for the same paragraph.
+
+        Args:
+            task_id: Id of the EditTask
+            paragraph_results: Paragraph result dictionaries, each with the
+                paragraph's position in the section as ``index``
+
+        Returns:
+            Whether the results were stored
+        """
+
+    async def asave_partial_results(
+        self, task_id: str, paragraph_results: List[dict]
+    ) -> bool:
+        """Store paragraph results without blocking the event loop."""
+        return await sync_to_async(self.save_partial_results, thread_sensitive=False)(
+            task_id, paragraph_results
+        )
+
+    @abstractmethod
+    def get_partial_results(self, task_id: str) -> Optional[List[dict]]:
+        """Return the task's stored paragraph results in section order, or None."""
+
+    @abstractmethod
+    def delete(self, task_id: str) -> None:
+        """Drop the task's stored progress and paragraph results."""
+
+
+class InMemoryProgressStore(ProgressStore):
+    """Per-process progress store, for tests and single-process deployments.
+
+    Args:
+        ttl_seconds: How long progress is kept after its last update
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = PROGRESS_STORE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, dict, Dict[int, dict]]] = {}
+        self._partial_results: Dict[str, Tuple[float, Dict[int, dict]]] = {}
+        self._lock = threading.Lock()
+
+    def save(self, task_id: str, progress_data: dict) -> bool:
+        summary, paragraphs = _split_progress(progress_data)
+        with self._lock:
+            entry = self._live_entry(task_id)
+            stored_paragraphs = entry[2] if entry else {}
+            stored_paragraphs.update(paragraphs)
+            self._entries[task_id] = (
+                self._clock() + self.ttl_seconds,
+                summary,
+                stored_paragraphs,
+            )
+        return True
+
+    def get(self, task_id: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._live_entry(task_id)
+            if entry is None:
+                return None
+            _, summary, paragraphs = entry
+            return _join_progress(summary, paragraphs)
+
+    def save_partial_results(self, task_id: str, paragraph_results: List[dict]) -> bool:
+        with self._lock:
+            entry = self._partial_results.get(task_id)
+            stored = entry[1] if entry and entry[0] > self._clock() else {}
+            stored.update(
+                (paragraph["index"], paragraph) for paragraph in paragraph_results
+            )
+            self._partial_results[task_id] = (self._clock() + self.ttl_seconds, stored)
+        return True
+
+    # Saving only takes a lock, so it is cheaper than a hop to a thread
+    async def asave_partial_results(
+        self, task_id: str, paragraph_results: List[dict]
+    ) -> bool:
+        return self.save_partial_results(task_id, paragraph_results)
+
+    def get_partial_results(self, task_id: str) -> Optional[List[dict]]:
+        with self._lock:
+            entry = self._partial_results.get(task_id)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            return [entry[1][index] for index in sorted(entry[1])]
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            self._entries.pop(task_id, None)
+            self._partial_results.pop(task_id, None)
+
+    def _live_entry(self, task_id: str):
+        """Return an unexpired entry, dropping it if expired (lock must be held)."""
+        entry = self._entries.get(task_id)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[task_id]
+            return None
+        return entry
+
+
+class RedisProgressStore(ProgressStore):
+    """Redis-backed progress store shared by workers and the web tier.
+
+    Redis failures are reported as unsaved or missing progress, so callers fall
+    back to the database and a Redis outage never fails an edit.
+    """
+
+    KEY_PREFIX = "editengine:progress:"
+    PARTIAL_RESULTS_KEY_PREFIX = "editengine:partial-results:"
+
+    def __init__(
+        self, client: redis.Redis, ttl_seconds: int = PROGRESS_STORE_TTL_SECONDS
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def save(self, task_id: str, progress_data: dict) -> bool:
+        summary, paragraphs = _split_progress(progress_data)
+        mapping = {SUMMARY_FIELD: json.dumps(summary)}
+        for index, paragraph in paragraphs.items():
+            mapping[f"{PARAGRAPH_FIELD_PREFIX}{index}"] = json.dumps(paragraph)
+
+        key = self.KEY_PREFIX + task_id
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.hset(key, mapping=mapping)
+            pipeline.expire(key, self.ttl_seconds)
+            pipeline.execute()
+        except redis.RedisError:
+            return False
+        return True
+
+    def get(self, task_id: str) -> Optional[dict]:
+        try:
+            fields = cast(
+                Dict[str, str], self.client.hgetall(self.KEY_PREFIX + task_id)
+            )
+        except redis.RedisError:
+            return None
+        if not fields or SUMMARY_FIELD not in fields:
+            return None
+
+        prefix_length = len(PARAGRAPH_FIELD_PREFIX)
+        paragraphs = {
+            int(field[prefix_length:]): json.loads(value)
+            for field, value in fields.items()
+            if field.startswith(PARAGRAPH_FIELD_PREFIX)
+        }
+        return _join_progress(json.loads(fields[SUMMARY_FIELD]), paragraphs)
+
+    def save_partial_results(self, task_id: str, paragraph_results: List[dict]) -> bool:
+        mapping = {
+            str(paragraph["index"]): json.dumps(paragraph)
+            for paragraph in paragraph_results
+        }
+        if not mapping:
+            return True
+
+        key = self.PARTIAL_RESULTS_KEY_PREFIX + task_id
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.hset(key, mapping=mapping)
+            pipeline.expire(key, self.ttl_seconds)
+            pipeline.execute()
+        except redis.RedisError:
+            return False
+        return True
+
+    def get_partial_results(self, task_id: str) -> Optional[List[dict]]:
+        try:
+            fields = cast(
+                Dict[str, str],
+                self.client.hgetall(self.PARTIAL_RESULTS_KEY_PREFIX + task_id),
+            )
+        except redis.RedisError:
+            return None
+        if not fields:
+            return None
+        return [json.loads(fields[index]) for index in sorted(fields, key=int)]
+
+    def delete(self, task_id: str) -> None:
+        try:
+            self.client.delete(
+                self.KEY_PREFIX + task_id, self.PARTIAL_RESULTS_KEY_PREFIX + task_id
+            )
+        except redis.RedisError:
+            return
+
+
+_progress_store_instance: Optional[ProgressStore] = None
+_progress_store_initialized = False
+
+
+def get_progress_store() -> Optional[ProgressStore]:
+    """Return the process-wide live progress store configured for this deployment.
+
+    Returns:
+        The configured store, or None when progress is written to the database
+    """
+    global _progress_store_instance, _progress_store_initialized
+    if not _progress_store_initialized:
+        if PROGRESS_STORE_BACKEND == "redis":
+            from services.utils.redis_client import get_redis_client
+
+            _progress_store_instance = RedisProgressStore(get_redis_client())
+        elif PROGRESS_STORE_BACKEND == "memory":
+            _progress_store_instance = InMemoryProgressStore()
+        else:
+            _progress_store_instance = None
+        _progress_store_initialized = True
+    return _progress_store_instance
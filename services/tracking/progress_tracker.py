@@ -4,7 +4,7 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 
 class ProcessingPhase(Enum):
@@ -55,6 +55,10 @@ class EnhancedProgressTracker:
         self.total_paragraphs = total_paragraphs
         self._paragraphs: Dict[int, ParagraphProgress] = {}
         self._lock = threading.Lock()
+        # Current adaptive concurrency window, published once processing starts
+        self._concurrency_window: Optional[int] = None
+        # Paragraphs changed since the last progress delta; all of them at first
+        self._changed: Set[int] = set(range(total_paragraphs))
 
         # Initialize all paragraphs as pending
         for i in range(total_paragraphs):
@@ -77,6 +81,7 @@ class EnhancedProgressTracker:
                 raise ValueError(f"Invalid paragraph index: {paragraph_index}")
 
             paragraph = self._paragraphs[paragraph_index]
+            self._changed.add(paragraph_index)
             old_phase = paragraph.phase
             paragraph.phase = phase
 
@@ -122,32 +127,50 @@ class EnhancedProgressTracker:
     def get_progress_data(self) -> dict:
         """Get complete progress data for API response."""
         with self._lock:
-            # Calculate phase counts directly to avoid nested locking
-            counts = {phase.value: 0 for phase in ProcessingPhase}
-            completed_count = 0
-            for paragraph in self._paragraphs.values():
-                counts[paragraph.phase.value] += 1
-                if paragraph.phase == ProcessingPhase.COMPLETE:
-                    completed_count += 1
+            return self._build_progress_data(sorted(self._paragraphs.keys()))
 
-            # Calculate progress percentage directly
-            progress_percentage = (
-                round((completed_count / self.total_paragraphs) * 100)
-                if self.total_paragraphs > 0
-                else 0
-            )
+    def get_progress_delta(self) -> dict:
+        """Get progress data with only the paragraphs changed since the last delta.
 
-            # Sort paragraphs by index for consistent ordering
-            paragraphs = [
-                self._paragraphs[i].to_dict() for i in sorted(self._paragraphs.keys())
-            ]
-
-            return {
-                "total_paragraphs": self.total_paragraphs,
-                "progress_percentage": progress_percentage,
-                "phase_counts": counts,
-                "paragraphs": paragraphs,
-            }
+        The summary fields are always complete. The first delta includes every
+        paragraph, so applying the deltas in order rebuilds the full progress.
+        """
+        with self._lock:
+            changed = sorted(self._changed)
+            self._changed.clear()
+            return self._build_progress_data(changed)
+
+    def _build_progress_data(self, paragraph_indexes) -> dict:
+        """Build progress data for the given paragraphs (lock must be held)."""
+        # Calculate phase counts directly to avoid nested locking
+        counts = {phase.value: 0 for phase in ProcessingPhase}
+        completed_count = 0
+        for paragraph in self._paragraphs.values():
+            counts[paragraph.phase.value] += 1
+            if paragraph.phase == ProcessingPhase.COMPLETE:
+                completed_count += 1
+
+        # Calculate progress percentage directly
+        progress_percentage = (
+            round((completed_count / self.total_paragraphs) * 100)
+            if self.total_paragraphs > 0
+            else 0
+        )
+
+        progress_data = {
+            "total_paragraphs": self.total_paragraphs,
+            "progress_percentage": progress_percentage,
+            "phase_counts": counts,
+            "paragraphs": [self._paragraphs[i].to_dict() for i in paragraph_indexes],
+        }
+        if self._concurrency_window is not None:
+            progress_data["concurrency_window"] = self._concurrency_window
+        return progress_data
+
+    def set_concurrency_window(self, window: int):
+        """Record how many paragraphs may currently be processed concurrently."""
+        with self._lock:
+            self._concurrency_window = window
 
     def mark_paragraph_started(self, paragraph_index: int, content: str):
         """Mark a paragraph as starting pre-processing."""
@@ -0,0 +1,109 @@
+"""Debounced writer for enhanced progress updates.
+
+Paragraphs change phase several times each, so writing the full progress on
+every change means many writes per task, each one a thread hop for the ORM and
+a rebuild of every paragraph entry. The writer coalesces changes made within a
+flush interval into a single write, and each write carries only the paragraphs
+that changed since the previous one.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+from asgiref.sync import sync_to_async
+
+from services.core.constants import PROGRESS_FLUSH_INTERVAL_SECONDS
+from services.tracking.progress_tracker import EnhancedProgressTracker
+
+
+class ProgressWriter:
+    """Coalesces progress changes and hands deltas to a synchronous callback.
+
+    The first change after a quiet period is written immediately; changes within
+    the interval after a write are held and written together when it ends.
+    ``close`` writes anything still held, so the last state is never lost.
+
+    Args:
+        tracker: Progress tracker the deltas are read from
+        callback: Synchronous callback receiving each progress delta
+        interval_seconds: Minimum time between writes; 0 writes every change
+        clock: Time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        tracker: EnhancedProgressTracker,
+        callback: Callable[[dict], None],
+        interval_seconds: float = PROGRESS_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tracker = tracker
+        self.callback = callback
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._last_flush_at: Optional[float] = None
+        self._pending: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._error: Optional[BaseException] = None
+
+    async def update(self) -> None:
+        """Record that progress changed, writing it now or after the interval.
+
+        Raises:
+            Exception: Any error the callback raised in a delayed write
+        """
+        self._raise_pending_error()
+        self._dirty = True
+        if self._pending is not None:
+            return
+
+        now = self._clock()
+        if self._last_flush_at is None or self.interval_seconds <= 0:
+            await self.flush()
+            return
+        remaining = self._last_flush_at + self.interval_seconds - now
+        if remaining <= 0:
+            await self.flush()
+        else:
+            self._pending = asyncio.ensure_future(self._flush_later(remaining))
+
+    async def flush(self) -> None:
+        """Write the current progress delta immediately."""
+        async with self._lock:
+            self._dirty = False
+            self._last_flush_at = self._clock()
+            await sync_to_async(self.callback)(self.tracker.get_progress_delta())
+
+    async def close(self) -> None:
+        """Cancel any delayed write and write held changes now.
+
+        Raises:
+            Exception: Any error the callback raised in a delayed write
+        """
+        self.cancel()
+        self._raise_pending_error()
+        if self._dirty:
+            await self.flush()
+
+    def cancel(self) -> None:
+        """Drop any delayed write without writing it."""
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+        self._pending = None
+
+    async def _flush_later(self, delay: float) -> None:
+        """Write held changes once the interval since the last write has passed."""
+        await asyncio.sleep(delay)
+        self._pending = None
+        try:
+            await self.flush()
+        except Exception as e:
+            # Surfaced by the next update or close rather than lost in the task
+            self._error = e
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -0,0 +1,247 @@
+"""Publish/subscribe channel for events of running edit tasks.
+
+Workers publish an event whenever a task's progress changes, a paragraph
+finishes or the task completes, and the results stream endpoint pushes them to
+clients as server-sent events. Clients therefore see updates as they happen
+instead of polling the results endpoint on a timer. Events are best effort: a
+client that misses one still gets a snapshot when it connects, and streams check
+the task status on every heartbeat.
+"""
+
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+
+import redis
+import redis.asyncio as redis_asyncio
+from asgiref.sync import sync_to_async
+
+from services.core.constants import TASK_EVENTS_BACKEND
+from services.utils.redis_client import REDIS_SOCKET_TIMEOUT_SECONDS
+
+TaskEvent = Tuple[str, dict]
+
+# Event names
+PROGRESS_EVENT = "progress"
+PARAGRAPH_EVENT = "paragraph"
+DONE_EVENT = "done"
+
+
+class TaskEventSubscription(ABC):
+    """Events of one task, received from the moment the subscription is entered.
+
+    Use as an async context manager so the subscription is always released.
+    """
+
+    async def __aenter__(self) -> "TaskEventSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @abstractmethod
+    async def get(self, timeout: float) -> Optional[TaskEvent]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The event name and data, or None if none arrived in time
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop receiving events."""
+
+
+class IdleSubscription(TaskEventSubscription):
+    """Subscription that never receives events, for when events are disabled."""
+
+    async def get(self, timeout: float) -> Optional[TaskEvent]:
+        await asyncio.sleep(timeout)
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class TaskEventBroker(ABC):
+    """Base class for task event brokers."""
+
+    @abstractmethod
+    def publish(self, task_id: str, event: str, data: dict) -> None:
+        """Publish an event to current subscribers of a task; never raises."""
+
+    async def apublish(self, task_id: str, event: str, data: dict) -> None:
+        """Publish an event without blocking the event loop; never raises."""
+        await sync_to_async(self.publish, thread_sensitive=False)(task_id, event, data)
+
+    @abstractmethod
+    def subscribe(self, task_id: str) -> TaskEventSubscription:
+        """Create a subscription to a task's events."""
+
+
+class _InMemorySubscription(TaskEventSubscription):
+    def __init__(self, broker: "InMemoryTaskEventBroker", task_id: str):
+        self._broker = broker
+        self._task_id = task_id
+        self.queue: "asyncio.Queue[TaskEvent]" = asyncio.Queue()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "TaskEventSubscription":
+        self.loop = asyncio.get_running_loop()
+        self._broker._add(self._task_id, self)
+        return self
+
+    async def get(self, timeout: float) -> Optional[TaskEvent]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self._broker._remove(self._task_id, self)
+
+
+class InMemoryTaskEventBroker(TaskEventBroker):
+    """Delivers events to subscribers in the same process, from any thread."""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[_InMemorySubscription]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, task_id: str, event: str, data: dict) -> None:
+        with self._lock:
+            subscriptions: List[_InMemorySubscription] = list(
+                self._subscriptions.get(task_id, ())
+            )
+        for subscription in subscriptions:
+            if subscription.loop is not None and not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(
+                    subscription.queue.put_nowait, (event, data)
+                )
+
+    # Publishing only takes a lock, so it is cheaper than a hop to a thread
+    async def apublish(self, task_id: str, event: str, data: dict) -> None:
+        self.publish(task_id, event, data)
+
+    def subscribe(self, task_id: str) -> TaskEventSubscription:
+        return _InMemorySubscription(self, task_id)
+
+    def _add(self, task_id: str, subscription: _InMemorySubscription) -> None:
+        with self._lock:
+            self._subscriptions.setdefault(task_id, set()).add(subscription)
+
+    def _remove(self, task_id: str, subscription: _InMemorySubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(task_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[task_id]
+
+
+class _RedisSubscription(TaskEventSubscription):
+    def __init__(self, url: str, channel: str):
+        self._url = url
+        self._channel = channel
+        self._client: Optional[redis_asyncio.Redis] = None
+        self._pubsub: Optional[redis_asyncio.client.PubSub] = None
+
+    async def __aenter__(self) -> "TaskEventSubscription":
+        # Pub/sub holds a connection for as long as the stream is open, so each
+        # subscription gets its own client rather than borrowing a shared pool
+        try:
+            client = redis_asyncio.Redis.from_url(
+                self._url,
+                decode_responses=True,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            )
+            pubsub = client.pubsub()
+            self._client, self._pubsub = client, pubsub
+            await pubsub.subscribe(self._channel)
+        except redis.RedisError:
+            # Without pub/sub the stream still sees the task finish on heartbeats
+            await self.close()
+        return self
+
+    async def get(self, timeout: float) -> Optional[TaskEvent]:
+        if self._pubsub is None:
+            await asyncio.sleep(timeout)
+            return None
+        try:
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=timeout
+            )
+        except redis.RedisError:
+            await self.close()
+            return None
+        if message is None:
+            return None
+        payload = json.loads(message["data"])
+        return payload["event"], payload["data"]
+
+    async def close(self) -> None:
+        pubsub, client = self._pubsub, self._client
+        self._pubsub = None
+        self._client = None
+        try:
+            if pubsub is not None:
+                await pubsub.aclose()
+            if client is not None:
+                await client.aclose()
+        except redis.RedisError:
+            return
+
+
+class RedisTaskEventBroker(TaskEventBroker):
+    """Redis pub/sub broker reaching subscribers in every web process."""
+
+    CHANNEL_PREFIX = "editengine:task-events:"
+
+    def __init__(self, client: redis.Redis, url: str):
+        self.client = client
+        self.url = url
+
+    def publish(self, task_id: str, event: str, data: dict) -> None:
+        try:
+            self.client.publish(
+                self.CHANNEL_PREFIX + task_id,
+                json.dumps({"event": event, "data": data}),
+            )
+        except (redis.RedisError, TypeError, ValueError):
+            return
+
+    def subscribe(self, task_id: str) -> TaskEventSubscription:
+        return _RedisSubscription(self.url, self.CHANNEL_PREFIX + task_id)
+
+
+_task_event_broker_instance: Optional[TaskEventBroker] = None
+_task_event_broker_initialized = False
+
+
+def get_task_event_broker() -> Optional[TaskEventBroker]:
+    """Return the process-wide task event broker configured for this deployment.
+
+    Returns:
+        The configured broker, or None when task events are disabled
+    """
+    global _task_event_broker_instance, _task_event_broker_initialized
+    if not _task_event_broker_initialized:
+        if TASK_EVENTS_BACKEND == "redis":
+            from django.conf import settings
+
+            from services.utils.redis_client import get_redis_client
+
+            _task_event_broker_instance = RedisTaskEventBroker(
+                get_redis_client(), settings.CELERY_BROKER_URL
+            )
+        elif TASK_EVENTS_BACKEND == "memory":
+            _task_event_broker_instance = InMemoryTaskEventBroker()
+        else:
+            _task_event_broker_instance = None
+        _task_event_broker_initialized = True
+    return _task_event_broker_instance
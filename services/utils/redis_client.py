@@ -0,0 +1,34 @@
+"""Shared Redis connection for services that coordinate across worker processes.
+
+The Celery broker already runs on Redis, so services that need state shared
+between Celery workers and the web tier (caches, rate limits, registries) reuse
+the broker connection settings instead of requiring a separate deployment.
+"""
+
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+# Keep Redis round trips from ever stalling an edit for long: every caller treats
+# Redis as an optimization and falls back to local behaviour when it is slow.
+REDIS_SOCKET_TIMEOUT_SECONDS = 2
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the process-wide Redis client built from the broker settings.
+
+    The client is created lazily and shared, so every caller in a process uses
+    the same connection pool. No connection is opened until the first command.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.CELERY_BROKER_URL,
+            decode_responses=True,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    return _redis_client
@@ -4,7 +4,7 @@ This module contains functions specifically for working with wiki text and wiki
 """
 
 import re
-from typing import List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
 from services.core.constants import NON_PROSE_PREFIXES
 
@@ -156,6 +156,48 @@ def extract_lead_content(wikitext: str) -> Optional[str]:
     return None
 
 
+def split_article_sections(wikitext: str) -> List[Tuple[str, str]]:
+    """Split wikitext into its lead section and level 2 sections, in article order.
+
+    Each section's content matches what ``extract_section_content`` returns for
+    it, so the article only has to be parsed once to edit every section.
+    Sections with nothing below their heading are left out.
+
+    Args:
+        wikitext: The wikitext content to parse
+
+    Returns:
+        List of (section title, section content) pairs, with the lead section
+        titled "Lead"
+    """
+    sections: List[Tuple[str, str]] = []
+
+    lead_content = extract_lead_content(wikitext)
+    if lead_content is not None:
+        sections.append(("Lead", lead_content))
+
+    heading_pattern = r"^(={2})\s*([^=]+?)\s*\1\s*$"  # Only match level 2 headings
+    current_title: Optional[str] = None
+    current_lines: List[str] = []
+
+    def add_current_section() -> None:
+        # Skip sections that are only a heading
+        if current_title is not None and "".join(current_lines[1:]).strip():
+            sections.append((current_title, "\n".join(current_lines)))
+
+    for line in wikitext.split("\n"):
+        match = re.match(heading_pattern, line.strip())
+        if match:
+            add_current_section()
+            current_title = match.group(2).strip()
+            current_lines = [line]
+        elif current_title is not None:
+            current_lines.append(line)
+
+    add_current_section()
+    return sections
+
+
 def contains_wikilinks(text: str) -> bool:
     """Checks if the text likely contains wikilinks.
 
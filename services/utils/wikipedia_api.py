@@ -3,7 +3,7 @@
 This module provides functionality to fetch Wikipedia article content using the MediaWiki API.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple, Optional
 
 import httpx
 
@@ -14,6 +14,13 @@ class WikipediaAPIError(Exception):
     pass
 
 
+class ArticleRevision(NamedTuple):
+    """The wikitext of an article at one revision."""
+
+    wikitext: str
+    revision_id: Optional[int]
+
+
 class WikipediaAPI:
     """Client for fetching Wikipedia article content via MediaWiki API."""
 
@@ -28,25 +35,134 @@ class WikipediaAPI:
         self.timeout = timeout
         self.base_url = f"https://{language}.wikipedia.org/w/api.php"
 
-    async def get_article_wikitext(self, title: str) -> str:
+    async def get_article_wikitext(
+        self, title: str, revision_id: Optional[int] = None
+    ) -> str:
         """Fetch the wikitext content of a Wikipedia article.
 
         Args:
             title: The title of the Wikipedia article
+            revision_id: Revision to fetch instead of the latest one
 
         Returns:
             The wikitext content of the article
 
+        Raises:
+            WikipediaAPIError: If the article cannot be fetched or doesn't exist
+        """
+        article_revision = await self.get_article_revision(title, revision_id)
+        return article_revision.wikitext
+
+    async def get_article_revision(
+        self, title: str, revision_id: Optional[int] = None
+    ) -> ArticleRevision:
+        """Fetch the wikitext of a Wikipedia article with its revision ID.
+
+        Args:
+            title: The title of the Wikipedia article
+            revision_id: Revision to fetch instead of the latest one
+
+        Returns:
+            The article's wikitext and the ID of the revision it was taken from
+
         Raises:
             WikipediaAPIError: If the article cannot be fetched or doesn't exist
         """
         self._validate_title(title)
         title = title.strip()
-        normalized_title = await self._normalize_title_with_error_handling(title)
-        params = self._get_query_params(normalized_title)
+        if revision_id is None:
+            normalized_title = await self._normalize_title_with_error_handling(title)
+            params = self._get_query_params(normalized_title)
+        else:
+            params = self._get_revision_query_params(revision_id)
         data = await self._fetch_article_data(params, title)
         content = self._extract_content_from_data(data, title)
-        return content
+        revision = self._extract_revision_from_data(data, title)
+        return ArticleRevision(wikitext=content, revision_id=revision.get("revid"))
+
+    async def get_latest_revision_id(self, title: str) -> int:
+        """Fetch the ID of an article's latest revision without its content.
+
+        Args:
+            title: The title of the Wikipedia article; redirects are followed
+
+        Returns:
+            The ID of the article's latest revision
+
+        Raises:
+            WikipediaAPIError: If the article cannot be fetched or doesn't exist
+        """
+        self._validate_title(title)
+        title = title.strip()
+        params: Dict[str, Any] = {
+            "action": "query",
+            "format": "json",
+            "titles": title,
+            "redirects": 1,
+            "prop": "revisions",
+            "rvprop": "ids",
+            "formatversion": 2,
+        }
+        data = await self._fetch_article_data(params, title)
+        revision_id = self._extract_revision_from_data(data, title).get("revid")
+        if not revision_id:
+            raise WikipediaAPIError(f"No revision found for article: {title}")
+        return revision_id
+
+    async def get_section_wikitext(
+        self, revision_id: int, section_title: str
+    ) -> Optional[str]:
+        """Fetch one section of a revision without the rest of the article.
+
+        The lead is section 0. Other sections are looked up by their level 2
+        heading in the revision's section list, then fetched alone with
+        ``rvsection``.
+
+        Args:
+            revision_id: The revision to take the section from
+            section_title: Heading of the section (case-insensitive), or "Lead"
+
+        Returns:
+            The section's wikitext, starting with its heading, or None if the
+            revision has no such section
+
+        Raises:
+            WikipediaAPIError: If the revision cannot be fetched
+        """
+        section_index = await self._find_section_index(revision_id, section_title)
+        if section_index is None:
+            return None
+        params = {
+            **self._get_revision_query_params(revision_id),
+            "rvsection": section_index,
+        }
+        data = await self._fetch_article_data(params, section_title)
+        return self._extract_revision_from_data(data, section_title).get("content")
+
+    async def _find_section_index(
+        self, revision_id: int, section_title: str
+    ) -> Optional[int]:
+        if section_title.strip().lower() == "lead":
+            return 0
+        params: Dict[str, Any] = {
+            "action": "parse",
+            "format": "json",
+            "oldid": revision_id,
+            "prop": "sections",
+            "formatversion": 2,
+        }
+        data = await self._fetch_article_data(params, section_title)
+        for section in data.get("parse", {}).get("sections", []):
+            # Sections transcluded from templates have indexes like "T-1"
+            index = str(section.get("index", ""))
+            if (
+                str(section.get("level")) == "2"
+                and index.isdigit()
+                and section.get("line", "").strip().lower()
+                == section_title.strip().lower()
+            ):
+                return int(index)
+        return None
 
     def _validate_title(self, title: str):
         if not title or not title.strip():
@@ -62,11 +178,22 @@ class WikipediaAPI:
             "format": "json",
             "titles": normalized_title,
             "prop": "revisions",
-            "rvprop": "content",
+            "rvprop": "ids|content",
             "rvlimit": 1,
             "formatversion": 2,
         }
 
+    def _get_revision_query_params(self, revision_id: int) -> Dict[str, Any]:
+        # Revisions are looked up by ID, so there is no title to normalize
+        return {
+            "action": "query",
+            "format": "json",
+            "revids": revision_id,
+            "prop": "revisions",
+            "rvprop": "ids|content",
+            "formatversion": 2,
+        }
+
     async def _fetch_article_data(
         self, params: Dict[str, Any], title: str
     ) -> Dict[str, Any]:
@@ -89,6 +216,16 @@ class WikipediaAPI:
             ) from e
 
     def _extract_content_from_data(self, data: Dict[str, Any], title: str) -> str:
+        content = self._extract_revision_from_data(data, title).get("content", "")
+        if not content:
+            raise WikipediaAPIError(f"Empty content for article: {title}")
+        return content
+
+    def _extract_revision_from_data(
+        self, data: Dict[str, Any], title: str
+    ) -> Dict[str, Any]:
+        if data.get("query", {}).get("badrevids"):
+            raise WikipediaAPIError(f"Revision not found for article: {title}")
         pages = data.get("query", {}).get("pages", [])
         if not pages:
             raise WikipediaAPIError(f"No pages found for title: {title}")
@@ -98,10 +235,7 @@ class WikipediaAPI:
         revisions = page.get("revisions", [])
         if not revisions:
             raise WikipediaAPIError(f"No content found for article: {title}")
-        content = revisions[0].get("content", "")
-        if not content:
-            raise WikipediaAPIError(f"Empty content for article: {title}")
-        return content
+        return revisions[0]
 
     async def _normalize_title(self, title: str) -> str:
         """Normalize a Wikipedia article title and handle redirects.
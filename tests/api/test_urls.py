@@ -9,7 +9,13 @@ if not settings.configured:
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "EditEngine.settings")
     django.setup()
 
-from api.views.edit_views import EditView, ResultView, SectionHeadingsView
+from api.views.edit_views import (
+    ArticleEditView,
+    EditView,
+    ResultStreamView,
+    ResultView,
+    SectionHeadingsView,
+)
 
 
 class TestDjangoUrls(TestCase):
@@ -37,7 +43,7 @@ class TestDjangoUrls(TestCase):
         """Test that edit URLs resolve correctly."""
         from api.urls import urlpatterns
 
-        self.assertEqual(len(urlpatterns), 5)
+        self.assertEqual(len(urlpatterns), 7)
 
         # Test edit URL pattern
         edit_url = urlpatterns[0]
@@ -67,6 +73,35 @@ class TestDjangoUrls(TestCase):
         self.assertEqual(results_url.callback.view_class, ResultView)
         self.assertEqual(results_url.name, "results")
 
+    def test_results_stream_view_class(self):
+        """Test that ResultStreamView is routed under the results URL."""
+        from api.urls import urlpatterns
+
+        stream_url = urlpatterns[5]
+        self.assertEqual(stream_url.pattern._route, "results/<str:task_id>/stream")
+        self.assertEqual(stream_url.callback.view_class, ResultStreamView)
+        self.assertEqual(stream_url.name, "results-stream")
+
+    def test_stream_process_routes_only_the_result_stream(self):
+        """Test that the stream process URLs leave the API to the web process."""
+        from EditEngine.stream_urls import urlpatterns
+
+        self.assertEqual(
+            [url.name for url in urlpatterns], ["health", "results-stream"]
+        )
+        stream_url = urlpatterns[1]
+        self.assertEqual(stream_url.pattern._route, "api/results/<str:task_id>/stream")
+        self.assertEqual(stream_url.callback.view_class, ResultStreamView)
+
+    def test_article_edit_view_class(self):
+        """Test that ArticleEditView is routed under the edit URL."""
+        from api.urls import urlpatterns
+
+        article_url = urlpatterns[6]
+        self.assertEqual(article_url.pattern._route, "edit/<str:editing_mode>/article")
+        self.assertEqual(article_url.callback.view_class, ArticleEditView)
+        self.assertEqual(article_url.name, "edit-article")
+
     def test_section_headings_view_class(self):
         """Test that SectionHeadingsView is properly imported and used."""
         from api.urls import urlpatterns
@@ -1,3 +1,4 @@
+import json
 import os
 import uuid
 from datetime import datetime, timezone
@@ -14,11 +15,16 @@ if not settings.configured:
 from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import AsyncClient, TestCase
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from api.views import ResultStreamView
 from data.models.edit_task import EditTask
+from data.models.edit_task_submission import EditTaskSubmission
+from services.tasks.cancellation import InMemoryTaskCancellationFlags
+from services.tracking.progress_store import InMemoryProgressStore
+from services.tracking.task_events import InMemoryTaskEventBroker
 
 # Import is used implicitly by Django URL routing
 
@@ -474,6 +480,18 @@ class TestResultViewDRF(TestCase):
         assert response.data["status"] == "STARTED"
         assert response.data["task_id"] == self.task_id
 
+    def test_result_started_includes_partial_results(self):
+        self.edit_task.status = "STARTED"
+        self.edit_task.partial_results = [
+            {"index": 3, "before": "b", "after": "b2", "status": "CHANGED"},
+            {"index": 0, "before": "a", "after": "a", "status": "UNCHANGED"},
+        ]
+        self.edit_task.save()
+
+        response = self.client.get(self.url)
+        assert response.status_code == 202
+        assert [p["index"] for p in response.data["partial_results"]] == [0, 3]
+
     def test_result_not_found(self):
         # Test with non-existent task ID
         fake_uuid = str(uuid.uuid4())
@@ -490,6 +508,19 @@ class TestResultViewDRF(TestCase):
         assert response.data["status"] == "RETRY"
         assert response.data["task_id"] == self.task_id
 
+    def test_result_revoked_keeps_partial_results(self):
+        self.edit_task.partial_results = [
+            {"index": 2, "before": "b", "after": "b2", "status": "CHANGED"},
+        ]
+        self.edit_task.save()
+        self.edit_task.mark_revoked()
+
+        response = self.client.get(self.url)
+        assert response.status_code == 200
+        assert response.data["status"] == "REVOKED"
+        assert response.data["error"] == "Task was cancelled"
+        assert [p["index"] for p in response.data["partial_results"]] == [2]
+
     def test_result_pending_with_progress_data(self):
         # Test PENDING state with progress data
         self.edit_task.status = "PENDING"
@@ -502,6 +533,179 @@ class TestResultViewDRF(TestCase):
         assert response.data["task_id"] == self.task_id
         assert response.data["progress"] == {"processed": 5, "total": 10}
 
+    def test_result_started_reads_live_progress(self):
+        # Live progress in the progress store wins over the database column
+        self.edit_task.status = "STARTED"
+        self.edit_task.progress_data = {"processed": 1, "total": 10}
+        self.edit_task.save()
+        store = InMemoryProgressStore()
+        store.save(
+            self.task_id,
+            {
+                "total_paragraphs": 1,
+                "phase_counts": {"complete": 1},
+                "paragraphs": [{"index": 0, "phase": "complete"}],
+            },
+        )
+
+        with patch("api.views.edit_views.get_progress_store", return_value=store):
+            response = self.client.get(self.url)
+
+        assert response.status_code == 202
+        assert response.data["progress"]["paragraphs"] == [
+            {"index": 0, "phase": "complete"}
+        ]
+
+    def test_result_article_task_reports_section_progress(self):
+        self.edit_task.status = "STARTED"
+        self.edit_task.sections_total = 2
+        self.edit_task.save()
+        EditTask.objects.create(
+            editing_mode="copyedit",
+            section_title="Lead",
+            status="SUCCESS",
+            parent=self.edit_task,
+            section_index=0,
+        )
+        EditTask.objects.create(
+            editing_mode="copyedit",
+            section_title="History",
+            status="STARTED",
+            parent=self.edit_task,
+            section_index=1,
+            progress_data={"progress_percentage": 40},
+        )
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == 202
+        progress = response.data["progress"]
+        assert progress["sections_total"] == 2
+        assert progress["sections_completed"] == 1
+        assert progress["progress_percentage"] == 70
+        assert [section["section_title"] for section in progress["sections"]] == [
+            "Lead",
+            "History",
+        ]
+
+
+class TestArticleEditView(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    @patch("api.views.edit_views.EditTaskService.create_and_start_article_edit_task")
+    def test_post_starts_article_task(self, mock_create):
+        mock_create.return_value = {
+            "task_id": "task",
+            "status_url": "/api/results/task",
+        }
+
+        response = self.client.post(
+            "/api/edit/brevity/article",
+            data={"article_title": "Apollo"},
+            format="json",
+            HTTP_X_GOOGLE_API_KEY="google-key",
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["task_id"] == "task"
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["editing_mode"] == "brevity"
+        assert kwargs["article_title"] == "Apollo"
+        assert kwargs["google_api_key"] == "google-key"
+        assert kwargs["bypass_cache"] is False
+
+    def test_post_requires_article_title(self):
+        response = self.client.post("/api/edit/brevity/article", data={}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_post_rejects_invalid_mode(self):
+        response = self.client.post(
+            "/api/edit/shorten/article",
+            data={"article_title": "Apollo"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestResultStreamView(TestCase):
+    def setUp(self):
+        self.edit_task = EditTask.objects.create(
+            editing_mode="copyedit",
+            article_title="Test Article",
+            section_title="Test Section",
+            llm_provider="google",
+            status="STARTED",
+        )
+        self.task_id = str(self.edit_task.id)
+        self.url = f"/api/results/{self.task_id}/stream"
+
+    @staticmethod
+    def parse_event(chunk):
+        lines = chunk.decode().strip().split("\n")
+        return lines[0].removeprefix("event: "), json.loads(
+            lines[1].removeprefix("data: ")
+        )
+
+    async def test_stream_pushes_events_until_done(self):
+        broker = InMemoryTaskEventBroker()
+        with patch("api.views.edit_views.get_task_event_broker", return_value=broker):
+            response = await AsyncClient().get(self.url)
+            assert response.status_code == 200
+            assert response["Content-Type"] == "text/event-stream"
+
+            chunks = response.streaming_content
+            event, data = self.parse_event(await anext(chunks))
+            assert event == "snapshot"
+            assert data == {"task_id": self.task_id, "status": "STARTED"}
+
+            broker.publish(self.task_id, "paragraph", {"index": 0, "after": "b"})
+            broker.publish(self.task_id, "done", {"status": "SUCCESS"})
+            events = [self.parse_event(chunk) async for chunk in chunks]
+
+        assert events == [
+            ("paragraph", {"index": 0, "after": "b"}),
+            ("done", {"status": "SUCCESS"}),
+        ]
+
+    async def test_stream_of_finished_task_ends_after_snapshot(self):
+        self.edit_task.status = "SUCCESS"
+        await self.edit_task.asave()
+
+        response = await AsyncClient().get(self.url)
+        events = [self.parse_event(chunk) async for chunk in response.streaming_content]
+
+        assert [event for event, _ in events] == ["snapshot", "done"]
+        assert events[1][1] == {"status": "SUCCESS"}
+
+    async def test_stream_notices_missed_completion_on_heartbeat(self):
+        self.edit_task.status = "FAILURE"
+        await self.edit_task.asave()
+
+        with (
+            patch("api.views.edit_views.get_task_event_broker", return_value=None),
+            patch("api.views.edit_views.TASK_EVENTS_HEARTBEAT_SECONDS", 0.01),
+            patch.object(
+                ResultStreamView,
+                "_get_snapshot",
+                return_value={"task_id": self.task_id, "status": "STARTED"},
+            ),
+        ):
+            response = await AsyncClient().get(self.url)
+            events = [
+                self.parse_event(chunk) async for chunk in response.streaming_content
+            ]
+
+        assert events[-1] == ("done", {"status": "FAILURE"})
+
+    async def test_stream_unknown_task(self):
+        response = await AsyncClient().get(f"/api/results/{uuid.uuid4()}/stream")
+        assert response.status_code == 404
+
+    def test_stream_requires_asgi(self):
+        response = APIClient().get(self.url)
+        assert response.status_code == 501
+
 
 class TestEditTaskListViewDRF(TestCase):
     """Test EditTaskListView class using DRF testing patterns."""
@@ -660,6 +864,7 @@ class TestEditTaskDetailViewDRF(TestCase):
             llm_provider="google",
             llm_model="gemini-pro",
             result={"paragraphs": [{"status": "CHANGED", "content": "edited content"}]},
+            usage_data={"input_tokens": 42, "latency_p50_seconds": 1.5},
             error_message=None,
         )
 
@@ -675,6 +880,7 @@ class TestEditTaskDetailViewDRF(TestCase):
         self.assertEqual(response.data["llm_provider"], "google")
         self.assertEqual(response.data["llm_model"], "gemini-pro")
         self.assertIn("result", response.data)
+        self.assertEqual(response.data["usage_data"]["input_tokens"], 42)
         self.assertIsNone(response.data["error_message"])
 
     def test_get_nonexistent_task(self):
@@ -683,6 +889,84 @@ class TestEditTaskDetailViewDRF(TestCase):
         response = self.client.get(f"/api/tasks/{fake_uuid}/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    @patch("services.tasks.edit_task_service.current_app")
+    def test_delete_cancels_running_task(self, mock_celery_app):
+        """Test DELETE request revokes a running task and flags its worker."""
+        self.task.status = "STARTED"
+        self.task.celery_task_id = "celery-id"
+        self.task.save()
+        submission = EditTaskSubmission.objects.create(edit_task=self.task)
+        flags = InMemoryTaskCancellationFlags()
+
+        with patch(
+            "services.tasks.edit_task_service.get_task_cancellation_flags",
+            return_value=flags,
+        ):
+            response = self.client.delete(
+                f"/api/tasks/{self.task.id}/",
+                HTTP_X_CANCEL_TOKEN=str(submission.cancel_token),
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "REVOKED")
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, "REVOKED")
+        self.assertIsNotNone(self.task.completed_at)
+        mock_celery_app.control.revoke.assert_called_once_with("celery-id")
+        self.assertTrue(flags.is_cancelled(str(self.task.id)))
+
+    @patch("services.tasks.edit_task_service.current_app")
+    def test_delete_keeps_task_running_for_other_submissions(self, mock_celery_app):
+        """Test DELETE request only withdraws the caller's submission of a shared task."""
+        self.task.status = "STARTED"
+        self.task.save()
+        first, second = (
+            EditTaskSubmission.objects.create(edit_task=self.task) for _ in range(2)
+        )
+
+        response = self.client.delete(
+            f"/api/tasks/{self.task.id}/",
+            HTTP_X_CANCEL_TOKEN=str(first.cancel_token),
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "STARTED")
+        mock_celery_app.control.revoke.assert_not_called()
+
+        response = self.client.delete(
+            f"/api/tasks/{self.task.id}/",
+            HTTP_X_CANCEL_TOKEN=str(second.cancel_token),
+        )
+        self.assertEqual(response.data["status"], "REVOKED")
+
+    def test_delete_without_cancel_token_is_forbidden(self):
+        """Test DELETE request from a client that did not submit the task."""
+        self.task.status = "STARTED"
+        self.task.save()
+        EditTaskSubmission.objects.create(edit_task=self.task)
+
+        for headers in ({}, {"HTTP_X_CANCEL_TOKEN": str(uuid.uuid4())}):
+            response = self.client.delete(f"/api/tasks/{self.task.id}/", **headers)
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, "STARTED")
+
+    def test_delete_finished_task_is_rejected(self):
+        """Test DELETE request for a task that already succeeded."""
+        submission = EditTaskSubmission.objects.create(edit_task=self.task)
+        response = self.client.delete(
+            f"/api/tasks/{self.task.id}/",
+            HTTP_X_CANCEL_TOKEN=str(submission.cancel_token),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, "SUCCESS")
+
+    def test_delete_nonexistent_task(self):
+        """Test DELETE request for a non-existent task."""
+        response = self.client.delete(f"/api/tasks/{uuid.uuid4()}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class TestEditViewSerializerErrorHandling(TestCase):
     """Test edge cases for serializer error handling in EditView."""
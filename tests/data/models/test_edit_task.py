@@ -119,6 +119,10 @@ class TestEditTask(TestCase):
         self.assertIsNotNone(task.started_at)
         self.assertGreater(task.updated_at, original_updated_at)
 
+        # Every start counts as a delivery of the task
+        task.mark_started()
+        self.assertEqual(task.delivery_count, 2)
+
     def test_mark_success_method(self):
         """Test the mark_success method."""
         task = EditTask.objects.create(
@@ -136,8 +140,92 @@ class TestEditTask(TestCase):
 
         self.assertEqual(task.status, "SUCCESS")
         self.assertEqual(task.result, result_data)
+        self.assertIsNone(task.usage_data)
         self.assertIsNotNone(task.completed_at)
 
+    def test_mark_success_stores_usage_data(self):
+        """Test that mark_success persists LLM usage alongside the results."""
+        task = EditTask.objects.create(
+            editing_mode="copyedit", llm_provider="google", created_at=timezone.now()
+        )
+        usage_data = {"input_tokens": 120, "paragraphs": [{"paragraph_index": 0}]}
+
+        task.mark_success({"paragraphs": []}, usage_data=usage_data)
+
+        task.refresh_from_db()
+        self.assertEqual(task.usage_data, usage_data)
+
+    def test_cancelled_task_stays_revoked(self):
+        """Test that a worker finishing a cancelled task does not overwrite it."""
+        task = EditTask.objects.create(editing_mode="copyedit", llm_provider="google")
+        EditTask.objects.get(id=task.id).mark_revoked()
+
+        self.assertFalse(task.mark_success({"paragraphs": []}))
+        self.assertEqual(task.status, "REVOKED")
+        self.assertFalse(task.mark_failure("Worker error"))
+        self.assertFalse(task.mark_started())
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, "REVOKED")
+        self.assertEqual(task.error_message, "Task was cancelled")
+        self.assertIsNone(task.result)
+
+    def test_partial_results_until_success(self):
+        """Test that partial results accumulate and are cleared on success."""
+        task = EditTask.objects.create(
+            editing_mode="copyedit", llm_provider="google", created_at=timezone.now()
+        )
+        self.assertIsNone(task.get_partial_results_for_api())
+
+        task.add_partial_results([{"index": 2, "before": "b", "after": "c"}])
+        task.add_partial_results([{"index": 0, "before": "a", "after": "a"}])
+
+        task.refresh_from_db()
+        self.assertEqual(
+            [p["index"] for p in task.get_partial_results_for_api()], [0, 2]
+        )
+
+        task.mark_success({"paragraphs": []})
+        task.refresh_from_db()
+        self.assertIsNone(task.partial_results)
+
+    def test_record_section_completed_reports_the_last_section(self):
+        """Test that only the last finished section completes an article task."""
+        article_task = EditTask.objects.create(
+            editing_mode="copyedit", llm_provider="google", sections_total=2
+        )
+        self.assertTrue(article_task.is_article_task())
+        first, second = (
+            EditTask.objects.create(
+                editing_mode="copyedit",
+                llm_provider="google",
+                parent=article_task,
+                section_index=index,
+            )
+            for index in range(2)
+        )
+
+        first.mark_success({"paragraphs": []})
+        self.assertFalse(article_task.record_section_completed())
+        second.mark_failure("Section failed")
+        self.assertTrue(article_task.record_section_completed())
+        # A redelivered section does not complete the article a second time
+        self.assertFalse(article_task.record_section_completed())
+
+        article_task.refresh_from_db()
+        self.assertEqual(article_task.sections_completed, 2)
+
+    def test_add_partial_results_replaces_paragraphs_by_index(self):
+        """Test that a paragraph recorded again replaces its earlier result."""
+        task = EditTask.objects.create(editing_mode="copyedit", llm_provider="google")
+        task.add_partial_results([{"index": 0, "before": "a", "after": "b"}])
+        task.add_partial_results([{"index": 0, "before": "a", "after": "c"}])
+
+        task.refresh_from_db()
+        self.assertEqual(
+            task.partial_results, [{"index": 0, "before": "a", "after": "c"}]
+        )
+
     def test_mark_failure_method(self):
         """Test the mark_failure method."""
         task = EditTask.objects.create(
@@ -304,6 +392,42 @@ class TestEditTask(TestCase):
 
         self.assertEqual(task.progress_data, progress_data)
 
+    def test_update_progress_data_merges_paragraph_deltas(self):
+        """Test that progress deltas are merged into stored paragraphs by index."""
+        task = EditTask.objects.create(
+            editing_mode="copyedit", llm_provider="google", created_at=timezone.now()
+        )
+        task.update_progress_enhanced(
+            {
+                "phase_counts": {"pending": 2, "complete": 0},
+                "total_paragraphs": 2,
+                "progress_percentage": 0,
+                "paragraphs": [
+                    {"index": 0, "phase": "pending"},
+                    {"index": 1, "phase": "pending"},
+                ],
+            }
+        )
+
+        task.update_progress_enhanced(
+            {
+                "phase_counts": {"pending": 1, "complete": 1},
+                "total_paragraphs": 2,
+                "progress_percentage": 50,
+                "paragraphs": [{"index": 1, "phase": "complete", "status": "CHANGED"}],
+            }
+        )
+        task.refresh_from_db()
+
+        self.assertEqual(task.progress_data["progress_percentage"], 50)
+        self.assertEqual(
+            task.progress_data["paragraphs"],
+            [
+                {"index": 0, "phase": "pending"},
+                {"index": 1, "phase": "complete", "status": "CHANGED"},
+            ],
+        )
+
     def test_update_progress_data_invalid_counts(self):
         """Test updating progress data with invalid phase counts."""
         task = EditTask.objects.create(
@@ -17,6 +17,7 @@ def test_llm_provider_enum():
     """Test LLM provider enum values."""
     assert LLMProvider.GOOGLE.value == "google"
     assert LLMProvider.OPENAI.value == "openai"
+    assert LLMProvider.FAKE.value == "fake"
 
 
 def test_gemini_model_enum():
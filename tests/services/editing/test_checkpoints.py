@@ -0,0 +1,64 @@
+"""Tests for paragraph checkpoints."""
+
+from services.editing.checkpoints import (
+    checkpoints_from_partial_results,
+    checkpoints_from_previous_edit,
+    paragraph_checkpoint_key,
+    paragraph_content_key,
+)
+
+
+def paragraph(index, before, status="CHANGED"):
+    return {
+        "index": index,
+        "before": before,
+        "after": before.upper(),
+        "status": status,
+        "status_details": "",
+    }
+
+
+def test_key_depends_on_position_and_content():
+    key = paragraph_checkpoint_key(0, "First")
+
+    assert key == paragraph_checkpoint_key(0, "First")
+    assert key != paragraph_checkpoint_key(1, "First")
+    assert key != paragraph_checkpoint_key(0, "First.")
+
+
+def test_errored_paragraphs_are_not_checkpointed():
+    checkpoints = checkpoints_from_partial_results(
+        [
+            paragraph(0, "First"),
+            paragraph(1, "Second", status="ERRORED"),
+            paragraph(2, "Third", status="TIMED_OUT"),
+        ]
+    )
+
+    assert checkpoints == {paragraph_checkpoint_key(0, "First"): paragraph(0, "First")}
+
+
+def test_no_partial_results():
+    assert checkpoints_from_partial_results(None) == {}
+
+
+def test_content_key_ignores_whitespace_but_not_wording():
+    key = paragraph_content_key("First  sentence.\nSecond.")
+
+    assert key == paragraph_content_key(" First sentence. Second. ")
+    assert key != paragraph_content_key("First sentence. Second!")
+    assert key not in {paragraph_checkpoint_key(0, "First sentence. Second.")}
+
+
+def test_previous_edit_checkpoints_are_keyed_by_content():
+    result = {
+        "paragraphs": [
+            paragraph(0, "First"),
+            paragraph(1, "Second", status="ERRORED"),
+        ]
+    }
+
+    assert checkpoints_from_previous_edit(result) == {
+        paragraph_content_key("First"): paragraph(0, "First")
+    }
+    assert checkpoints_from_previous_edit(None) == {}
@@ -13,13 +13,20 @@ from services.core.interfaces import (
     IReversionTracker,
     ParagraphProcessingResult,
 )
+from services.editing.checkpoints import (
+    checkpoints_from_partial_results,
+    checkpoints_from_previous_edit,
+)
 from services.editing.edit_orchestrator import (
     EditOrchestrator,
     EditResult,
     EditTask,
     ParagraphResult,
+    ParagraphTimeoutError,
     SkippedItem,
 )
+from services.llm.concurrency import AdaptiveConcurrencyLimiter
+from services.tracking.progress_tracker import EnhancedProgressTracker
 
 
 # Test helper classes
@@ -1502,6 +1509,462 @@ class TestEditOrchestrator:
         assert not results[1].success
         assert isinstance(results[1].error, RuntimeError)
 
+    @pytest.mark.asyncio
+    async def test_process_single_task_respects_concurrency_window(self):
+        """Test that paragraph processing never exceeds the concurrency window."""
+        self.orchestrator.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            max_limit=2, initial_limit=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def process(content, context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ParagraphProcessingResult(success=True, content=content)
+
+        paragraph_processor = AsyncMock()
+        paragraph_processor.process.side_effect = process
+        tasks = [EditTask(f"Test paragraph {i}", i, i, False, 6) for i in range(6)]
+
+        results = await self.orchestrator._process_edit_tasks(
+            tasks, paragraph_processor
+        )
+
+        assert peak == 2
+        assert all(result.success for result in results)
+
+    @pytest.mark.asyncio
+    async def test_progress_data_includes_concurrency_window(self):
+        """Test that progress updates publish the current concurrency window."""
+        self.orchestrator.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            max_limit=6, initial_limit=3
+        )
+        self.orchestrator._progress_tracker = EnhancedProgressTracker(1)
+        callback = Mock()
+        self.orchestrator._enhanced_progress_callback = callback
+
+        await self.orchestrator._update_progress(0, "llm_processing")
+
+        assert callback.call_args[0][0]["concurrency_window"] == 3
+
+    @pytest.mark.asyncio
+    async def test_process_edit_tasks_batch_packed(self):
+        """Test that packed batches are processed with one processor call."""
+        self.orchestrator.pack_paragraphs = True
+        batch_tasks = [
+            EditTask("Test paragraph 1", 0, 0, True, 2),
+            EditTask("Test paragraph 2", 1, 1, False, 2),
+        ]
+        paragraph_processor = AsyncMock()
+        paragraph_processor.process_packed.return_value = [
+            ParagraphProcessingResult(success=True, content="Edited paragraph 1"),
+            ParagraphProcessingResult(
+                success=False, content="Test paragraph 2", failure_reason="Bad edit"
+            ),
+        ]
+
+        results = await self.orchestrator._process_edit_tasks_batch(
+            batch_tasks, paragraph_processor
+        )
+
+        paragraph_processor.process_packed.assert_called_once()
+        items = paragraph_processor.process_packed.call_args[0][0]
+        assert [content for content, _ in items] == [
+            "Test paragraph 1",
+            "Test paragraph 2",
+        ]
+        paragraph_processor.process.assert_not_called()
+        assert results[0].success
+        assert results[0].content == "Edited paragraph 1"
+        assert not results[1].success
+        assert results[1].failure_reason == "Bad edit"
+
+    @pytest.mark.asyncio
+    async def test_process_edit_tasks_batch_packed_exception(self):
+        """Test that a failing packed call errors every task in the batch."""
+        self.orchestrator.pack_paragraphs = True
+        batch_tasks = [
+            EditTask("Test paragraph 1", 0, 0, True, 2),
+            EditTask("Test paragraph 2", 1, 1, False, 2),
+        ]
+        paragraph_processor = AsyncMock()
+        paragraph_processor.process_packed.side_effect = RuntimeError("Packed fail")
+
+        results = await self.orchestrator._process_edit_tasks_batch(
+            batch_tasks, paragraph_processor
+        )
+
+        assert [result.content for result in results] == [
+            "Test paragraph 1",
+            "Test paragraph 2",
+        ]
+        assert all(isinstance(result.error, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_process_edit_tasks_batch_packed_timed_out_paragraph(self):
+        """Test that a paragraph the processor timed out is marked TIMED_OUT."""
+        self.orchestrator.pack_paragraphs = True
+        batch_tasks = [
+            EditTask("Test paragraph 1", 0, 0, True, 2),
+            EditTask("Test paragraph 2", 1, 1, False, 2),
+        ]
+        paragraph_processor = AsyncMock()
+        paragraph_processor.process_packed.return_value = [
+            ParagraphProcessingResult(success=True, content="Edited paragraph 1"),
+            ParagraphProcessingResult(
+                success=False,
+                content="Test paragraph 2",
+                failure_reason="Paragraph was not edited within 30 seconds",
+                timed_out=True,
+            ),
+        ]
+
+        results = await self.orchestrator._process_edit_tasks_batch(
+            batch_tasks, paragraph_processor
+        )
+
+        assert results[0].success
+        assert isinstance(results[1].error, ParagraphTimeoutError)
+        structured = self.orchestrator._create_result_for_processed_item(
+            "Test paragraph 2", results[1]
+        )
+        assert structured.status == "TIMED_OUT"
+
+    @pytest.mark.asyncio
+    async def test_process_edit_tasks_batch_packed_limit_scales_with_paragraphs(self):
+        """Test that a packed batch gets the time limit of each paragraph it holds."""
+        self.orchestrator.pack_paragraphs = True
+        self.orchestrator.paragraph_timeout_seconds = 0.05
+        batch_tasks = [
+            EditTask("Test paragraph 1", 0, 0, True, 2),
+            EditTask("Test paragraph 2", 1, 1, False, 2),
+        ]
+
+        async def process_packed(items):
+            # Longer than one paragraph's limit, well within the batch's
+            await asyncio.sleep(0.08)
+            return [
+                ParagraphProcessingResult(success=True, content=content)
+                for content, _ in items
+            ]
+
+        paragraph_processor = AsyncMock()
+        paragraph_processor.process_packed.side_effect = process_packed
+
+        results = await self.orchestrator._process_edit_tasks_batch(
+            batch_tasks, paragraph_processor
+        )
+
+        assert all(result.success for result in results)
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_yields_in_completion_order(self):
+        """Test that paragraphs are yielded as they finish, skipped items first."""
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph slow",
+            "== Heading ==",
+            "This is a test paragraph fast",
+        ]
+
+        async def mock_process(content, context):
+            if content.endswith("slow"):
+                await asyncio.sleep(0.05)
+            return ParagraphProcessingResult(success=True, content=content + "!")
+
+        self.mock_paragraph_processor.process.side_effect = mock_process
+
+        yielded = [
+            (index, result.status)
+            async for index, result in self.orchestrator.iter_edit_structured_batched(
+                "text", self.mock_paragraph_processor
+            )
+        ]
+
+        assert yielded == [(1, "SKIPPED"), (2, "CHANGED"), (0, "CHANGED")]
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_restores_checkpoints(self):
+        """Test that checkpointed paragraphs are restored instead of edited."""
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+        ]
+        self.mock_paragraph_processor.process.return_value = ParagraphProcessingResult(
+            success=True, content="Edited paragraph"
+        )
+        checkpoints = checkpoints_from_partial_results(
+            [
+                {
+                    "index": 1,
+                    "before": "This is a test paragraph 2",
+                    "after": "Restored paragraph",
+                    "status": "CHANGED",
+                    "status_details": "Success",
+                }
+            ]
+        )
+
+        results = dict(
+            [
+                pair
+                async for pair in self.orchestrator.iter_edit_structured_batched(
+                    "text", self.mock_paragraph_processor, checkpoints=checkpoints
+                )
+            ]
+        )
+
+        assert results[1].after == "Restored paragraph"
+        assert results[0].after == "Edited paragraph"
+        self.mock_paragraph_processor.process.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_reuses_previous_edit(self):
+        """Test that paragraphs unchanged since an earlier edit reuse its results."""
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph added since the earlier edit",
+            "This is a test paragraph  1",
+            "This is a test paragraph 2",
+        ]
+        self.mock_paragraph_processor.process.return_value = ParagraphProcessingResult(
+            success=True, content="Edited paragraph"
+        )
+        # The earlier edit saw the paragraphs at other positions and spacing
+        checkpoints = checkpoints_from_previous_edit(
+            {
+                "paragraphs": [
+                    {
+                        "before": "This is a test paragraph 1",
+                        "after": "Reused paragraph",
+                        "status": "CHANGED",
+                        "status_details": "Success",
+                    },
+                    {
+                        "before": "This is a test paragraph 2",
+                        "after": "This is a test paragraph 2",
+                        "status": "UNCHANGED",
+                        "status_details": "No changes",
+                    },
+                ]
+            }
+        )
+
+        results = dict(
+            [
+                pair
+                async for pair in self.orchestrator.iter_edit_structured_batched(
+                    "text", self.mock_paragraph_processor, checkpoints=checkpoints
+                )
+            ]
+        )
+
+        assert results[0].after == "Edited paragraph"
+        assert results[1].before == "This is a test paragraph  1"
+        assert results[1].after == "Reused paragraph"
+        assert (results[2].after, results[2].status) == (
+            "This is a test paragraph 2",
+            "UNCHANGED",
+        )
+        self.mock_paragraph_processor.process.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_times_out_slow_paragraphs(self):
+        """Test that paragraphs over the paragraph time limit are TIMED_OUT."""
+        self.orchestrator.paragraph_timeout_seconds = 0.01
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+        ]
+
+        async def process(content, context):
+            if content.endswith("2"):
+                await asyncio.sleep(1)
+            return ParagraphProcessingResult(success=True, content="Edited paragraph")
+
+        self.mock_paragraph_processor.process.side_effect = process
+
+        results = dict(
+            [
+                pair
+                async for pair in self.orchestrator.iter_edit_structured_batched(
+                    "text", self.mock_paragraph_processor
+                )
+            ]
+        )
+
+        assert results[0].status == "CHANGED"
+        assert results[1].status == "TIMED_OUT"
+        assert results[1].after == "This is a test paragraph 2"
+        assert "0.01 seconds" in results[1].status_details
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_stops_at_task_deadline(self):
+        """Test that the task completes with finished paragraphs at its deadline."""
+        self.orchestrator.task_deadline_seconds = 0.05
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+            "This is a test paragraph 3",
+        ]
+        cancelled = []
+
+        async def process(content, context):
+            if content.endswith("1"):
+                return ParagraphProcessingResult(success=True, content="Edited")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(content)
+                raise
+
+        self.mock_paragraph_processor.process.side_effect = process
+        progress_calls: List[dict] = []
+
+        yielded = [
+            (index, result.status)
+            async for index, result in self.orchestrator.iter_edit_structured_batched(
+                "text", self.mock_paragraph_processor, progress_calls.append
+            )
+        ]
+        await asyncio.sleep(0)
+
+        assert yielded == [(0, "CHANGED"), (1, "TIMED_OUT"), (2, "TIMED_OUT")]
+        assert len(cancelled) == 2
+        assert progress_calls[-1]["progress_percentage"] == 100
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("packed", [False, True])
+    async def test_orchestrate_edit_structured_stops_at_task_deadline(self, packed):
+        """Test that the returned results mark paragraphs edited too late TIMED_OUT."""
+        self.orchestrator.task_deadline_seconds = 0.05
+        self.orchestrator.pack_paragraphs = packed
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+        ]
+
+        async def process(content, context):
+            if content.endswith("2"):
+                await asyncio.sleep(10)
+            return ParagraphProcessingResult(success=True, content="Edited")
+
+        async def process_packed(items):
+            await asyncio.sleep(10)
+
+        self.mock_paragraph_processor.process.side_effect = process
+        self.mock_paragraph_processor.process_packed.side_effect = process_packed
+
+        results = await asyncio.wait_for(
+            self.orchestrator.orchestrate_edit_structured_batched(
+                "text", self.mock_paragraph_processor, batch_size=2
+            ),
+            timeout=5,
+        )
+
+        expected = ["TIMED_OUT", "TIMED_OUT"] if packed else ["CHANGED", "TIMED_OUT"]
+        assert [result.status for result in results] == expected
+        assert "0.05 second limit" in results[1].status_details
+
+        if not packed:
+            results = await asyncio.wait_for(
+                self.orchestrator.orchestrate_edit_structured(
+                    "text", self.mock_paragraph_processor
+                ),
+                timeout=5,
+            )
+            assert [result.status for result in results] == expected
+
+    @pytest.mark.asyncio
+    async def test_progress_is_debounced_and_flushed_on_completion(self):
+        """Test that progress changes are coalesced and the final state written."""
+        self.orchestrator.progress_flush_interval_seconds = 60
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+        ]
+        self.mock_paragraph_processor.process.return_value = (
+            ParagraphProcessingResult(success=True, content="Edited paragraph")
+        )
+        progress_calls: List[dict] = []
+
+        async for _ in self.orchestrator.iter_edit_structured_batched(
+            "text", self.mock_paragraph_processor, progress_calls.append
+        ):
+            pass
+
+        # The initial progress, then every change written together at the end
+        assert len(progress_calls) == 2
+        assert len(progress_calls[0]["paragraphs"]) == 2
+        assert progress_calls[-1]["progress_percentage"] == 100
+        assert {p["phase"] for p in progress_calls[-1]["paragraphs"]} == {"complete"}
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_packed_failure(self):
+        """Test that a failed packed batch yields an error for each paragraph."""
+        self.orchestrator.pack_paragraphs = True
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph 1",
+            "This is a test paragraph 2",
+        ]
+        self.mock_paragraph_processor.process_packed.side_effect = RuntimeError(
+            "Packed fail"
+        )
+
+        results = dict(
+            [
+                pair
+                async for pair in self.orchestrator.iter_edit_structured_batched(
+                    "text", self.mock_paragraph_processor, batch_size=2
+                )
+            ]
+        )
+
+        assert self.mock_paragraph_processor.process_packed.call_count == 1
+        assert {result.status for result in results.values()} == {"ERRORED"}
+        assert sorted(results) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_iter_edit_structured_batched_close_cancels_pending(self):
+        """Test that closing the generator early cancels unfinished edits."""
+        self.orchestrator.document_processor = Mock()
+        self.orchestrator.document_processor.process.return_value = [
+            "This is a test paragraph fast",
+            "This is a test paragraph slow",
+        ]
+        cancelled = asyncio.Event()
+
+        async def mock_process(content, context):
+            if content.endswith("slow"):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return ParagraphProcessingResult(success=True, content=content)
+
+        self.mock_paragraph_processor.process.side_effect = mock_process
+
+        results = self.orchestrator.iter_edit_structured_batched(
+            "text", self.mock_paragraph_processor
+        )
+        index, _ = await results.__anext__()
+        await results.aclose()
+        await asyncio.sleep(0)
+
+        assert index == 0
+        assert cancelled.is_set()
+
 
 class TestEditTask:
     """Test cases for EditTask."""
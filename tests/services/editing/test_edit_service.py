@@ -54,6 +54,47 @@ class TestWikiEditor:
         assert editor.paragraph_processor is not None
         assert editor.orchestrator is not None
 
+    def test_wiki_editor_pack_paragraphs(self, mock_llm):
+        """Test that packing wires the packed chain into the editing components."""
+        editor = WikiEditor(llm=mock_llm, editing_mode="copyedit")
+        assert editor.paragraph_processor.packed_llm_chain is None
+        assert editor.orchestrator.pack_paragraphs is False
+
+        packed_editor = WikiEditor(
+            llm=mock_llm, editing_mode="copyedit", pack_paragraphs=True
+        )
+        assert (
+            packed_editor.paragraph_processor.packed_llm_chain
+            is packed_editor.packed_chain
+        )
+        assert packed_editor.orchestrator.pack_paragraphs is True
+
+    def test_wiki_editor_prompt_caching(self, mock_llm):
+        """Test cache breakpoints for Anthropic and usage tracking wiring."""
+        from services.llm.usage import UsageTracker
+
+        anthropic_editor = WikiEditor(
+            llm=mock_llm, editing_mode="copyedit", llm_provider="anthropic"
+        )
+        system_content = anthropic_editor.chain.first.invoke(
+            {"wikitext": "X"}
+        ).to_messages()[0].content
+        assert system_content[0]["cache_control"] == {"type": "ephemeral"}
+
+        openai_editor = WikiEditor(
+            llm=mock_llm, editing_mode="copyedit", llm_provider="openai"
+        )
+        system_content = openai_editor.chain.first.invoke(
+            {"wikitext": "X"}
+        ).to_messages()[0].content
+        assert isinstance(system_content, str)
+
+        usage_tracker = UsageTracker()
+        tracked_editor = WikiEditor(
+            llm=mock_llm, editing_mode="copyedit", usage_tracker=usage_tracker
+        )
+        assert tracked_editor.paragraph_processor.usage_tracker is usage_tracker
+
     def test_wiki_editor_initialization_with_custom_components(
         self, mock_llm, mock_dependencies
     ):
@@ -288,12 +329,56 @@ class TestWikiEditor:
 
                 assert result == mock_results
                 mock_api_class.assert_called_once_with(language="en")
-                mock_api.get_article_wikitext.assert_called_once_with("Test Article")
+                mock_api.get_article_wikitext.assert_called_once_with(
+                    "Test Article", revision_id=None
+                )
                 mock_extract.assert_called_once()
                 wiki_editor.edit_wikitext_structured.assert_called_once_with(
                     "Section content here", callback
                 )
 
+    @pytest.mark.asyncio
+    async def test_stream_article_section_structured_batched_errors_rest(
+        self, wiki_editor
+    ):
+        """Test that a failure mid-stream returns the unfinished paragraphs unchanged."""
+        with patch("services.editing.edit_service.WikipediaAPI") as mock_api_class:
+            mock_api = AsyncMock()
+            mock_api_class.return_value = mock_api
+            mock_api.get_article_wikitext = AsyncMock(return_value="wikitext")
+
+            with patch(
+                "services.utils.wiki_utils.extract_section_content",
+                return_value="First\n\nSecond",
+            ):
+
+                async def failing_stream(*args, **kwargs):
+                    yield 0, ParagraphResult(
+                        before="First",
+                        after="First!",
+                        status="CHANGED",
+                        status_details="Success",
+                    )
+                    raise RuntimeError("boom")
+
+                wiki_editor.orchestrator.iter_edit_structured_batched = failing_stream
+                wiki_editor.document_processor = Mock()
+                wiki_editor.document_processor.process.return_value = [
+                    "First",
+                    "Second",
+                ]
+
+                results = [
+                    (index, result.status)
+                    async for index, result in (
+                        wiki_editor.stream_article_section_structured_batched(
+                            "Test Article", "Test Section"
+                        )
+                    )
+                ]
+
+        assert results == [(0, "CHANGED"), (1, "ERRORED")]
+
     @pytest.mark.asyncio
     async def test_edit_article_section_structured_section_not_found(self, wiki_editor):
         """Test edit_article_section_structured when section is not found."""
@@ -1,5 +1,6 @@
 """Tests for paragraph processor module."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,6 +13,7 @@ from services.core.interfaces import (
     ValidationContext,
 )
 from services.editing.paragraph_processor import ParagraphProcessor
+from services.llm.response_cache import CacheScope, InMemoryResponseCache
 from services.tracking.reversion_tracker import ReversionType
 from services.validation.pipeline import (
     ValidationFailure,
@@ -824,3 +826,770 @@ class TestParagraphProcessor:
         finally:
             # Restore original value
             processor.MAX_LLM_RETRIES = original_max_retries
+
+    @pytest.mark.asyncio
+    async def test_get_llm_edit_uses_response_cache(self, mock_reference_handler):
+        """Test that identical text is served from the response cache."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Edited text from LLM"
+        cache = InMemoryResponseCache(max_entries=10, ttl_seconds=60)
+
+        processor = ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            response_cache=cache,
+            cache_scope=CacheScope("copyedit", "openai", "gpt-4o-mini", "v1"),
+        )
+        context = ValidationContext(
+            paragraph_index=0,
+            total_paragraphs=1,
+            is_first_prose=False,
+            refs_list=[],
+            additional_data={},
+        )
+
+        first = await processor._get_llm_edit("test text", context)
+        second = await processor._get_llm_edit("test text", context)
+
+        assert first == second == "Edited text from LLM"
+        llm_chain.ainvoke.assert_called_once()
+        assert cache.get_stats() == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_llm_edit_does_not_cache_failures(self, mock_reference_handler):
+        """Test that failed LLM calls are not written to the cache."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = None
+        cache = InMemoryResponseCache(max_entries=10, ttl_seconds=60)
+
+        processor = ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            response_cache=cache,
+            cache_scope=CacheScope("copyedit", "openai", "gpt-4o-mini", "v1"),
+        )
+        context = ValidationContext(
+            paragraph_index=0,
+            total_paragraphs=1,
+            is_first_prose=False,
+            refs_list=[],
+            additional_data={},
+        )
+
+        await processor._get_llm_edit("test text", context)
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_acquire_rate_limit(self, mock_reference_handler):
+        """Test that every LLM attempt waits for rate limit capacity first."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [
+            ChatGoogleGenerativeAIError("API Error"),
+            "Edited text",
+        ]
+        rate_limiter = AsyncMock()
+
+        processor = ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            rate_limiter=rate_limiter,
+            prompt_overhead_tokens=100,
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await processor._invoke_llm_with_retries("x" * 40)
+
+        assert result == "Edited text"
+        assert rate_limiter.acquire.await_count == 2
+        rate_limiter.acquire.assert_awaited_with(120)
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_go_through_hedging_policy(self, mock_reference_handler):
+        """Test that single-paragraph requests are run by the hedging policy."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Edited text"
+        hedging_policy = MagicMock()
+
+        async def run(make_request, can_hedge=None):
+            assert await can_hedge() is True
+            return await make_request()
+
+        hedging_policy.run.side_effect = run
+        processor = ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            hedging_policy=hedging_policy,
+        )
+
+        assert await processor._invoke_llm_with_retries("text") == "Edited text"
+        hedging_policy.run.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_hedged_attempts_each_take_a_request_slot(
+        self, mock_reference_handler
+    ):
+        """Test that a hedged duplicate waits for its own process-wide slot."""
+        from services.llm.concurrency import InFlightRequestLimit
+
+        in_flight = 0
+        peak = 0
+
+        async def ainvoke(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Edited text"
+
+        async def run(make_request, can_hedge=None):
+            primary, hedge = await asyncio.gather(make_request(), make_request())
+            return primary
+
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = ainvoke
+        hedging_policy = MagicMock()
+        hedging_policy.run.side_effect = run
+        processor = ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            hedging_policy=hedging_policy,
+            in_flight_request_limit=InFlightRequestLimit(1),
+        )
+
+        assert await processor._invoke_llm_with_retries("text") == "Edited text"
+        assert llm_chain.ainvoke.await_count == 2
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_share_process_request_limit(self, mock_reference_handler):
+        """Test that requests of all processors wait for the process-wide limit."""
+        from services.llm.concurrency import InFlightRequestLimit
+
+        in_flight = 0
+        peak = 0
+
+        async def ainvoke(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Edited text"
+
+        limit = InFlightRequestLimit(2)
+        processors = []
+        for _ in range(3):
+            llm_chain = AsyncMock()
+            llm_chain.ainvoke.side_effect = ainvoke
+            processors.append(
+                ParagraphProcessor(
+                    llm_chain,
+                    AsyncMock(),
+                    AsyncMock(),
+                    MockReversionTracker(),
+                    mock_reference_handler,
+                    in_flight_request_limit=limit,
+                )
+            )
+
+        results = await asyncio.gather(
+            *(
+                processor._invoke_llm_with_retries(f"text {i}")
+                for processor in processors
+                for i in range(2)
+            )
+        )
+
+        assert results == ["Edited text"] * 6
+        assert peak == 2
+
+    def test_response_cache_requires_scope(self, mock_reference_handler):
+        """Test that a cache without a scope is ignored."""
+        processor = ParagraphProcessor(
+            AsyncMock(),
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            mock_reference_handler,
+            response_cache=InMemoryResponseCache(),
+        )
+        assert processor.response_cache is None
+
+
+class TestParagraphProcessorPacked:
+    """Test cases for packed multi-paragraph processing."""
+
+    @staticmethod
+    def _passthrough_pipeline():
+        pipeline = AsyncMock(spec=ValidationPipeline)
+        pipeline.validate = AsyncMock(
+            side_effect=lambda original, edited, context: (edited, False)
+        )
+        return pipeline
+
+    @staticmethod
+    def _items(*contents):
+        return [
+            (
+                content,
+                ValidationContext(
+                    paragraph_index=index,
+                    total_paragraphs=len(contents),
+                    is_first_prose=False,
+                    refs_list=[],
+                    additional_data={"text_with_placeholders": content},
+                ),
+            )
+            for index, content in enumerate(contents)
+        ]
+
+    def _make_processor(self, llm_chain, packed_llm_chain, **kwargs):
+        return ParagraphProcessor(
+            llm_chain,
+            self._passthrough_pipeline(),
+            self._passthrough_pipeline(),
+            MockReversionTracker(),
+            AsyncMock(spec=IReferenceHandler),
+            packed_llm_chain=packed_llm_chain,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_packed_splits_single_response(self):
+        """Test that one packed call produces a result for every paragraph."""
+        llm_chain = AsyncMock()
+        packed_chain = AsyncMock()
+        packed_chain.ainvoke.return_value = (
+            "<<<PARAGRAPH 1>>>\nFirst edited.\n<<<END PARAGRAPH 1>>>\n\n"
+            "<<<PARAGRAPH 2>>>\n<UNCHANGED>\n<<<END PARAGRAPH 2>>>"
+        )
+        processor = self._make_processor(llm_chain, packed_chain)
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert [r.content for r in results] == ["First edited.", "Second original."]
+        assert all(r.success for r in results)
+        packed_chain.ainvoke.assert_called_once()
+        prompt_text = packed_chain.ainvoke.call_args[0][0]["wikitext"]
+        assert "<<<PARAGRAPH 2>>>\nSecond original.\n<<<END PARAGRAPH 2>>>" in (
+            prompt_text
+        )
+        llm_chain.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_packed_falls_back_for_malformed_parts(self):
+        """Test that only paragraphs with malformed parts get single calls."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Second edited alone."
+        packed_chain = AsyncMock()
+        packed_chain.ainvoke.return_value = (
+            "<<<PARAGRAPH 1>>>\nFirst edited.\n<<<END PARAGRAPH 1>>>\n"
+            "<<<PARAGRAPH 2>>>\nSecond edited, but never closed."
+        )
+        processor = self._make_processor(llm_chain, packed_chain)
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert [r.content for r in results] == [
+            "First edited.",
+            "Second edited alone.",
+        ]
+        llm_chain.ainvoke.assert_called_once_with({"wikitext": "Second original."})
+
+    @pytest.mark.asyncio
+    async def test_process_packed_api_failure_does_not_fan_out(self):
+        """Test that an API failure of the packed call fails every paragraph."""
+        llm_chain = AsyncMock()
+        packed_chain = AsyncMock()
+        packed_chain.ainvoke.side_effect = ChatGoogleGenerativeAIError("API Error")
+        processor = self._make_processor(llm_chain, packed_chain)
+        processor.MAX_LLM_RETRIES = 1
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert not any(r.success for r in results)
+        assert all(
+            r.failure_reason == "LLM did not return any content" for r in results
+        )
+        assert processor.reversion_tracker.recorded_reversions == [
+            ReversionType.API_ERROR
+        ]
+        llm_chain.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_packed_uses_cache_per_paragraph(self):
+        """Test that cached paragraphs are left out of the packed prompt."""
+        scope = CacheScope("copyedit", "openai", "gpt-4o-mini", "v1")
+        cache = InMemoryResponseCache(max_entries=10, ttl_seconds=60)
+        cache.set(scope.key_for("Cached original."), "Cached edited.")
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Fresh edited."
+        packed_chain = AsyncMock()
+        processor = self._make_processor(
+            llm_chain, packed_chain, response_cache=cache, cache_scope=scope
+        )
+
+        results = await processor.process_packed(
+            self._items("Cached original.", "Fresh original.")
+        )
+
+        assert [r.content for r in results] == ["Cached edited.", "Fresh edited."]
+        # A single remaining paragraph is not worth packing
+        packed_chain.ainvoke.assert_not_called()
+        assert cache.get(scope.key_for("Fresh original.")) == "Fresh edited."
+
+    @pytest.mark.asyncio
+    async def test_process_packed_without_packed_chain(self):
+        """Test that processing falls back to single calls without a packed chain."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Edited."
+        processor = self._make_processor(llm_chain, None)
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert [r.content for r in results] == ["Edited.", "Edited."]
+        assert llm_chain.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_packed_slow_call_falls_back_to_single_calls(self):
+        """Test that a packed call over its time limit falls back per paragraph."""
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.return_value = "Edited alone."
+        packed_chain = AsyncMock()
+
+        async def slow_packed(_inputs):
+            await asyncio.sleep(1)
+
+        packed_chain.ainvoke.side_effect = slow_packed
+        processor = self._make_processor(
+            llm_chain, packed_chain, paragraph_timeout_seconds=0.01
+        )
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert [r.content for r in results] == ["Edited alone.", "Edited alone."]
+        assert llm_chain.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_packed_slow_fallback_times_out_alone(self):
+        """Test that a slow single-paragraph fallback times out only itself."""
+        llm_chain = AsyncMock()
+
+        async def single(inputs):
+            if inputs["wikitext"].startswith("Second"):
+                await asyncio.sleep(1)
+            return "Edited alone."
+
+        llm_chain.ainvoke.side_effect = single
+        packed_chain = AsyncMock()
+        packed_chain.ainvoke.return_value = (
+            "<<<PARAGRAPH 1>>>\nFirst edited.\n<<<END PARAGRAPH 1>>>\n"
+            "<<<PARAGRAPH 2>>>\nSecond edited, but never closed."
+        )
+        processor = self._make_processor(
+            llm_chain, packed_chain, paragraph_timeout_seconds=0.05
+        )
+
+        results = await processor.process_packed(
+            self._items("First original.", "Second original.")
+        )
+
+        assert results[0].success and not results[0].timed_out
+        assert results[0].content == "First edited."
+        assert not results[1].success and results[1].timed_out
+        assert results[1].content == "Second original."
+        assert results[1].failure_reason == (
+            "Paragraph was not edited within 0.05 seconds"
+        )
+
+
+class StreamingChain:
+    """LLM chain test double that streams canned chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.yielded = 0
+        self.closed = False
+
+    async def astream(self, inputs):
+        try:
+            for chunk in self.chunks:
+                self.yielded += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+class TestParagraphProcessorStreaming:
+    """Test cases for streamed LLM responses."""
+
+    def _make_processor(self, llm_chain):
+        return ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            AsyncMock(spec=IReferenceHandler),
+            stream_responses=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_streamed_output_is_joined(self):
+        chain = StreamingChain(["Edited ", "text."])
+        processor = self._make_processor(chain)
+
+        assert await processor._invoke_llm_with_retries("Original text.") == (
+            "Edited text."
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_marker_stops_stream_early(self):
+        chain = StreamingChain([UNCHANGED_MARKER, " never", " consumed"])
+        processor = self._make_processor(chain)
+
+        result = await processor._invoke_llm_with_retries("Original text.")
+
+        assert result == UNCHANGED_MARKER
+        assert chain.yielded == 1
+        assert chain.closed
+
+    @pytest.mark.asyncio
+    async def test_meta_commentary_rejects_paragraph(self):
+        chain = StreamingChain(["Sorry, ", "I cannot ", "edit this."])
+        processor = self._make_processor(chain)
+        context = ValidationContext(
+            paragraph_index=0,
+            total_paragraphs=1,
+            is_first_prose=False,
+            refs_list=[],
+            additional_data={"text_with_placeholders": "Original text."},
+        )
+        processor.pre_processing_pipeline.validate.return_value = (
+            "Original text.",
+            False,
+        )
+
+        result = await processor.process("Original text.", context)
+
+        assert not result.success
+        assert result.content == "Original text."
+        assert "aborted early" in result.failure_reason
+        assert chain.closed
+        # Stopping a hopeless generation is not an error
+        assert processor.reversion_tracker.recorded_reversions == []
+
+    @pytest.mark.asyncio
+    async def test_chains_without_astream_use_ainvoke(self):
+        chain = MagicMock(spec_set=["ainvoke"])
+        chain.ainvoke = AsyncMock(return_value="Edited content")
+        processor = self._make_processor(chain)
+
+        assert await processor._invoke_llm_with_retries("Original.") == (
+            "Edited content"
+        )
+
+
+class TestParagraphProcessorUsage:
+    """Test cases for per-paragraph token and latency accounting."""
+
+    @staticmethod
+    def _context(index=0, content="Original text."):
+        return ValidationContext(
+            paragraph_index=index,
+            total_paragraphs=2,
+            is_first_prose=False,
+            refs_list=[],
+            additional_data={"text_with_placeholders": content},
+        )
+
+    @staticmethod
+    def _chat_chain(*contents, usage=None):
+        from langchain_core.language_models.fake_chat_models import (
+            GenericFakeChatModel,
+        )
+        from langchain_core.messages import AIMessage
+        from langchain_core.output_parsers import StrOutputParser
+
+        from services.prompts.prompt_manager import PromptManager
+
+        llm = GenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(content=content, usage_metadata=usage)
+                    for content in contents
+                ]
+            )
+        )
+        return PromptManager().get_template("copyedit") | llm | StrOutputParser()
+
+    def _make_processor(self, llm_chain, usage_tracker, **kwargs):
+        pipeline = AsyncMock(spec=ValidationPipeline)
+        pipeline.validate = AsyncMock(
+            side_effect=lambda original, edited, context: (edited, False)
+        )
+        return ParagraphProcessor(
+            llm_chain,
+            pipeline,
+            pipeline,
+            MockReversionTracker(),
+            AsyncMock(spec=IReferenceHandler),
+            usage_tracker=usage_tracker,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_provider_usage_per_paragraph(self):
+        from services.llm.usage import UsageTracker
+
+        usage_tracker = UsageTracker()
+        chain = self._chat_chain(
+            "Edited text.",
+            usage={
+                "input_tokens": 900,
+                "output_tokens": 4,
+                "total_tokens": 904,
+                "input_token_details": {"cache_read": 850},
+            },
+        )
+        processor = self._make_processor(chain, usage_tracker)
+
+        result = await processor.process("Original text.", self._context(index=3))
+
+        assert result.content == "Edited text."
+        [usage] = usage_tracker.paragraphs
+        assert usage.paragraph_index == 3
+        assert usage.llm_calls == 1
+        assert usage.input_tokens == 900
+        assert usage.cached_input_tokens == 850
+        assert usage.output_tokens == 4
+        assert not usage.tokens_estimated
+        assert usage.latency_seconds is not None
+        assert usage.time_to_first_token_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_counts_tokens_without_usage_metadata(self, monkeypatch):
+        from services.llm import usage as usage_module
+        from services.llm.usage import UsageTracker
+
+        monkeypatch.setattr(usage_module, "_get_encoding", lambda: None)
+        usage_tracker = UsageTracker()
+        processor = self._make_processor(
+            self._chat_chain("Edited text."), usage_tracker
+        )
+
+        await processor.process("Original text.", self._context())
+
+        [usage] = usage_tracker.paragraphs
+        assert usage.tokens_estimated
+        assert usage.input_tokens > 0
+        assert usage.output_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_records_retries_and_provider_errors(self):
+        from services.llm.usage import UsageTracker
+
+        usage_tracker = UsageTracker()
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [
+            ChatGoogleGenerativeAIError("API Error"),
+            "Edited text.",
+        ]
+        processor = self._make_processor(llm_chain, usage_tracker)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await processor.process("Original text.", self._context())
+
+        [usage] = usage_tracker.paragraphs
+        assert usage.provider_errors == 1
+        assert usage.retries == 1
+        assert "config" in llm_chain.ainvoke.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_response_cache_hits_are_recorded(self):
+        from services.llm.usage import UsageTracker
+
+        usage_tracker = UsageTracker()
+        cache = InMemoryResponseCache()
+        scope = CacheScope("copyedit", "google", "model", "v1")
+        cache.set(scope.key_for("Original text."), "Cached edit.")
+        llm_chain = AsyncMock()
+        processor = self._make_processor(
+            llm_chain, usage_tracker, response_cache=cache, cache_scope=scope
+        )
+
+        await processor.process("Original text.", self._context())
+
+        [usage] = usage_tracker.paragraphs
+        assert usage.response_cache_hit
+        assert usage.llm_calls == 0
+        llm_chain.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_packed_call_usage_is_split_between_paragraphs(self):
+        from services.llm.usage import UsageTracker
+
+        usage_tracker = UsageTracker()
+        packed_chain = self._chat_chain(
+            "<<<PARAGRAPH 1>>>\nFirst.\n<<<END PARAGRAPH 1>>>\n\n"
+            "<<<PARAGRAPH 2>>>\nSecond.\n<<<END PARAGRAPH 2>>>",
+            usage={"input_tokens": 1001, "output_tokens": 20, "total_tokens": 1021},
+        )
+        processor = self._make_processor(
+            AsyncMock(), usage_tracker, packed_llm_chain=packed_chain
+        )
+
+        await processor.process_packed(
+            [
+                ("First original.", self._context(0, "First original.")),
+                ("Second original.", self._context(1, "Second original.")),
+            ]
+        )
+
+        paragraphs = usage_tracker.paragraphs
+        assert [usage.paragraph_index for usage in paragraphs] == [0, 1]
+        assert [usage.input_tokens for usage in paragraphs] == [501, 500]
+        assert all(usage.packed for usage in paragraphs)
+        assert usage_tracker.totals()["input_tokens"] == 1001
+
+
+class TestParagraphProcessorRetries:
+    """Test cases for retry backoff and the provider circuit breaker."""
+
+    @staticmethod
+    def _make_processor(llm_chain, **kwargs):
+        return ParagraphProcessor(
+            llm_chain,
+            AsyncMock(),
+            AsyncMock(),
+            MockReversionTracker(),
+            AsyncMock(spec=IReferenceHandler),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sleeps_for_retry_after(self):
+        from google.api_core.exceptions import TooManyRequests
+
+        error = TooManyRequests("slow down")
+        error.retry_after = 4  # type: ignore
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [error, "Edited text"]
+        processor = self._make_processor(llm_chain)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await processor._invoke_llm_with_retries("text")
+
+        assert result == "Edited text"
+        mock_sleep.assert_awaited_once_with(4.0)
+
+    @pytest.mark.asyncio
+    async def test_retries_overload_errors_from_any_provider(self):
+        class RateLimitError(Exception):
+            status_code = 429
+
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [RateLimitError("rate limited"), "Edited"]
+        processor = self._make_processor(llm_chain)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await processor._invoke_llm_with_retries("text")
+
+        assert result == "Edited"
+
+    @pytest.mark.asyncio
+    async def test_only_first_attempt_successes_grow_concurrency_window(self):
+        from services.llm.concurrency import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=1)
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [
+            ChatGoogleGenerativeAIError("API Error"),
+            "Edited after a retry",
+            "Edited",
+        ]
+        processor = self._make_processor(llm_chain, concurrency_limiter=limiter)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await processor._invoke_llm_with_retries("retried")
+            assert limiter.limit == 1
+            await processor._invoke_llm_with_retries("first try")
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_non_transient_errors_are_not_retried(self):
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = ValueError("bad request")
+        processor = self._make_processor(llm_chain)
+
+        with pytest.raises(ValueError):
+            await processor._invoke_llm_with_retries("text")
+        assert llm_chain.ainvoke.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        from services.llm.retry_policy import CircuitBreaker
+
+        breaker = CircuitBreaker("google:test", failure_threshold=2)
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = ChatGoogleGenerativeAIError("API Error")
+        processor = self._make_processor(llm_chain, circuit_breaker=breaker)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            first = await processor._invoke_llm_with_retries("first")
+            second = await processor._invoke_llm_with_retries("second")
+
+        assert first is None
+        assert second is None
+        # The second failure opened the circuit, so nothing more was sent
+        assert llm_chain.ainvoke.call_count == 2
+        assert processor.reversion_tracker.recorded_reversions == [
+            ReversionType.API_ERROR,
+            ReversionType.API_ERROR,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_success_closes_circuit(self):
+        from services.llm.retry_policy import CircuitBreaker
+
+        breaker = CircuitBreaker("google:test", failure_threshold=2)
+        llm_chain = AsyncMock()
+        llm_chain.ainvoke.side_effect = [
+            ChatGoogleGenerativeAIError("API Error"),
+            "Edited",
+            ChatGoogleGenerativeAIError("API Error"),
+            "Edited again",
+        ]
+        processor = self._make_processor(llm_chain, circuit_breaker=breaker)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            assert await processor._invoke_llm_with_retries("one") == "Edited"
+            assert await processor._invoke_llm_with_retries("two") == "Edited again"
+
+        assert not breaker.is_open
@@ -0,0 +1,100 @@
+"""Tests for the per-process LLM client pool."""
+
+from services.llm import client_pool as client_pool_module
+from services.llm.client_pool import LLMClientPool, get_llm_client_pool, hash_api_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingFactory:
+    def __init__(self):
+        self.created = 0
+
+    def __call__(self):
+        self.created += 1
+        return object()
+
+
+class TestLLMClientPool:
+    def test_reuses_client_for_same_configuration(self):
+        pool = LLMClientPool(max_size=4, idle_timeout_seconds=60)
+        factory = CountingFactory()
+
+        first = pool.get("openai", "model", "key", factory)
+        second = pool.get("openai", "model", "key", factory)
+
+        assert first is second
+        assert factory.created == 1
+
+    def test_separates_providers_models_and_keys(self):
+        pool = LLMClientPool(max_size=4, idle_timeout_seconds=60)
+        factory = CountingFactory()
+
+        clients = {
+            id(pool.get("openai", "model", "key", factory)),
+            id(pool.get("openai", "model", "other-key", factory)),
+            id(pool.get("openai", "other-model", "key", factory)),
+            id(pool.get("anthropic", "model", "key", factory)),
+        }
+
+        assert len(clients) == 4
+        assert factory.created == 4
+
+    def test_evicts_least_recently_used(self):
+        pool = LLMClientPool(max_size=2, idle_timeout_seconds=60)
+        factory = CountingFactory()
+
+        first = pool.get("openai", "model", "a", factory)
+        pool.get("openai", "model", "b", factory)
+        pool.get("openai", "model", "a", factory)  # "b" is now least recent
+        pool.get("openai", "model", "c", factory)
+
+        assert len(pool) == 2
+        assert pool.get("openai", "model", "a", factory) is first
+        pool.get("openai", "model", "b", factory)
+        assert factory.created == 4
+
+    def test_evicts_idle_clients(self):
+        clock = FakeClock()
+        pool = LLMClientPool(max_size=4, idle_timeout_seconds=10, clock=clock)
+        factory = CountingFactory()
+
+        first = pool.get("openai", "model", "key", factory)
+        clock.now = 5
+        assert pool.get("openai", "model", "key", factory) is first
+        clock.now = 16
+
+        assert pool.get("openai", "model", "key", factory) is not first
+        assert factory.created == 2
+
+    def test_zero_size_disables_pooling(self):
+        pool = LLMClientPool(max_size=0)
+        factory = CountingFactory()
+
+        pool.get("openai", "model", "key", factory)
+        pool.get("openai", "model", "key", factory)
+
+        assert factory.created == 2
+        assert len(pool) == 0
+
+    def test_api_keys_are_not_stored_in_plaintext(self):
+        pool = LLMClientPool(max_size=4, idle_timeout_seconds=60)
+        pool.get("openai", "model", "sk-secret", CountingFactory())
+
+        [key] = list(pool._clients)
+        assert "sk-secret" not in key
+        assert key == ("openai", "model", hash_api_key("sk-secret"))
+
+
+def test_get_llm_client_pool_is_per_process(monkeypatch):
+    pool = get_llm_client_pool()
+    assert get_llm_client_pool() is pool
+
+    monkeypatch.setattr(client_pool_module.os, "getpid", lambda: -1)
+    assert get_llm_client_pool() is not pool
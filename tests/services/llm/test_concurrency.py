@@ -0,0 +1,211 @@
+"""Tests for the adaptive LLM concurrency limiter."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from services.llm import concurrency
+from services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    InFlightRequestLimit,
+    get_in_flight_request_limit,
+    is_overload_error,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitError(Exception):
+    """Stand-in for provider SDK rate limit errors."""
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestIsOverloadError:
+    def test_timeouts(self):
+        assert is_overload_error(httpx.ReadTimeout("slow"))
+        assert is_overload_error(asyncio.TimeoutError())
+
+    def test_rate_limit_class_names(self):
+        assert is_overload_error(RateLimitError("429"))
+
+    def test_status_codes(self):
+        assert is_overload_error(StatusError(429))
+        assert is_overload_error(StatusError(529))
+        assert not is_overload_error(StatusError(400))
+
+    def test_other_errors(self):
+        assert not is_overload_error(ValueError("bad input"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_initial_window_is_half_of_max(self):
+        assert AdaptiveConcurrencyLimiter(max_limit=8).limit == 4
+        assert AdaptiveConcurrencyLimiter(max_limit=1).limit == 1
+
+    def test_additive_increase_is_capped(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=2)
+        # 2 -> 2.5 -> 2.9 -> 3.24, i.e. about one slot per window of successes
+        for _ in range(3):
+            limiter.record_latency(1.0)
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.record_latency(1.0)
+        assert limiter.limit == 3
+
+    def test_overload_halves_window_once_per_cooldown(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            max_limit=16, initial_limit=16, clock=clock
+        )
+
+        limiter.record_overload()
+        limiter.record_overload()
+        assert limiter.limit == 8
+
+        clock.now += 5
+        limiter.record_overload()
+        assert limiter.limit == 4
+
+    def test_window_never_drops_below_minimum(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2, clock=clock)
+        for _ in range(5):
+            clock.now += 10
+            limiter.record_overload()
+        assert limiter.limit == 2
+
+    def test_latency_spike_shrinks_window(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+        for _ in range(AdaptiveConcurrencyLimiter.MIN_LATENCY_SAMPLES + 1):
+            limiter.record_latency(1.0)
+        limiter.record_latency(10.0)
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_bounds_in_flight_requests(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_records_overload_errors(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+
+        with pytest.raises(RateLimitError):
+            async with limiter.slot():
+                raise RateLimitError("429")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_ignores_other_errors(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad")
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_slot_does_not_grow_window(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=2)
+
+        for _ in range(4):
+            async with limiter.slot():
+                pass
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_attempt_grows_window_only_when_allowed(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=2)
+
+        for _ in range(4):
+            async with limiter.attempt(grow=False):
+                pass
+        assert limiter.limit == 2
+
+        for _ in range(4):
+            async with limiter.attempt():
+                pass
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_attempt_records_overload_errors(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+
+        with pytest.raises(RateLimitError):
+            async with limiter.attempt():
+                raise RateLimitError("429")
+
+        assert limiter.limit == 4
+
+
+class TestInFlightRequestLimit:
+    @pytest.mark.asyncio
+    async def test_requests_wait_for_a_free_slot(self):
+        limit = InFlightRequestLimit(2)
+        entered = []
+        release = asyncio.Event()
+
+        async def request(i):
+            async with limit.slot():
+                entered.append(i)
+                await release.wait()
+
+        tasks = [asyncio.create_task(request(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert entered == [0, 1]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert entered == [0, 1, 2]
+
+    def test_each_event_loop_gets_its_own_slots(self):
+        limit = InFlightRequestLimit(1)
+
+        async def request():
+            async with limit.slot():
+                return True
+
+        # A semaphore bound to a closed loop would fail here
+        assert asyncio.run(request())
+        assert asyncio.run(request())
+
+    def test_process_limit_is_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(concurrency, "LLM_MAX_IN_FLIGHT_REQUESTS", 0)
+        assert get_in_flight_request_limit() is None
+
+    def test_process_limit_is_shared(self, monkeypatch):
+        monkeypatch.setattr(concurrency, "LLM_MAX_IN_FLIGHT_REQUESTS", 4)
+        monkeypatch.setattr(concurrency, "_in_flight_request_limit", None)
+
+        limit = get_in_flight_request_limit()
+
+        assert limit is not None
+        assert limit is get_in_flight_request_limit()
+        assert limit.max_in_flight == 4
@@ -0,0 +1,160 @@
+"""Tests for the deterministic fake LLM provider."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from google.api_core.exceptions import TooManyRequests
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from services.core.constants import UNCHANGED_MARKER
+from services.llm import fake_llm as fake_llm_module
+from services.llm.concurrency import is_overload_error
+from services.llm.fake_llm import (
+    FAKE_LLM_PRESETS,
+    FakeEditorChatModel,
+    FakeLLMProfile,
+    create_fake_llm,
+)
+from services.prompts.paragraph_packing import pack_paragraphs, unpack_paragraphs
+
+
+def messages(text):
+    return [SystemMessage("Edit the wikitext."), HumanMessage(text)]
+
+
+class TestFakeLLMProfile:
+    def test_preset_names(self):
+        assert FakeLLMProfile.from_config("flaky") is FAKE_LLM_PRESETS["flaky"]
+
+    def test_empty_uses_default_preset(self):
+        assert FakeLLMProfile.from_config(None) == FAKE_LLM_PRESETS["instant"]
+        assert FakeLLMProfile.from_config("") == FAKE_LLM_PRESETS["instant"]
+
+    def test_json_profile(self):
+        profile = FakeLLMProfile.from_config(
+            json.dumps(
+                {
+                    "response_mode": "transform",
+                    "transforms": [["colour", "color"]],
+                    "latency_median_seconds": 0.5,
+                }
+            )
+        )
+        assert profile.response_mode == "transform"
+        assert profile.transforms == (("colour", "color"),)
+        assert profile.latency_median_seconds == 0.5
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "no-such-preset",
+            "{not json",
+            '{"response_mode": "shout"}',
+            '{"unknown_field": 1}',
+            '{"transforms": [["(", "x"]]}',
+        ],
+    )
+    def test_invalid_profiles(self, value):
+        with pytest.raises(ValueError):
+            FakeLLMProfile.from_config(value)
+
+
+class TestFakeEditorChatModel:
+    def test_identity_returns_input_with_usage(self):
+        llm = FakeEditorChatModel()
+        result = llm.invoke(messages("Some paragraph text."))
+        assert result.content == "Some paragraph text."
+        assert isinstance(result, AIMessage)
+        assert result.usage_metadata is not None
+        assert result.usage_metadata["input_tokens"] > 0
+        assert result.usage_metadata["output_tokens"] > 0
+
+    def test_unchanged_mode(self):
+        llm = FakeEditorChatModel(profile=FakeLLMProfile(response_mode="unchanged"))
+        assert llm.invoke(messages("Text.")).content == UNCHANGED_MARKER
+
+    def test_transform_mode(self):
+        llm = FakeEditorChatModel(
+            profile=FakeLLMProfile(
+                response_mode="transform",
+                transforms=((r"\bcolour\b", "color"), ("very ", "")),
+            )
+        )
+        result = llm.invoke(messages("A very bright colour."))
+        assert result.content == "A bright color."
+
+    def test_recorded_mode_falls_back_to_input(self):
+        llm = FakeEditorChatModel(
+            profile=FakeLLMProfile(response_mode="recorded"),
+            recordings={"First.": "First, edited."},
+        )
+        assert llm.invoke(messages("First.")).content == "First, edited."
+        assert llm.invoke(messages("Second.")).content == "Second."
+
+    def test_packed_prompts_are_edited_per_paragraph(self):
+        llm = FakeEditorChatModel(
+            profile=FakeLLMProfile(
+                response_mode="transform", transforms=(("colour", "color"),)
+            )
+        )
+        packed = pack_paragraphs(["One colour.", "Two colours."])
+        result = llm.invoke(messages(packed))
+        assert unpack_paragraphs(result.text(), 2) == ["One color.", "Two colors."]
+
+    def test_streaming_splits_output_into_chunks(self):
+        llm = FakeEditorChatModel(profile=FakeLLMProfile(stream_chunk_chars=4))
+
+        async def collect():
+            return [chunk async for chunk in llm.astream(messages("abcdefghij"))]
+
+        chunks = asyncio.run(collect())
+        assert [chunk.content for chunk in chunks] == ["abcd", "efgh", "ij"]
+        assert chunks[-1].usage_metadata is not None
+
+    def test_rate_limit_bursts(self):
+        llm = FakeEditorChatModel(
+            profile=FakeLLMProfile(rate_limit_burst_every=4, rate_limit_burst_length=2)
+        )
+        outcomes = []
+        for _ in range(8):
+            try:
+                llm.invoke(messages("Text."))
+                outcomes.append("ok")
+            except TooManyRequests as e:
+                assert is_overload_error(e)
+                outcomes.append("429")
+        assert outcomes == ["429", "429", "ok", "ok"] * 2
+
+    def test_timeouts(self, monkeypatch):
+        monkeypatch.setattr(fake_llm_module.time, "sleep", lambda seconds: None)
+        llm = FakeEditorChatModel(profile=FakeLLMProfile(timeout_rate=1.0))
+        with pytest.raises(httpx.TimeoutException):
+            llm.invoke(messages("Text."))
+
+    def test_latency_is_deterministic_per_seed(self):
+        profile = FakeLLMProfile(latency_median_seconds=1.0, latency_sigma=0.5, seed=7)
+        first = FakeEditorChatModel(profile=profile)._plan(messages("Text."))
+        second = FakeEditorChatModel(profile=profile)._plan(messages("Text."))
+        other = FakeEditorChatModel(
+            profile=FakeLLMProfile(
+                latency_median_seconds=1.0, latency_sigma=0.5, seed=8
+            )
+        )._plan(messages("Text."))
+
+        assert first.latency_seconds == second.latency_seconds
+        assert first.latency_seconds != other.latency_seconds
+        assert first.latency_seconds > 0
+
+
+def test_create_fake_llm_reads_recordings_from_settings(tmp_path, monkeypatch):
+    recordings_path = tmp_path / "recordings.json"
+    recordings_path.write_text(json.dumps({"Text.": "Edited text."}))
+    monkeypatch.setattr(
+        fake_llm_module, "LLM_FAKE_RECORDINGS_PATH", str(recordings_path)
+    )
+
+    llm = create_fake_llm('{"response_mode": "recorded"}')
+
+    assert llm.invoke(messages("Text.")).content == "Edited text."
@@ -0,0 +1,160 @@
+"""Tests for hedged LLM requests."""
+
+import asyncio
+
+import pytest
+
+from services.llm import hedging as hedging_module
+from services.llm.hedging import HedgingPolicy, LatencyTracker, get_hedging_policy
+
+
+def make_tracker(latency=0.01, samples=20):
+    tracker = LatencyTracker(min_samples=samples)
+    for _ in range(samples):
+        tracker.record(latency)
+    return tracker
+
+
+class TestLatencyTracker:
+    def test_no_percentile_until_enough_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record(1.0)
+        tracker.record(2.0)
+        assert tracker.percentile(0.9) is None
+
+    def test_percentile(self):
+        tracker = LatencyTracker(min_samples=1)
+        for latency in range(1, 11):
+            tracker.record(float(latency))
+        assert tracker.percentile(0.9) == 9.0
+        assert tracker.percentile(0.5) == 5.0
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window_size=2, min_samples=1)
+        for latency in (100.0, 1.0, 2.0):
+            tracker.record(latency)
+        assert tracker.percentile(1.0) == 2.0
+
+
+class TestHedgingPolicy:
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        policy = HedgingPolicy(LatencyTracker(min_samples=5), max_hedge_ratio=1.0)
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            return "done"
+
+        assert await policy.run(request) == "done"
+        assert calls == 1
+        assert policy.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_straggler_is_hedged_and_loser_cancelled(self):
+        policy = HedgingPolicy(make_tracker(), max_hedge_ratio=1.0)
+        cancelled = []
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            attempt = calls
+            try:
+                # The first attempt straggles, the hedge is fast
+                await asyncio.sleep(1.0 if attempt == 1 else 0.01)
+                return f"attempt {attempt}"
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+
+        assert await policy.run(request) == "attempt 2"
+        await asyncio.sleep(0)
+        assert cancelled == [1]
+        assert policy.hedges == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_is_capped(self):
+        policy = HedgingPolicy(make_tracker(), max_hedge_ratio=0.05)
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.03)
+            return "done"
+
+        await policy.run(request)
+
+        # One hedge would be 100% of one request, far above the 5% budget
+        assert calls == 1
+        assert policy.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_can_hedge_veto_returns_budget(self):
+        policy = HedgingPolicy(make_tracker(), max_hedge_ratio=1.0)
+
+        async def request():
+            await asyncio.sleep(0.03)
+            return "done"
+
+        async def rate_limited():
+            return False
+
+        assert await policy.run(request, can_hedge=rate_limited) == "done"
+        assert policy.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_waits_for_the_other(self):
+        policy = HedgingPolicy(make_tracker(), max_hedge_ratio=1.0)
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.03)
+                raise RuntimeError("primary failed")
+            await asyncio.sleep(0.05)
+            return "hedge"
+
+        assert await policy.run(request) == "hedge"
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_failing_raises(self):
+        policy = HedgingPolicy(make_tracker(), max_hedge_ratio=1.0)
+
+        async def request():
+            await asyncio.sleep(0.03)
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            await policy.run(request)
+
+    @pytest.mark.asyncio
+    async def test_records_latency(self):
+        tracker = LatencyTracker(min_samples=1)
+        policy = HedgingPolicy(tracker)
+
+        async def request():
+            return "done"
+
+        await policy.run(request)
+        assert tracker.percentile(0.5) is not None
+
+
+class TestGetHedgingPolicy:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(hedging_module, "LLM_HEDGE_REQUESTS", False)
+        assert get_hedging_policy("openai", "gpt-4o-mini") is None
+
+    def test_shared_per_provider_and_model(self, monkeypatch):
+        monkeypatch.setattr(hedging_module, "LLM_HEDGE_REQUESTS", True)
+        monkeypatch.setattr(hedging_module, "_hedging_policies", {})
+        monkeypatch.setattr(hedging_module, "_latency_trackers", {})
+
+        policy = get_hedging_policy("openai", "gpt-4o-mini")
+        assert isinstance(policy, HedgingPolicy)
+        assert get_hedging_policy("openai", "gpt-4o-mini") is policy
+        assert get_hedging_policy("google", "gemini") is not policy
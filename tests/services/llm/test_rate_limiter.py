@@ -0,0 +1,174 @@
+"""Tests for the LLM request rate limiter."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from services.llm import rate_limiter as rate_limiter_module
+from services.llm.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimits,
+    RedisRateLimiter,
+    estimate_tokens,
+    get_rate_limit_key,
+    get_rate_limiter,
+    get_rate_limits,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+class TestInMemoryRateLimiter:
+    def test_request_bucket_limits_burst(self):
+        clock = FakeClock()
+        limiter = InMemoryRateLimiter(RateLimits(2, 1000), clock=clock)
+
+        assert limiter._try_acquire(0) == 0
+        assert limiter._try_acquire(0) == 0
+        # One request refills every 30 seconds at 2 requests per minute
+        assert limiter._try_acquire(0) == pytest.approx(30)
+
+        clock.now += 30
+        assert limiter._try_acquire(0) == 0
+
+    def test_token_bucket_limits_large_requests(self):
+        clock = FakeClock()
+        limiter = InMemoryRateLimiter(RateLimits(100, 600), clock=clock)
+
+        assert limiter._try_acquire(500) == 0
+        # 10 tokens refill per second and 400 more tokens are needed
+        assert limiter._try_acquire(500) == pytest.approx(40)
+
+    def test_rejected_requests_do_not_consume_capacity(self):
+        clock = FakeClock()
+        limiter = InMemoryRateLimiter(RateLimits(1, 600), clock=clock)
+
+        assert limiter._try_acquire(100) == 0
+        assert limiter._try_acquire(100) > 0
+        clock.now += 60
+        assert limiter._try_acquire(600) == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_capacity(self, monkeypatch):
+        clock = FakeClock()
+        limiter = InMemoryRateLimiter(RateLimits(1, 1000), clock=clock)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock.now += seconds
+
+        monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+
+        await limiter.acquire(10)
+        await limiter.acquire(10)
+
+        assert sleeps == [pytest.approx(60)]
+
+    @pytest.mark.asyncio
+    async def test_acquire_clamps_oversized_requests(self):
+        limiter = InMemoryRateLimiter(RateLimits(10, 100), clock=FakeClock())
+        # Would never fit in the bucket without clamping
+        await limiter.acquire(10_000)
+
+
+class TestRedisRateLimiter:
+    def _make_limiter(self, script_result="0"):
+        client = MagicMock()
+        script = MagicMock(return_value=script_result)
+        client.register_script.return_value = script
+        limiter = RedisRateLimiter(client, "openai:abc", RateLimits(60, 6000))
+        return limiter, script
+
+    def test_passes_both_buckets_to_script(self):
+        limiter, script = self._make_limiter()
+
+        assert limiter._try_acquire(50) == 0
+
+        script.assert_called_once_with(
+            keys=[
+                "editengine:rate-limit:openai:abc:requests",
+                "editengine:rate-limit:openai:abc:tokens",
+            ],
+            args=[60, 1.0, 1, 6000, 100.0, 50],
+        )
+
+    def test_returns_wait_from_script(self):
+        limiter, _ = self._make_limiter(script_result="1.5")
+        assert limiter._try_acquire(50) == 1.5
+
+    def test_falls_back_to_local_buckets_when_redis_fails(self):
+        limiter, script = self._make_limiter()
+        script.side_effect = redis.ConnectionError("down")
+
+        assert limiter._try_acquire(50) == 0
+        assert limiter._fallback._levels[0] == pytest.approx(59, abs=0.1)
+
+    async def test_acquire_runs_the_script_off_the_event_loop(self):
+        limiter, script = self._make_limiter()
+        threads = []
+
+        def record_thread(**kwargs):
+            threads.append(threading.get_ident())
+            return "0"
+
+        script.side_effect = record_thread
+
+        await limiter.acquire(50)
+        assert await limiter.try_acquire_now(50)
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+
+class TestGetRateLimiter:
+    def _reset(self, monkeypatch, backend):
+        monkeypatch.setattr(rate_limiter_module, "_rate_limiters", {})
+        monkeypatch.setattr(rate_limiter_module, "LLM_RATE_LIMIT_BACKEND", backend)
+
+    def test_key_hides_api_key(self):
+        key = get_rate_limit_key("openai", "sk-secret")
+        assert key.startswith("openai:")
+        assert "sk-secret" not in key
+        assert key != get_rate_limit_key("openai", "sk-other")
+
+    def test_limiters_are_shared_per_key(self, monkeypatch):
+        self._reset(monkeypatch, "memory")
+        limiter = get_rate_limiter("openai", "key-1")
+        assert isinstance(limiter, InMemoryRateLimiter)
+        assert get_rate_limiter("openai", "key-1") is limiter
+        assert get_rate_limiter("openai", "key-2") is not limiter
+        assert get_rate_limiter("google", "key-1") is not limiter
+
+    def test_redis_backend(self, monkeypatch):
+        self._reset(monkeypatch, "redis")
+        monkeypatch.setattr(
+            "services.utils.redis_client.get_redis_client", lambda: MagicMock()
+        )
+        assert isinstance(get_rate_limiter("openai", "key"), RedisRateLimiter)
+
+    def test_disabled_backend(self, monkeypatch):
+        self._reset(monkeypatch, "none")
+        assert get_rate_limiter("openai", "key") is None
+
+    def test_overrides_take_precedence(self, monkeypatch):
+        monkeypatch.setattr(
+            rate_limiter_module, "LLM_RATE_LIMIT_REQUESTS_PER_MINUTE", 7
+        )
+        limits = get_rate_limits("anthropic")
+        assert limits.requests_per_minute == 7
+        assert limits.tokens_per_minute == 50_000
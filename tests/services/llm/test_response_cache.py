@@ -0,0 +1,197 @@
+"""Tests for the LLM response cache."""
+
+import threading
+from unittest.mock import MagicMock
+
+import redis
+
+from services.llm import response_cache as response_cache_module
+from services.llm.response_cache import (
+    CacheScope,
+    InMemoryResponseCache,
+    RedisResponseCache,
+    get_response_cache,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestCacheScope:
+    def test_key_for_is_deterministic(self):
+        scope = CacheScope("copyedit", "openai", "gpt-4o-mini", "abc123")
+        assert scope.key_for("Some text") == scope.key_for("Some text")
+
+    def test_key_for_differs_by_text(self):
+        scope = CacheScope("copyedit", "openai", "gpt-4o-mini", "abc123")
+        assert scope.key_for("Some text") != scope.key_for("Some text.")
+
+    def test_key_for_differs_by_scope_fields(self):
+        text = "Some text"
+        base = CacheScope("copyedit", "openai", "gpt-4o-mini", "abc123")
+        variants = [
+            CacheScope("brevity", "openai", "gpt-4o-mini", "abc123"),
+            CacheScope("copyedit", "google", "gpt-4o-mini", "abc123"),
+            CacheScope("copyedit", "openai", "other-model", "abc123"),
+            CacheScope("copyedit", "openai", "gpt-4o-mini", "def456"),
+        ]
+        keys = {variant.key_for(text) for variant in variants}
+        assert base.key_for(text) not in keys
+        assert len(keys) == len(variants)
+
+    def test_key_does_not_contain_raw_text(self):
+        scope = CacheScope("copyedit", "openai", "gpt-4o-mini", "abc123")
+        assert "secret paragraph" not in scope.key_for("secret paragraph")
+
+
+class TestInMemoryResponseCache:
+    def test_miss_then_hit(self):
+        cache = InMemoryResponseCache(max_entries=10, ttl_seconds=60)
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get_stats() == {"hits": 1, "misses": 1}
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = InMemoryResponseCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.set("key", "value")
+
+        clock.now += 59
+        assert cache.get("key") == "value"
+
+        clock.now += 2
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryResponseCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") == "1"
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_clear(self):
+        cache = InMemoryResponseCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", "1")
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestRedisResponseCache:
+    def _make_client(self, size=1):
+        client = MagicMock()
+        pipeline = MagicMock()
+        pipeline.execute.return_value = [True, 1, 0, size]
+        client.pipeline.return_value = pipeline
+        return client, pipeline
+
+    def test_get_hit_refreshes_recency(self):
+        client, _ = self._make_client()
+        client.get.return_value = "cached"
+        cache = RedisResponseCache(client, clock=FakeClock(5.0))
+
+        assert cache.get("key") == "cached"
+        client.get.assert_called_once_with(RedisResponseCache.KEY_PREFIX + "key")
+        client.zadd.assert_called_once_with(RedisResponseCache.INDEX_KEY, {"key": 5.0})
+        assert cache.get_stats() == {"hits": 1, "misses": 0}
+
+    def test_get_miss(self):
+        client, _ = self._make_client()
+        client.get.return_value = None
+        cache = RedisResponseCache(client)
+
+        assert cache.get("key") is None
+        client.zadd.assert_not_called()
+        assert cache.get_stats() == {"hits": 0, "misses": 1}
+
+    def test_set_uses_ttl(self):
+        client, pipeline = self._make_client()
+        cache = RedisResponseCache(client, ttl_seconds=30, clock=FakeClock(100.0))
+
+        cache.set("key", "value")
+
+        pipeline.set.assert_called_once_with(
+            RedisResponseCache.KEY_PREFIX + "key", "value", ex=30
+        )
+        pipeline.zremrangebyscore.assert_called_once_with(
+            RedisResponseCache.INDEX_KEY, 0, 70.0
+        )
+        client.zpopmin.assert_not_called()
+
+    def test_set_evicts_oldest_entries_over_capacity(self):
+        client, _ = self._make_client(size=5)
+        client.zpopmin.return_value = [("old1", 1.0), ("old2", 2.0)]
+        cache = RedisResponseCache(client, max_entries=3)
+
+        cache.set("key", "value")
+
+        client.zpopmin.assert_called_once_with(RedisResponseCache.INDEX_KEY, 2)
+        client.delete.assert_called_once_with(
+            RedisResponseCache.KEY_PREFIX + "old1",
+            RedisResponseCache.KEY_PREFIX + "old2",
+        )
+
+    def test_redis_errors_are_treated_as_misses(self):
+        client, pipeline = self._make_client()
+        client.get.side_effect = redis.ConnectionError("down")
+        pipeline.execute.side_effect = redis.ConnectionError("down")
+        cache = RedisResponseCache(client)
+
+        assert cache.get("key") is None
+        cache.set("key", "value")  # Must not raise
+        assert cache.get_stats() == {"hits": 0, "misses": 1}
+
+    async def test_async_lookups_run_off_the_event_loop(self):
+        client, pipeline = self._make_client()
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.get_ident())
+            return [True, 1, 0, 1]
+
+        client.get.side_effect = record_thread
+        pipeline.execute.side_effect = record_thread
+        cache = RedisResponseCache(client)
+
+        await cache.aget("key")
+        await cache.aset("key", "value")
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+
+class TestGetResponseCache:
+    def _reset(self, monkeypatch, backend):
+        monkeypatch.setattr(response_cache_module, "_response_cache_instance", None)
+        monkeypatch.setattr(response_cache_module, "_response_cache_initialized", False)
+        monkeypatch.setattr(
+            response_cache_module, "LLM_RESPONSE_CACHE_BACKEND", backend
+        )
+
+    def test_memory_backend_is_a_singleton(self, monkeypatch):
+        self._reset(monkeypatch, "memory")
+        cache = get_response_cache()
+        assert isinstance(cache, InMemoryResponseCache)
+        assert get_response_cache() is cache
+
+    def test_redis_backend(self, monkeypatch):
+        self._reset(monkeypatch, "redis")
+        monkeypatch.setattr(
+            "services.utils.redis_client.get_redis_client", lambda: MagicMock()
+        )
+        assert isinstance(get_response_cache(), RedisResponseCache)
+
+    def test_disabled_backend(self, monkeypatch):
+        self._reset(monkeypatch, "none")
+        assert get_response_cache() is None
@@ -0,0 +1,178 @@
+"""Tests for the LLM retry policy and circuit breaker."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from google.api_core.exceptions import TooManyRequests
+
+from services.llm.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_circuit_breaker,
+    get_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProviderError(Exception):
+    """Error carrying an HTTP response, like the OpenAI and Anthropic SDKs."""
+
+    def __init__(self, headers, status_code=429):
+        super().__init__("provider error")
+        self.status_code = status_code
+        self.response = httpx.Response(status_code, headers=headers)
+
+
+class TestGetRetryAfter:
+    def test_seconds_header(self):
+        assert get_retry_after(ProviderError({"Retry-After": "7"})) == 7.0
+
+    def test_milliseconds_header_wins(self):
+        error = ProviderError({"retry-after-ms": "1500", "retry-after": "7"})
+        assert get_retry_after(error) == 1.5
+
+    def test_http_date_header(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        error = ProviderError({"Retry-After": format_datetime(when, usegmt=True)})
+        retry_after = get_retry_after(error)
+        assert retry_after is not None
+        assert 25 <= retry_after <= 30
+
+    def test_retry_after_attribute(self):
+        error = TooManyRequests("slow down")
+        error.retry_after = 3  # type: ignore
+        assert get_retry_after(error) == 3.0
+
+    def test_missing_or_invalid(self):
+        assert get_retry_after(TooManyRequests("slow down")) is None
+        assert get_retry_after(ProviderError({})) is None
+        assert get_retry_after(ProviderError({"Retry-After": "soon"})) is None
+
+
+class TestRetryPolicy:
+    def test_full_jitter_stays_under_exponential_ceiling(self):
+        policy = RetryPolicy(
+            base_delay_seconds=1.0, max_delay_seconds=5.0, rng=random.Random(1)
+        )
+        for attempt, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_retry_after_is_honoured_and_capped(self):
+        policy = RetryPolicy(base_delay_seconds=1.0, max_delay_seconds=10.0)
+        assert policy.delay(0, ProviderError({"Retry-After": "4"})) == 4.0
+        assert policy.delay(0, ProviderError({"Retry-After": "60"})) == 10.0
+
+    def test_retryable_errors(self):
+        assert RetryPolicy.is_retryable(TooManyRequests("slow down"))
+        assert RetryPolicy.is_retryable(httpx.ReadTimeout("timeout"))
+        assert RetryPolicy.is_retryable(ProviderError({}, status_code=529))
+        assert not RetryPolicy.is_retryable(ProviderError({}, status_code=401))
+        assert not RetryPolicy.is_retryable(ValueError("bad"))
+
+
+class TestCircuitBreaker:
+    def make_breaker(self, clock):
+        return CircuitBreaker(
+            "openai:test",
+            failure_threshold=3,
+            window_seconds=10.0,
+            reset_timeout_seconds=5.0,
+            clock=clock,
+        )
+
+    def test_opens_after_burst_of_failures(self):
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+
+        for _ in range(3):
+            breaker.check()
+            breaker.record_failure()
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.check()
+        assert exc_info.value.retry_in_seconds == 5.0
+
+    def test_failures_outside_window_do_not_open(self):
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 11.0
+        breaker.record_failure()
+
+        assert not breaker.is_open
+        breaker.check()
+
+    def test_success_resets_failure_count(self):
+        breaker = self.make_breaker(FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
+
+    def test_half_open_probe_closes_on_success(self):
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 5.0
+        breaker.check()
+        # Others are held back while the probe is in flight
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        breaker.record_success()
+        breaker.check()
+        assert not breaker.is_open
+
+    def test_half_open_probe_failure_reopens(self):
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 5.0
+        breaker.check()
+        breaker.record_failure()
+
+        clock.now = 9.0
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        clock.now = 10.0
+        breaker.check()
+
+    def test_retry_after_extends_open_time(self):
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure(retry_after=20.0)
+
+        clock.now = 19.0
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+
+def test_get_circuit_breaker_is_shared_per_provider_and_key():
+    first = get_circuit_breaker("openai", "key-1")
+    assert first is get_circuit_breaker("openai", "key-1")
+    assert first is not get_circuit_breaker("openai", "key-2")
+    assert first is not get_circuit_breaker("anthropic", "key-1")
+    assert first is not None
+    assert "key-1" not in first.name
@@ -0,0 +1,56 @@
+"""Tests for incremental checks on streamed LLM output."""
+
+import pytest
+
+from services.llm.streaming import LLMOutputAbortedError, StreamGuard
+
+
+def feed_all(guard, chunks):
+    for chunk in chunks:
+        if guard.feed(chunk):
+            return True
+    return False
+
+
+class TestStreamGuard:
+    def test_normal_edit_streams_to_completion(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        assert not feed_all(guard, ["The cat ", "sat on ", "the mat."])
+        assert guard.output == "The cat sat on the mat."
+
+    def test_unchanged_marker_stops_stream(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        assert not guard.feed("<UNCH")
+        assert guard.feed("ANGED>")
+
+    def test_wrapped_unchanged_marker_stops_stream(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        assert feed_all(guard, ["\n`", "<UNCHANGED>", "`"])
+
+    def test_meta_commentary_aborts(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        with pytest.raises(LLMOutputAbortedError) as exc_info:
+            feed_all(guard, ["Sorry", ", I cannot ", "help"])
+        assert "Sorry" in exc_info.value.reason
+
+    def test_incomplete_words_are_not_matched(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        # "I" is only the start of "In" here
+        assert not guard.feed("I")
+        assert not guard.feed("n the ")
+
+    def test_words_from_original_are_allowed(self):
+        guard = StreamGuard(
+            'He said "I agree" yesterday.<ref name="0" />',
+            original='He said "I agree" yesterday.<ref>Please see</ref>',
+        )
+        assert not feed_all(guard, ['He said "I ', 'agree" today. Please '])
+
+    def test_code_fence_language_is_not_meta_commentary(self):
+        guard = StreamGuard("The cat sat on the mat.")
+        assert not feed_all(guard, ["``", "`wikitext\n", "The cat ", "sat."])
+
+    def test_runaway_output_aborts(self):
+        guard = StreamGuard("Short.")
+        with pytest.raises(LLMOutputAbortedError):
+            guard.feed("x" * (guard.max_length + 1))
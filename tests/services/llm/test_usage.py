@@ -0,0 +1,156 @@
+"""Tests for LLM token and latency accounting."""
+
+import uuid
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from services.llm import usage as usage_module
+from services.llm.usage import (
+    LLMCallUsageHandler,
+    ParagraphUsage,
+    UsageTracker,
+    count_tokens,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_result(content="edited", usage=None):
+    message = AIMessage(content=content, usage_metadata=usage)
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+class TestCountTokens:
+    def test_falls_back_to_estimate_without_tiktoken(self, monkeypatch):
+        monkeypatch.setattr(usage_module, "_get_encoding", lambda: None)
+        assert count_tokens("a" * 10) == 3
+        assert count_tokens("") == 0
+
+
+class TestLLMCallUsageHandler:
+    def test_records_usage_metadata_and_first_token(self):
+        clock = FakeClock()
+        usage = ParagraphUsage(paragraph_index=0)
+        handler = LLMCallUsageHandler(usage, clock=clock)
+        run_id = uuid.uuid4()
+
+        handler.on_chat_model_start(
+            {}, [[SystemMessage("rules"), HumanMessage("text")]], run_id=run_id
+        )
+        clock.now = 0.4
+        handler.on_llm_new_token("ed", run_id=run_id)
+        clock.now = 1.0
+        handler.on_llm_new_token("ited", run_id=run_id)
+        handler.on_llm_end(
+            make_result(
+                usage={
+                    "input_tokens": 1000,
+                    "output_tokens": 50,
+                    "total_tokens": 1050,
+                    "input_token_details": {
+                        "cache_read": 900,
+                        "cache_creation": 100,
+                    },
+                }
+            ),
+            run_id=run_id,
+        )
+
+        assert usage.llm_calls == 1
+        assert usage.time_to_first_token_seconds == 0.4
+        assert usage.input_tokens == 1000
+        assert usage.output_tokens == 50
+        assert usage.cached_input_tokens == 900
+        assert usage.cache_creation_input_tokens == 100
+        assert not usage.tokens_estimated
+
+    def test_counts_tokens_when_provider_reports_none(self, monkeypatch):
+        monkeypatch.setattr(usage_module, "_get_encoding", lambda: None)
+        usage = ParagraphUsage(paragraph_index=0)
+        handler = LLMCallUsageHandler(usage, clock=FakeClock())
+        run_id = uuid.uuid4()
+
+        handler.on_chat_model_start({}, [[HumanMessage("a" * 40)]], run_id=run_id)
+        handler.on_llm_end(make_result(content="b" * 8), run_id=run_id)
+
+        assert usage.tokens_estimated
+        assert usage.input_tokens == 10
+        assert usage.output_tokens == 2
+        # Without streaming, the first token arrives with the whole response
+        assert usage.time_to_first_token_seconds == 0.0
+
+
+class TestParagraphUsage:
+    def test_split_keeps_totals(self):
+        usage = ParagraphUsage(
+            paragraph_index=-1,
+            llm_calls=1,
+            input_tokens=10,
+            output_tokens=5,
+            latency_seconds=2.0,
+        )
+
+        shares = usage.split([4, 5, 6])
+
+        assert [share.paragraph_index for share in shares] == [4, 5, 6]
+        assert [share.input_tokens for share in shares] == [4, 3, 3]
+        assert [share.output_tokens for share in shares] == [2, 2, 1]
+        assert all(share.packed and share.latency_seconds == 2.0 for share in shares)
+
+
+class TestUsageTracker:
+    def test_totals_and_summaries(self):
+        tracker = UsageTracker()
+        tracker.record(
+            ParagraphUsage(
+                paragraph_index=0,
+                llm_calls=2,
+                retries=1,
+                provider_errors=1,
+                input_tokens=1000,
+                output_tokens=40,
+                cached_input_tokens=900,
+                latency_seconds=3.0,
+                time_to_first_token_seconds=0.5,
+            )
+        )
+        tracker.record(ParagraphUsage(paragraph_index=1, response_cache_hit=True))
+        tracker.record(
+            ParagraphUsage(
+                paragraph_index=2,
+                llm_calls=1,
+                input_tokens=1000,
+                output_tokens=60,
+                latency_seconds=1.0,
+                time_to_first_token_seconds=0.3,
+            )
+        )
+
+        usage = tracker.as_dict()
+
+        assert usage["llm_calls"] == 3
+        assert usage["input_tokens"] == 2000
+        assert usage["output_tokens"] == 100
+        assert usage["cached_input_tokens"] == 900
+        assert usage["cache_hit_ratio"] == 0.45
+        assert usage["retries"] == 1
+        assert usage["provider_errors"] == 1
+        assert usage["response_cache_hits"] == 1
+        assert usage["latency_p50_seconds"] == 1.0
+        assert usage["latency_p95_seconds"] == 3.0
+        assert usage["time_to_first_token_p50_seconds"] == 0.3
+        assert [p["paragraph_index"] for p in usage["paragraphs"]] == [0, 1, 2]
+
+    def test_empty_tracker(self):
+        usage = UsageTracker().as_dict()
+        assert usage["llm_calls"] == 0
+        assert usage["cache_hit_ratio"] == 0.0
+        assert usage["latency_p50_seconds"] is None
+        assert usage["paragraphs"] == []
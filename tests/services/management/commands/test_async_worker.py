@@ -0,0 +1,65 @@
+"""Tests for the async worker management command."""
+
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from services.management.commands import async_worker
+from services.management.commands.async_worker import Command
+
+
+@override_settings(CELERY_ASYNC_WORKER_CONCURRENCY=16)
+class TestAsyncWorkerCommand(TestCase):
+    """Test the async worker management command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.command = Command()
+        self.options = {
+            "concurrency": None,
+            "max_in_flight": None,
+            "loglevel": "info",
+            "purge": False,
+        }
+
+    @patch.object(async_worker, "LLM_MAX_IN_FLIGHT_REQUESTS", 0)
+    @patch("os.execvpe")
+    def test_default_worker_command(self, mock_execvpe):
+        """Test the worker runs tasks on threads with the default request limit."""
+        self.command.handle(**self.options)
+
+        cmd = mock_execvpe.call_args.args[1]
+        env = mock_execvpe.call_args.args[2]
+        assert cmd == [
+            "celery",
+            "-A",
+            "EditEngine",
+            "worker",
+            "--pool",
+            "threads",
+            "--concurrency",
+            "16",
+            "--loglevel",
+            "info",
+        ]
+        assert env["LLM_MAX_IN_FLIGHT_REQUESTS"] == "32"
+
+    @patch.object(async_worker, "LLM_MAX_IN_FLIGHT_REQUESTS", 12)
+    @patch("os.execvpe")
+    def test_request_limit_from_environment(self, mock_execvpe):
+        """Test a configured request limit is kept."""
+        self.command.handle(**self.options)
+
+        assert mock_execvpe.call_args.args[2]["LLM_MAX_IN_FLIGHT_REQUESTS"] == "12"
+
+    @patch("os.execvpe")
+    def test_custom_options(self, mock_execvpe):
+        """Test command line options override the configuration."""
+        self.command.handle(
+            concurrency=40, max_in_flight=64, loglevel="debug", purge=True
+        )
+
+        cmd = mock_execvpe.call_args.args[1]
+        assert cmd[cmd.index("--concurrency") + 1] == "40"
+        assert cmd[-3:] == ["--loglevel", "debug", "--purge"]
+        assert mock_execvpe.call_args.args[2]["LLM_MAX_IN_FLIGHT_REQUESTS"] == "64"
@@ -0,0 +1,60 @@
+"""Tests for packing several paragraphs into one prompt."""
+
+from services.prompts.paragraph_packing import (
+    can_pack,
+    pack_paragraphs,
+    unpack_paragraphs,
+)
+
+
+def test_pack_paragraphs_wraps_each_paragraph():
+    packed = pack_paragraphs(["First.", "Second."])
+    assert packed == (
+        "<<<PARAGRAPH 1>>>\nFirst.\n<<<END PARAGRAPH 1>>>\n\n"
+        "<<<PARAGRAPH 2>>>\nSecond.\n<<<END PARAGRAPH 2>>>"
+    )
+
+
+def test_round_trip():
+    texts = ["First [[link|text]].", "Second {{template}}.\nWith two lines."]
+    assert unpack_paragraphs(pack_paragraphs(texts), len(texts)) == texts
+
+
+def test_unpack_tolerates_surrounding_text_and_reordering():
+    response = (
+        "```\n<<<PARAGRAPH 2>>>\nSecond.\n<<<END PARAGRAPH 2>>>\n"
+        "Some chatter\n<<<PARAGRAPH 1>>> First. <<<END PARAGRAPH 1>>>\n```"
+    )
+    assert unpack_paragraphs(response, 2) == ["First.", "Second."]
+
+
+def test_unpack_marks_missing_and_empty_parts():
+    response = "<<<PARAGRAPH 1>>>\n\n<<<END PARAGRAPH 1>>>"
+    assert unpack_paragraphs(response, 2) == [None, None]
+
+
+def test_unpack_marks_mismatched_delimiters():
+    response = (
+        "<<<PARAGRAPH 1>>>\nFirst.\n<<<END PARAGRAPH 2>>>\n"
+        "<<<PARAGRAPH 2>>>\nSecond.\n<<<END PARAGRAPH 2>>>"
+    )
+    assert unpack_paragraphs(response, 2) == [None, "Second."]
+
+
+def test_unpack_marks_duplicated_parts():
+    response = (
+        "<<<PARAGRAPH 1>>>\nFirst.\n<<<END PARAGRAPH 1>>>\n"
+        "<<<PARAGRAPH 1>>>\nAgain.\n<<<END PARAGRAPH 1>>>\n"
+        "<<<PARAGRAPH 2>>>\nSecond.\n<<<END PARAGRAPH 2>>>"
+    )
+    assert unpack_paragraphs(response, 2) == [None, "Second."]
+
+
+def test_unpack_ignores_out_of_range_numbers():
+    response = "<<<PARAGRAPH 3>>>\nExtra.\n<<<END PARAGRAPH 3>>>"
+    assert unpack_paragraphs(response, 2) == [None, None]
+
+
+def test_can_pack_rejects_delimiter_text():
+    assert can_pack("Plain paragraph.")
+    assert not can_pack("A paragraph containing <<< arrows.")
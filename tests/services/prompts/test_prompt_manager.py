@@ -33,6 +33,70 @@ class TestPrompts:
         assert "<CONSTRAINTS_PLACEHOLDER>" in actual_prompt_text
         assert "<TASK_PLACEHOLDER>" in actual_prompt_text
 
+    def test_template_version_is_stable_and_mode_specific(self):
+        """Test that template versions identify prompt content."""
+        prompt_manager = PromptManager()
+        assert prompt_manager.get_template_version(
+            "copyedit"
+        ) == PromptManager().get_template_version("copyedit")
+        assert prompt_manager.get_template_version(
+            "copyedit"
+        ) != prompt_manager.get_template_version("brevity")
+
+    def test_packed_template_uses_paragraph_delimiters(self):
+        """Test that packed templates share the mode's rules but expect delimiters."""
+        prompt_manager = PromptManager()
+        single_text = prompt_manager.get_template("copyedit").format(wikitext="X")
+        packed_text = prompt_manager.get_packed_template("copyedit").format(
+            wikitext="X"
+        )
+        assert "<<<PARAGRAPH 1>>>" in packed_text
+        assert "<<<PARAGRAPH 1>>>" not in single_text
+        assert single_text.split("== Critical Preservation Rules ==")[0] in packed_text
+
+    def test_system_message_is_static_and_wikitext_is_separate(self):
+        """Test that only the user message varies between paragraphs."""
+        template = PromptManager().get_template("copyedit")
+        first = template.invoke({"wikitext": "First paragraph."}).to_messages()
+        second = template.invoke({"wikitext": "Second paragraph."}).to_messages()
+
+        assert [message.type for message in first] == ["system", "human"]
+        assert first[0].content == second[0].content
+        assert "First paragraph." not in first[0].content
+        assert first[1].content == "First paragraph."
+
+    def test_cache_system_prompt_marks_cache_breakpoint(self):
+        """Test that cacheable templates put cache_control on the system message."""
+        prompt_manager = PromptManager(cache_system_prompt=True)
+        prompt_manager.add_custom_template("custom_task", "Custom task description")
+
+        for template in (
+            prompt_manager.get_template("brevity"),
+            prompt_manager.get_packed_template("copyedit"),
+            prompt_manager.get_template("custom_task"),
+        ):
+            system_message = template.invoke({"wikitext": "X"}).to_messages()[0]
+            system_block = system_message.content[0]
+            assert isinstance(system_block, dict)
+            assert system_block["cache_control"] == {"type": "ephemeral"}
+            assert "{{" in system_block["text"]
+
+        plain_system_message = (
+            PromptManager().get_template("brevity").invoke({"wikitext": "X"})
+        ).to_messages()[0]
+        assert isinstance(plain_system_message.content, str)
+
+    def test_template_version_ignores_cache_breakpoint(self):
+        """Test that cache markers do not change the prompt version."""
+        assert PromptManager(cache_system_prompt=True).get_template_version(
+            "brevity"
+        ) == PromptManager().get_template_version("brevity")
+
+    def test_get_packed_template_unknown_mode(self):
+        """Test that unknown modes raise for packed templates too."""
+        with pytest.raises(ValueError):
+            PromptManager().get_packed_template("unknown")
+
     def test_add_and_get_custom_template(self):
         """Test adding and retrieving a custom prompt template."""
         prompt_manager = PromptManager()
@@ -0,0 +1,55 @@
+"""Tests for the task cancellation flags."""
+
+from unittest.mock import MagicMock
+
+import redis
+
+from services.tasks.cancellation import (
+    InMemoryTaskCancellationFlags,
+    RedisTaskCancellationFlags,
+)
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestInMemoryTaskCancellationFlags:
+    def test_flags_are_per_task_and_expire(self):
+        clock = FakeClock()
+        flags = InMemoryTaskCancellationFlags(ttl_seconds=10, clock=clock)
+
+        flags.cancel("task")
+
+        assert flags.is_cancelled("task")
+        assert not flags.is_cancelled("other-task")
+        clock.now = 10
+        assert not flags.is_cancelled("task")
+
+
+class TestRedisTaskCancellationFlags:
+    def test_cancel_sets_an_expiring_key(self):
+        client = MagicMock()
+        client.exists.return_value = 1
+        flags = RedisTaskCancellationFlags(client, ttl_seconds=60)
+
+        flags.cancel("task")
+
+        client.set.assert_called_once_with(
+            RedisTaskCancellationFlags.KEY_PREFIX + "task", 1, ex=60
+        )
+        assert flags.is_cancelled("task")
+
+    def test_redis_errors_never_cancel(self):
+        client = MagicMock()
+        client.set.side_effect = redis.ConnectionError("down")
+        client.exists.side_effect = redis.ConnectionError("down")
+        flags = RedisTaskCancellationFlags(client)
+
+        flags.cancel("task")
+
+        assert not flags.is_cancelled("task")
@@ -108,6 +108,56 @@ class TestEditTaskQueryService(TestCase):
         queryset = EditTaskQueryService.build_filtered_queryset()
         self.assertEqual(queryset.count(), 2)
 
+    def test_build_filtered_queryset_excludes_section_tasks(self):
+        """Test that section tasks of a whole-article task are not listed."""
+        EditTask.objects.create(
+            editing_mode="copyedit", parent=self.task1, section_index=0
+        )
+        queryset = EditTaskQueryService.build_filtered_queryset()
+        self.assertEqual(queryset.count(), 2)
+
+    def test_get_article_progress_prefers_live_section_progress(self):
+        """Test that running sections report live progress when it is stored."""
+        from unittest.mock import patch
+
+        from services.tracking.progress_store import InMemoryProgressStore
+
+        self.task1.sections_total = 2
+        self.task1.save()
+        running = EditTask.objects.create(
+            editing_mode="copyedit",
+            section_title="History",
+            status="STARTED",
+            parent=self.task1,
+            section_index=1,
+            progress_data={"progress_percentage": 10},
+        )
+        EditTask.objects.create(
+            editing_mode="copyedit",
+            section_title="Lead",
+            status="FAILURE",
+            parent=self.task1,
+            section_index=0,
+        )
+        store = InMemoryProgressStore()
+        store.save(str(running.id), {"total_paragraphs": 2, "progress_percentage": 50})
+
+        with patch(
+            "services.tasks.edit_task_query_service.get_progress_store",
+            return_value=store,
+        ):
+            progress = EditTaskQueryService.get_article_progress(self.task1)
+
+        self.assertEqual(progress["sections_completed"], 1)
+        self.assertEqual(progress["progress_percentage"], 75)
+        self.assertEqual(
+            [
+                (s["section_title"], s["progress_percentage"])
+                for s in progress["sections"]
+            ],
+            [("Lead", 100), ("History", 50)],
+        )
+
     def test_build_filtered_queryset_status_filter(self):
         """Test building queryset with status filter."""
         queryset = EditTaskQueryService.build_filtered_queryset(status_filter="SUCCESS")
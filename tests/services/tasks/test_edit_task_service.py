@@ -1,5 +1,6 @@
 import os
-from unittest.mock import MagicMock, patch
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Configure Django settings before importing Django modules
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "EditEngine.settings")
@@ -8,13 +9,25 @@ import django
 from django.conf import settings
 from django.test import TestCase
 
-from api.exceptions.user_facing_exceptions import APIKeyError
+from api.exceptions.user_facing_exceptions import (
+    APIKeyError,
+    UserFacingError,
+    ValidationError,
+)
 
 if not settings.configured:
     django.setup()
 
 from data.models.edit_task import EditTask
+from data.models.edit_task_submission import EditTaskSubmission
+from services.tasks.cancellation import InMemoryTaskCancellationFlags
 from services.tasks.edit_task_service import EditTaskService
+from services.tasks.edit_tasks import get_model_name
+from services.tasks.in_flight_registry import (
+    InMemoryInFlightRegistry,
+    get_coalescing_key,
+)
+from services.utils.wikipedia_api import WikipediaAPIError
 
 
 class TestEditTaskService(TestCase):
@@ -62,6 +75,40 @@ class TestEditTaskService(TestCase):
             EditTaskService.create_llm_config(None, None, None, None, None)
         self.assertIn("API key required", str(cm.exception))
 
+    @patch("services.tasks.edit_task_service.LLM_FAKE_PROVIDER_ENABLED", True)
+    def test_create_llm_config_fake(self):
+        """Test creating LLM config for the fake provider when it is enabled."""
+        config = EditTaskService.create_llm_config(
+            None, None, None, None, None, "realistic"
+        )
+        self.assertEqual(config["provider"], "fake")
+        self.assertEqual(config["fake_profile"], "realistic")
+
+    @patch("services.tasks.edit_task_service.LLM_FAKE_PROVIDER_ENABLED", True)
+    def test_create_llm_config_real_key_takes_precedence_over_fake(self):
+        """Test that a real API key is used even when a fake profile is given."""
+        config = EditTaskService.create_llm_config(
+            "google_key", None, None, None, None, "instant"
+        )
+        self.assertEqual(config["provider"], "google")
+
+    @patch("services.tasks.edit_task_service.LLM_FAKE_PROVIDER_ENABLED", True)
+    def test_create_llm_config_fake_invalid_profile(self):
+        """Test creating LLM config with an unknown fake profile."""
+        with self.assertRaises(ValidationError):
+            EditTaskService.create_llm_config(
+                None, None, None, None, None, "no-such-preset"
+            )
+
+    @patch("services.tasks.edit_task_service.LLM_FAKE_PROVIDER_ENABLED", False)
+    def test_create_llm_config_fake_disabled(self):
+        """Test that the fake provider is refused unless enabled."""
+        with self.assertRaises(APIKeyError):
+            EditTaskService.create_llm_config(None, None, None, None, None, "instant")
+        self.assertFalse(
+            EditTaskService.validate_api_keys(None, None, None, None, None, "instant")
+        )
+
     def test_validate_api_keys_google(self):
         """Test validating API keys with Google key."""
         result = EditTaskService.validate_api_keys("google_key", None, None, None, None)
@@ -132,15 +179,27 @@ class TestEditTaskService(TestCase):
         self.assertEqual(kwargs["edit_task_id"], "test-id")
         self.assertEqual(kwargs["article_title"], "Test Article")
         self.assertEqual(kwargs["section_title"], "Test Section")
+        self.assertFalse(kwargs["bypass_cache"])
         self.assertNotIn("content", kwargs)
 
+    def test_build_task_kwargs_with_bypass_cache(self):
+        """Test building task kwargs that bypass the response cache."""
+        kwargs = EditTaskService.build_task_kwargs(
+            edit_task_id="test-id",
+            article_title="Test Article",
+            section_title="Test Section",
+            bypass_cache=True,
+        )
+
+        self.assertTrue(kwargs["bypass_cache"])
+
     @patch("services.tasks.edit_task_service.EncryptionService")
     @patch("services.tasks.edit_task_service.process_edit_task_batched")
     def test_start_processing_task(self, mock_process_task, mock_encryption_service):
         """Test starting processing task."""
         mock_celery_task = MagicMock()
         mock_celery_task.id = "celery-task-id"
-        mock_process_task.delay.return_value = mock_celery_task
+        mock_process_task.apply_async.return_value = mock_celery_task
 
         # Mock encryption service
         mock_encryption = MagicMock()
@@ -156,11 +215,14 @@ class TestEditTaskService(TestCase):
 
         self.assertEqual(result, "celery-task-id")
         mock_encryption.encrypt_dict.assert_called_once_with(llm_config)
-        mock_process_task.delay.assert_called_once_with(
-            editing_mode="copyedit",
-            encrypted_llm_config="encrypted_config",
-            edit_task_id="test-id",
-            content="test content",
+        mock_process_task.apply_async.assert_called_once_with(
+            kwargs={
+                "editing_mode": "copyedit",
+                "encrypted_llm_config": "encrypted_config",
+                "edit_task_id": "test-id",
+                "content": "test content",
+            },
+            queue=None,
         )
 
     def test_update_task_with_celery_id(self):
@@ -183,7 +245,7 @@ class TestEditTaskService(TestCase):
         """Test complete workflow for creating and starting edit task."""
         mock_celery_task = MagicMock()
         mock_celery_task.id = "celery-task-id"
-        mock_process_task.delay.return_value = mock_celery_task
+        mock_process_task.apply_async.return_value = mock_celery_task
 
         result = EditTaskService.create_and_start_edit_task(
             editing_mode="copyedit",
@@ -211,7 +273,7 @@ class TestEditTaskService(TestCase):
         """Test creating and starting edit task with article title."""
         mock_celery_task = MagicMock()
         mock_celery_task.id = "celery-task-id"
-        mock_process_task.delay.return_value = mock_celery_task
+        mock_process_task.apply_async.return_value = mock_celery_task
 
         result = EditTaskService.create_and_start_edit_task(
             editing_mode="brevity",
@@ -235,6 +297,259 @@ class TestEditTaskService(TestCase):
         self.assertEqual(task.section_title, "Test Section")
         self.assertEqual(task.llm_provider, "openai")
 
+    @patch("services.tasks.edit_task_service.EncryptionService")
+    @patch("services.tasks.edit_task_service.process_edit_article_task")
+    def test_create_and_start_article_edit_task(
+        self, mock_article_task, mock_encryption_service
+    ):
+        """Test creating and starting a whole-article edit task."""
+        mock_celery_task = MagicMock()
+        mock_celery_task.id = "celery-task-id"
+        mock_article_task.delay.return_value = mock_celery_task
+        mock_encryption_service.return_value.encrypt_dict.return_value = "encrypted"
+
+        result = EditTaskService.create_and_start_article_edit_task(
+            editing_mode="brevity",
+            article_title="Test Article",
+            google_api_key="google_key",
+            openai_api_key=None,
+            anthropic_api_key=None,
+            mistral_api_key=None,
+            perplexity_api_key=None,
+            bypass_cache=True,
+        )
+
+        task = EditTask.objects.get(id=result["task_id"])
+        self.assertEqual(task.article_title, "Test Article")
+        self.assertIsNone(task.section_title)
+        self.assertEqual(task.celery_task_id, "celery-task-id")
+        mock_article_task.delay.assert_called_once_with(
+            editing_mode="brevity",
+            encrypted_llm_config="encrypted",
+            edit_task_id=result["task_id"],
+            article_title="Test Article",
+            bypass_cache=True,
+            force=False,
+        )
+
+    @patch("services.tasks.edit_task_service.get_in_flight_registry")
+    @patch("services.tasks.edit_task_service.process_edit_task_batched")
+    def test_identical_submissions_attach_to_the_task_in_flight(
+        self, mock_process_task, mock_get_registry
+    ):
+        """Test that identical submissions share one task while it is running."""
+        mock_get_registry.return_value = InMemoryInFlightRegistry()
+        mock_process_task.apply_async.return_value.id = "celery-task-id"
+        submission: Dict[str, Any] = {
+            "editing_mode": "copyedit",
+            "article_title": "Test Article",
+            "section_title": "Test Section",
+            "google_api_key": "google_key",
+            "openai_api_key": None,
+            "anthropic_api_key": None,
+            "mistral_api_key": None,
+            "perplexity_api_key": None,
+        }
+
+        first = EditTaskService.create_and_start_edit_task(**submission)
+        second = EditTaskService.create_and_start_edit_task(
+            **{**submission, "google_api_key": "other_google_key"}
+        )
+
+        self.assertEqual(second["task_id"], first["task_id"])
+        self.assertNotEqual(second["cancel_token"], first["cancel_token"])
+        self.assertEqual(EditTask.objects.count(), 1)
+        self.assertEqual(EditTaskSubmission.objects.count(), 2)
+        mock_process_task.apply_async.assert_called_once()
+
+        # Bypassing the cache always starts a new task
+        bypassed = EditTaskService.create_and_start_edit_task(
+            **submission, bypass_cache=True
+        )
+        self.assertNotEqual(bypassed["task_id"], first["task_id"])
+
+        # Once the task finishes, the next submission starts a new one
+        EditTask.objects.get(id=first["task_id"]).mark_success({"paragraphs": []})
+        third = EditTaskService.create_and_start_edit_task(**submission)
+        self.assertNotEqual(third["task_id"], first["task_id"])
+        self.assertEqual(
+            EditTaskService.create_and_start_edit_task(**submission)["task_id"],
+            third["task_id"],
+        )
+        self.assertEqual(mock_process_task.apply_async.call_count, 3)
+
+    @patch("services.tasks.edit_task_service.get_in_flight_registry")
+    @patch("services.tasks.edit_task_service.process_edit_task_batched")
+    def test_forced_submission_does_not_attach_to_the_task_in_flight(
+        self, mock_process_task, mock_get_registry
+    ):
+        """Test that a forced submission never shares a task reusing old results."""
+        mock_get_registry.return_value = InMemoryInFlightRegistry()
+        mock_process_task.apply_async.return_value.id = "celery-task-id"
+        submission: Dict[str, Any] = {
+            "editing_mode": "copyedit",
+            "article_title": "Test Article",
+            "section_title": "Test Section",
+            "google_api_key": "google_key",
+            "openai_api_key": None,
+            "anthropic_api_key": None,
+            "mistral_api_key": None,
+            "perplexity_api_key": None,
+        }
+
+        in_flight = EditTaskService.create_and_start_edit_task(**submission)
+        forced = EditTaskService.create_and_start_edit_task(**submission, force=True)
+
+        self.assertNotEqual(forced["task_id"], in_flight["task_id"])
+        self.assertEqual(EditTask.objects.count(), 2)
+        self.assertEqual(mock_process_task.apply_async.call_count, 2)
+        forced_kwargs = mock_process_task.apply_async.call_args.kwargs["kwargs"]
+        self.assertTrue(forced_kwargs["force"])
+
+    @patch("services.tasks.edit_task_service.get_in_flight_registry")
+    @patch("services.tasks.edit_task_service.process_edit_task_batched")
+    def test_submission_that_failed_to_start_is_not_attached_to(
+        self, mock_process_task, mock_get_registry
+    ):
+        """Test that a task whose dispatch failed leaves the registry."""
+        registry = InMemoryInFlightRegistry()
+        mock_get_registry.return_value = registry
+        mock_process_task.apply_async.side_effect = Exception("Celery error")
+
+        with self.assertRaisesRegex(Exception, "Celery error"):
+            EditTaskService.create_and_start_edit_task(
+                editing_mode="copyedit",
+                article_title="Test Article",
+                section_title="Test Section",
+                google_api_key="google_key",
+                openai_api_key=None,
+                anthropic_api_key=None,
+                mistral_api_key=None,
+                perplexity_api_key=None,
+            )
+
+        key = get_coalescing_key(
+            "copyedit", "Test Article", "Test Section", {"provider": "google"}
+        )
+        self.assertIsNone(registry.claim(key, "next-task"))
+
+    @patch("services.tasks.edit_task_service.RESULT_CACHE_ENABLED", True)
+    @patch("services.tasks.edit_task_service.WikipediaAPI")
+    @patch("services.tasks.edit_task_service.process_edit_task_batched")
+    def test_finished_result_of_the_current_revision_is_returned(
+        self, mock_process_task, mock_wikipedia_api
+    ):
+        """Test that an unchanged revision reuses the finished task's result."""
+        mock_process_task.apply_async.return_value.id = "celery-task-id"
+        mock_wikipedia_api.return_value.get_latest_revision_id = AsyncMock(
+            return_value=1234
+        )
+        submission: Dict[str, Any] = {
+            "editing_mode": "copyedit",
+            "article_title": "Test Article",
+            "section_title": "Test Section",
+            "google_api_key": "google_key",
+            "openai_api_key": None,
+            "anthropic_api_key": None,
+            "mistral_api_key": None,
+            "perplexity_api_key": None,
+        }
+
+        first = EditTaskService.create_and_start_edit_task(**submission)
+        first_task = EditTask.objects.get(id=first["task_id"])
+        self.assertEqual(first_task.revision_id, 1234)
+        self.assertIsNotNone(first_task.prompt_version)
+        # The worker records the model it ran with
+        first_task.llm_model = get_model_name("google")
+        first_task.save()
+        first_task.mark_success({"paragraphs": []})
+
+        # A finished result cannot be cancelled, so it comes without a token
+        self.assertEqual(
+            EditTaskService.create_and_start_edit_task(**submission),
+            EditTaskService.build_task_response(first["task_id"]),
+        )
+        self.assertEqual(mock_process_task.apply_async.call_count, 1)
+
+        forced = EditTaskService.create_and_start_edit_task(**submission, force=True)
+        self.assertNotEqual(forced["task_id"], first["task_id"])
+
+        # A new revision is edited again
+        mock_wikipedia_api.return_value.get_latest_revision_id.return_value = 5678
+        edited = EditTaskService.create_and_start_edit_task(**submission)
+        self.assertNotIn(edited["task_id"], [first["task_id"], forced["task_id"]])
+        self.assertEqual(mock_process_task.apply_async.call_count, 3)
+
+    @patch("services.tasks.edit_task_service.RESULT_CACHE_ENABLED", True)
+    @patch("services.tasks.edit_task_service.WikipediaAPI")
+    def test_get_current_revision_when_lookup_fails(self, mock_wikipedia_api):
+        """Test that a failed revision lookup leaves the task unpinned."""
+        mock_wikipedia_api.return_value.get_latest_revision_id = AsyncMock(
+            side_effect=WikipediaAPIError("Article not found: Test Article")
+        )
+
+        self.assertIsNone(EditTaskService.get_current_revision_id("Test Article"))
+
+    @patch("services.tasks.edit_task_service.EDIT_QUEUE_ROUTING_ENABLED", True)
+    @patch("services.tasks.queue_routing.EDIT_QUEUE_ROUTING_ENABLED", True)
+    @patch("services.tasks.queue_routing.SMALL_EDIT_MAX_PARAGRAPHS", 1)
+    @patch("services.tasks.edit_task_service.WikipediaAPI")
+    @patch("services.tasks.edit_task_service.process_edit_task_batched")
+    def test_section_edit_is_queued_by_size(
+        self, mock_process_task, mock_wikipedia_api
+    ):
+        """Test that a section edit goes to the queue for its size."""
+        mock_process_task.apply_async.return_value.id = "celery-task-id"
+        paragraph = "This is a test paragraph with enough prose to be sent to the LLM."
+        sections = {
+            "Short": f"== Short ==\n\n{paragraph}",
+            "Long": f"== Long ==\n\n{paragraph}\n\n{paragraph}",
+        }
+        wikipedia_api = mock_wikipedia_api.return_value
+        wikipedia_api.get_latest_revision_id = AsyncMock(return_value=1234)
+        wikipedia_api.get_section_wikitext = AsyncMock(
+            side_effect=lambda revision_id, section_title: sections.get(section_title)
+        )
+        submission: Dict[str, Any] = {
+            "editing_mode": "copyedit",
+            "article_title": "Test Article",
+            "google_api_key": "google_key",
+            "openai_api_key": None,
+            "anthropic_api_key": None,
+            "mistral_api_key": None,
+            "perplexity_api_key": None,
+        }
+
+        for section_title, queue in [("Short", "edits-small"), ("Long", "edits-large")]:
+            EditTaskService.create_and_start_edit_task(
+                **submission, section_title=section_title
+            )
+            self.assertEqual(
+                mock_process_task.apply_async.call_args.kwargs["queue"], queue
+            )
+        # The section is sized from the revision the task edits
+        self.assertEqual(EditTask.objects.latest("created_at").revision_id, 1234)
+        wikipedia_api.get_section_wikitext.assert_called_with(1234, "Long")
+
+        # A submission attached to the task in flight does not fetch the section
+        with patch(
+            "services.tasks.edit_task_service.get_in_flight_registry",
+            return_value=InMemoryInFlightRegistry(),
+        ):
+            first = EditTaskService.create_and_start_edit_task(
+                **submission, section_title="Short"
+            )
+            fetches = wikipedia_api.get_section_wikitext.call_count
+            second = EditTaskService.create_and_start_edit_task(
+                **submission, section_title="Short"
+            )
+        self.assertEqual(second["task_id"], first["task_id"])
+        self.assertEqual(wikipedia_api.get_section_wikitext.call_count, fetches)
+
+        # Sections that could not be found go to the default queue
+        self.assertIsNone(EditTaskService.get_section_queue("Missing", 1234))
+        self.assertIsNone(EditTaskService.get_section_queue("Short", None))
+
     def test_create_and_start_edit_task_no_api_key(self):
         """Test creating and starting edit task with no API key."""
         with self.assertRaises(APIKeyError) as cm:
@@ -253,7 +568,7 @@ class TestEditTaskService(TestCase):
     @patch("services.tasks.edit_task_service.process_edit_task_batched")
     def test_create_and_start_edit_task_celery_failure(self, mock_process_task):
         """Test handling Celery task failure."""
-        mock_process_task.delay.side_effect = Exception("Celery error")
+        mock_process_task.apply_async.side_effect = Exception("Celery error")
 
         with self.assertRaises(Exception) as cm:
             EditTaskService.create_and_start_edit_task(
@@ -271,3 +586,83 @@ class TestEditTaskService(TestCase):
         # Verify task was still created even if Celery failed
         tasks = EditTask.objects.filter(editing_mode="copyedit")
         self.assertEqual(tasks.count(), 1)
+
+    @patch("services.tasks.edit_task_service.get_task_cancellation_flags")
+    @patch("services.tasks.edit_task_service.current_app")
+    def test_cancel_article_task_cancels_unfinished_sections(
+        self, mock_celery_app, mock_get_flags
+    ):
+        """Test that cancelling an article stops its sections still in progress."""
+        flags = InMemoryTaskCancellationFlags()
+        mock_get_flags.return_value = flags
+        article_task = EditTask.objects.create(
+            editing_mode="copyedit",
+            article_title="Test Article",
+            status="STARTED",
+            celery_task_id="article",
+            sections_total=3,
+        )
+        sections = {
+            status: EditTask.objects.create(
+                editing_mode="copyedit",
+                article_title="Test Article",
+                section_title=status,
+                status=status,
+                celery_task_id=status.lower(),
+                parent=article_task,
+                section_index=index,
+            )
+            for index, status in enumerate(["SUCCESS", "STARTED", "PENDING"])
+        }
+        cancel_token = str(
+            EditTaskSubmission.objects.create(edit_task=article_task).cancel_token
+        )
+
+        EditTaskService.cancel_edit_task(article_task, cancel_token)
+
+        article_task.refresh_from_db()
+        self.assertEqual(article_task.status, "REVOKED")
+        for section in sections.values():
+            section.refresh_from_db()
+        self.assertEqual(sections["SUCCESS"].status, "SUCCESS")
+        self.assertEqual(sections["STARTED"].status, "REVOKED")
+        self.assertEqual(sections["PENDING"].status, "REVOKED")
+        revoked = [call.args[0] for call in mock_celery_app.control.revoke.mock_calls]
+        self.assertEqual(revoked, ["article", "started", "pending"])
+        self.assertTrue(flags.is_cancelled(str(sections["STARTED"].id)))
+        self.assertFalse(flags.is_cancelled(str(sections["SUCCESS"].id)))
+
+        # Cancelling again does nothing
+        EditTaskService.cancel_edit_task(article_task, cancel_token)
+        self.assertEqual(mock_celery_app.control.revoke.call_count, 3)
+
+    @patch("services.tasks.edit_task_service.get_task_cancellation_flags")
+    @patch("services.tasks.edit_task_service.current_app")
+    def test_running_task_is_not_cancelled_without_flags(
+        self, mock_celery_app, mock_get_flags
+    ):
+        """Test that a running edit is only cancelled when its worker can stop."""
+        mock_get_flags.return_value = None
+        edit_task = EditTask.objects.create(
+            editing_mode="copyedit",
+            article_title="Test Article",
+            section_title="Test Section",
+            status="STARTED",
+        )
+        cancel_token = str(
+            EditTaskSubmission.objects.create(edit_task=edit_task).cancel_token
+        )
+
+        with self.assertRaises(UserFacingError) as cm:
+            EditTaskService.cancel_edit_task(edit_task, cancel_token)
+        self.assertEqual(cm.exception.error_code, "TASK_CANNOT_BE_STOPPED")
+        edit_task.refresh_from_db()
+        self.assertEqual(edit_task.status, "STARTED")
+        self.assertFalse(edit_task.submissions.filter(withdrawn_at__isnull=False))
+        mock_celery_app.control.revoke.assert_not_called()
+
+        # A queued task is still revoked before a worker takes it
+        edit_task.status = "PENDING"
+        edit_task.save()
+        cancelled = EditTaskService.cancel_edit_task(edit_task, cancel_token)
+        self.assertEqual(cancelled.status, "REVOKED")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uuid
 from dataclasses import dataclass
@@ -5,6 +6,7 @@ from unittest.mock import MagicMock
 
 import django
 import pytest
+from asgiref.sync import sync_to_async
 from celery import current_app
 from django.conf import settings
 
@@ -14,7 +16,14 @@ if not settings.configured:
     django.setup()
 
 from data.models.edit_task import EditTask
+from services.editing.checkpoints import (
+    paragraph_checkpoint_key,
+    paragraph_content_key,
+)
 from services.tasks.edit_tasks import process_edit_task, process_edit_task_batched
+from services.tracking.progress_store import InMemoryProgressStore
+from services.tracking.task_events import TaskEventBroker
+from services.utils.wikipedia_api import ArticleRevision
 
 
 @dataclass
@@ -26,10 +35,12 @@ class ParagraphResult:
 
 @pytest.fixture(autouse=True)
 def celery_eager():
-    # Run Celery tasks synchronously for testing
-    current_app.conf.task_always_eager = True
+    # Run Celery tasks synchronously for testing. The app reads its settings
+    # from Django with the CELERY namespace, so the namespaced key takes
+    # precedence over task_always_eager
+    current_app.conf.CELERY_TASK_ALWAYS_EAGER = True
     yield
-    current_app.conf.task_always_eager = False
+    current_app.conf.CELERY_TASK_ALWAYS_EAGER = False
 
 
 @pytest.mark.django_db
@@ -74,11 +85,13 @@ def test_process_edit_task_article_section(monkeypatch):
     assert result["article_title"] == "Test"
     assert result["section_title"] == "Intro"
     assert result["article_url"].endswith("/Test")
+    assert result["token_usage"]["llm_calls"] == 0
 
     # Verify the EditTask was updated
     edit_task.refresh_from_db()
     assert edit_task.status == "SUCCESS"
     assert edit_task.result["paragraphs"][0]["after"] == "qux"
+    assert edit_task.usage_data["paragraphs"] == []
 
 
 @pytest.mark.django_db
@@ -164,6 +177,31 @@ def test_initialize_llm_anthropic(monkeypatch):
     assert isinstance(llm, DummyLLM)
 
 
+@pytest.mark.parametrize(
+    "provider, client_class",
+    [
+        ("google", "ChatGoogleGenerativeAI"),
+        ("openai", "ChatOpenAI"),
+        ("anthropic", "ChatAnthropic"),
+        ("mistral", "ChatMistralAI"),
+        ("perplexity", "ChatPerplexity"),
+    ],
+)
+def test_create_llm_bounds_request_time(monkeypatch, provider, client_class):
+    from services.core.constants import LLM_REQUEST_TIMEOUT_SECONDS
+    from services.tasks.edit_tasks import _create_llm
+
+    client_kwargs = {}
+    monkeypatch.setattr(
+        f"services.tasks.edit_tasks.{client_class}",
+        lambda **kwargs: client_kwargs.update(kwargs),
+    )
+
+    _create_llm({"provider": provider, "api_key": "fake"})
+
+    assert client_kwargs["timeout"] == LLM_REQUEST_TIMEOUT_SECONDS
+
+
 def test_initialize_llm_mistral(monkeypatch):
     from services.tasks.edit_tasks import _initialize_llm
 
@@ -192,6 +230,53 @@ def test_initialize_llm_perplexity(monkeypatch):
     assert isinstance(llm, DummyLLM)
 
 
+def test_initialize_llm_reuses_pooled_clients(monkeypatch):
+    from services.llm.client_pool import LLMClientPool
+    from services.tasks.edit_tasks import _initialize_llm
+
+    created = []
+    pool = LLMClientPool(max_size=4, idle_timeout_seconds=60)
+
+    def create_openai(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.get_llm_client_pool",
+        lambda: pool,
+    )
+    monkeypatch.setattr("services.tasks.edit_tasks.ChatOpenAI", create_openai)
+
+    first = _initialize_llm({"provider": "openai", "api_key": "key-1"})
+    second = _initialize_llm({"provider": "openai", "api_key": "key-1"})
+    other = _initialize_llm({"provider": "openai", "api_key": "key-2"})
+
+    assert first is second
+    assert other is not first
+    assert len(created) == 2
+
+
+def test_initialize_llm_fake(monkeypatch):
+    from services.llm.fake_llm import FAKE_LLM_PRESETS, FakeEditorChatModel
+    from services.tasks.edit_tasks import _initialize_llm
+
+    monkeypatch.setattr("services.tasks.edit_tasks.LLM_FAKE_PROVIDER_ENABLED", True)
+    config = {"provider": "fake", "api_key": "", "fake_profile": "flaky"}
+    llm = _initialize_llm(config)
+    assert isinstance(llm, FakeEditorChatModel)
+    assert llm.profile == FAKE_LLM_PRESETS["flaky"]
+
+
+def test_initialize_llm_fake_disabled(monkeypatch):
+    from api.exceptions.user_facing_exceptions import ValidationError
+    from services.tasks.edit_tasks import _initialize_llm
+
+    monkeypatch.setattr("services.tasks.edit_tasks.LLM_FAKE_PROVIDER_ENABLED", False)
+    config = {"provider": "fake", "api_key": ""}
+    with pytest.raises(ValidationError, match="fake LLM provider is not enabled"):
+        _initialize_llm(config)
+
+
 def test_initialize_llm_invalid():
     from api.exceptions.user_facing_exceptions import ValidationError
     from services.tasks.edit_tasks import _initialize_llm
@@ -278,38 +363,21 @@ def test_process_edit_task_nonexistent_edit_task(monkeypatch):
     assert f"EditTask with id {fake_uuid} not found" in result["error"]
 
 
-def test_run_async_safely_with_event_loop(monkeypatch):
+@pytest.mark.asyncio
+async def test_run_async_safely_with_event_loop():
     """Test _run_async_safely when an event loop is already running."""
     from services.tasks.edit_tasks import _run_async_safely
 
-    # Create a mock coroutine object instead of a real one
-    mock_coro = MagicMock()
-
-    # Mock asyncio.get_running_loop to simulate running event loop
-    def mock_get_running_loop():
-        return MagicMock()  # Return a mock loop to simulate running loop
+    async def current_loop():
+        return asyncio.get_running_loop()
 
-    monkeypatch.setattr("asyncio.get_running_loop", mock_get_running_loop)
+    # Coroutines run on the process's own loop, the same one for every call
+    loop = _run_async_safely(current_loop())
+    assert loop is not asyncio.get_running_loop()
+    assert _run_async_safely(current_loop()) is loop
 
-    # Mock concurrent.futures to capture the call
-    mock_executor = MagicMock()
-    mock_future = MagicMock()
-    mock_future.result.return_value = "test_result"
-    mock_executor.submit.return_value = mock_future
-    mock_executor.__enter__ = lambda self: self
-    mock_executor.__exit__ = lambda self, *args: None
 
-    mock_thread_pool = MagicMock(return_value=mock_executor)
-    monkeypatch.setattr("concurrent.futures.ThreadPoolExecutor", mock_thread_pool)
-
-    result = _run_async_safely(mock_coro)
-
-    assert result == "test_result"
-    mock_executor.submit.assert_called_once()
-    mock_future.result.assert_called_once()
-
-
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True)
 def test_process_edit_task_batched_article_section(monkeypatch):
     """Test the batched version of process_edit_task."""
     # Create a test EditTask
@@ -320,13 +388,20 @@ def test_process_edit_task_batched_article_section(monkeypatch):
         llm_provider="google",
     )
 
-    async def mock_edit_article_section_structured_batched(
-        article_title, section_title, language="en", progress_callback=None, batch_size=5
+    async def mock_stream_article_section_structured_batched(
+        article_title,
+        section_title,
+        language="en",
+        progress_callback=None,
+        batch_size=5,
+        checkpoints=None,
+        revision_id=None,
     ):
-        return [ParagraphResult(before="baz", after="qux", status="CHANGED")]
+        yield 1, ParagraphResult(before="", after="", status="SKIPPED")
+        yield 0, ParagraphResult(before="baz", after="qux", status="CHANGED")
 
     mock_editor = MagicMock()
-    mock_editor.edit_article_section_structured_batched = mock_edit_article_section_structured_batched
+    mock_editor.stream_article_section_structured_batched = mock_stream_article_section_structured_batched
     monkeypatch.setattr(
         "services.tasks.edit_tasks.WikiEditor", lambda **kwargs: mock_editor
     )
@@ -359,11 +434,111 @@ def test_process_edit_task_batched_article_section(monkeypatch):
     assert result["article_title"] == "Test"
     assert result["section_title"] == "Intro"
     assert result["article_url"].endswith("/Test")
+    assert result["token_usage"]["llm_calls"] == 0
 
     # Verify the EditTask was updated
     edit_task.refresh_from_db()
     assert edit_task.status == "SUCCESS"
     assert edit_task.result["paragraphs"][0]["after"] == "qux"
+    assert edit_task.usage_data["paragraphs"] == []
+    assert edit_task.partial_results is None
+
+
+def test_collect_streamed_results_saves_paragraphs_as_they_finish(monkeypatch):
+    from services.tasks.edit_tasks import _collect_streamed_results, _run_async_safely
+
+    async def streamed_results():
+        yield 2, ParagraphResult(before="c", after="c2", status="CHANGED")
+        yield 1, ParagraphResult(before="", after="", status="SKIPPED")
+        yield 0, ParagraphResult(before="a", after="a", status="UNCHANGED")
+
+    edit_task = MagicMock(id="task")
+    store = InMemoryProgressStore()
+    monkeypatch.setattr("services.tasks.edit_tasks.get_progress_store", lambda: store)
+    broker = MagicMock(spec=TaskEventBroker)
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.get_task_event_broker", lambda: broker
+    )
+    results = _run_async_safely(_collect_streamed_results(streamed_results(), edit_task))
+
+    assert [result.before for result in results] == ["a", "", "c"]
+    # Results with empty content are left out, as in the final result, and each
+    # one is kept in the live store rather than rewriting the task's results
+    saved = store.get_partial_results("task")
+    assert saved == [
+        {"index": 0, "before": "a", "after": "a", "status": "UNCHANGED"},
+        {"index": 2, "before": "c", "after": "c2", "status": "CHANGED"},
+    ]
+    edit_task.add_partial_results.assert_not_called()
+    # Each saved paragraph is also pushed to clients streaming the results
+    published = [call.args[1:] for call in broker.apublish.call_args_list]
+    assert published == [("paragraph", saved[1]), ("paragraph", saved[0])]
+
+
+def test_streamed_results_are_batched_into_task_writes_without_a_store(monkeypatch):
+    from services.tasks.edit_tasks import _collect_streamed_results, _run_async_safely
+
+    async def streamed_results():
+        for index in range(3):
+            yield index, ParagraphResult(before="a", after="a!", status="CHANGED")
+
+    edit_task = MagicMock()
+    monkeypatch.setattr("services.tasks.edit_tasks.get_progress_store", lambda: None)
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.PROGRESS_FLUSH_INTERVAL_SECONDS", 60.0
+    )
+    _run_async_safely(_collect_streamed_results(streamed_results(), edit_task))
+
+    # The first paragraph is written at once, the rest together at the end
+    saved = [
+        [paragraph["index"] for paragraph in call.args[0]]
+        for call in edit_task.add_partial_results.call_args_list
+    ]
+    assert saved == [[0], [1, 2]]
+
+
+@pytest.mark.django_db
+def test_progress_is_kept_live_and_copied_to_the_task_when_done(monkeypatch):
+    from services.tasks.edit_tasks import _persist_progress_snapshot, _save_progress
+    from services.tracking.progress_store import InMemoryProgressStore
+
+    edit_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+    store = InMemoryProgressStore()
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.get_progress_store", lambda: store
+    )
+    progress_data = {
+        "total_paragraphs": 1,
+        "phase_counts": {"complete": 1},
+        "paragraphs": [{"index": 0, "phase": "complete"}],
+    }
+
+    _save_progress(edit_task, store, progress_data)
+    edit_task.refresh_from_db()
+    assert edit_task.progress_data is None
+    assert store.get(str(edit_task.id)) == progress_data
+
+    _persist_progress_snapshot(edit_task)
+    edit_task.refresh_from_db()
+    assert edit_task.progress_data == progress_data
+    assert store.get(str(edit_task.id)) is None
+
+
+@pytest.mark.django_db
+def test_progress_is_written_to_the_task_without_a_store():
+    from services.tasks.edit_tasks import _save_progress
+
+    edit_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+    progress_data = {"total_paragraphs": 0, "phase_counts": {}, "paragraphs": []}
+
+    _save_progress(edit_task, None, progress_data)
+
+    edit_task.refresh_from_db()
+    assert edit_task.progress_data == progress_data
 
 
 @pytest.mark.django_db
@@ -378,7 +553,7 @@ def test_process_edit_task_batched_handles_exception(monkeypatch):
     )
 
     mock_editor = MagicMock()
-    mock_editor.edit_article_section_structured_batched.side_effect = RuntimeError("batched fail")
+    mock_editor.stream_article_section_structured_batched.side_effect = RuntimeError("batched fail")
     monkeypatch.setattr(
         "services.tasks.edit_tasks.WikiEditor", lambda **kwargs: mock_editor
     )
@@ -510,3 +685,468 @@ def test_process_edit_task_enhanced_progress_callback(monkeypatch):
     assert isinstance(result, dict)
     assert "paragraphs" in result
 
+
+
+def test_get_task_response_cache_respects_bypass(monkeypatch):
+    from services.tasks.edit_tasks import _get_task_response_cache
+
+    sentinel_cache = MagicMock()
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.get_response_cache", lambda: sentinel_cache
+    )
+
+    assert _get_task_response_cache({}) is sentinel_cache
+    assert _get_task_response_cache({"bypass_cache": False}) is sentinel_cache
+    assert _get_task_response_cache({"bypass_cache": True}) is None
+
+
+def _mock_article_editing(monkeypatch, wikitext):
+    """Serve the article from a fake Wikipedia API and edit it with a fake editor."""
+
+    class FakeWikipediaAPI:
+        async def get_article_revision(self, title, revision_id=None):
+            return ArticleRevision(wikitext=wikitext, revision_id=revision_id or 1234)
+
+        def get_article_url(self, title):
+            return f"https://en.wikipedia.org/wiki/{title}"
+
+    edited = []
+
+    async def stream_wikitext_structured_batched(
+        wikitext, progress_callback=None, batch_size=5, checkpoints=None
+    ):
+        if "Broken" in wikitext:
+            raise RuntimeError("provider unavailable")
+        for index, line in enumerate(wikitext.strip().split("\n")):
+            checkpoint = (checkpoints or {}).get(
+                paragraph_checkpoint_key(index, line)
+            ) or (checkpoints or {}).get(paragraph_content_key(line))
+            if checkpoint is not None:
+                yield index, ParagraphResult(
+                    before=line, after=checkpoint["after"], status=checkpoint["status"]
+                )
+                continue
+            edited.append(line)
+            yield index, ParagraphResult(before=line, after=line.upper(), status="CHANGED")
+
+    mock_editor = MagicMock()
+    mock_editor.stream_wikitext_structured_batched = stream_wikitext_structured_batched
+    monkeypatch.setattr("services.tasks.edit_tasks.WikipediaAPI", FakeWikipediaAPI)
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.WikiEditor", lambda **kwargs: mock_editor
+    )
+    mock_encryption_service = MagicMock()
+    mock_encryption_service.decrypt_dict.return_value = {"provider": "google"}
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.EncryptionService", lambda: mock_encryption_service
+    )
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks._initialize_llm", lambda config: MagicMock()
+    )
+    return edited
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_edit_article_task_merges_sections_in_article_order(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(
+        monkeypatch,
+        "Lead text.\n\n== History ==\nHistory text.\n\n== Broken ==\nBroken text.\n",
+    )
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+
+    result = process_edit_article_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(article_task.id),
+        article_title="Test",
+    )
+
+    assert result == {"sections": 3}
+    section_tasks = list(article_task.sections.order_by("section_index"))
+    assert [task.section_title for task in section_tasks] == [
+        "Lead",
+        "History",
+        "Broken",
+    ]
+    assert [task.status for task in section_tasks] == ["SUCCESS", "SUCCESS", "FAILURE"]
+    assert {task.revision_id for task in section_tasks} == {1234}
+
+    # The last section to finish merged every section into the article task
+    article_task.refresh_from_db()
+    assert article_task.status == "SUCCESS"
+    assert article_task.revision_id == 1234
+    assert article_task.sections_completed == 3
+    assert [p["before"] for p in article_task.result["paragraphs"]] == [
+        "Lead text.",
+        "== History ==",
+        "History text.",
+    ]
+    sections = article_task.result["sections"]
+    assert [section.get("paragraph_count") for section in sections] == [1, 2, None]
+    assert sections[2]["status"] == "FAILURE"
+    assert sections[2]["error"]
+    assert article_task.result["article_url"].endswith("/Test")
+    assert article_task.usage_data["llm_calls"] == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_edit_article_task_fails_when_every_section_fails(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(monkeypatch, "Broken lead.\n\n== Broken ==\nMore.\n")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+
+    process_edit_article_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(article_task.id),
+        article_title="Test",
+    )
+
+    article_task.refresh_from_db()
+    assert article_task.status == "FAILURE"
+    assert article_task.error_message
+
+
+@pytest.mark.django_db
+def test_process_edit_article_task_without_sections(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(monkeypatch, "")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+
+    result = process_edit_article_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(article_task.id),
+        article_title="Test",
+    )
+
+    assert result == {"sections": 0}
+    article_task.refresh_from_db()
+    assert article_task.status == "SUCCESS"
+    assert article_task.result["paragraphs"] == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_redelivered_section_task_resumes_from_saved_paragraphs(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_section_task
+
+    edited = _mock_article_editing(monkeypatch, "")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        llm_provider="google",
+        sections_total=1,
+    )
+    # The first attempt saved one paragraph before its worker was lost
+    section_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        section_title="Lead",
+        llm_provider="google",
+        parent=article_task,
+        section_index=0,
+        status="STARTED",
+        partial_results=[
+            {
+                "index": 0,
+                "before": "First",
+                "after": "First!",
+                "status": "CHANGED",
+                "status_details": "",
+            }
+        ],
+    )
+    task_kwargs = {
+        "editing_mode": "brevity",
+        "encrypted_llm_config": "encrypted_config",
+        "edit_task_id": str(section_task.id),
+        "section_content": "First\nSecond",
+    }
+
+    result = process_edit_section_task(**task_kwargs)
+
+    assert edited == ["Second"]
+    assert [p["after"] for p in result["paragraphs"]] == ["First!", "SECOND"]
+    article_task.refresh_from_db()
+    assert article_task.status == "SUCCESS"
+
+    # Delivering the message again neither edits nor merges a second time
+    completed_at = article_task.completed_at
+    assert process_edit_section_task(**task_kwargs) == result
+    assert edited == ["Second"]
+    article_task.refresh_from_db()
+    assert article_task.completed_at == completed_at
+
+
+@pytest.mark.django_db(transaction=True)
+def test_section_task_fails_after_too_many_deliveries(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_section_task
+
+    edited = _mock_article_editing(monkeypatch, "")
+    monkeypatch.setattr("services.tasks.edit_tasks.MAX_TASK_DELIVERIES", 3)
+    article_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        llm_provider="google",
+        sections_total=1,
+    )
+    # Every earlier attempt was lost before the section finished
+    section_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        section_title="Lead",
+        llm_provider="google",
+        parent=article_task,
+        section_index=0,
+        status="STARTED",
+        delivery_count=3,
+    )
+
+    result = process_edit_section_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(section_task.id),
+        section_content="First\nSecond",
+    )
+
+    assert result == {"error": "Task was stopped after 3 attempts that did not finish"}
+    assert edited == []
+    section_task.refresh_from_db()
+    assert section_task.status == "FAILURE"
+    assert section_task.delivery_count == 4
+    # The article no longer waits for the section
+    article_task.refresh_from_db()
+    assert article_task.sections_completed == 1
+    assert article_task.status == "FAILURE"
+
+
+@pytest.mark.django_db
+def test_process_edit_task_batched_fails_after_too_many_deliveries(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_task_batched
+
+    monkeypatch.setattr("services.tasks.edit_tasks.MAX_TASK_DELIVERIES", 2)
+    create_editor = MagicMock()
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks._create_batched_editor", create_editor
+    )
+    edit_task = EditTask.objects.create(
+        editing_mode="copyedit",
+        llm_provider="google",
+        status="STARTED",
+        delivery_count=2,
+    )
+
+    result = process_edit_task_batched(
+        editing_mode="copyedit",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(edit_task.id),
+        article_title="Test",
+        section_title="Lead",
+    )
+
+    assert result == {"error": "Task was stopped after 2 attempts that did not finish"}
+    create_editor.assert_not_called()
+    edit_task.refresh_from_db()
+    assert edit_task.status == "FAILURE"
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    "force, expected_edited", [(False, ["New"]), (True, ["First", "New", "Second"])]
+)
+def test_section_task_reuses_paragraphs_of_previous_edit(
+    monkeypatch, force, expected_edited
+):
+    from services.tasks.edit_tasks import get_model_name, process_edit_section_task
+
+    edited = _mock_article_editing(monkeypatch, "")
+    EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        section_title="History",
+        llm_provider="google",
+        llm_model=get_model_name("google"),
+        status="SUCCESS",
+        result={
+            "paragraphs": [
+                {"before": "First", "after": "First!", "status": "CHANGED"},
+                {"before": "Second", "after": "Second!", "status": "CHANGED"},
+            ]
+        },
+    )
+    section_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        section_title="History",
+        llm_provider="google",
+    )
+
+    result = process_edit_section_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(section_task.id),
+        section_content="First\nNew\nSecond",
+        force=force,
+    )
+
+    assert edited == expected_edited
+    assert [p["after"] for p in result["paragraphs"]][1] == "NEW"
+    if not force:
+        assert [p["after"] for p in result["paragraphs"]] == ["First!", "NEW", "Second!"]
+
+
+@pytest.mark.django_db
+def test_redelivered_article_task_does_not_split_the_article_again(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(monkeypatch, "Lead text.\n")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+    task_kwargs = {
+        "editing_mode": "brevity",
+        "encrypted_llm_config": "encrypted_config",
+        "edit_task_id": str(article_task.id),
+        "article_title": "Test",
+    }
+
+    assert process_edit_article_task(**task_kwargs) == {"sections": 1}
+    assert process_edit_article_task(**task_kwargs) == {"sections": 1}
+    assert article_task.sections.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_redelivered_article_task_queues_sections_that_were_never_queued(
+    monkeypatch,
+):
+    from services.tasks import edit_tasks
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(monkeypatch, "Lead text.\n\n== History ==\nOld text.\n")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+    task_kwargs = {
+        "editing_mode": "brevity",
+        "encrypted_llm_config": "encrypted_config",
+        "edit_task_id": str(article_task.id),
+        "article_title": "Test",
+    }
+
+    # The worker is lost after creating the sections but before queueing them
+    real_group = edit_tasks.group
+    monkeypatch.setattr(edit_tasks, "group", MagicMock())
+    assert process_edit_article_task(**task_kwargs) == {"sections": 2}
+    assert set(article_task.sections.values_list("status", flat=True)) == {"PENDING"}
+
+    monkeypatch.setattr(edit_tasks, "group", real_group)
+    assert process_edit_article_task(**task_kwargs) == {"sections": 2}
+
+    article_task.refresh_from_db()
+    assert article_task.status == "SUCCESS"
+    assert article_task.sections.count() == 2
+    assert [section["status"] for section in article_task.result["sections"]] == [
+        "SUCCESS",
+        "SUCCESS",
+    ]
+
+
+@pytest.mark.django_db
+def test_article_sections_are_not_kept_without_their_count(monkeypatch):
+    from services.tasks.edit_tasks import process_edit_article_task
+
+    _mock_article_editing(monkeypatch, "Lead text.\n")
+    article_task = EditTask.objects.create(
+        editing_mode="brevity", article_title="Test", llm_provider="google"
+    )
+
+    def lost_save(self, *args, **kwargs):
+        raise RuntimeError("database connection lost")
+
+    monkeypatch.setattr(EditTask, "save", lost_save)
+    result = process_edit_article_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(article_task.id),
+        article_title="Test",
+    )
+
+    assert "error" in result
+    assert article_task.sections.count() == 0
+    article_task.refresh_from_db()
+    assert article_task.sections_total is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_section_task_stops_when_its_article_is_cancelled(monkeypatch):
+    from services.tasks.cancellation import InMemoryTaskCancellationFlags
+    from services.tasks.edit_tasks import process_edit_section_task
+
+    _mock_article_editing(monkeypatch, "")
+    flags = InMemoryTaskCancellationFlags()
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.get_task_cancellation_flags", lambda: flags
+    )
+    monkeypatch.setattr("services.tasks.edit_tasks.TASK_CANCELLATION_POLL_SECONDS", 0.01)
+    article_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        llm_provider="google",
+        status="STARTED",
+        sections_total=1,
+    )
+    section_task = EditTask.objects.create(
+        editing_mode="brevity",
+        article_title="Test",
+        section_title="Lead",
+        llm_provider="google",
+        parent=article_task,
+        section_index=0,
+    )
+    stream_closed = []
+
+    async def stream_wikitext_structured_batched(
+        wikitext, progress_callback=None, batch_size=5, checkpoints=None
+    ):
+        try:
+            yield 0, ParagraphResult(before="First", after="First!", status="CHANGED")
+            # The user cancels the article while the next paragraph is edited
+            await sync_to_async(article_task.mark_revoked)()
+            flags.cancel(str(section_task.id))
+            await asyncio.sleep(60)
+            yield 1, ParagraphResult(before="Second", after="SECOND", status="CHANGED")
+        finally:
+            stream_closed.append(True)
+
+    mock_editor = MagicMock()
+    mock_editor.stream_wikitext_structured_batched = stream_wikitext_structured_batched
+    monkeypatch.setattr(
+        "services.tasks.edit_tasks.WikiEditor", lambda **kwargs: mock_editor
+    )
+
+    result = process_edit_section_task(
+        editing_mode="brevity",
+        encrypted_llm_config="encrypted_config",
+        edit_task_id=str(section_task.id),
+        section_content="First\nSecond",
+    )
+
+    assert result == {"error": "Task was cancelled"}
+    assert stream_closed == [True]
+    section_task.refresh_from_db()
+    assert section_task.status == "REVOKED"
+    assert [p["after"] for p in section_task.partial_results] == ["First!"]
+    # The cancelled article is left as it is rather than merged
+    article_task.refresh_from_db()
+    assert article_task.status == "REVOKED"
+    assert article_task.sections_completed == 0
@@ -0,0 +1,91 @@
+"""Tests for the in-flight task registry."""
+
+from unittest.mock import MagicMock
+
+import redis
+
+from services.tasks.in_flight_registry import (
+    InMemoryInFlightRegistry,
+    RedisInFlightRegistry,
+    get_coalescing_key,
+)
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_coalescing_key_ignores_the_api_key():
+    google = {"provider": "google", "api_key": "first"}
+
+    key = get_coalescing_key("brevity", "Title", "Lead", google)
+
+    assert key == get_coalescing_key(
+        "brevity", "Title", "Lead", {**google, "api_key": "second"}
+    )
+    assert key != get_coalescing_key("copyedit", "Title", "Lead", google)
+    assert key != get_coalescing_key("brevity", "Title", None, google)
+    assert key != get_coalescing_key("brevity", "Title", "Lead", google, 1234)
+    assert key != get_coalescing_key(
+        "brevity", "Title", "Lead", {"provider": "openai", "api_key": "first"}
+    )
+
+
+class TestInMemoryInFlightRegistry:
+    def test_first_claim_registers_the_task(self):
+        registry = InMemoryInFlightRegistry()
+
+        assert registry.claim("key", "first") is None
+        assert registry.claim("key", "second") == "first"
+
+    def test_replace_only_moves_the_key_from_the_stale_task(self):
+        registry = InMemoryInFlightRegistry()
+        registry.claim("key", "first")
+
+        assert registry.replace("key", "first", "second")
+        assert not registry.replace("key", "first", "third")
+        assert registry.claim("key", "third") == "second"
+
+    def test_release_keeps_keys_held_by_other_tasks(self):
+        registry = InMemoryInFlightRegistry()
+        registry.claim("key", "first")
+
+        registry.release("key", "second")
+        assert registry.claim("key", "second") == "first"
+        registry.release("key", "first")
+        assert registry.claim("key", "second") is None
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        registry = InMemoryInFlightRegistry(ttl_seconds=10, clock=clock)
+        registry.claim("key", "first")
+
+        clock.now = 10.0
+        assert registry.claim("key", "second") is None
+
+
+class TestRedisInFlightRegistry:
+    def test_claim_sets_the_key_only_if_missing(self):
+        client = MagicMock()
+        client.set.return_value = None
+        client.get.return_value = "first"
+        registry = RedisInFlightRegistry(client, ttl_seconds=60)
+
+        assert registry.claim("key", "second") == "first"
+        client.set.assert_called_once_with(
+            RedisInFlightRegistry.KEY_PREFIX + "key", "second", nx=True, ex=60
+        )
+
+    def test_redis_errors_start_a_new_task(self):
+        client = MagicMock()
+        client.set.side_effect = redis.ConnectionError("down")
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+        registry = RedisInFlightRegistry(client)
+
+        assert registry.claim("key", "first") is None
+        assert registry.replace("key", "stale", "first")
+        registry.release("key", "first")
@@ -0,0 +1,93 @@
+"""Tests for size-aware routing of edit tasks."""
+
+from unittest.mock import patch
+
+from services.tasks.queue_routing import (
+    DEFAULT_QUEUE,
+    LARGE_EDITS_QUEUE,
+    SMALL_EDITS_QUEUE,
+    AgingQueueCycle,
+    estimate_edit_work,
+    get_edit_queue,
+)
+
+PARAGRAPH = "This is a test paragraph with enough prose to be sent to the LLM."
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _section(paragraph_count):
+    paragraphs = [f"{PARAGRAPH} ({index})" for index in range(paragraph_count)]
+    return "== History ==\n\n" + "\n\n".join(paragraphs)
+
+
+def test_estimate_counts_only_paragraphs_that_will_be_edited():
+    wikitext = _section(2) + "\n\n{{Infobox}}\n\n[[Category:Tests]]\n\nToo short."
+
+    estimate = estimate_edit_work(wikitext)
+
+    assert estimate.paragraphs == 2
+    assert estimate.characters == 2 * len(f"{PARAGRAPH} (0)")
+
+
+@patch("services.tasks.queue_routing.EDIT_QUEUE_ROUTING_ENABLED", True)
+@patch("services.tasks.queue_routing.SMALL_EDIT_MAX_PARAGRAPHS", 3)
+def test_sections_are_routed_by_size():
+    assert get_edit_queue(_section(3)) == SMALL_EDITS_QUEUE
+    assert get_edit_queue(_section(4)) == LARGE_EDITS_QUEUE
+
+    with patch("services.tasks.queue_routing.SMALL_EDIT_MAX_CHARACTERS", 100):
+        assert get_edit_queue(_section(2)) == LARGE_EDITS_QUEUE
+
+
+@patch("services.tasks.queue_routing.EDIT_QUEUE_ROUTING_ENABLED", False)
+def test_disabled_routing_uses_the_default_queue():
+    assert get_edit_queue(_section(100)) is None
+
+
+class TestAgingQueueCycle:
+    def test_small_edits_are_read_before_large_edits(self):
+        cycle = AgingQueueCycle(aging_seconds=0)
+
+        cycle.update({LARGE_EDITS_QUEUE, SMALL_EDITS_QUEUE, DEFAULT_QUEUE})
+
+        assert cycle.consume(3) == [DEFAULT_QUEUE, SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE]
+
+    def test_waiting_large_edits_go_first_once_aged(self):
+        clock = FakeClock()
+        cycle = AgingQueueCycle(
+            [SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE], aging_seconds=30, clock=clock
+        )
+
+        clock.now = 29
+        cycle.rotate(SMALL_EDITS_QUEUE)
+        assert cycle.consume(2) == [SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE]
+
+        clock.now = 30
+        assert cycle.consume(2) == [LARGE_EDITS_QUEUE, SMALL_EDITS_QUEUE]
+        cycle.rotate(LARGE_EDITS_QUEUE)
+
+        # Taking a large edit starts the wait over
+        assert cycle.consume(2) == [SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE]
+
+    def test_empty_large_edits_queue_starts_the_wait_over(self):
+        clock = FakeClock()
+        cycle = AgingQueueCycle(
+            [SMALL_EDITS_QUEUE, LARGE_EDITS_QUEUE], aging_seconds=30, clock=clock
+        )
+
+        clock.now = 45
+        assert cycle.consume(2)[0] == LARGE_EDITS_QUEUE
+        # A small edit came through, so no large edit was waiting
+        cycle.rotate(SMALL_EDITS_QUEUE)
+
+        clock.now = 60
+        assert cycle.consume(2)[0] == SMALL_EDITS_QUEUE
+        clock.now = 75
+        assert cycle.consume(2)[0] == LARGE_EDITS_QUEUE
@@ -0,0 +1,64 @@
+"""Tests for the worker event loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from services.tasks.worker_loop import WorkerEventLoop
+
+
+@pytest.fixture
+def worker_loop():
+    worker_loop = WorkerEventLoop()
+    yield worker_loop
+    worker_loop.stop()
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_loop_is_kept_across_runs(worker_loop):
+    loop = worker_loop.run(current_loop())
+
+    assert worker_loop.run(current_loop()) is loop
+    assert worker_loop.start() is loop
+
+
+def test_runs_from_several_threads(worker_loop):
+    loops = []
+    threads = [
+        threading.Thread(target=lambda: loops.append(worker_loop.run(current_loop())))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(loops)) == 1
+
+
+def test_exceptions_reach_the_caller(worker_loop):
+    async def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        worker_loop.run(failing())
+
+
+def test_waiting_from_inside_the_loop_is_rejected(worker_loop):
+    async def nested():
+        return worker_loop.run(current_loop())
+
+    with pytest.raises(RuntimeError):
+        worker_loop.run(nested())
+
+
+def test_stop_closes_the_loop_and_start_makes_a_new_one(worker_loop):
+    loop = worker_loop.start()
+    worker_loop.stop()
+
+    assert loop.is_closed()
+    assert worker_loop.run(current_loop()) is not loop
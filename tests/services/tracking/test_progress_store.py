@@ -0,0 +1,153 @@
+"""Tests for the live progress store."""
+
+import json
+from unittest.mock import MagicMock
+
+import redis
+
+from services.tracking.progress_store import (
+    InMemoryProgressStore,
+    RedisProgressStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def progress(total, paragraphs, complete=0):
+    return {
+        "total_paragraphs": total,
+        "progress_percentage": round(complete / total * 100),
+        "phase_counts": {"pending": total - complete, "complete": complete},
+        "paragraphs": paragraphs,
+    }
+
+
+class TestInMemoryProgressStore:
+    def test_deltas_are_merged_by_index(self):
+        store = InMemoryProgressStore()
+        store.save(
+            "task",
+            progress(
+                2, [{"index": 0, "phase": "pending"}, {"index": 1, "phase": "pending"}]
+            ),
+        )
+        store.save("task", progress(2, [{"index": 1, "phase": "complete"}], complete=1))
+
+        assert store.get("task") == progress(
+            2,
+            [{"index": 0, "phase": "pending"}, {"index": 1, "phase": "complete"}],
+            complete=1,
+        )
+
+    def test_missing_and_deleted(self):
+        store = InMemoryProgressStore()
+        assert store.get("task") is None
+
+        store.save("task", progress(1, []))
+        store.delete("task")
+        assert store.get("task") is None
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        store = InMemoryProgressStore(ttl_seconds=10, clock=clock)
+        store.save("task", progress(1, []))
+
+        clock.now = 10.0
+        assert store.get("task") is None
+
+    def test_paragraphs_beyond_total_are_dropped(self):
+        store = InMemoryProgressStore()
+        store.save("task", progress(3, [{"index": 2, "phase": "complete"}]))
+        store.save("task", progress(2, [{"index": 0, "phase": "pending"}]))
+
+        stored = store.get("task")
+        assert stored is not None
+        assert [p["index"] for p in stored["paragraphs"]] == [0]
+
+    def test_partial_results_are_merged_by_index_and_deleted_with_progress(self):
+        store = InMemoryProgressStore()
+        assert store.get_partial_results("task") is None
+
+        store.save_partial_results("task", [{"index": 2, "after": "old"}])
+        store.save_partial_results(
+            "task", [{"index": 0, "after": "a"}, {"index": 2, "after": "new"}]
+        )
+        assert store.get_partial_results("task") == [
+            {"index": 0, "after": "a"},
+            {"index": 2, "after": "new"},
+        ]
+
+        store.delete("task")
+        assert store.get_partial_results("task") is None
+
+
+class TestRedisProgressStore:
+    def test_save_writes_only_listed_paragraph_fields(self):
+        client = MagicMock()
+        pipeline = client.pipeline.return_value
+        store = RedisProgressStore(client, ttl_seconds=60)
+
+        assert store.save("task", progress(3, [{"index": 2, "phase": "complete"}]))
+
+        key = RedisProgressStore.KEY_PREFIX + "task"
+        mapping = pipeline.hset.call_args.kwargs["mapping"]
+        assert pipeline.hset.call_args.args == (key,)
+        assert set(mapping) == {"summary", "paragraph:2"}
+        assert "paragraphs" not in json.loads(mapping["summary"])
+        pipeline.expire.assert_called_once_with(key, 60)
+
+    def test_get_assembles_progress_in_paragraph_order(self):
+        client = MagicMock()
+        client.hgetall.return_value = {
+            "summary": json.dumps({"total_paragraphs": 11}),
+            "paragraph:10": json.dumps({"index": 10}),
+            "paragraph:2": json.dumps({"index": 2}),
+        }
+        store = RedisProgressStore(client)
+
+        assert store.get("task") == {
+            "total_paragraphs": 11,
+            "paragraphs": [{"index": 2}, {"index": 10}],
+        }
+
+    def test_partial_results_are_stored_one_field_per_paragraph(self):
+        client = MagicMock()
+        pipeline = client.pipeline.return_value
+        store = RedisProgressStore(client, ttl_seconds=60)
+
+        assert store.save_partial_results("task", [{"index": 10}, {"index": 2}])
+
+        key = RedisProgressStore.PARTIAL_RESULTS_KEY_PREFIX + "task"
+        assert pipeline.hset.call_args.args == (key,)
+        assert set(pipeline.hset.call_args.kwargs["mapping"]) == {"10", "2"}
+        pipeline.expire.assert_called_once_with(key, 60)
+
+        client.hgetall.return_value = {
+            "10": json.dumps({"index": 10}),
+            "2": json.dumps({"index": 2}),
+        }
+        assert store.get_partial_results("task") == [{"index": 2}, {"index": 10}]
+
+    def test_missing_progress(self):
+        client = MagicMock()
+        client.hgetall.return_value = {}
+        assert RedisProgressStore(client).get("task") is None
+
+    def test_redis_errors_fall_back(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        client.hgetall.side_effect = redis.ConnectionError("down")
+        client.delete.side_effect = redis.ConnectionError("down")
+        store = RedisProgressStore(client)
+
+        assert store.save("task", progress(1, [])) is False
+        assert store.get("task") is None
+        assert store.save_partial_results("task", [{"index": 0}]) is False
+        assert store.get_partial_results("task") is None
+        store.delete("task")
@@ -255,6 +255,34 @@ class TestEnhancedProgressTracker:
         assert progress_data["paragraphs"][2]["phase"] == "complete"
         assert progress_data["paragraphs"][2]["status"] == "CHANGED"
 
+    def test_concurrency_window_in_progress_data(self):
+        """Test that the concurrency window is only published once set."""
+        tracker = EnhancedProgressTracker(total_paragraphs=1)
+        assert "concurrency_window" not in tracker.get_progress_data()
+
+        tracker.set_concurrency_window(4)
+        assert tracker.get_progress_data()["concurrency_window"] == 4
+
+    def test_progress_delta_includes_only_changed_paragraphs(self):
+        """Test that progress deltas list paragraphs changed since the last one."""
+        tracker = EnhancedProgressTracker(total_paragraphs=3)
+
+        first = tracker.get_progress_delta()
+        assert [p["index"] for p in first["paragraphs"]] == [0, 1, 2]
+
+        tracker.mark_paragraph_started(2, "Content")
+        tracker.mark_paragraph_complete(2, "CHANGED")
+        delta = tracker.get_progress_delta()
+        assert [p["index"] for p in delta["paragraphs"]] == [2]
+        assert delta["phase_counts"]["complete"] == 1
+        assert delta["total_paragraphs"] == 3
+
+        assert tracker.get_progress_delta()["paragraphs"] == []
+        # Full progress data does not consume changes
+        tracker.mark_paragraph_started(0, "Content")
+        assert len(tracker.get_progress_data()["paragraphs"]) == 3
+        assert [p["index"] for p in tracker.get_progress_delta()["paragraphs"]] == [0]
+
     def test_thread_safety_basic(self):
         """Test basic thread safety of operations."""
         import threading
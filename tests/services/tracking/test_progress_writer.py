@@ -0,0 +1,107 @@
+"""Tests for the debounced progress writer."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from services.tracking.progress_tracker import EnhancedProgressTracker
+from services.tracking.progress_writer import ProgressWriter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def changed_indexes(progress_data):
+    return [paragraph["index"] for paragraph in progress_data["paragraphs"]]
+
+
+class TestProgressWriter:
+    @pytest.mark.asyncio
+    async def test_zero_interval_writes_every_change(self):
+        tracker = EnhancedProgressTracker(2)
+        writes: List[dict] = []
+        writer = ProgressWriter(tracker, writes.append, interval_seconds=0)
+
+        await writer.flush()
+        tracker.mark_paragraph_started(0, "Content")
+        await writer.update()
+        tracker.mark_paragraph_started(1, "Content")
+        await writer.update()
+
+        assert [changed_indexes(write) for write in writes] == [[0, 1], [0], [1]]
+
+    @pytest.mark.asyncio
+    async def test_changes_within_interval_are_coalesced(self):
+        tracker = EnhancedProgressTracker(3)
+        writes: List[dict] = []
+        writer = ProgressWriter(tracker, writes.append, interval_seconds=0.05)
+
+        await writer.flush()
+        for index in range(3):
+            tracker.mark_paragraph_started(index, "Content")
+            await writer.update()
+            tracker.mark_paragraph_llm_processing(index)
+            await writer.update()
+        assert len(writes) == 1
+
+        await asyncio.sleep(0.1)
+
+        assert len(writes) == 2
+        assert changed_indexes(writes[1]) == [0, 1, 2]
+        assert writes[1]["phase_counts"]["llm_processing"] == 3
+
+    @pytest.mark.asyncio
+    async def test_first_change_after_quiet_period_is_written_immediately(self):
+        clock = FakeClock()
+        tracker = EnhancedProgressTracker(1)
+        writes: List[dict] = []
+        writer = ProgressWriter(tracker, writes.append, interval_seconds=1, clock=clock)
+
+        await writer.flush()
+        clock.now = 5.0
+        tracker.mark_paragraph_started(0, "Content")
+        await writer.update()
+
+        assert len(writes) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_writes_held_changes(self):
+        tracker = EnhancedProgressTracker(1)
+        writes: List[dict] = []
+        writer = ProgressWriter(tracker, writes.append, interval_seconds=60)
+
+        await writer.flush()
+        tracker.mark_paragraph_complete(0, "CHANGED")
+        await writer.update()
+        assert len(writes) == 1
+
+        await writer.close()
+        await writer.close()
+
+        assert len(writes) == 2
+        assert writes[1]["progress_percentage"] == 100
+
+    @pytest.mark.asyncio
+    async def test_delayed_write_errors_are_raised_on_close(self):
+        tracker = EnhancedProgressTracker(1)
+        calls = []
+
+        def failing_callback(progress_data):
+            calls.append(progress_data)
+            if len(calls) > 1:
+                raise RuntimeError("database unavailable")
+
+        writer = ProgressWriter(tracker, failing_callback, interval_seconds=0.01)
+        await writer.flush()
+        tracker.mark_paragraph_started(0, "Content")
+        await writer.update()
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await writer.close()
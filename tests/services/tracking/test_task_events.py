@@ -0,0 +1,84 @@
+"""Tests for the task event brokers."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from services.tracking.task_events import (
+    InMemoryTaskEventBroker,
+    RedisTaskEventBroker,
+)
+
+
+class TestInMemoryTaskEventBroker:
+    @pytest.mark.asyncio
+    async def test_events_reach_subscribers_from_other_threads(self):
+        broker = InMemoryTaskEventBroker()
+
+        async with broker.subscribe("task") as subscription:
+            publisher = threading.Thread(
+                target=broker.publish, args=("task", "progress", {"complete": 1})
+            )
+            publisher.start()
+            publisher.join()
+
+            assert await subscription.get(timeout=1) == ("progress", {"complete": 1})
+            assert await subscription.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_events_are_scoped_to_the_task_and_subscription(self):
+        broker = InMemoryTaskEventBroker()
+        broker.publish("task", "progress", {"before": "subscribing"})
+
+        async with broker.subscribe("task") as subscription:
+            broker.publish("other-task", "progress", {})
+            await asyncio.sleep(0)
+            assert await subscription.get(timeout=0.01) is None
+
+        # Closed subscriptions no longer receive events
+        broker.publish("task", "progress", {})
+        assert broker._subscriptions == {}
+
+
+class TestRedisTaskEventBroker:
+    def test_publish_sends_event_to_task_channel(self):
+        client = MagicMock()
+        broker = RedisTaskEventBroker(client, "redis://localhost")
+
+        broker.publish("task", "done", {"status": "SUCCESS"})
+
+        channel, message = client.publish.call_args.args
+        assert channel == RedisTaskEventBroker.CHANNEL_PREFIX + "task"
+        assert json.loads(message) == {"event": "done", "data": {"status": "SUCCESS"}}
+
+    def test_publish_ignores_redis_errors(self):
+        client = MagicMock()
+        client.publish.side_effect = redis.ConnectionError("down")
+
+        RedisTaskEventBroker(client, "redis://localhost").publish("task", "done", {})
+
+    def test_publish_ignores_unserializable_data(self):
+        client = MagicMock()
+
+        RedisTaskEventBroker(client, "redis://localhost").publish(
+            "task", "done", {"value": object()}
+        )
+
+        client.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_publish_runs_off_the_event_loop(self):
+        client = MagicMock()
+        threads = []
+        client.publish.side_effect = lambda *args: threads.append(threading.get_ident())
+
+        await RedisTaskEventBroker(client, "redis://localhost").apublish(
+            "task", "done", {}
+        )
+
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
@@ -11,6 +11,7 @@ from services.utils.wiki_utils import (
     extract_section_content,
     extract_section_headings,
     is_prose_content,
+    split_article_sections,
 )
 
 
@@ -496,3 +497,41 @@ Section content.
         assert extract_section_content(wikitext, "lead") is not None
         assert extract_section_content(wikitext, "LEAD") is not None
         assert extract_section_content(wikitext, "Lead") is not None
+
+
+class TestSplitArticleSections:
+    """Test cases for split_article_sections function."""
+
+    def test_sections_match_extracted_section_content(self):
+        """Test that every section is split out as extract_section_content finds it."""
+        wikitext = """Lead content here.
+
+== Overview ==
+Overview content.
+=== Details ===
+Details content.
+
+== History ==
+History content.
+"""
+        sections = split_article_sections(wikitext)
+
+        assert [title for title, _ in sections] == ["Lead", "Overview", "History"]
+        for title, content in sections:
+            assert content == extract_section_content(wikitext, title)
+
+    def test_empty_sections_and_lead_are_skipped(self):
+        """Test that headings without content and a missing lead are left out."""
+        wikitext = """
+== See also ==
+
+== History ==
+History content.
+"""
+        assert split_article_sections(wikitext) == [
+            ("History", "== History ==\nHistory content.\n")
+        ]
+
+    def test_empty_wikitext(self):
+        """Test that empty wikitext has no sections."""
+        assert split_article_sections("") == []
@@ -283,3 +283,138 @@ class TestWikipediaAPI:
         # Test that the original title is returned when there's an error
         result = await wikipedia_api._normalize_title("bad*title")
         assert result == "bad*title"
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_article_revision_by_id(self, mock_client, wikipedia_api):
+        """Test fetching a pinned revision without normalizing the title."""
+        content_response = MagicMock()
+        content_response.json.return_value = {
+            "query": {
+                "pages": [
+                    {
+                        "title": "Apollo",
+                        "revisions": [{"revid": 1234, "content": "Apollo is..."}],
+                    }
+                ]
+            }
+        }
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = content_response
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        result = await wikipedia_api.get_article_revision("Apollo", revision_id=1234)
+
+        assert result.wikitext == "Apollo is..."
+        assert result.revision_id == 1234
+        params = mock_client_instance.get.call_args.kwargs["params"]
+        assert params["revids"] == 1234
+        assert "titles" not in params
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_article_revision_bad_revision(self, mock_client, wikipedia_api):
+        """Test fetching a revision that does not exist."""
+        content_response = MagicMock()
+        content_response.json.return_value = {
+            "query": {"badrevids": {"1": {"revid": 1, "missing": True}}}
+        }
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = content_response
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        with pytest.raises(WikipediaAPIError, match="Revision not found"):
+            await wikipedia_api.get_article_revision("Apollo", revision_id=1)
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_section_wikitext(self, mock_client, wikipedia_api):
+        """Test fetching one section of a revision by its heading."""
+        sections_response = MagicMock()
+        sections_response.json.return_value = {
+            "parse": {
+                "sections": [
+                    {"index": "1", "level": "2", "line": "Early life"},
+                    {"index": "2", "level": "3", "line": "Career"},
+                    {"index": "T-1", "level": "2", "line": "Career"},
+                    {"index": "3", "level": "2", "line": "Career"},
+                ]
+            }
+        }
+        content_response = MagicMock()
+        content_response.json.return_value = {
+            "query": {
+                "pages": [
+                    {
+                        "title": "Apollo",
+                        "revisions": [
+                            {"revid": 1234, "content": "== Career ==\nApollo..."}
+                        ],
+                    }
+                ]
+            }
+        }
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.side_effect = [sections_response, content_response]
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        result = await wikipedia_api.get_section_wikitext(1234, "career")
+
+        assert result == "== Career ==\nApollo..."
+        params = mock_client_instance.get.call_args.kwargs["params"]
+        assert params["revids"] == 1234
+        assert params["rvsection"] == 3
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_section_wikitext_lead(self, mock_client, wikipedia_api):
+        """Test that the lead is fetched as section 0 without a section list."""
+        content_response = MagicMock()
+        content_response.json.return_value = {
+            "query": {
+                "pages": [
+                    {
+                        "title": "Apollo",
+                        "revisions": [{"revid": 1234, "content": "Apollo is..."}],
+                    }
+                ]
+            }
+        }
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = content_response
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        assert await wikipedia_api.get_section_wikitext(1234, "Lead") == "Apollo is..."
+        mock_client_instance.get.assert_called_once()
+        assert mock_client_instance.get.call_args.kwargs["params"]["rvsection"] == 0
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_section_wikitext_missing(self, mock_client, wikipedia_api):
+        """Test that a heading the revision does not have returns None."""
+        sections_response = MagicMock()
+        sections_response.json.return_value = {"parse": {"sections": []}}
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = sections_response
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        assert await wikipedia_api.get_section_wikitext(1234, "Career") is None
+        mock_client_instance.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("services.utils.wikipedia_api.httpx.AsyncClient")
+    async def test_get_latest_revision_id(self, mock_client, wikipedia_api):
+        """Test looking up the latest revision ID in a single request."""
+        ids_response = MagicMock()
+        ids_response.json.return_value = {
+            "query": {"pages": [{"title": "Apollo", "revisions": [{"revid": 5678}]}]}
+        }
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = ids_response
+        mock_client.return_value.__aenter__.return_value = mock_client_instance
+
+        assert await wikipedia_api.get_latest_revision_id("apollo") == 5678
+        mock_client_instance.get.assert_called_once()
+        params = mock_client_instance.get.call_args.kwargs["params"]
+        assert params["rvprop"] == "ids"
+        assert params["redirects"] == 1